@@ -10,6 +10,10 @@ from report_integration_agent import ReportIntegrationNode
 from final_analysis_agent import FinalAnalysisAgent
 from fin_report_scorer_agent import ReportScorerAgent
 from report_supervisor_agent import ReportSupervisorAgent, get_next_node
+from graph_registry import registry
+
+# 프로세스 레지스트리에 등록하는 그래프 이름
+GRAPH_NAME = "langgraph"
 
 # StartNode 및 EndNode 정의
 START = "START"
@@ -68,7 +72,7 @@ def create_graph() -> Graph:
     투자 분석을 위한 전체 워크플로우 그래프를 생성합니다.
 
     그래프는 다음 컴포넌트들로 구성됩니다:
-    1. 기본 분석 노드들
+    1. 기본 분석 노드들 (START 이후 동시 실행, 통합 노드에서 합류)
         - 재무제표 분석
         - 뉴스 분석
         - 거시경제 분석
@@ -111,13 +115,12 @@ def create_graph() -> Graph:
                  integration_node, scorer_node, supervisor_node, final_node, end_node]:
         graph.add_node(node)
 
-    # 엣지 연결 (순차적 흐름)
-    graph.add_edge(START, "FinancialStatementsAnalysisAgent")
-    graph.add_edge("FinancialStatementsAnalysisAgent", "NewsAnalysisAgent")
-    graph.add_edge("NewsAnalysisAgent", "MacroeconomicAnalysisAgent")
-    graph.add_edge("MacroeconomicAnalysisAgent", "FinancialReportsAnalysisAgent")
-    graph.add_edge("FinancialReportsAnalysisAgent", "DailyChartAnalysisAgent")
-    graph.add_edge("DailyChartAnalysisAgent", "ReportIntegrationNode")
+    # 엣지 연결: 5개의 분석 노드는 서로의 결과를 읽지 않으므로
+    # START에서 동시에 분기하고 ReportIntegrationNode에서 합류
+    analysis_nodes = [fs_node, news_node, macro_node, financial_node, daily_chart_node]
+    for node in analysis_nodes:
+        graph.add_edge(START, node.name)
+        graph.add_edge(node.name, "ReportIntegrationNode")
     graph.add_edge("ReportIntegrationNode", "ReportScorerAgent")
     graph.add_edge("ReportScorerAgent", "ReportSupervisorAgent")
     graph.add_edge("ReportSupervisorAgent", "FinalAnalysisAgent")
@@ -135,6 +138,10 @@ def create_graph() -> Graph:
     })
     return graph
 
+
+registry.register(GRAPH_NAME, create_graph)
+
+
 def run_graph_stream(initial_state: GraphState):
     """
     초기 상태를 받아 그래프를 실행하고 실행 과정을 스트리밍합니다.
@@ -151,12 +158,12 @@ def run_graph_stream(initial_state: GraphState):
             - investment_persona: 투자 성향
 
     Returns:
-        list: (노드명, 상태) 튜플의 리스트
-            그래프 실행 과정의 각 단계별 상태를 포함
+        list: StateDelta 리스트
+            그래프 실행 과정의 각 단계별로 노드가 변경한 키와 값을 포함
     """
     
-    graph = create_graph()
-    return list(graph.run_stream(initial_state))
+    graph = registry.get(GRAPH_NAME)
+    return list(graph.run_deltas(initial_state))
 
 def main():
     """
@@ -191,7 +198,7 @@ def main():
     }
     
     final_state = None
-    graph = create_graph()
+    graph = registry.get(GRAPH_NAME)
     for node_name, state in graph.run_stream(initial_state):
         print(f"[Stream] {node_name} 완료. 현재 state keys: {list(state.keys())}")
         final_state = state
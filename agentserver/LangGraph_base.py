@@ -1,5 +1,253 @@
-from typing import Annotated, List, Tuple, Iterator
+import time
+import random
+import asyncio
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Annotated, Any, AsyncIterator, Awaitable, List, Optional, Tuple, Iterator, Set
 from typing_extensions import TypedDict
+from graph_cache import NodeCache, fingerprint
+from graph_checkpoint import Checkpoint, CheckpointStore
+from graph_tracing import Span, SpanExporter, Tracer
+
+# 체크포인트의 첫 기록(초기 state)에 사용하는 노드 이름
+CHECKPOINT_INITIAL = "__initial__"
+
+# run_deltas()가 마지막으로 내보내는 실행 종료 이벤트의 노드 이름
+GRAPH_END = "__end__"
+
+# 현재 실행 중인 그래프의 전체 마감 시각 (time.monotonic() 기준, 없으면 None)
+_deadline_at: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("graph_deadline_at", default=None)
+
+# 현재 노드 실행 시도의 취소 신호 (제한 시간이 있는 동기 실행에서만 설정, 시간 초과 시 set)
+_cancel_event: contextvars.ContextVar[Optional[threading.Event]] = contextvars.ContextVar("node_cancel_event",
+                                                                                         default=None)
+
+# run_sync()가 취소 신호를 확인하는 주기 (초)
+CANCEL_POLL_INTERVAL = 0.1
+
+
+class NodeTimeoutError(TimeoutError):
+    """
+    노드 실행이 노드 제한 시간 또는 그래프 전체 제한 시간을 넘겼을 때 발생하는 예외입니다.
+    """
+
+
+def failure_message(task: str, error: Exception) -> str:
+    """
+    fallback()에서 보고서 대신 기록할 안내 문구를 만듭니다. (시간 초과와 그 외 실패를 구분)
+
+    Args:
+        task (str): 완료하지 못한 작업 이름 (예: "뉴스 분석")
+        error (Exception): 마지막 실패 원인
+
+    Returns:
+        str: 예) "뉴스 분석을 제한 시간 내에 완료하지 못했습니다. (NodeTimeoutError)"
+    """
+
+    if isinstance(error, NodeTimeoutError):
+        return f"{task}을 제한 시간 내에 완료하지 못했습니다. ({type(error).__name__})"
+    return f"{task}에 실패했습니다. ({type(error).__name__})"
+
+
+class RetryPolicy:
+    """
+    노드 실행 실패 시 재시도 정책입니다. (지수 백오프 + jitter)
+
+    Attributes:
+        max_attempts (int): 최대 시도 횟수 (첫 실행 포함)
+        initial_delay (float): 첫 재시도 전 대기 시간 (초)
+        backoff (float): 재시도마다 대기 시간에 곱하는 배수
+        max_delay (float): 최대 대기 시간 (초)
+        jitter (float): 대기 시간에 적용할 무작위 변동 비율 (0.5이면 ±50%)
+        retry_on (Tuple[type, ...]): 재시도할 예외 타입
+    """
+
+    def __init__(self, max_attempts: int = 3, initial_delay: float = 1.0, backoff: float = 2.0,
+                 max_delay: float = 30.0, jitter: float = 0.5,
+                 retry_on: Tuple[type, ...] = (Exception,)) -> None:
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_on = retry_on
+
+    def delay(self, attempt: int) -> float:
+        """
+        attempt번째 시도가 실패한 뒤 다음 시도까지 대기할 시간을 계산합니다.
+        """
+
+        base = min(self.max_delay, self.initial_delay * self.backoff ** (attempt - 1))
+        return base * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """
+        attempt번째 시도에서 발생한 예외를 재시도할지 결정합니다.
+        """
+
+        return attempt < self.max_attempts and isinstance(error, self.retry_on)
+
+
+# 재시도 정책을 지정하지 않은 노드는 한 번만 실행
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+def remaining_time(default: Optional[float] = None) -> Optional[float]:
+    """
+    현재 그래프 실행의 남은 시간을 반환합니다.
+    노드 내부의 외부 호출(HTTP 등) 제한 시간을 그래프 마감 시각에 맞추는 데 사용합니다.
+
+    Args:
+        default (Optional[float]): 그래프 제한 시간이 없을 때 사용할 값이자 최대값 (초)
+
+    Returns:
+        Optional[float]: min(default, 남은 시간), 그래프 제한 시간이 없으면 default
+
+    Example:
+        >>> httpx.AsyncClient(timeout=remaining_time(10.0))
+    """
+
+    deadline_at = _deadline_at.get()
+    if deadline_at is None:
+        return default
+    remaining = max(0.0, deadline_at - time.monotonic())
+    return remaining if default is None else min(default, remaining)
+
+
+def cancelled() -> bool:
+    """
+    현재 노드 실행 시도가 시간 초과로 취소되었는지 반환합니다.
+    aprocess()를 run_sync()로 실행하는 노드는 자동으로 취소되며,
+    긴 반복 작업을 하는 동기 process()는 중간에 이 값을 확인하여 일찍 종료합니다.
+    """
+
+    event = _cancel_event.get()
+    return event is not None and event.is_set()
+
+
+class _Run:
+    """
+    그래프 실행 1회 동안 노드 실행에 공유되는 정보입니다.
+
+    Attributes:
+        deadline_at (Optional[float]): 그래프 마감 시각 (time.monotonic() 기준)
+        tracer (Tracer): 이번 실행의 span 수집기
+        root (Span): 그래프 실행 전체를 나타내는 span (노드 span의 부모)
+        run_id (Optional[str]): 실행 ID (워커에서는 task_id)
+    """
+
+    def __init__(self, deadline_at: Optional[float], tracer: Tracer, root: Span,
+                 run_id: Optional[str] = None) -> None:
+        self.deadline_at = deadline_at
+        self.tracer = tracer
+        self.root = root
+        self.run_id = run_id
+
+
+class ProgressListener:
+    """
+    노드 실행 시작/종료를 전달받는 리스너의 기본 클래스입니다. (진행 상황 표시용)
+    run_id를 지정한 실행에 대해서만 호출되며, 하위 클래스는 필요한 메서드만 오버라이드합니다.
+
+    Note:
+        노드 실행 스레드(또는 이벤트 루프)에서 바로 호출되므로 오래 걸리는 작업(DB 기록 등)은
+        모아 두었다가 별도 스레드에서 처리해야 합니다.
+    """
+
+    def node_started(self, run_id: str, node_name: str) -> None:
+        pass
+
+    def node_finished(self, run_id: str, node_name: str, seconds: float) -> None:
+        pass
+
+
+def _call_with_timeout(func, state: "GraphState", timeout: Optional[float], name: str) -> "GraphState":
+    """
+    동기 함수를 제한 시간 안에 실행합니다.
+
+    제한 시간이 있으면 daemon 스레드에서 실행하고 제한 시간이 지나면 결과를 기다리지 않고
+    NodeTimeoutError를 발생시킵니다. (멈춘 소켓 등으로 끝나지 않는 스레드가 워커 종료를 막지 않음)
+    포기한 시도는 취소 신호(cancelled(), run_sync())로 중단되므로 재시도와 겹쳐 실행되지 않으며,
+    노드 내부의 remaining_time()도 이번 시도의 제한 시간을 넘지 않습니다.
+    """
+
+    if timeout is None:
+        return func(state)
+
+    outcome = {}
+    cancel = threading.Event()
+
+    def target():
+        _cancel_event.set(cancel)
+        deadline_at = time.monotonic() + timeout
+        graph_deadline_at = _deadline_at.get()
+        _deadline_at.set(deadline_at if graph_deadline_at is None else min(graph_deadline_at, deadline_at))
+        try:
+            outcome["result"] = func(state)
+        except BaseException as e:
+            outcome["error"] = e
+
+    context = contextvars.copy_context()
+    thread = threading.Thread(target=context.run, args=(target,), name=f"node-{name}", daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        cancel.set()
+        raise NodeTimeoutError(f"{name}: {timeout:.1f}초 제한 시간 초과")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+
+class StateDelta:
+    """
+    노드 1회 완료로 바뀐 state 부분만 담은 이벤트입니다.
+    전체 state 복사본 대신 이 이벤트를 쌓으면 실행 1회의 메모리가 노드 수가 아닌 출력 크기에 비례합니다.
+
+    Attributes:
+        node (str): 완료된 노드 이름 (실행 종료 이벤트는 GRAPH_END)
+        version (int): 실행 내에서 1부터 증가하는 이벤트 번호
+        changed (dict[str, Any]): 노드가 변경하거나 추가한 키와 값
+        removed (List[str]): 노드가 삭제한 키 목록
+    """
+
+    def __init__(self, node: str, version: int, changed: dict, removed: Optional[List[str]] = None) -> None:
+        self.node = node
+        self.version = version
+        self.changed = changed
+        self.removed = removed or []
+
+    @classmethod
+    def from_keys(cls, node: str, version: int, state: dict, keys: Set[str]) -> "StateDelta":
+        """
+        병합이 끝난 state와 변경된 키 집합으로 이벤트를 만듭니다.
+        (state에 없는 키는 삭제된 키로 기록)
+        """
+
+        return cls(node, version,
+                   {key: state[key] for key in keys if key in state},
+                   sorted(key for key in keys if key not in state))
+
+    def apply(self, state: dict) -> dict:
+        """
+        이벤트를 state에 적용합니다. (제자리 수정 후 같은 dict 반환)
+        """
+
+        state.update(self.changed)
+        for key in self.removed:
+            state.pop(key, None)
+        return state
+
+    def to_dict(self) -> dict:
+        """
+        스트리밍 응답(JSON) 전송용 dict로 변환합니다.
+        """
+
+        return {"node": self.node, "version": self.version,
+                "changed": self.changed, "removed": self.removed}
+
 
 class GraphState(TypedDict, total=False):
     """
@@ -26,8 +274,10 @@ class GraphState(TypedDict, total=False):
         final_opinion (str): 최종 매매의견
         portfolio_suggestion (str): 자산 배분 제안
         final_report (str): 최종 보고서
+        final_fallback (bool): 최종 분석이 실패해 fallback()의 기본 의견으로 작성되었는지 여부
         report_score (float): 최종 보고서 점수
         next (str): 다음 실행할 노드 (조건부 엣지용)
+        run_timing (dict): 실행 시간 요약 (Graph가 실행 종료 시 기록)
 
     Note:
         total=False 옵션으로 모든 필드가 선택적(optional)입니다.
@@ -59,6 +309,7 @@ class GraphState(TypedDict, total=False):
 
     # 최종 산출물
     final_report: Annotated[str, "최종 보고서"]
+    final_fallback: Annotated[bool, "최종 분석 fallback 여부 (매매 알림을 보내지 않음)"]
 
     # 보고서 품질 점수
     report_score: Annotated[float, "최종 보고서 점수"]
@@ -66,6 +317,12 @@ class GraphState(TypedDict, total=False):
     # 감독자 노드가 결정한 다음 실행 노드를 지정 (조건부 엣지용)
     next: Annotated[str, "다음 실행할 노드"]
 
+    # 실행 시간 요약 (노드별/LLM/데이터 소스 소요 시간)
+    run_timing: Annotated[dict, "실행 시간 요약"]
+
+    # 이 실행의 기업 분석 결과를 공유하여 최종 분석만 따로 수행할 작업 ID 목록
+    coalesced_task_ids: Annotated[List[str], "분석 결과를 공유하는 작업 ID"]
+
 
 # Node: 각 에이전트(노드)의 기본 클래스
 class Node:
@@ -75,7 +332,27 @@ class Node:
 
     Attributes:
         name (str): 노드의 이름
+        reads (Optional[Tuple[str, ...]]): 노드가 읽는 state 키 목록
+            None이면 모든 키를 읽는 것으로 간주합니다.
+        writes (Optional[Tuple[str, ...]]): 노드가 기록하는 state 키 목록
+            None이면 변경된 모든 키를 노드의 출력으로 간주합니다.
+        cache_ttl (Optional[float]): 노드 결과 캐시 유효 시간 (초)
+            None이면 캐시하지 않습니다.
+        timeout (Optional[float]): 1회 실행 제한 시간 (초), None이면 제한 없음
+        retry (Optional[RetryPolicy]): 실패/시간 초과 시 재시도 정책, None이면 재시도하지 않음
+
+    Note:
+        reads/writes는 재실행 범위 계산에 사용됩니다. 상위 노드가 재실행되어
+        writes에 해당하는 키가 바뀌면, 그 키를 reads로 선언한 하위 노드만 다시 실행됩니다.
+        그래프에 캐시가 설정되어 있으면 reads 값이 같은 실행 결과를 cache_ttl 동안 재사용합니다.
+        재시도 후에도 실패하거나 그래프 전체 제한 시간을 넘기면 fallback()의 결과로 실행을 이어갑니다.
     """
+
+    reads: Optional[Tuple[str, ...]] = None
+    writes: Optional[Tuple[str, ...]] = None
+    cache_ttl: Optional[float] = None
+    timeout: Optional[float] = None
+    retry: Optional[RetryPolicy] = None
     
     def __init__(self, name: str):
         self.name = name
@@ -98,11 +375,116 @@ class Node:
         print(f"[{self.name}] 기본 process() 호출")
         return state
 
+    async def aprocess(self, state: GraphState) -> GraphState:
+        """
+        노드의 비동기 처리 로직을 실행합니다.
+        비동기 LLM/HTTP 클라이언트를 사용하는 노드는 이 메서드를 오버라이드합니다.
+
+        Args:
+            state (GraphState): 현재 그래프의 상태
+
+        Returns:
+            GraphState: 처리 후 업데이트된 상태
+
+        Note:
+            기본 구현은 동기 process()를 별도 스레드에서 실행하므로
+            이벤트 루프를 막지 않습니다.
+        """
+
+        return await asyncio.to_thread(self.process, state)
+
+    def should_cache(self, changed: dict) -> bool:
+        """
+        노드 결과를 캐시에 저장할지 결정합니다.
+        데이터 수집 실패 등 재사용하면 안 되는 결과는 하위 클래스에서 False를 반환합니다.
+
+        Args:
+            changed (dict): 노드가 변경한 state 키와 값
+
+        Returns:
+            bool: 저장할 경우 True
+        """
+
+        return bool(changed)
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        재시도 후에도 실패하거나 제한 시간을 넘긴 경우 사용할 대체 결과를 만듭니다.
+        하위 클래스에서 오버라이드하여 writes 키에 대체 값을 기록하면 그래프 실행이 계속됩니다.
+
+        Args:
+            state (GraphState): 노드에 전달된 state 복사본
+            error (Exception): 마지막 실패 원인
+
+        Returns:
+            GraphState: 대체 값이 기록된 상태
+
+        Raises:
+            Exception: 기본 구현은 원래 예외를 다시 발생시켜 그래프 실행을 중단합니다.
+        """
+
+        raise error
+
+    def warm_up(self) -> None:
+        """
+        프로세스 시작 시 한 번 호출되어 모델 로딩 후 첫 추론, 외부 연결 등
+        첫 실행에서만 발생하는 지연을 미리 처리합니다.
+        기본 구현은 아무 일도 하지 않으며, 필요한 노드에서 오버라이드합니다.
+
+        Note:
+            노드 인스턴스는 여러 작업이 공유하므로 실행별 값을 인스턴스에 저장하지 않아야 합니다.
+        """
+
+
+def run_sync(coro: Awaitable[Any]) -> Any:
+    """
+    코루틴을 동기 방식으로 실행합니다. (aprocess를 감싸는 동기 process()용 adapter)
+
+    현재 스레드에 실행 중인 이벤트 루프가 없으면 asyncio.run()으로 실행하고,
+    이미 이벤트 루프 안에서 호출된 경우에는 별도 스레드에서 실행하여
+    "asyncio.run() cannot be called from a running event loop" 오류를 피합니다.
+    노드 실행 시도가 시간 초과로 취소되면 코루틴도 취소합니다.
+
+    Args:
+        coro (Awaitable[Any]): 실행할 코루틴
+
+    Returns:
+        Any: 코루틴의 반환값
+    """
+
+    cancel = _cancel_event.get()
+    if cancel is not None:
+        coro = _cancel_on(cancel, coro)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def _cancel_on(cancel: threading.Event, coro: Awaitable[Any]) -> Any:
+    """
+    코루틴을 실행하다가 취소 신호가 set되면 취소합니다. (asyncio.CancelledError 발생)
+    """
+
+    task = asyncio.ensure_future(coro)
+    while not task.done():
+        if cancel.is_set():
+            task.cancel()
+            break
+        await asyncio.wait({task}, timeout=CANCEL_POLL_INTERVAL)
+    return await task
+
 
 class Graph:
     """
     에이전트 노드들을 연결하여 실행하는 DAG(Directed Acyclic Graph) 구현체입니다.
 
+    선행 노드가 모두 끝난 노드들은 스레드 풀에서 동시에 실행됩니다.
+    예를 들어 START 이후 서로의 결과를 읽지 않는 5개의 분석 에이전트는
+    동시에 LLM을 호출하고, 통합 노드는 다섯 노드가 모두 끝난 뒤 실행됩니다.
+
     Attributes:
         nodes (dict[str, Node]): 노드 이름과 노드 객체의 매핑
         edges (dict[str, List[str]]): 노드 간의 연결 관계
@@ -110,13 +492,37 @@ class Graph:
             조건부 엣지 정보 저장
             - Key: supervisor 노드 이름
             - Value: (선택 함수, 노드 매핑 딕셔너리)
+        max_workers (int): 동시에 실행할 수 있는 최대 노드 수
+        cache (Optional[NodeCache]): 노드 결과 캐시 (None이면 캐시 사용 안 함)
+        cache_ttls (dict[str, float]): 노드별 캐시 유효 시간 (초), Node.cache_ttl보다 우선
+        checkpointer (Optional[CheckpointStore]): 노드 완료마다 실행 상태를 기록하는 저장소
+            run_stream(run_id=...)으로 실행하면 중단된 실행을 이어서 진행합니다.
+        deadline (Optional[float]): 실행 1회의 전체 제한 시간 (초)
+            시간이 지나면 실행 중인 노드는 시간 초과로, 남은 노드는 바로 fallback()으로 처리됩니다.
+        span_exporter (Optional[SpanExporter]): 실행마다 노드/LLM/데이터 호출 span을 내보낼 exporter
+            exporter가 없어도 실행 시간 요약은 최종 state의 'run_timing'에 기록됩니다.
+        progress (Optional[ProgressListener]): 노드 실행 시작/종료를 전달받는 리스너
     """
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 8, cache: Optional[NodeCache] = None,
+                 cache_ttls: Optional[dict[str, float]] = None,
+                 checkpointer: Optional[CheckpointStore] = None,
+                 deadline: Optional[float] = None,
+                 span_exporter: Optional[SpanExporter] = None,
+                 progress: Optional[ProgressListener] = None):
         self.nodes: dict[str, Node] = {}
         self.edges: dict[str, List[str]] = {}
         # 조건부 엣지를 위한 딕셔너리: supervisor 노드 이름 -> (selector 함수, mapping dict)
         self.conditional_edges: dict[str, Tuple[callable, dict[str, str]]] = {}
+        self.max_workers = max_workers
+        self.cache = cache
+        self.cache_ttls: dict[str, float] = dict(cache_ttls or {})
+        self.checkpointer = checkpointer
+        self.deadline = deadline
+        self.span_exporter = span_exporter
+        self.progress = progress
+        # compile()로 계산한 (위상 정렬 순서, 상위 노드 맵), 노드/엣지가 바뀌면 초기화
+        self._compiled: Optional[Tuple[List[str], dict[str, Set[str]]]] = None
 
     def add_node(self, node: Node) -> None:
         """
@@ -129,6 +535,7 @@ class Graph:
         self.nodes[node.name] = node
         if node.name not in self.edges:
             self.edges[node.name] = []
+        self._compiled = None
 
     def add_edge(self, source: str, destination: str) -> None:
         """
@@ -145,6 +552,7 @@ class Graph:
         if source not in self.nodes or destination not in self.nodes:
             raise ValueError("Source 또는 Destination 노드가 그래프에 존재하지 않습니다.")
         self.edges[source].append(destination)
+        self._compiled = None
 
     def add_conditional_edges(self, supervisor_node: str, selector: callable, mapping: dict[str, str]) -> None:
         """
@@ -192,63 +600,805 @@ class Graph:
             raise ValueError("사이클이 존재하거나 위상 정렬 실패.")
         return topo_order
 
-    def run_stream(self, initial_state: GraphState) -> Iterator[Tuple[str, GraphState]]:
+    def get_descendants(self, node_name: str) -> Set[str]:
+        """
+        특정 노드에서 도달 가능한 모든 하위 노드를 계산합니다.
+
+        Args:
+            node_name (str): 기준 노드 이름
+
+        Returns:
+            Set[str]: 기준 노드를 제외한 하위 노드 이름 집합
+        """
+
+        descendants = set()
+        stack = list(self.edges.get(node_name, []))
+        while stack:
+            current = stack.pop()
+            if current in descendants:
+                continue
+            descendants.add(current)
+            stack.extend(self.edges[current])
+        return descendants
+
+    def get_ancestors(self) -> dict[str, Set[str]]:
+        """
+        노드별 상위(선행) 노드 집합을 계산합니다.
+
+        Returns:
+            dict[str, Set[str]]: 노드 이름 -> 해당 노드에 도달할 수 있는 모든 상위 노드 집합
+        """
+
+        ancestors = {n: set() for n in self.nodes}
+        for node_name in self.nodes:
+            for descendant in self.get_descendants(node_name):
+                ancestors[descendant].add(node_name)
+        return ancestors
+
+    def compile(self) -> Tuple[List[str], dict[str, Set[str]]]:
+        """
+        위상 정렬 순서와 상위 노드 맵을 한 번만 계산하여 저장합니다.
+        같은 그래프를 여러 작업에서 재사용할 때 실행마다 다시 계산하지 않습니다.
+
+        Returns:
+            Tuple[List[str], dict[str, Set[str]]]: (위상 정렬 순서, 상위 노드 맵)
+
+        Raises:
+            ValueError: 그래프에 사이클이 존재하는 경우
+        """
+
+        compiled = self._compiled
+        if compiled is None:
+            compiled = (self.get_topological_order(), self.get_ancestors())
+            self._compiled = compiled
+        return compiled
+
+    def warm_up(self) -> dict[str, float]:
+        """
+        그래프를 compile()하고 모든 노드의 warm_up()을 호출합니다.
+        작업을 받기 전 프로세스 시작 시점에 한 번 호출합니다.
+
+        Returns:
+            dict[str, float]: 노드 이름 -> warm_up 소요 시간 (초)
+        """
+
+        self.compile()
+        elapsed = {}
+        for node_name, node in self.nodes.items():
+            if not hasattr(node, "warm_up"):
+                continue
+            started = time.perf_counter()
+            node.warm_up()
+            elapsed[node_name] = time.perf_counter() - started
+            print(f"   [WARMUP] {node_name}: {elapsed[node_name]:.2f}s")
+        return elapsed
+
+    def _plan(self, targets: Set[str]) -> Set[str]:
+        """
+        주어진 노드들부터 다시 실행해야 하는 노드 집합을 계산합니다.
+
+        조건부 엣지를 가진 노드(supervisor)의 하위 노드는 해당 노드의 결정이
+        나온 뒤에만 실행되어야 하므로 실행 계획에서 제외합니다.
+
+        Args:
+            targets (Set[str]): 실행을 시작할 노드 이름 집합
+
+        Returns:
+            Set[str]: 실행 대기 상태로 추가할 노드 이름 집합
+        """
+
+        region = set(targets)
+        for target in targets:
+            region |= self.get_descendants(target)
+        gated = set()
+        for node_name in region & set(self.conditional_edges):
+            gated |= self.get_descendants(node_name)
+        return (region - gated) | set(targets)
+
+    @staticmethod
+    def _diff(before: GraphState, after: GraphState) -> Tuple[dict, List[str]]:
+        """
+        노드 실행 전후의 state를 비교하여 변경된 키와 삭제된 키를 구합니다.
+        새 객체라도 이전 값과 같으면 변경으로 보지 않습니다. (재시도가 같은 보고서를 만들면 하위 노드를 다시 실행하지 않음)
+
+        Args:
+            before (GraphState): 노드에 전달한 state 스냅샷
+            after (GraphState): 노드가 반환한 state
+
+        Returns:
+            Tuple[dict, List[str]]: (변경/추가된 키와 값, 삭제된 키 리스트)
+        """
+
+        missing = object()
+        changed = {}
+        for key, value in after.items():
+            old = before.get(key, missing)
+            if old is not value and (old is missing or old != value):
+                changed[key] = value
+        removed = [k for k in before if k not in after]
+        return changed, removed
+
+    def _ready_nodes(self, topo_order: List[str], ancestors: dict[str, Set[str]],
+                     pending: Set[str], running_names: Set[str]) -> List[str]:
+        """
+        대기 중인 노드 중 지금 실행할 수 있는 노드를 위상 정렬 순서로 반환합니다.
+
+        대기 또는 실행 중인 상위 노드가 하나도 없는 노드만 실행할 수 있습니다.
         """
-        그래프를 스트리밍 방식으로 실행합니다.
+
+        blocked = pending | running_names
+        return [n for n in topo_order if n in pending and not ancestors[n] & blocked]
+
+    def _merge(self, state: GraphState, snapshot: GraphState, result: GraphState) -> Set[str]:
+        """
+        노드 결과 중 변경된 키만 공유 state에 병합합니다.
+
+        Returns:
+            Set[str]: 변경 또는 삭제된 키 집합
+        """
+
+        changed, removed = self._diff(snapshot, result)
+        state.update(changed)
+        for key in removed:
+            state.pop(key, None)
+        return set(changed) | set(removed)
+
+    def get_dirty_region(self, node_name: str) -> Set[str]:
+        """
+        노드의 출력 변경이 전파될 수 있는 하위 노드 집합을 계산합니다.
+
+        조건부 엣지를 가진 노드까지는 포함하지만, 그 하위 노드는
+        조건부 결정으로만 실행되므로 포함하지 않습니다.
+
+        Args:
+            node_name (str): 기준 노드 이름
+
+        Returns:
+            Set[str]: 기준 노드를 제외한 전파 대상 노드 집합
+        """
+
+        region = set()
+        stack = [] if node_name in self.conditional_edges else list(self.edges.get(node_name, []))
+        while stack:
+            current = stack.pop()
+            if current in region:
+                continue
+            region.add(current)
+            if current not in self.conditional_edges:
+                stack.extend(self.edges[current])
+        return region
+
+    def _propagate(self, node_name: str, changed: Set[str], pending: Set[str]) -> None:
+        """
+        재실행된 노드가 바꾼 키를 읽는 하위 노드만 실행 대기 상태로 추가합니다.
+
+        Args:
+            node_name (str): 방금 완료된 노드 이름
+            changed (Set[str]): 노드가 변경한 state 키
+            pending (Set[str]): 실행 대기 노드 집합 (이 함수에서 갱신)
+        """
+
+        writes = getattr(self.nodes[node_name], "writes", None)
+        dirty = changed if writes is None else changed & set(writes)
+        if not dirty:
+            return
+        added = []
+        for name in self.get_dirty_region(node_name):
+            reads = getattr(self.nodes[name], "reads", None)
+            if name not in pending and (reads is None or dirty & set(reads)):
+                pending.add(name)
+                added.append(name)
+        if added:
+            print(f"   [DIRTY] {node_name} 변경 키 {sorted(dirty)} -> 재실행 대상: {added}")
+
+    def _schedule(self, target: str, pending: Set[str], completed: Set[str]) -> None:
+        """
+        분기 대상 노드를 실행 대기 상태로 추가합니다.
+
+        이미 실행된 노드로 돌아가는 경우(재시도)에는 대상 노드만 다시 실행하고,
+        이후 노드는 _propagate()가 변경된 키를 읽는 노드만 골라 재실행합니다.
+        다만 대상 노드의 출력이 바뀌지 않아도 다음 분기를 결정할 수 있도록
+        하위의 조건부 엣지 노드(supervisor)는 함께 다시 실행합니다. (상위 노드가 끝난 뒤 실행)
+        아직 실행되지 않은 노드로 진행하는 경우에는 대상 노드와 그 하위 노드를 모두 실행합니다.
+        """
+
+        if target in completed:
+            pending.add(target)
+            pending |= self.get_dirty_region(target) & set(self.conditional_edges)
+        else:
+            pending |= self._plan({target})
+
+    def _route(self, node_name: str, state: GraphState, pending: Set[str], completed: Set[str]) -> bool:
+        """
+        노드 완료 후 조건부 엣지와 롤백 요청을 처리하여 실행 대기 노드를 갱신합니다.
+
+        Args:
+            node_name (str): 방금 완료된 노드 이름
+            state (GraphState): 병합이 끝난 공유 state
+            pending (Set[str]): 실행 대기 노드 집합 (이 함수에서 갱신)
+            completed (Set[str]): 이번 실행에서 한 번 이상 완료된 노드 집합
+
+        Returns:
+            bool: FINISH 결정으로 그래프 실행을 종료해야 하면 True
+        """
+
+        # 조건부 엣지 체크: 결정이 나기 전까지 하위 노드는 실행하지 않음
+        if node_name in self.conditional_edges:
+            selector, mapping = self.conditional_edges[node_name]
+            decision = selector(state)
+            print(f"   {node_name} 조건부 결정: {decision}")
+            next_node = mapping.get(decision)
+            if next_node == "FINISH":
+                print("   FINISH 결정. 그래프 실행 종료합니다.")
+                return True
+            if next_node in self.nodes:
+                self._schedule(next_node, pending, completed)
+            else:
+                pending |= self._plan(set(self.edges[node_name]))
+
+        # 롤백 체크 (필요 시)
+        if "rollback" in state:
+            rollback_target = state["rollback"]
+            print(f"   [ROLLBACK] {rollback_target} 노드로 돌아갑니다.")
+            if rollback_target in self.nodes:
+                self._schedule(rollback_target, pending, completed)
+                del state["rollback"]
+            else:
+                print("   [ERROR] 롤백 대상 노드가 존재하지 않습니다.")
+        return False
+
+    def _cache_ttl(self, node_name: str) -> Optional[float]:
+        """
+        노드의 캐시 유효 시간을 반환합니다.
+        캐시가 없거나 reads를 선언하지 않은 노드는 입력을 알 수 없으므로 None을 반환합니다.
+        """
+
+        node = self.nodes[node_name]
+        if self.cache is None or getattr(node, "reads", None) is None:
+            return None
+        return self.cache_ttls.get(node_name, getattr(node, "cache_ttl", None))
+
+    def _store(self, node_name: str, key: str, ttl: float, before: GraphState,
+               result: GraphState, started: float) -> None:
+        """
+        노드 결과 중 변경된 키를 캐시에 저장합니다. (키를 삭제한 결과는 저장하지 않음)
+        """
+
+        changed, removed = self._diff(before, result)
+        if not removed and self.nodes[node_name].should_cache(changed):
+            self.cache.set(key, changed, ttl, time.perf_counter() - started)
+
+    @staticmethod
+    def _time_limit(node, deadline_at: Optional[float]) -> Optional[float]:
+        """
+        노드 1회 실행에 허용할 시간을 노드 제한 시간과 그래프 남은 시간 중 작은 값으로 계산합니다.
+        """
+
+        limit = getattr(node, "timeout", None)
+        if deadline_at is not None:
+            remaining = deadline_at - time.monotonic()
+            limit = remaining if limit is None else min(limit, remaining)
+        return limit
+
+    @staticmethod
+    def _fallback(node, state: GraphState, error: Exception) -> GraphState:
+        """
+        노드의 fallback()으로 대체 결과를 만듭니다. fallback()이 없는 노드는 예외를 다시 발생시킵니다.
+        """
+
+        fallback = getattr(node, "fallback", None)
+        if fallback is None:
+            raise error
+        print(f"   [FALLBACK] {node.name}: {error!r} -> 대체 결과로 진행합니다.")
+        return fallback(state, error)
+
+    def _invoke(self, node, state: GraphState, deadline_at: Optional[float],
+                span: Optional[Span] = None) -> Tuple[GraphState, bool]:
+        """
+        노드 제한 시간, 재시도 정책, 그래프 마감 시각을 적용하여 process()를 실행합니다.
+        각 시도에는 state의 새 복사본을 전달하므로 실패한 시도의 변경은 남지 않습니다.
+
+        Returns:
+            Tuple[GraphState, bool]: (결과 state, 정상 실행 여부 - fallback 결과면 False)
+        """
+
+        policy = getattr(node, "retry", None) or NO_RETRY
+        attempt = 0
+        while True:
+            attempt += 1
+            if span is not None:
+                span.set_attribute("attempts", attempt)
+            limit = self._time_limit(node, deadline_at)
+            try:
+                if limit is not None and limit <= 0:
+                    raise NodeTimeoutError(f"{node.name}: 그래프 전체 제한 시간 초과")
+                return _call_with_timeout(node.process, dict(state), limit, node.name), True
+            except Exception as e:
+                delay = policy.delay(attempt)
+                if not policy.should_retry(e, attempt) or (
+                        deadline_at is not None and time.monotonic() + delay >= deadline_at):
+                    if span is not None:
+                        span.set_attribute("fallback", repr(e))
+                    return self._fallback(node, dict(state), e), False
+                print(f"   [RETRY] {node.name} {attempt}회차 실패 ({e!r}), {delay:.1f}초 후 재시도")
+                time.sleep(delay)
+
+    async def _ainvoke(self, node, state: GraphState, deadline_at: Optional[float],
+                       span: Optional[Span] = None) -> Tuple[GraphState, bool]:
+        """
+        _invoke()의 비동기 버전입니다. 시간 초과 시 노드 코루틴을 취소합니다.
+        """
+
+        policy = getattr(node, "retry", None) or NO_RETRY
+        attempt = 0
+        while True:
+            attempt += 1
+            if span is not None:
+                span.set_attribute("attempts", attempt)
+            limit = self._time_limit(node, deadline_at)
+            try:
+                if limit is not None and limit <= 0:
+                    raise NodeTimeoutError(f"{node.name}: 그래프 전체 제한 시간 초과")
+                try:
+                    return await asyncio.wait_for(self._aprocess(node, dict(state)), limit), True
+                except asyncio.TimeoutError:
+                    raise NodeTimeoutError(f"{node.name}: {limit:.1f}초 제한 시간 초과")
+            except Exception as e:
+                delay = policy.delay(attempt)
+                if not policy.should_retry(e, attempt) or (
+                        deadline_at is not None and time.monotonic() + delay >= deadline_at):
+                    if span is not None:
+                        span.set_attribute("fallback", repr(e))
+                    return self._fallback(node, dict(state), e), False
+                print(f"   [RETRY] {node.name} {attempt}회차 실패 ({e!r}), {delay:.1f}초 후 재시도")
+                await asyncio.sleep(delay)
+
+    def _run_node(self, node_name: str, state: GraphState, bypass_cache: bool, run: _Run) -> GraphState:
+        """
+        노드를 실행합니다. 캐시에 같은 입력의 결과가 있으면 process()를 호출하지 않고
+        저장된 결과를 state에 적용합니다.
+
+        Args:
+            node_name (str): 실행할 노드 이름
+            state (GraphState): 노드에 전달할 state 복사본
+            bypass_cache (bool): True이면 캐시 조회 없이 실행 (재시도 등 명시적 재실행)
+            run (_Run): 마감 시각과 tracer 등 이번 실행의 공유 정보
+
+        Returns:
+            GraphState: 노드 실행(또는 캐시 적용, fallback) 결과
+        """
+
+        token = _deadline_at.set(run.deadline_at)
+        started = time.perf_counter()
+        self._notify_progress("node_started", run, node_name)
+        try:
+            with run.tracer.span(node_name, "node", parent=run.root) as span:
+                return self._run_cached(node_name, state, bypass_cache, run.deadline_at, span)
+        finally:
+            _deadline_at.reset(token)
+            self._notify_progress("node_finished", run, node_name, time.perf_counter() - started)
+
+    def _run_cached(self, node_name: str, state: GraphState, bypass_cache: bool,
+                    deadline_at: Optional[float], span: Span) -> GraphState:
+        node = self.nodes[node_name]
+        ttl = self._cache_ttl(node_name)
+        if ttl is None:
+            return self._invoke(node, state, deadline_at, span)[0]
+
+        key = fingerprint(node_name, node.reads, state)
+        span.set_attribute("cache", "bypass" if bypass_cache else "miss")
+        if not bypass_cache:
+            cached = self.cache.get(node_name, key)
+            if cached is not None:
+                print(f"   [CACHE HIT] {node_name}")
+                span.set_attribute("cache", "hit")
+                state.update(cached)
+                return state
+
+        started = time.perf_counter()
+        result, ok = self._invoke(node, state, deadline_at, span)
+        # fallback으로 만든 대체 결과는 캐시하지 않음
+        if ok:
+            self._store(node_name, key, ttl, state, result, started)
+        return result
+
+    async def _arun_node(self, node_name: str, state: GraphState, bypass_cache: bool, run: _Run) -> GraphState:
+        """
+        _run_node()의 비동기 버전입니다. 캐시 조회/저장은 별도 스레드에서 수행합니다.
+        (각 노드는 별도 asyncio 태스크로 실행되므로 컨텍스트 변수 설정이 다른 노드에 영향을 주지 않음)
+        """
+
+        _deadline_at.set(run.deadline_at)
+        started = time.perf_counter()
+        self._notify_progress("node_started", run, node_name)
+        try:
+            with run.tracer.span(node_name, "node", parent=run.root) as span:
+                return await self._arun_cached(node_name, state, bypass_cache, run.deadline_at, span)
+        finally:
+            self._notify_progress("node_finished", run, node_name, time.perf_counter() - started)
+
+    def _notify_progress(self, event: str, run: _Run, node_name: str, *args) -> None:
+        """
+        진행 상황 리스너를 호출합니다. 리스너 오류는 노드 실행에 영향을 주지 않도록 로그만 남깁니다.
+        """
+
+        if self.progress is None or run.run_id is None:
+            return
+        try:
+            getattr(self.progress, event)(run.run_id, node_name, *args)
+        except Exception as e:
+            print(f"[Progress] {event}({node_name}) 처리 실패: {e}")
+
+    async def _arun_cached(self, node_name: str, state: GraphState, bypass_cache: bool,
+                           deadline_at: Optional[float], span: Span) -> GraphState:
+        node = self.nodes[node_name]
+        ttl = self._cache_ttl(node_name)
+        if ttl is None:
+            return (await self._ainvoke(node, state, deadline_at, span))[0]
+
+        key = fingerprint(node_name, node.reads, state)
+        span.set_attribute("cache", "bypass" if bypass_cache else "miss")
+        if not bypass_cache:
+            cached = await asyncio.to_thread(self.cache.get, node_name, key)
+            if cached is not None:
+                print(f"   [CACHE HIT] {node_name}")
+                span.set_attribute("cache", "hit")
+                state.update(cached)
+                return state
+
+        started = time.perf_counter()
+        result, ok = await self._ainvoke(node, state, deadline_at, span)
+        if ok:
+            await asyncio.to_thread(self._store, node_name, key, ttl, state, result, started)
+        return result
+
+    def _start(self, initial_state: GraphState, run_id: Optional[str] = None) -> Tuple[
+            List[str], dict[str, Set[str]], GraphState, Set[str], Set[str], Optional[Checkpoint]]:
+        """
+        실행에 필요한 위상 정렬 순서, 상위 노드 맵, state, 실행 대기/완료 노드를 준비합니다.
+
+        체크포인트 저장소와 run_id가 주어지고 이전 기록이 있으면 기록을 재생하여
+        마지막으로 완료된 노드 이후부터 이어서 실행하도록 state와 실행 대기 노드를 복원합니다.
+        기록이 없으면 초기 state를 첫 기록으로 남깁니다.
+
+        Returns:
+            Tuple: (위상 정렬 순서, 상위 노드 맵, state, 실행 대기 노드, 완료 노드, 복원된 체크포인트)
+        """
+
+        topo_order, ancestors = self.compile()
+        checkpoint = None
+        if self.checkpointer is not None and run_id is not None:
+            checkpoint = self.checkpointer.load(run_id)
+
+        print("\n===== Graph Execution (Streaming) 시작 =====\n")
+        print("초기 위상 정렬 순서:", topo_order)
+        if checkpoint is not None:
+            state, pending, completed = checkpoint.state, checkpoint.pending, checkpoint.completed
+            print(f"[RESUME] {run_id}: {checkpoint.last_node} 이후부터 재개, 실행 대기: {sorted(pending)}")
+        else:
+            state, completed = initial_state, set()
+            pending = self._plan({n for n in topo_order if not ancestors[n]})
+            if self.checkpointer is not None and run_id is not None:
+                self.checkpointer.append(run_id, 0, CHECKPOINT_INITIAL, dict(state), [], pending, completed)
+        print("\n-------------------------------\n")
+        return topo_order, ancestors, state, pending, completed, checkpoint
+
+    def _checkpoint(self, run_id: Optional[str], seq: int, node_name: str, state: GraphState,
+                    changed: Set[str], pending: Set[str], completed: Set[str], finished: bool) -> None:
+        """
+        노드 완료 후의 실행 상태를 기록합니다. state 전체가 아닌 변경된 키의 값만 저장합니다.
+
+        Args:
+            run_id (Optional[str]): 실행 ID (None이면 기록하지 않음)
+            seq (int): 기록 번호
+            node_name (str): 완료된 노드 이름
+            state (GraphState): 병합 및 분기 처리가 끝난 공유 state
+            changed (Set[str]): 노드가 변경 또는 삭제한 키
+            pending (Set[str]): 재개 시 실행할 노드 (실행 중인 노드 포함)
+            completed (Set[str]): 완료 노드 집합
+            finished (bool): 그래프 실행 종료 여부
+        """
+
+        if self.checkpointer is None or run_id is None:
+            return
+        delta = {k: state[k] for k in changed if k in state}
+        removed = [k for k in changed if k not in state]
+        self.checkpointer.append(run_id, seq, node_name, delta, removed, pending, completed, finished)
+
+    def _new_run(self, run_id: Optional[str], checkpoint: Optional[Checkpoint]) -> _Run:
+        """
+        실행 1회의 마감 시각과 tracer, 그래프 전체 span을 준비합니다.
+        """
+
+        deadline_at = time.monotonic() + self.deadline if self.deadline is not None else None
+        tracer = Tracer(exporter=self.span_exporter)
+        root = tracer.start_span("graph.run", "graph", run_id=str(run_id) if run_id is not None else None,
+                                 resumed=checkpoint is not None)
+        return _Run(deadline_at, tracer, root, str(run_id) if run_id is not None else None)
+
+    @staticmethod
+    def _finish_run(run: _Run) -> None:
+        """
+        그래프 전체 span을 종료하고 수집한 span을 내보냅니다.
+        """
+
+        run.root.end()
+        run.tracer.flush()
+
+    @staticmethod
+    def _timing(run: _Run) -> dict:
+        """
+        실행 시간 요약을 계산하고 로그로 남깁니다.
+        """
+
+        timing = run.tracer.summary()
+        nodes = ", ".join(f"{name} {entry['seconds']:.1f}s" for name, entry in timing["nodes"].items())
+        print(f"[TIMING] 전체 {timing['total_seconds']:.1f}s | LLM {timing['llm']['calls']}회 "
+              f"{timing['llm']['seconds']:.1f}s | {nodes}")
+        return timing
+
+    def run_node(self, node_name: str, state: GraphState, run_id: Optional[str] = None) -> GraphState:
+        """
+        그래프의 노드 하나만 실행합니다.
+        다른 실행의 결과 state를 이어받아 특정 노드만 다시 계산할 때(예: 투자 성향별 최종 분석) 사용합니다.
+
+        Args:
+            node_name (str): 실행할 노드 이름
+            state (GraphState): 노드에 전달할 state (변경되지 않음)
+            run_id (Optional[str]): span에 기록할 실행 ID
+
+        Returns:
+            GraphState: 노드가 변경한 키를 병합한 새 state
+
+        Note:
+            노드의 timeout/retry/fallback, 캐시, span 기록은 그래프 실행과 같게 적용되며
+            그래프 전체 제한 시간(deadline)은 이 노드 실행에 대해 새로 계산됩니다.
+        """
+
+        run = self._new_run(run_id, None)
+        snapshot = dict(state)
+        try:
+            result = self._run_node(node_name, dict(snapshot), False, run)
+        finally:
+            self._finish_run(run)
+        merged = dict(snapshot)
+        self._merge(merged, snapshot, result)
+        return merged
+
+    def _stream(self, initial_state: GraphState,
+                run_id: Optional[str] = None) -> Iterator[Tuple[str, GraphState, Set[str]]]:
+        """
+        그래프를 스트리밍 방식으로 실행합니다. (run_stream/run_deltas가 공유하는 실행 루프)
 
         Args:
             initial_state (GraphState): 초기 상태
+            run_id (Optional[str]): 체크포인트 기록/재개에 사용할 실행 ID (워커에서는 task_id)
 
         Yields:
-            Tuple[str, GraphState]: (현재 실행 노드 이름, 현재 상태)의 튜플
+            Tuple[str, GraphState, Set[str]]: (완료된 노드 이름, 공유 state, 변경/삭제된 키)의 튜플
+            마지막으로 (GRAPH_END, state, {'run_timing'})을 yield
 
         Note:
-            - 위상 정렬 순서대로 노드를 실행
-            - 조건부 엣지에 따른 분기 처리
+            - 선행 노드가 모두 완료된 노드들을 스레드 풀에서 동시에 실행
+            - 각 노드에는 state 스냅샷의 복사본이 전달되고, 노드가 변경한 키만
+              완료 순서대로 공유 state에 병합 (병합은 이 제너레이터에서만 수행)
+            - 조건부 엣지에 따른 분기 처리 (이전 노드로의 분기 시 해당 노드와,
+              그 노드가 바꾼 키를 reads로 선언한 하위 노드만 재실행)
             - 롤백 요청 처리 ('rollback' 키가 state에 있을 경우)
+            - 캐시가 설정된 경우 reads 값이 같은 노드 결과를 재사용
+              (hit/miss 통계는 graph.cache.stats()로 확인)
+            - 노드별 timeout/retry 정책과 그래프 전체 제한 시간(deadline)을 적용하고,
+              실패한 노드는 fallback() 결과로 대체하여 실행을 이어감
+            - 체크포인트 저장소와 run_id가 주어지면 노드 완료마다 변경된 키를 기록하고,
+              이전 기록이 있으면 마지막 완료 노드를 복원된 state와 함께 먼저 yield한 뒤 이어서 실행
+            - 노드/LLM/데이터 소스 호출을 span으로 기록하고 (span_exporter로 내보냄),
+              실행이 끝나면 실행 시간 요약을 state['run_timing']에 기록
         """
         
-        topo_order = self.get_topological_order()
-        current_index = 0
-        state = initial_state
+        topo_order, ancestors, state, pending, completed, checkpoint = self._start(initial_state, run_id)
+        run = self._new_run(run_id, checkpoint)
+        running = {}
+        finished = checkpoint.finished if checkpoint else False
+        seq = checkpoint.seq if checkpoint else 0
+        if checkpoint is not None and checkpoint.last_node != CHECKPOINT_INITIAL:
+            yield checkpoint.last_node, state, set(state)
 
-        print("\n===== Graph Execution (Streaming) 시작 =====\n")
-        print("초기 위상 정렬 순서:", topo_order)
-        print("\n-------------------------------\n")
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            while (pending or running) and not finished:
+                running_names = {name for name, _ in running.values()}
+                for node_name in self._ready_nodes(topo_order, ancestors, pending, running_names):
+                    print(f"==> 노드 실행: {node_name}")
+                    snapshot = dict(state)
+                    # 이미 완료된 노드의 재실행(재시도)은 캐시를 거치지 않음
+                    future = executor.submit(
+                        self._run_node, node_name, dict(snapshot), node_name in completed, run)
+                    running[future] = (node_name, snapshot)
+                    pending.discard(node_name)
+
+                if not running:
+                    print("   [ERROR] 실행 가능한 노드가 없습니다.")
+                    break
 
-        while current_index < len(topo_order):
-            node_name = topo_order[current_index]
-            node = self.nodes[node_name]
-            print(f"==> 노드 실행: {node_name}")
-            state = node.process(state)
-            print(f"   {node_name} 완료. 현재 state keys: {list(state.keys())}")
-            yield node_name, state
-
-            # 조건부 엣지 체크
-            if node_name in self.conditional_edges:
-                selector, mapping = self.conditional_edges[node_name]
-                decision = selector(state)
-                print(f"   {node_name} 조건부 결정: {decision}")
-                if decision in mapping:
-                    next_node = mapping[decision]
-                    if next_node == "FINISH":
-                        print("   FINISH 결정. 그래프 실행 종료합니다.")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: topo_order.index(running[f][0])):
+                    node_name, snapshot = running.pop(future)
+                    changed = self._merge(state, snapshot, future.result())
+                    completed.add(node_name)
+                    print(f"   {node_name} 완료. 현재 state keys: {list(state.keys())}")
+                    self._propagate(node_name, changed, pending)
+                    finished = self._route(node_name, state, pending, completed)
+                    remaining = pending | {name for name, _ in running.values()}
+                    seq += 1
+                    self._checkpoint(run_id, seq, node_name, state, changed, remaining, completed,
+                                     finished or not remaining)
+                    # 라우팅(롤백 키 삭제 등)까지 반영된 뒤 내보냄
+                    yield node_name, state, changed
+                    if finished:
                         break
-                    if next_node in topo_order:
-                        current_index = topo_order.index(next_node)
-                        continue
-
-            # 롤백 체크 (필요 시)
-            if "rollback" in state:
-                rollback_target = state["rollback"]
-                print(f"   [ROLLBACK] {rollback_target} 노드로 돌아갑니다.")
-                if rollback_target in topo_order:
-                    current_index = topo_order.index(rollback_target)
-                    del state["rollback"]
-                    continue
-                else:
-                    print("   [ERROR] 롤백 대상 노드가 존재하지 않습니다.")
-            current_index += 1
+        finally:
+            # FINISH 결정 또는 예외 시 아직 실행되지 않은 노드는 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._finish_run(run)
 
+        state["run_timing"] = self._timing(run)
         print("\n===== Graph Execution 종료 =====\n")
-        return state
+        yield GRAPH_END, state, {"run_timing"}
+
+    def run_stream(self, initial_state: GraphState,
+                   run_id: Optional[str] = None) -> Iterator[Tuple[str, GraphState]]:
+        """
+        그래프를 스트리밍 방식으로 실행합니다.
+
+        Args:
+            initial_state (GraphState): 초기 상태
+            run_id (Optional[str]): 체크포인트 기록/재개에 사용할 실행 ID (워커에서는 task_id)
+
+        Yields:
+            Tuple[str, GraphState]: (현재 실행 노드 이름, 현재 상태)의 튜플
+
+        Note:
+            yield되는 state는 실행 중 계속 갱신되는 공유 객체입니다.
+            노드별 결과를 보관하려면 복사하지 말고 run_deltas()를 사용하세요.
+        """
+
+        for node_name, state, _ in self._stream(initial_state, run_id):
+            if node_name != GRAPH_END:
+                yield node_name, state
+
+    def run_deltas(self, initial_state: GraphState,
+                   run_id: Optional[str] = None) -> Iterator[StateDelta]:
+        """
+        그래프를 실행하며 노드가 완료될 때마다 변경된 키만 담은 StateDelta를 yield합니다.
+
+        Args:
+            initial_state (GraphState): 초기 상태
+            run_id (Optional[str]): 체크포인트 기록/재개에 사용할 실행 ID
+
+        Yields:
+            StateDelta: 노드별 변경분 (체크포인트에서 재개한 경우 첫 이벤트는 복원된 state 전체),
+            마지막 이벤트는 run_timing을 담은 GRAPH_END
+
+        Example:
+            >>> state = dict(initial_state)
+            >>> for delta in graph.run_deltas(initial_state):
+            ...     delta.apply(state)
+        """
+
+        for version, (node_name, state, keys) in enumerate(self._stream(initial_state, run_id), 1):
+            yield StateDelta.from_keys(node_name, version, state, keys)
+
+    async def _astream(self, initial_state: GraphState,
+                       run_id: Optional[str] = None) -> AsyncIterator[Tuple[str, GraphState, Set[str]]]:
+        """
+        그래프를 하나의 이벤트 루프 위에서 비동기 스트리밍 방식으로 실행합니다.
+        (arun_stream/arun_deltas가 공유하는 실행 루프)
+
+        run_stream과 같은 스케줄링 규칙을 따르되, 노드의 aprocess() 코루틴을
+        asyncio 태스크로 동시에 실행하므로 FastAPI 등 실행 중인 이벤트 루프에서
+        여러 그래프를 동시에 구동할 수 있습니다.
+
+        Args:
+            initial_state (GraphState): 초기 상태
+            run_id (Optional[str]): 체크포인트 기록/재개에 사용할 실행 ID
+
+        Yields:
+            Tuple[str, GraphState, Set[str]]: (완료된 노드 이름, 공유 state, 변경/삭제된 키)의 튜플
+            마지막으로 (GRAPH_END, state, {'run_timing'})을 yield
+        """
+
+        topo_order, ancestors, state, pending, completed, checkpoint = await asyncio.to_thread(
+            self._start, initial_state, run_id)
+        run = self._new_run(run_id, checkpoint)
+        running = {}
+        finished = checkpoint.finished if checkpoint else False
+        seq = checkpoint.seq if checkpoint else 0
+        if checkpoint is not None and checkpoint.last_node != CHECKPOINT_INITIAL:
+            yield checkpoint.last_node, state, set(state)
+
+        try:
+            while (pending or running) and not finished:
+                running_names = {name for name, _ in running.values()}
+                for node_name in self._ready_nodes(topo_order, ancestors, pending, running_names):
+                    print(f"==> 노드 실행: {node_name}")
+                    snapshot = dict(state)
+                    # 이미 완료된 노드의 재실행(재시도)은 캐시를 거치지 않음
+                    task = asyncio.ensure_future(
+                        self._arun_node(node_name, dict(snapshot), node_name in completed, run))
+                    running[task] = (node_name, snapshot)
+                    pending.discard(node_name)
+
+                if not running:
+                    print("   [ERROR] 실행 가능한 노드가 없습니다.")
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: topo_order.index(running[t][0])):
+                    node_name, snapshot = running.pop(task)
+                    changed = self._merge(state, snapshot, task.result())
+                    completed.add(node_name)
+                    print(f"   {node_name} 완료. 현재 state keys: {list(state.keys())}")
+                    self._propagate(node_name, changed, pending)
+                    finished = self._route(node_name, state, pending, completed)
+                    remaining = pending | {name for name, _ in running.values()}
+                    seq += 1
+                    await asyncio.to_thread(self._checkpoint, run_id, seq, node_name, state, changed,
+                                            remaining, completed, finished or not remaining)
+                    # 라우팅(롤백 키 삭제 등)까지 반영된 뒤 내보냄
+                    yield node_name, state, changed
+                    if finished:
+                        break
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.to_thread(self._finish_run, run)
+
+        state["run_timing"] = self._timing(run)
+        print("\n===== Graph Execution 종료 =====\n")
+        yield GRAPH_END, state, {"run_timing"}
+
+    async def arun_stream(self, initial_state: GraphState,
+                          run_id: Optional[str] = None) -> AsyncIterator[Tuple[str, GraphState]]:
+        """
+        그래프를 비동기 스트리밍 방식으로 실행합니다. (run_stream의 비동기 버전)
+
+        Args:
+            initial_state (GraphState): 초기 상태
+            run_id (Optional[str]): 체크포인트 기록/재개에 사용할 실행 ID
+
+        Yields:
+            Tuple[str, GraphState]: (현재 실행 노드 이름, 현재 상태)의 튜플
+        """
+
+        async for node_name, state, _ in self._astream(initial_state, run_id):
+            if node_name != GRAPH_END:
+                yield node_name, state
+
+    async def arun_deltas(self, initial_state: GraphState,
+                          run_id: Optional[str] = None) -> AsyncIterator[StateDelta]:
+        """
+        그래프를 비동기로 실행하며 노드별 StateDelta를 yield합니다. (run_deltas의 비동기 버전)
+
+        Args:
+            initial_state (GraphState): 초기 상태
+            run_id (Optional[str]): 체크포인트 기록/재개에 사용할 실행 ID
+
+        Yields:
+            StateDelta: 노드별 변경분, 마지막 이벤트는 run_timing을 담은 GRAPH_END
+        """
+
+        version = 0
+        async for node_name, state, keys in self._astream(initial_state, run_id):
+            version += 1
+            yield StateDelta.from_keys(node_name, version, state, keys)
+
+    @staticmethod
+    async def _aprocess(node: Node, state: GraphState) -> GraphState:
+        """
+        노드를 비동기로 실행합니다. aprocess()가 없는 노드(START/END 등)는
+        process()를 별도 스레드에서 실행합니다.
+        """
+
+        if hasattr(node, "aprocess"):
+            return await node.aprocess(state)
+        return await asyncio.to_thread(node.process, state)
@@ -5,7 +5,7 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlmodel import Session, select
 from app.db.session import get_db, engine
 from app.schemas.invest_task import InvestTask, InvestTaskCreate, InvestTaskDetailedResponse, AgentMessage
-from app.graph import run_graph  # run_graph 함수 임포트
+from app.graph import run_graph, apply_deltas  # run_graph 함수 임포트
 
 router = APIRouter()
 
@@ -36,19 +36,18 @@ def create_invest_task(
         "company_code": new_task.company_code
     }
     
-    # 3. run_graph 함수를 동기적으로 호출하여 각 에이전트의 실행 단계별 상태(중간 메시지)를 수집
-    #    run_graph는 [(node_name, state), ...] 형태의 리스트를 반환합니다.
+    # 3. run_graph 함수를 동기적으로 호출하여 각 에이전트의 실행 단계별 변경분(StateDelta)을 수집
+    #    run_graph는 [StateDelta, ...] 형태의 리스트를 반환합니다.
     steps = run_graph(initial_state)
     
     # 4. 각 단계에서 해당 에이전트의 상태 메시지를 추출하여 messages 리스트를 구성합니다.
     messages = []
-    for node_name, state in steps:
-        # 각 에이전트는 자신의 이름을 키로 하여 status_message를 state에 기록했다고 가정합니다.
-        msg =f"{node_name}가 작업을 진행중 입니다."
-        messages.append(AgentMessage(agent=node_name, message=msg))
+    for delta in steps:
+        msg =f"{delta.node}가 작업을 진행중 입니다."
+        messages.append(AgentMessage(agent=delta.node, message=msg))
     
-    # 5. 최종 단계의 상태를 가져옵니다.
-    final_state = steps[-1][1] if steps else {}
+    # 5. 변경분을 순서대로 적용하여 최종 상태를 복원합니다.
+    final_state = apply_deltas(steps, initial_state)
     final_status = final_state
     
     # 7. 구성된 응답 반환: user_id, task_id, 각 에이전트의 메시지 리스트, 최종 상태
@@ -68,7 +67,7 @@ from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
 from app.db.session import get_db, engine
 from app.schemas.invest_task import InvestTask, InvestTaskCreate, InvestTaskMinimalResponse
-from app.graph import run_graph  # 각 에이전트의 중간 상태를 yield하는 run_graph 함수
+from app.graph import run_graph, apply_deltas  # 각 에이전트의 변경분(StateDelta)을 반환하는 run_graph 함수
 
 router = APIRouter()
 
@@ -90,7 +89,7 @@ def process_invest_task(task_id: str) -> None:
     # 예시: run_graph를 호출한 후 최종 상태로 DB 업데이트
     intermediate_steps = run_graph({})  # 이 함수는 별도로 호출하지 않고, 스트리밍 응답에서 처리할 수도 있습니다.
     if intermediate_steps:
-        final_state = intermediate_steps[-1][1]
+        final_state = apply_deltas(intermediate_steps)
         final_status = final_state.get("final_report", "unknown")
         final_message = final_state.get("integrated_report", "Final report generated")
         update_task_status(task_id, final_status, final_message)
@@ -124,7 +123,10 @@ async def create_invest_task_stream(
     
     def event_generator():
 
-        for node_name, state in run_graph(initial_state):
+        state = dict(initial_state)
+        for delta in run_graph(initial_state):
+            node_name = delta.node
+            delta.apply(state)
             # 각 에이전트가 작업할 때마다, 해당 에이전트의 상태 메시지와 상태를 추출합니다.
             try:
                 message = f"{node_name}가 작업을 진행중 입니다."
@@ -1,9 +1,9 @@
-import time
+import asyncio
 from fastapi import APIRouter, Depends
 from sqlmodel import Session, select
 from app.db.session import get_db, engine
 from app.schemas.invest_task import InvestTask, InvestTaskCreate, InvestTaskMinimalResponse
-from app.graph import run_graph
+from app.graph import arun_graph
 
 router = APIRouter()
 
@@ -17,13 +17,13 @@ def update_task_status(task_id: str, status: str, status_message: str):
             db.commit()
 
 @router.post("/", response_model=InvestTaskMinimalResponse)
-def no_stream_invest_task(
+async def no_stream_invest_task(
     task_in: InvestTaskCreate,
     db: Session = Depends(get_db)
 ):
     """
     1) invest_task 레코드 생성
-    2) run_graph 동기 실행 -> 각 단계에서 status 업데이트
+    2) arun_graph 비동기 실행 -> 각 단계에서 status 업데이트
     3) 최종 완료 후 user_id, task_id, status 반환
     """
     # 1. invest_task 생성
@@ -39,22 +39,21 @@ def no_stream_invest_task(
     db.commit()
     db.refresh(new_task)
 
-    # 2. run_graph 실행
+    # 2. arun_graph 실행 (이벤트 루프를 막지 않음)
     initial_state = {
         "company_name": new_task.company_name,
         "investment_persona": new_task.invest_type
     }
-    steps = run_graph(initial_state)
 
-    for node_name, state in steps:
-        # 중간 상태 가져오기
-        s_msg = state.get(f"{node_name}_status_message", "No message")
-        s_val = state.get(f"{node_name}_status", "inprogress")
+    async for delta in arun_graph(initial_state):
+        # 노드가 바꾼 키에서 중간 상태 가져오기
+        s_msg = delta.changed.get(f"{delta.node}_status_message", "No message")
+        s_val = delta.changed.get(f"{delta.node}_status", "inprogress")
         # 마지막 노드면 성공 처리
-        if node_name == "FinalAnalysisAgent":
+        if delta.node == "FinalAnalysisAgent":
             s_val = "success"
             s_msg = "최종 리포트 생성 완료"
-        update_task_status(new_task.task_id, s_val, s_msg)
+        await asyncio.to_thread(update_task_status, new_task.task_id, s_val, s_msg)
 
     # 최종 상태 DB 조회
     db.refresh(new_task)
@@ -1,9 +1,9 @@
 # app/api/v1/report/stream_invest.py
-import time
 import json
+import asyncio
 from fastapi import APIRouter, Query
 from fastapi.responses import StreamingResponse
-from app.graph import run_graph
+from app.graph import arun_graph
 
 router = APIRouter()
 
@@ -22,17 +22,19 @@ async def stream_invest(
             "company_name": target_company,
             "investment_persona": persona
         }
-        steps = run_graph(initial_state)
-        for node_name, state in steps:
-            msg = state.get(f"{node_name}_status_message", "No message")
-            st = state.get(f"{node_name}_status", "inprogress")
+        async for delta in arun_graph(initial_state):
+            # 노드가 바꾼 키(delta)만 전송
+            msg = delta.changed.get(f"{delta.node}_status_message", "No message")
+            st = delta.changed.get(f"{delta.node}_status", "inprogress")
             data = {
-                "agent": node_name,
+                "agent": delta.node,
                 "message": msg,
-                "status": st
+                "status": st,
+                "version": delta.version,
+                "changed_keys": list(delta.changed),
             }
             yield f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
-            time.sleep(1)  # Optional delay
+            await asyncio.sleep(1)  # Optional delay
 
         # 최종 단계 완료 시 추가 메시지
         yield "data: {\"message\": \"All steps completed.\"}\n\n"
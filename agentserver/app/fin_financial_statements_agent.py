@@ -1,4 +1,4 @@
-import time
+import asyncio
 from dotenv import load_dotenv
 
 import yfinance as yf
@@ -7,7 +7,7 @@ from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
 # LangGraph_base에서 Node, GraphState import (에이전트 구조)
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, run_sync
 
 
 class FinancialStatementsAnalysisAgent(Node):
@@ -166,13 +166,13 @@ class FinancialStatementsAnalysisAgent(Node):
         except Exception as e:
             return f"데이터 조회 중 오류 발생: {e}"
 
-    def format_financial_statements(self, fs_data: dict) -> str:
+    def format_financial_statements(self, fs_data: dict, company_name: str) -> str:
         """
         재무 비율(또는 재무제표) 데이터를 문자열로 가공.
         현재 구조는 '연도'별 정보가 key가 되어 있으며,
         그 내부에 각 재무 항목(부채비율, ROE 등)이 담겨 있음.
         """
-        formatted = f"기업명: {self.current_company}\n"
+        formatted = f"기업명: {company_name}\n"
 
         for year, values in fs_data.items():
             formatted += f"\n[연도: {year}]\n"
@@ -181,7 +181,7 @@ class FinancialStatementsAnalysisAgent(Node):
 
         return formatted
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph 노드 인터페이스 구현:
         1) state에서 company_name 가져옴
@@ -192,13 +192,12 @@ class FinancialStatementsAnalysisAgent(Node):
         print(f"[{self.name}] process() 호출")
 
         company = state.get("company_name", "Unknown")
-        self.current_company = company  # 문자열 포맷팅에 사용
 
         # 간단히 'fs_query' 같은 질의키를 사용하거나, 고정된 질문 사용 가능
         question = "위 재무제표를 기반으로 투자 의견을 제시해주세요."
 
         # 1) 재무제표(또는 비율) 데이터 수집
-        fs_data = self.fetch_financial_ratios(company)
+        fs_data = await asyncio.to_thread(self.fetch_financial_ratios, company)
 
         # 데이터가 문자열(에러 메시지)인지 여부 확인
         if isinstance(fs_data, str):
@@ -207,10 +206,10 @@ class FinancialStatementsAnalysisAgent(Node):
             return state
 
         # 2) 문자열로 포맷
-        formatted_fs = self.format_financial_statements(fs_data)
+        formatted_fs = self.format_financial_statements(fs_data, company)
 
         # 3) LLM 분석
-        final_answer = self.final_answer_chain.invoke({
+        final_answer = await self.final_answer_chain.ainvoke({
             "fs_data": formatted_fs,
             "question": question
         })
@@ -218,9 +217,13 @@ class FinancialStatementsAnalysisAgent(Node):
         # 4) 결과 저장 (예: 'financial_statements_report' 키)
         state["fin_statements_report"] = final_answer.content
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
         return state
 
+    def process(self, state: GraphState) -> GraphState:
+        """aprocess()를 동기 방식으로 실행하는 adapter"""
+        return run_sync(self.aprocess(state))
+
 
 if __name__ == "__main__":
     # standalone 테스트 예시
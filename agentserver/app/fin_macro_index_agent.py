@@ -1,16 +1,16 @@
 # fin_macro_index_agent.py
 
 import requests
+import httpx
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI 
 from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
-import time
 import asyncio
 
 # LangGraph의 Node와 GraphState 타입을 사용
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, run_sync
 
 class MacroeconomicAnalysisAgent(Node):
     def __init__(self, name: str) -> None:
@@ -72,6 +72,27 @@ class MacroeconomicAnalysisAgent(Node):
             print(f"데이터 수집 오류: {e}")
             return {}
 
+    async def aget_market_data(self) -> dict:
+        """시장 데이터 비동기 수집 함수 (섹션별 페이지를 동시에 요청)"""
+        urls = {
+            'main': "https://m.stock.naver.com/marketindex/home/major/exchange/bond",
+            'bond': "https://m.stock.naver.com/marketindex/home/bondAndInterest/bond/USA",
+            'energy': "https://m.stock.naver.com/marketindex/home/energy",
+            'metals': "https://m.stock.naver.com/marketindex/home/metals",
+            'agri': "https://m.stock.naver.com/marketindex/home/agricultural"
+        }
+        try:
+            async with httpx.AsyncClient(timeout=10.0) as client:
+                responses = await asyncio.gather(*(client.get(url) for url in urls.values()))
+            soups = {}
+            for key, response in zip(urls, responses):
+                response.raise_for_status()
+                soups[key] = BeautifulSoup(response.text, 'html.parser')
+            return self._parse_market_data(soups)
+        except httpx.HTTPError as e:
+            print(f"데이터 수집 오류: {e}")
+            return {}
+
     def _parse_market_data(self, soups: dict) -> dict:
         """파싱된 데이터에서 필요한 정보 추출"""
         data = {}
@@ -116,7 +137,7 @@ class MacroeconomicAnalysisAgent(Node):
 
     async def analyze_macro(self, query: str) -> str:
         """비동기 분석 실행 함수"""
-        market_data = self.get_market_data()
+        market_data = await self.aget_market_data()
         if not market_data:
             return "시장 데이터를 가져오는데 실패했습니다."
             
@@ -129,9 +150,9 @@ class MacroeconomicAnalysisAgent(Node):
 
     def run(self, query: str) -> str:
         """동기식 실행을 위한 wrapper 함수"""
-        return asyncio.run(self.analyze_macro(query))
+        return run_sync(self.analyze_macro(query))
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph에서 호출되는 메인 함수.
         state에서 'macro_question'을 받아 분석 후, 결과를 state['macro_report']에 저장
@@ -144,15 +165,18 @@ class MacroeconomicAnalysisAgent(Node):
             "현재 거시경제 지표들이 한국 주식 시장에 미치는 영향을 분석하고, 투자 전략을 제시해주세요."
         )
 
-        # 비동기 함수 호출을 동기 방식으로 처리
-        analysis_result = asyncio.run(self.analyze_macro(query))
+        analysis_result = await self.analyze_macro(query)
 
         # 분석 결과를 state에 저장
         state["macro_report"] = analysis_result
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
         return state
 
+    def process(self, state: GraphState) -> GraphState:
+        """aprocess()를 동기 방식으로 실행하는 adapter"""
+        return run_sync(self.aprocess(state))
+
 
 if __name__ == "__main__":
     # standalone 테스트
@@ -1,6 +1,7 @@
 import os
-import time
+import asyncio
 import feedparser
+import httpx
 from urllib.parse import quote
 from dotenv import load_dotenv
 
@@ -9,7 +10,7 @@ from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
 # LangGraph의 기본 클래스와 상태 타입 (파일명이 LangGraph_base.py)
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, run_sync
 
 class GoogleNewsFetcher:
     """
@@ -21,6 +22,17 @@ class GoogleNewsFetcher:
 
     def _fetch_news(self, url: str, k: int = 3) -> list:
         news_data = feedparser.parse(url)
+        return self._parse_entries(news_data, k)
+
+    async def _afetch_news(self, url: str, k: int = 3) -> list:
+        """RSS 피드를 비동기 HTTP 클라이언트로 내려받아 뉴스 항목을 가져옵니다."""
+        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+        news_data = feedparser.parse(response.text)
+        return self._parse_entries(news_data, k)
+
+    def _parse_entries(self, news_data, k: int) -> list:
         entries = news_data.entries[:k]
         result = []
         for entry in entries:
@@ -45,13 +57,19 @@ class GoogleNewsFetcher:
             })
         return result
 
-    def fetch_news_by_keyword(self, keyword: str, k: int = 3) -> list:
+    def _build_url(self, keyword: str) -> str:
         if keyword:
             encoded_keyword = quote(keyword)
-            url = f"{self.base_url}/search?q={encoded_keyword}&hl=ko&gl=KR&ceid=KR:ko"
-        else:
-            url = f"{self.base_url}?hl=ko&gl=KR&ceid=KR:ko"
-        news_list = self._fetch_news(url, k)
+            return f"{self.base_url}/search?q={encoded_keyword}&hl=ko&gl=KR&ceid=KR:ko"
+        return f"{self.base_url}?hl=ko&gl=KR&ceid=KR:ko"
+
+    def fetch_news_by_keyword(self, keyword: str, k: int = 3) -> list:
+        news_list = self._fetch_news(self._build_url(keyword), k)
+        return self._collect_news(news_list)
+
+    async def afetch_news_by_keyword(self, keyword: str, k: int = 3) -> list:
+        """fetch_news_by_keyword()의 비동기 버전"""
+        news_list = await self._afetch_news(self._build_url(keyword), k)
         return self._collect_news(news_list)
 
 class NewsAnalysisAgent(Node):
@@ -105,26 +123,30 @@ class NewsAnalysisAgent(Node):
             formatted += (f"{idx}. {news['title']} (발행일: {news['published']})\n")
         return formatted
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         print(f"[{self.name}] process() 호출")
         # state에서 'company_name'을 뉴스 검색 키워드로 사용
         company = state.get("company_name", "Unknown")
         # 특정 기업 관련 최신 뉴스 10개를 불러옴
-        news_items = self.news_fetcher.fetch_news_by_keyword(company, k=10)
+        news_items = await self.news_fetcher.afetch_news_by_keyword(company, k=10)
         formatted_news = self.format_news_data(news_items)
         state["news_report"] = formatted_news  # 뉴스 원시 데이터 저장
 
         # LLM을 통한 뉴스 분석 실행
         query = f"해당 뉴스 데이터가 {company} 주식 시장에 미치는 영향과 투자 전략에 대해 분석해주세요."
-        final_answer = self.final_answer_chain.invoke({
+        final_answer = await self.final_answer_chain.ainvoke({
             "news_data": formatted_news,
             "query": query
         })
         state["news_report"] = final_answer.content
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
         return state
 
+    def process(self, state: GraphState) -> GraphState:
+        """aprocess()를 동기 방식으로 실행하는 adapter"""
+        return run_sync(self.aprocess(state))
+
 if __name__ == "__main__":
     agent = NewsAnalysisAgent("NewsAnalysisAgent")
     test_query = "해당 기업의 뉴스가 주식시장에 미치는 영향 분석"
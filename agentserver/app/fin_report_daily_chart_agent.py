@@ -1,5 +1,4 @@
 import os
-import time
 import asyncio
 from typing import Optional, Dict, Any
 import pandas as pd
@@ -14,7 +13,7 @@ from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
 # LangGraph_base: Node, GraphState 사용
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, run_sync
 
 load_dotenv()  # .env 파일에서 환경 변수 로드
 
@@ -200,8 +199,11 @@ class DailyChartAnalysisAgent(Node):
         code = self.target_stocks[company_name]
         print(f"\n=== {company_name}({code}) 분석 시작 ===")
 
-        daily_data = self.get_daily_data(code)
-        monthly_data = self.get_monthly_data(code)
+        # mojito는 동기 라이브러리이므로 별도 스레드에서 동시에 조회
+        daily_data, monthly_data = await asyncio.gather(
+            asyncio.to_thread(self.get_daily_data, code),
+            asyncio.to_thread(self.get_monthly_data, code),
+        )
 
         if not daily_data or not monthly_data:
             return "데이터 조회 실패"
@@ -222,10 +224,10 @@ class DailyChartAnalysisAgent(Node):
 
     def run(self, company_name: str, question: str = "차트 분석을 요청합니다.") -> str:
         """standalone 실행 함수"""
-        return asyncio.run(self.analyze_stock(company_name, question))
+        return run_sync(self.analyze_stock(company_name, question))
 
-    # LangGraph 용 process(state) 메서드 추가
-    def process(self, state: GraphState) -> GraphState:
+    # LangGraph 용 aprocess(state) 메서드
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph에서 호출되는 메인 함수.
         state에서 'company_name'을 받아 종목 분석 후, 결과를 state['daily_chart_report']에 저장.
@@ -235,15 +237,18 @@ class DailyChartAnalysisAgent(Node):
         company = state.get("company_name", "LG화학")
         question = state.get("chart_question", "차트 분석을 요청합니다.")
 
-        # 비동기 함수 호출을 동기 방식으로 처리
-        analysis_result = asyncio.run(self.analyze_stock(company, question))
+        analysis_result = await self.analyze_stock(company, question)
 
         # 분석 결과를 state에 저장
         state["daily_chart_report"] = analysis_result
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
         return state
 
+    def process(self, state: GraphState) -> GraphState:
+        """aprocess()를 동기 방식으로 실행하는 adapter"""
+        return run_sync(self.aprocess(state))
+
 
 if __name__ == "__main__":
     # standalone 테스트
@@ -1,14 +1,15 @@
 # fin_reports_analysis_agent.py
 
 import os
+import asyncio
 import requests
+import httpx
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI 
 from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
-import time
 
-from LangGraph_base import Node, GraphState 
+from LangGraph_base import Node, GraphState, run_sync
 
 class FinancialReportsAnalysisAgent(Node):
     def __init__(self, name: str) -> None:
@@ -51,7 +52,19 @@ class FinancialReportsAnalysisAgent(Node):
         except Exception as e:
             return f"API 호출 중 오류 발생: {e}"
 
-    def process(self, state: GraphState) -> GraphState:
+    async def acall_financial_api(self, query: str) -> str:
+        """call_financial_api()의 비동기 버전"""
+        api_url = os.getenv("FINANCIAL_API_URL", "http://localhost:8000/api/query")
+        try:
+            async with httpx.AsyncClient(timeout=25) as client:
+                response = await client.post(api_url, json={"query": query})
+                response.raise_for_status()
+                result = response.json()
+            return result.get("answer", "답변이 존재하지 않습니다.")
+        except Exception as e:
+            return f"API 호출 중 오류 발생: {e}"
+
+    async def aprocess(self, state: GraphState) -> GraphState:
         ## 기업명 state: company_name 입력 -> LLM으로 query 생성 -> query 입력  
         print(f"[{self.name}] process() 호출")
         query = state.get("financial_query", "")
@@ -59,12 +72,16 @@ class FinancialReportsAnalysisAgent(Node):
             state["financial_report"] = "재무 분석 쿼리가 없습니다."
             return state
         
-        api_context = self.call_financial_api(query)
-        final_answer = self.final_answer_chain.invoke({"context": api_context, "question": query})
+        api_context = await self.acall_financial_api(query)
+        final_answer = await self.final_answer_chain.ainvoke({"context": api_context, "question": query})
         state["financial_report"] = final_answer.content
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
         return state
 
+    def process(self, state: GraphState) -> GraphState:
+        """aprocess()를 동기 방식으로 실행하는 adapter"""
+        return run_sync(self.aprocess(state))
+
 if __name__ == "__main__":
     agent = FinancialReportsAnalysisAgent("FinancialReportsAnalysisAgent")
     test_query = " 전문가에 대한 기업 분석 의견...  정보성 있을지 "
@@ -3,7 +3,7 @@
 import os
 import requests
 import re
-import time
+import asyncio
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
@@ -15,7 +15,7 @@ from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
 # LangGraph
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, run_sync
 
 class InvestmentEvaluation(BaseModel):
     recommendation: Literal["매수", "매도", "관망"] = Field(
@@ -65,7 +65,7 @@ class FinalAnalysisAgent(Node):
             return match.group(1)
         return raw_response
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph에서 호출되는 메서드.
         1) company_name, integrated_report, (선택) user_persona 등 읽기
@@ -90,7 +90,7 @@ class FinalAnalysisAgent(Node):
             )
             
             # 모델 호출
-            response = self.llm(prompt_content)
+            response = await self.llm.ainvoke(prompt_content)
             raw_response = response.content if hasattr(response, "content") else response
 
             try:
@@ -109,7 +109,7 @@ class FinalAnalysisAgent(Node):
                                     f"자산 배분 제안: {final_output['weights']}"
                 state["final_report"] = final_report_text
 
-                time.sleep(0.5)
+                await asyncio.sleep(0.5)
                 return state
 
             except Exception as e:
@@ -124,6 +124,10 @@ class FinalAnalysisAgent(Node):
 
         return state
 
+    def process(self, state: GraphState) -> GraphState:
+        """aprocess()를 동기 방식으로 실행하는 adapter"""
+        return run_sync(self.aprocess(state))
+
 
 if __name__ == "__main__":
     agent = FinalAnalysisAgent("FinalAnalysisAgent")
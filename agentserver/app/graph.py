@@ -1,4 +1,4 @@
-from app.langgraph_base import Graph, GraphState
+from app.langgraph_base import Graph, GraphState, StateDelta
 from app.fin_financial_statements_agent import FinancialStatementsAnalysisAgent
 from app.fin_news_analysis_agent import NewsAnalysisAgent
 from app.fin_macro_index_agent import MacroeconomicAnalysisAgent
@@ -6,12 +6,15 @@ from app.fin_reports_analysis_agent import FinancialReportsAnalysisAgent
 from app.fin_report_daily_chart_agent import DailyChartAnalysisAgent
 from app.report_integration_agent import ReportIntegrationNode  # 수정 예정
 from app.final_analysis_agent import FinalAnalysisAgent  # 수정 예정
-from typing import List, Tuple
+from graph_registry import registry
+from typing import AsyncIterator, Iterable, List
 
-def run_graph(initial_state: GraphState) -> List[Tuple[str, GraphState]]:
+# API 서버가 graph_registry에 등록하는 그래프 이름 (워커의 "report" 그래프와 구분)
+APP_GRAPH = "app_report"
+
+def build_graph() -> Graph:
     """
-    langgraph_base.py의 Graph를 생성, 각 노드(에이전트)를 추가하고,
-    edges를 연결한 후 run_stream(initial_state) 결과를 모두 수집하여 반환.
+    langgraph_base.py의 Graph를 생성, 각 노드(에이전트)를 추가하고 edges를 연결하여 반환.
     """
     graph = Graph()
 
@@ -35,17 +38,48 @@ def run_graph(initial_state: GraphState) -> List[Tuple[str, GraphState]]:
     graph.add_edge("FinancialReportsAnalysisAgent", "DailyChartAnalysisAgent")
     graph.add_edge("DailyChartAnalysisAgent", "ReportIntegrationNode")
     graph.add_edge("ReportIntegrationNode", "FinalAnalysisAgent")
+    return graph
+
+
+# 요청마다 에이전트(LLM 클라이언트, 증권사 API 로그인 등)를 새로 만들지 않도록 프로세스당 한 번만 생성하여 공유
+registry.register(APP_GRAPH, build_graph)
+
+
+def run_graph(initial_state: GraphState) -> List[StateDelta]:
+    """
+    build_graph()로 만든 그래프의 run_deltas(initial_state) 결과를 모두 수집하여 반환.
+    노드마다 state 전체를 복사하지 않고 바뀐 키만 보관하므로, 최종 state는 apply_deltas()로 복원.
+    """
+    graph = registry.get(APP_GRAPH)
 
-    intermediate_steps: List[Tuple[str, GraphState]] = []
-    for node_name, state in graph.run_stream(initial_state):
-        # 여기에서 node_name, state를 통해 중간 정보를 확인하거나 DB 업데이트 가능
-        print(f"Node {node_name} completed.")
-        msg = state.get(f"{node_name}_status_message", "N/A")
-        st = state.get(f"{node_name}_status", "N/A")
+    deltas: List[StateDelta] = []
+    for delta in graph.run_deltas(initial_state):
+        # 여기에서 delta.changed를 통해 중간 정보를 확인하거나 DB 업데이트 가능
+        print(f"Node {delta.node} completed. (version {delta.version})")
+        msg = delta.changed.get(f"{delta.node}_status_message", "N/A")
+        st = delta.changed.get(f"{delta.node}_status", "N/A")
         print(f"Status Message: {msg}")
         print(f"Status: {st}\n")
+        deltas.append(delta)
 
-        # 상태를 copy()해서 저장 (이후 용도)
-        intermediate_steps.append((node_name, state.copy()))
+    return deltas
 
-    return intermediate_steps
+
+async def arun_graph(initial_state: GraphState) -> AsyncIterator[StateDelta]:
+    """
+    run_graph의 비동기 버전.
+    이벤트 루프를 막지 않고 각 노드가 끝날 때마다 StateDelta를 yield 합니다.
+    """
+    graph = registry.get(APP_GRAPH)
+    async for delta in graph.arun_deltas(initial_state):
+        yield delta
+
+
+def apply_deltas(deltas: Iterable[StateDelta], initial_state: GraphState = None) -> GraphState:
+    """
+    StateDelta들을 순서대로 적용하여 최종 state를 복원합니다.
+    """
+    state = dict(initial_state or {})
+    for delta in deltas:
+        delta.apply(state)
+    return state
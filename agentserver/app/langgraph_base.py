@@ -1,4 +1,6 @@
-from typing import Annotated, List, Tuple, Iterator
+import time
+import asyncio
+from typing import Annotated, Any, List, Optional, Tuple, Iterator, AsyncIterator
 from typing_extensions import TypedDict
 
 # GraphState: 모든 노드가 공유하는 상태를 정의합니다.
@@ -33,6 +35,55 @@ class GraphState(TypedDict, total=False):
     # rollback: Annotated[str, "롤백 대상 노드 이름"]
 
 
+# StateDelta: 노드 1회 완료로 바뀐 state 부분만 담은 이벤트
+class StateDelta:
+    """
+    전체 state 복사본 대신 노드가 바꾼 키만 전달하기 위한 이벤트입니다.
+
+    Attributes:
+        node (str): 완료된 노드 이름
+        version (int): 실행 내에서 1부터 증가하는 이벤트 번호
+        changed (dict[str, Any]): 노드가 변경하거나 추가한 키와 값 ({node}_status 등 포함)
+        removed (List[str]): 노드가 삭제한 키 목록
+    """
+
+    def __init__(self, node: str, version: int, changed: dict, removed: Optional[List[str]] = None):
+        self.node = node
+        self.version = version
+        self.changed = changed
+        self.removed = removed or []
+
+    def apply(self, state: dict) -> dict:
+        """
+        이벤트를 state에 적용합니다. (제자리 수정 후 같은 dict 반환)
+        """
+        state.update(self.changed)
+        for key in self.removed:
+            state.pop(key, None)
+        return state
+
+    def to_dict(self) -> dict:
+        """
+        스트리밍 응답(JSON) 전송용 dict로 변환합니다.
+        """
+        return {"node": self.node, "version": self.version,
+                "changed": self.changed, "removed": self.removed}
+
+
+def _diff(before: dict, after: dict) -> Tuple[dict, List[str]]:
+    """
+    노드 실행 전 state의 얕은 복사본과 실행 후 state를 비교하여 (변경된 키와 값, 삭제된 키)를 반환합니다.
+    """
+    missing = object()
+    changed = {}
+    for key, value in after.items():
+        old = before.get(key, missing)
+        if old is not value and (old is missing or old != value):
+            changed[key] = value
+    removed = [key for key in before if key not in after]
+    return changed, removed
+
+
 # Node: 각 에이전트(노드)의 기본 클래스
 class Node:
     def __init__(self, name: str):
@@ -48,6 +99,13 @@ class Node:
         print(f"[{self.name}] 기본 process() 호출")
         return state
 
+    async def aprocess(self, state: GraphState) -> GraphState:
+        """
+        비동기 실행용 메서드. 기본 구현은 process()를 별도 스레드에서 실행하여
+        이벤트 루프를 막지 않습니다.
+        """
+        return await asyncio.to_thread(self.process, state)
+
 
 # Graph: 노드들을 연결하여 실행하는 간단한 DAG 구현
 class Graph:
@@ -65,6 +123,20 @@ class Graph:
             raise ValueError("Source 또는 Destination 노드가 그래프에 존재하지 않습니다.")
         self.edges[source].append(destination)
 
+    def warm_up(self) -> dict[str, float]:
+        """
+        graph_registry가 그래프를 생성한 직후 호출합니다.
+        warm_up()을 구현한 노드만 호출하고 노드별 소요 시간(초)을 반환합니다.
+        """
+        elapsed = {}
+        for node_name, node in self.nodes.items():
+            if not hasattr(node, "warm_up"):
+                continue
+            started = time.perf_counter()
+            node.warm_up()
+            elapsed[node_name] = time.perf_counter() - started
+        return elapsed
+
     def get_topological_order(self) -> List[str]:
         in_degree = {n: 0 for n in self.nodes}
         for src, dest_list in self.edges.items():
@@ -122,3 +194,70 @@ class Graph:
 
         print("\n===== Graph Execution 종료 =====\n")
         return state
+
+    async def arun_stream(self, initial_state: GraphState) -> AsyncIterator[Tuple[str, GraphState]]:
+        """
+        run_stream의 비동기 버전.
+        노드의 aprocess() 코루틴을 await 하므로 FastAPI 이벤트 루프를 막지 않고,
+        각 노드가 완료될 때마다 (node_name, 현재 state)를 yield
+        """
+        topo_order = self.get_topological_order()
+        current_index = 0
+        state = initial_state
+
+        print("\n===== Graph Execution (Async Streaming) 시작 =====\n")
+        print("초기 위상 정렬 순서:", topo_order)
+        print("\n-------------------------------\n")
+
+        while current_index < len(topo_order):
+            node_name = topo_order[current_index]
+            node = self.nodes[node_name]
+            print(f"==> 노드 실행: {node_name}")
+            state[f"{node_name}_status"] = "inprogress"
+            state[f"{node_name}_status_message"] = f"{node_name} 작업 시작"
+            if hasattr(node, "aprocess"):
+                state = await node.aprocess(state)
+            else:
+                state = await asyncio.to_thread(node.process, state)
+
+            print(f"   {node_name} 완료. 현재 state keys: {list(state.keys())}")
+            yield node_name, state
+
+            # 롤백 체크
+            if "rollback" in state:
+                rollback_target = state["rollback"]
+                print(f"  [ROLLBACK] {rollback_target} 노드로 돌아갑니다.")
+                if rollback_target in topo_order:
+                    current_index = topo_order.index(rollback_target)
+                    del state["rollback"]
+                    continue
+                else:
+                    print("  [ERROR] 롤백 대상 노드가 존재하지 않습니다.")
+            current_index += 1
+
+        print("\n===== Graph Execution 종료 =====\n")
+
+    def run_deltas(self, initial_state: GraphState) -> Iterator[StateDelta]:
+        """
+        run_stream과 같은 순서로 실행하면서,
+        각 노드가 완료될 때마다 이전 yield 이후 바뀐 키만 담은 StateDelta를 yield
+        (노드 실행 전 기록하는 {node}_status, {node}_status_message 포함)
+        """
+        before = dict(initial_state)
+        for version, (node_name, state) in enumerate(self.run_stream(initial_state), 1):
+            changed, removed = _diff(before, state)
+            yield StateDelta(node_name, version, changed, removed)
+            # 다음 비교 기준은 키 참조만 복사 (값은 복사하지 않음)
+            before = dict(state)
+
+    async def arun_deltas(self, initial_state: GraphState) -> AsyncIterator[StateDelta]:
+        """
+        run_deltas의 비동기 버전.
+        """
+        before = dict(initial_state)
+        version = 0
+        async for node_name, state in self.arun_stream(initial_state):
+            version += 1
+            changed, removed = _diff(before, state)
+            yield StateDelta(node_name, version, changed, removed)
+            before = dict(state)
@@ -7,6 +7,7 @@ import argparse
 from app.api.router import api_router
 from app.config import settings
 from app.db.session import init_db
+from app.graph import APP_GRAPH, registry
 from app.logging import logger
 from app.middleware import LoggerMiddleware
 # API Key 인증(VPN 환경에서는 불필요하므로 주석 처리)
@@ -51,6 +52,8 @@ app.include_router(api_router, prefix="/api/v1")
 @app.on_event("startup")
 def on_startup():
     init_db()
+    # 첫 요청에서 에이전트를 생성하지 않도록 시작 시 그래프를 미리 준비
+    registry.warm_up(APP_GRAPH)
     logger.info('App started')
 
 
@@ -1,4 +1,4 @@
-import time
+import asyncio
 
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
@@ -6,7 +6,7 @@ from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
 # LangGraph_base에서 Node, GraphState import
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, run_sync
 
 class ReportIntegrationNode(Node):
     def __init__(self, name: str) -> None:
@@ -63,7 +63,7 @@ class ReportIntegrationNode(Node):
         # RunnableSequence
         self.final_answer_chain = self.final_prompt_template | self.llm
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph에서 통합 보고서를 생성하는 노드.
         state에 저장된 각 에이전트별 보고서를 모아서, LLM을 통해 'integrated_report'를 작성.
@@ -79,7 +79,7 @@ class ReportIntegrationNode(Node):
         daily_chart_report = state.get("daily_chart_report", "")
 
         # LLM 호출
-        final_answer = self.final_answer_chain.invoke({
+        final_answer = await self.final_answer_chain.ainvoke({
             "target": target,
             "company": company_report,
             "news": news_report,
@@ -99,9 +99,13 @@ class ReportIntegrationNode(Node):
         # state에 통합 보고서 저장
         state["integrated_report"] = integrated_text
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
         return state
 
+    def process(self, state: GraphState) -> GraphState:
+        """aprocess()를 동기 방식으로 실행하는 adapter"""
+        return run_sync(self.aprocess(state))
+
 if __name__ == "__main__":
     # standalone 테스트
     agent = ReportIntegrationNode("ReportIntegrationNode")
@@ -110,6 +110,34 @@ class Task(SQLModel, table=True):
         default=None,
         sa_column=Column(String, nullable=True)
     )
+    # priority: 작업 우선순위 클래스 (varchar, NULL 허용)
+    # "interactive"(웹 요청), "scheduled"(정기 생성), "backfill"(과거 보고서 재생성), NULL은 "scheduled"로 처리
+    # ALTER TABLE invest.tasks ADD COLUMN priority varchar;
+    priority: Optional[str] = Field(
+        default=None,
+        sa_column=Column(String, nullable=True)
+    )
+    # worker_id: 작업을 실행 중인 워커 ("호스트:pid", NULL 허용)
+    # heartbeat_at / lease_expires_at: 워커가 주기적으로 갱신하는 실행 확인 시각과 임대 만료 시각 (timestamptz, NULL 허용)
+    # attempt: 작업을 가져간 횟수 (임대가 만료되어 다시 대기열에 넣을 때마다 증가한 횟수로 재시도 한도 판단)
+    # ALTER TABLE invest.tasks ADD COLUMN worker_id varchar, ADD COLUMN heartbeat_at timestamptz,
+    #     ADD COLUMN lease_expires_at timestamptz, ADD COLUMN attempt integer NOT NULL DEFAULT 0;
+    worker_id: Optional[str] = Field(
+        default=None,
+        sa_column=Column(String, nullable=True)
+    )
+    heartbeat_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
+    )
+    lease_expires_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
+    )
+    attempt: int = Field(
+        default=0,
+        sa_column=Column(Integer, nullable=False, default=0, server_default="0")
+    )
 
 
 class Stock(SQLModel, table=True):
@@ -138,3 +166,73 @@ class Stock(SQLModel, table=True):
     stock_code: str = Field(
         sa_column=Column(String, nullable=False)
     )
+
+
+class TradeOutbox(SQLModel, table=True):
+    """
+    관리 서버(/trade)로 보낼 매매 알림 outbox입니다.
+    워커는 Task를 '완료'로 바꾸는 트랜잭션에서 함께 기록하고, 전송은 worker/trade_dispatcher.py가 따로 처리합니다.
+
+    CREATE TABLE invest.trade_outbox (
+        id integer GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+        task_id uuid NOT NULL CONSTRAINT trade_outbox_unique UNIQUE,
+        payload varchar NOT NULL, status varchar NOT NULL, attempts integer NOT NULL DEFAULT 0,
+        next_attempt_at timestamptz, last_error varchar, created_at timestamptz, sent_at timestamptz
+    );
+    CREATE INDEX trade_outbox_due ON invest.trade_outbox (status, next_attempt_at);
+    """
+
+    __tablename__ = "trade_outbox"
+    __table_args__ = (
+        UniqueConstraint("task_id", name="trade_outbox_unique"),
+        {"schema": "invest"},
+    )
+
+    # id: 정수형 기본키, GENERATED ALWAYS AS IDENTITY
+    id: Optional[int] = Field(
+        default=None,
+        sa_column=Column(
+            Integer,
+            Identity(always=True),
+            primary_key=True,
+            nullable=False,
+        )
+    )
+    # task_id: 알림 대상 Task (작업당 1건, 관리 서버의 중복 방지 키로도 사용)
+    task_id: str = Field(
+        sa_column=Column(UUID(as_uuid=True), nullable=False)
+    )
+    # payload: /trade 요청 본문 (JSON 문자열)
+    payload: str = Field(
+        sa_column=Column(String, nullable=False)
+    )
+    # status: 전송 상태 ("전송 대기", "전송 완료", "전송 실패")
+    status: str = Field(
+        default="전송 대기",
+        sa_column=Column(String, nullable=False)
+    )
+    # attempts: 전송 시도 횟수
+    attempts: int = Field(
+        default=0,
+        sa_column=Column(Integer, nullable=False, default=0)
+    )
+    # next_attempt_at: 다음 전송 시도 시각, timestamptz (NULL이면 바로 전송)
+    next_attempt_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
+    )
+    # last_error: 마지막 전송 실패 원인 (NULL 허용)
+    last_error: Optional[str] = Field(
+        default=None,
+        sa_column=Column(String, nullable=True)
+    )
+    # created_at: 생성 시각, timestamptz (NULL 허용)
+    created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
+    )
+    # sent_at: 전송 완료 시각, timestamptz (NULL 허용)
+    sent_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
+    )
@@ -0,0 +1,223 @@
+"""
+워커 보고서 그래프 벤치마크
+
+관심 종목(target_stocks) 10개에 대해 워커와 같은 그래프를 실행하고
+전체 소요 시간, 노드별 p50/p95 소요 시간, 최대 RSS를 출력합니다.
+
+외부 호출은 카세트로 기록/재생합니다.
+    # 1) 실제 API로 한 번 실행하여 응답 기록 (OpenAI/KIS/RAG API 키 필요)
+    python -m benchmark.report_graph --mode record
+    # 2) 기록된 응답으로 재생 (외부 호출 없음, 기록된 지연 시간의 절반으로 재생, 동시 5건)
+    python -m benchmark.report_graph --latency-scale 0.5 --concurrency 5
+    # 3) 그래프 오버헤드만 측정 (지연 없음)
+    python -m benchmark.report_graph --latency-scale 0 --repeat 5
+
+agentserver 디렉터리에서 실행합니다.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from graph_cassette import Cassette
+
+DEFAULT_CASSETTE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cassettes", "report_graph.pkl")
+
+
+def install_data_sources(cassette: Cassette) -> None:
+    """
+    LLM/HTTP 외에 HTTP 계층 위에서 가로채야 하는 데이터 소스를 카세트에 연결합니다.
+
+    - yfinance 재무제표 조회, 한국투자증권(mojito) 일봉/월봉 조회: 반환값 기록/재생
+    - 보고서 평가 모델: 통합 보고서별 점수 기록/재생 (재생 시 모델을 로드하지 않음)
+    - 증권사 API 로그인: 토큰이 카세트에 남지 않도록 기록하지 않음 (재생 시 로그인하지 않음)
+    """
+
+    import mojito
+    from LangGraph_base import Node
+    from fin_financial_statements_agent import FinancialStatementsAnalysisAgent
+    from fin_report_daily_chart_agent import DailyChartAnalysisAgent
+    from fin_report_scorer_agent import ReportScorerAgent
+
+    # 종목 코드 전달 여부와 관계없이 같은 기업이면 같은 기록을 사용
+    cassette.patch_method(FinancialStatementsAnalysisAgent, "fetch_financial_ratios", "yfinance",
+                          key=lambda agent, company_name, company_code=None: company_name)
+    cassette.patch_method(mojito.KoreaInvestment, "fetch_ohlcv", "kis")
+
+    original_process = ReportScorerAgent.process
+
+    def score(agent, state):
+        return original_process(agent, state).get("report_score")
+
+    def process(agent, state):
+        key = cassette.key("scorer", state.get("integrated_report", ""))
+        state["report_score"] = cassette.call("scorer", key, score, agent, state)
+        return state
+
+    cassette.patch(ReportScorerAgent, "process", process)
+
+    if cassette.mode == "record":
+        cassette.bypass(DailyChartAnalysisAgent, "_initialize_broker")
+        return
+
+    def init_scorer(agent, name, eval_model):
+        Node.__init__(agent, name)
+        agent.model_name = eval_model
+        agent.device = "cpu"
+
+    cassette.patch(ReportScorerAgent, "__init__", init_scorer)
+    cassette.patch(ReportScorerAgent, "warm_up", lambda agent: None)
+    # fetch_ohlcv가 재생되므로 로그인하지 않은 broker 객체로 충분
+    cassette.patch(DailyChartAnalysisAgent, "_initialize_broker",
+                   lambda agent: mojito.KoreaInvestment.__new__(mojito.KoreaInvestment))
+    os.environ.setdefault("OPENAI_API_KEY", "cassette-replay")
+
+
+def percentile(values: list, q: float) -> float:
+    """
+    선형 보간 백분위수를 계산합니다. (q: 0~100)
+    """
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def peak_rss_mb() -> float:
+    """
+    프로세스 최대 RSS (MB, Linux 기준 ru_maxrss는 KB 단위)
+    """
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_one(graph, company_name: str, company_code: str, persona: str) -> dict:
+    """
+    종목 1개에 대해 그래프를 실행하고 소요 시간과 노드별 실행 시간을 반환합니다.
+    """
+
+    from LangGraph_base import GRAPH_END
+
+    initial_state = {
+        "company_name": company_name,
+        "company_code": company_code,
+        "customer_id": "benchmark",
+        "task_id": f"benchmark-{company_code}",
+        # 카세트 키가 날짜에 따라 바뀌지 않도록 고정
+        "date": "2025-03-15",
+        "user_assets": 10000000.0,
+        "financial_query": "2025년 3월 기준, 해당 기업의 재무 리포트 및 투자 전망 분석",
+        "investment_persona": persona,
+    }
+    started = time.perf_counter()
+    run_timing, final_report = {}, None
+    for delta in graph.run_deltas(initial_state):
+        if delta.node == GRAPH_END:
+            run_timing = delta.changed.get("run_timing", {})
+        final_report = delta.changed.get("final_report", final_report)
+    return {
+        "company": company_name,
+        "seconds": time.perf_counter() - started,
+        "nodes": {name: entry["seconds"] for name, entry in run_timing.get("nodes", {}).items()},
+        "llm_calls": run_timing.get("llm", {}).get("calls", 0),
+        "ok": final_report is not None,
+    }
+
+
+def main(argv: Optional[list] = None) -> dict:
+    parser = argparse.ArgumentParser(description="보고서 그래프 record/replay 벤치마크")
+    parser.add_argument("--mode", choices=["record", "replay"], default="replay")
+    parser.add_argument("--cassette", default=DEFAULT_CASSETTE, help="카세트 파일 경로")
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="재생 시 기록된 소요 시간에 곱하는 배수 (0이면 대기 없음)")
+    parser.add_argument("--latency", action="append", default=[], metavar="KIND=SECONDS",
+                        help="호출 종류별 고정 지연 시간 (예: --latency llm=2.0), 종류: llm/http/yfinance/kis/scorer")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시에 실행할 종목 수")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 횟수 (재생 모드)")
+    parser.add_argument("--persona", default="중고위험(적극적)", help="투자 성향")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    latency = {kind: float(seconds) for kind, seconds in (item.split("=", 1) for item in args.latency)}
+    cassette = Cassette(args.cassette, mode=args.mode, latency_scale=args.latency_scale, latency=latency)
+    install_data_sources(cassette)
+    cassette.install()
+    repeat = 1 if args.mode == "record" else args.repeat
+
+    try:
+        from worker.node_generate_report import create_graph
+
+        started = time.perf_counter()
+        graph = create_graph()
+        graph.warm_up()
+        startup_seconds = time.perf_counter() - started
+        baseline_rss = peak_rss_mb()
+        stocks = graph.nodes["DailyChartAnalysisAgent"].target_stocks
+
+        runs, walls = [], []
+        for _ in range(repeat):
+            cassette.rewind()
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                futures = [executor.submit(run_one, graph, name, code, args.persona)
+                           for name, code in stocks.items()]
+                runs.extend(future.result() for future in futures)
+            walls.append(time.perf_counter() - started)
+    finally:
+        cassette.uninstall()
+
+    node_seconds: dict[str, list] = {}
+    for run in runs:
+        for name, seconds in run["nodes"].items():
+            node_seconds.setdefault(name, []).append(seconds)
+    run_seconds = [run["seconds"] for run in runs]
+    result = {
+        "mode": args.mode,
+        "concurrency": args.concurrency,
+        "latency_scale": args.latency_scale,
+        "stocks": len(stocks),
+        "repeat": repeat,
+        "startup_seconds": startup_seconds,
+        "wall_seconds": walls,
+        "run_seconds": {"p50": percentile(run_seconds, 50), "p95": percentile(run_seconds, 95),
+                        "max": max(run_seconds, default=0.0)},
+        "nodes": {name: {"p50": percentile(values, 50), "p95": percentile(values, 95)}
+                  for name, values in sorted(node_seconds.items())},
+        "failed_runs": [run["company"] for run in runs if not run["ok"]],
+        "peak_rss_mb": peak_rss_mb(),
+        "rss_growth_mb": peak_rss_mb() - baseline_rss,
+        "cassette": cassette.stats(),
+    }
+
+    print("\n===== 보고서 그래프 벤치마크 =====")
+    print(f"모드: {args.mode}, 종목 {len(stocks)}개 x {repeat}회, 동시 실행 {args.concurrency}, "
+          f"지연 배수 {args.latency_scale}")
+    print(f"그래프 준비: {startup_seconds:.2f}s")
+    print("전체 소요 시간: " + ", ".join(f"{wall:.2f}s" for wall in walls))
+    print(f"실행 1회: p50 {result['run_seconds']['p50']:.2f}s, p95 {result['run_seconds']['p95']:.2f}s")
+    print(f"{'노드':<36}{'p50(s)':>10}{'p95(s)':>10}")
+    for name, entry in result["nodes"].items():
+        print(f"{name:<36}{entry['p50']:>10.3f}{entry['p95']:>10.3f}")
+    print(f"최대 RSS: {result['peak_rss_mb']:.1f}MB (그래프 실행 중 증가 {result['rss_growth_mb']:.1f}MB)")
+    print(f"카세트: {result['cassette']}")
+    if result["failed_runs"]:
+        print(f"[WARN] 최종 보고서가 없는 실행: {result['failed_runs']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+보고서 평가 모델 CPU 백엔드 벤치마크
+
+모델 크기별로 CPU 백엔드(cpu-fp32, cpu-bf16, cpu-int8, 선택적으로 torch.compile)를 각각 새 프로세스에서 로드하고
+합성 리포트 평가의 로드 시간, 지연 시간 p50/p95, 로드 후 RSS, cpu-fp32 대비 점수 차이를 출력합니다.
+auto로 선택되는 백엔드도 함께 표시합니다.
+
+    # 기본 모델 3종 x 백엔드 3종
+    python -m benchmark.scorer_backends
+    # 모델/백엔드 지정, torch.compile 포함, 스레드 8
+    python -m benchmark.scorer_backends --models Qwen/Qwen2.5-1.5B-Instruct --backends cpu-bf16,cpu-int8 --compile --threads 8
+
+agentserver 디렉터리에서 실행합니다. (모델은 Hugging Face Hub에서 내려받음)
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# GPU가 있어도 CPU에서 측정
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+
+from benchmark.report_graph import percentile
+from benchmark.scorer_prefix_cache import synthetic_report
+
+DEFAULT_MODELS = "HuggingFaceTB/SmolLM2-135M,Qwen/Qwen2.5-0.5B-Instruct,Qwen/Qwen2.5-1.5B-Instruct"
+DEFAULT_BACKENDS = "cpu-fp32,cpu-bf16,cpu-int8"
+
+
+def current_rss_mb() -> float:
+    """
+    현재 프로세스의 RSS (MB, Linux /proc 기준, 그 외에는 0)
+    """
+
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return 0.0
+
+
+def run_config(model: str, backend: str, compile_model: bool, threads: int, lengths: list, repeat: int) -> dict:
+    """
+    (새 프로세스에서) 한 백엔드로 평가 모델을 로드하고 리포트를 평가합니다.
+    """
+
+    if threads:
+        os.environ["SCORER_NUM_THREADS"] = str(threads)
+    from fin_report_scorer_agent import ReportScorerAgent
+
+    baseline_rss = current_rss_mb()
+    started = time.perf_counter()
+    scorer = ReportScorerAgent("ReportScorerAgent", eval_model=model, batch_size=1,
+                               backend=backend, compile_model=compile_model)
+    scorer.warm_up()
+    load_seconds = time.perf_counter() - started
+    rss = current_rss_mb() - baseline_rss
+
+    scores, seconds = [], []
+    for length in lengths:
+        report = synthetic_report(length)
+        for _ in range(repeat):
+            started = time.perf_counter()
+            score = scorer.score_reports([report])[0]
+            seconds.append(time.perf_counter() - started)
+        scores.append(score)
+    return {
+        "model": model,
+        "backend": scorer.backend,
+        "compiled": scorer.compiled,
+        "load_seconds": load_seconds,
+        "rss_mb": rss,
+        "p50": percentile(seconds, 50),
+        "p95": percentile(seconds, 95),
+        "scores": scores,
+    }
+
+
+def main(argv: Optional[list] = None) -> dict:
+    parser = argparse.ArgumentParser(description="평가 모델 CPU 백엔드 벤치마크")
+    parser.add_argument("--models", default=DEFAULT_MODELS, help="쉼표로 구분한 모델 목록 (작은 순)")
+    parser.add_argument("--backends", default=DEFAULT_BACKENDS, help="쉼표로 구분한 백엔드 목록")
+    parser.add_argument("--compile", action="store_true", help="각 백엔드를 torch.compile로도 측정")
+    parser.add_argument("--lengths", default="200,2000", help="합성 리포트 길이(자) 목록")
+    parser.add_argument("--repeat", type=int, default=3, help="리포트별 반복 횟수")
+    parser.add_argument("--threads", type=int, default=0, help="torch CPU 스레드 수 (0이면 자동)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    from fin_report_scorer_agent import cpu_threads, select_backend
+
+    auto_backend, reason = select_backend("auto")
+    lengths = [int(length) for length in args.lengths.split(",")]
+    configs = [(model, backend, compile_model)
+               for model in args.models.split(",")
+               for backend in args.backends.split(",")
+               for compile_model in ((False, True) if args.compile else (False,))]
+
+    runs = []
+    for model, backend, compile_model in configs:
+        # 백엔드마다 새 프로세스에서 로드하여 메모리/스레드 설정이 서로 영향을 주지 않게 함
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            try:
+                runs.append(executor.submit(run_config, model, backend, compile_model, args.threads,
+                                            lengths, args.repeat).result())
+            except Exception as e:
+                print(f"[WARN] {model} {backend} 측정 실패: {e}")
+
+    reference = {run["model"]: run["scores"] for run in runs if run["backend"] == "cpu-fp32" and not run["compiled"]}
+    for run in runs:
+        if run["model"] in reference:
+            run["max_score_diff"] = max(abs(a - b) for a, b in zip(run["scores"], reference[run["model"]]))
+
+    result = {"auto_backend": auto_backend, "auto_reason": reason, "threads": args.threads or cpu_threads(),
+              "lengths": lengths, "runs": runs}
+
+    print("\n===== 평가 모델 CPU 백엔드 벤치마크 =====")
+    print(f"auto 선택: {auto_backend} ({reason}), 스레드 {result['threads']}, 리포트 길이 {lengths}자")
+    print(f"{'모델':<36}{'백엔드':<18}{'로드(s)':>9}{'RSS(MB)':>10}{'p50(s)':>9}{'p95(s)':>9}{'점수차':>9}")
+    for run in runs:
+        backend = run["backend"] + ("+compile" if run["compiled"] else "")
+        diff = f"{run['max_score_diff']:.4f}" if "max_score_diff" in run else "-"
+        print(f"{run['model']:<36}{backend:<18}{run['load_seconds']:>9.1f}{run['rss_mb']:>10.0f}"
+              f"{run['p50']:>9.3f}{run['p95']:>9.3f}{diff:>9}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+보고서 평가 모델 prefix KV 캐시 벤치마크
+
+작은 causal LM을 평가 모델 대신 CPU에 로드하고, 길이가 다른 합성 리포트들을
+prefix 캐시 없이(전체 프롬프트 forward) / 캐시 사용(리포트 + "평가 점수:"만 forward)으로 평가하여
+리포트별 forward 토큰 수, 지연 시간 p50/p95, 두 방식의 점수 차이를 출력합니다.
+
+    # 기본 모델(Qwen2.5-0.5B-Instruct)로 리포트 길이 200/800/2000자, 각 5회
+    python -m benchmark.scorer_prefix_cache
+    # 다른 모델, 스레드 수 지정
+    python -m benchmark.scorer_prefix_cache --model HuggingFaceTB/SmolLM2-135M --threads 4 --repeat 10
+    # 평가 모델과 같은 CPU 백엔드(int8)로 측정
+    python -m benchmark.scorer_prefix_cache --backend cpu-int8
+
+agentserver 디렉터리에서 실행합니다. (모델은 Hugging Face Hub에서 내려받음)
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+# GPU가 있어도 CPU에서 측정
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+
+from benchmark.report_graph import percentile
+
+DEFAULT_MODEL = "Qwen/Qwen2.5-0.5B-Instruct"
+REPORT_PARAGRAPH = (
+    "LG화학은 석유화학 업황 둔화에도 첨단소재 부문의 양극재 출하 증가로 매출이 전년 대비 소폭 성장했다. "
+    "영업이익률은 원재료 가격 안정으로 개선되었으나 배터리 자회사의 수익성 변동성이 여전히 크다. "
+)
+
+
+def synthetic_report(length: int) -> str:
+    """
+    length자 안팎의 합성 통합 리포트를 만듭니다.
+    """
+
+    repeat = max(1, length // len(REPORT_PARAGRAPH))
+    return f"[통합 리포트 {length}자]\n" + REPORT_PARAGRAPH * repeat
+
+
+def measure(scorer, reports: list, repeat: int) -> dict:
+    """
+    현재 prefix 캐시 설정으로 리포트를 한 건씩 평가하고 토큰 수와 지연 시간을 측정합니다.
+    """
+
+    import torch
+
+    scores, tokens, seconds = [], [], []
+    with torch.no_grad():
+        for report in reports:
+            ids = scorer.tokenizer(scorer.build_prompt(report))["input_ids"]
+            for _ in range(repeat):
+                started = time.perf_counter()
+                logits, processed = scorer._forward_digits([ids])
+                score = scorer.expected_score(logits[0])
+                seconds.append(time.perf_counter() - started)
+            scores.append(score)
+            tokens.append(processed)
+    return {
+        "scores": scores,
+        "tokens": tokens,
+        "total_tokens": sum(tokens),
+        "p50": percentile(seconds, 50),
+        "p95": percentile(seconds, 95),
+        "mean": sum(seconds) / len(seconds),
+    }
+
+
+def main(argv: Optional[list] = None) -> dict:
+    parser = argparse.ArgumentParser(description="평가 모델 prefix KV 캐시 벤치마크 (CPU)")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="평가 모델 대신 사용할 작은 causal LM")
+    parser.add_argument("--lengths", default="200,800,2000", help="합성 리포트 길이(자) 목록")
+    parser.add_argument("--repeat", type=int, default=5, help="리포트별 반복 횟수")
+    parser.add_argument("--threads", type=int, default=None, help="torch CPU 스레드 수")
+    parser.add_argument("--backend", default="cpu-fp32", help="평가 모델 백엔드 (auto, cpu-fp32, cpu-bf16, cpu-int8)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    if args.threads:
+        # 평가 모델 모듈이 import 시점에 읽으므로 먼저 설정
+        os.environ["SCORER_NUM_THREADS"] = str(args.threads)
+    import torch
+    from fin_report_scorer_agent import ReportScorerAgent
+
+    scorer = ReportScorerAgent("ReportScorerAgent", eval_model=args.model, batch_size=1, prefix_cache=False,
+                               backend=args.backend)
+    scorer.warm_up()
+
+    reports = [synthetic_report(int(length)) for length in args.lengths.split(",")]
+    before = measure(scorer, reports, args.repeat)
+    scorer.prepare_prefix_cache()
+    after = measure(scorer, reports, args.repeat)
+
+    result = {
+        "model": args.model,
+        "threads": torch.get_num_threads(),
+        "prefix_tokens": len(scorer.prefix_ids),
+        "reports": [len(report) for report in reports],
+        "before": before,
+        "after": after,
+        "max_score_diff": max(abs(a - b) for a, b in zip(before["scores"], after["scores"])),
+    }
+
+    print("\n===== 평가 모델 prefix KV 캐시 벤치마크 =====")
+    print(f"모델: {args.model} (CPU, 스레드 {result['threads']}), 캐시된 prefix {result['prefix_tokens']} 토큰")
+    print(f"{'리포트(자)':<12}{'토큰(전)':>10}{'토큰(후)':>10}{'점수(전)':>10}{'점수(후)':>10}")
+    for index, length in enumerate(result["reports"]):
+        print(f"{length:<12}{before['tokens'][index]:>10}{after['tokens'][index]:>10}"
+              f"{before['scores'][index]:>10.4f}{after['scores'][index]:>10.4f}")
+    for label, entry in (("캐시 없음", before), ("캐시 사용", after)):
+        print(f"{label}: 토큰 합계 {entry['total_tokens']}, 지연 p50 {entry['p50'] * 1000:.1f}ms, "
+              f"p95 {entry['p95'] * 1000:.1f}ms, 평균 {entry['mean'] * 1000:.1f}ms")
+    print(f"점수 최대 차이: {result['max_score_diff']:.6f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+    return result
+
+
+if __name__ == "__main__":
+    main()
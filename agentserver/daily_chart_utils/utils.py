@@ -57,7 +57,8 @@ async def get_realtime_hoga(identifier: str):
         params={
             "FID_COND_MRKT_DIV_CODE": 'J',
             "FID_INPUT_ISCD": stock_code
-        }
+        },
+        timeout=10
     )
     
     if resp.status_code != 200:
@@ -16,8 +16,8 @@ async def run_graph_endpoint():
     stream_results = await asyncio.to_thread(run_graph_stream, initial_state)
     
     async def event_generator():
-        for node_name, state in stream_results:
-            yield f"data: {json.dumps({'node': node_name, 'state': state}, default=str)}\n\n"
+        for delta in stream_results:
+            yield f"data: {json.dumps(delta.to_dict(), default=str)}\n\n"
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
 if __name__ == "__main__":
@@ -1,4 +1,7 @@
-import time
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
 from dotenv import load_dotenv
 
 import yfinance as yf
@@ -7,7 +10,12 @@ from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
 # LangGraph_base에서 Node, GraphState import (에이전트 구조)
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, failure_message, RetryPolicy, run_sync
+from tracing_callbacks import llm_span_callback
+from graph_tracing import start_span
+
+# 여러 기업의 재무제표를 미리 조회할 때 동시에 요청하는 수
+FINANCIALS_PREFETCH_WORKERS = int(os.getenv("FINANCIALS_PREFETCH_WORKERS", 4))
 
 
 class FinancialStatementsAnalysisAgent(Node):
@@ -25,9 +33,21 @@ class FinancialStatementsAnalysisAgent(Node):
     system_prompt (SystemMessage): 재무제표 분석 전문가 역할을 정의하는 시스템 프롬프트
     final_prompt_template (PromptTemplate): 재무제표 데이터를 분석하기 위한 프롬프트 템플릿
     final_answer_chain: LLM 분석을 실행하기 위한 프롬프트 체인
-    current_company (str): 현재 분석 중인 기업명
+
+    Note:
+        한 인스턴스를 여러 작업이 동시에 공유하므로 실행 중인 기업명 등은 인스턴스에 저장하지 않습니다.
     """
 
+    # 재실행 범위 계산에 사용되는 state 입출력 키
+    reads = ("company_name", "company_code")
+    writes = ("fin_statements_report", "financial_statements_report")
+
+    # 1회 실행 제한 시간(초)과 재시도 정책
+    timeout = 120
+    retry = RetryPolicy(max_attempts=3)
+    # 연간 재무제표는 자주 바뀌지 않으므로 6시간 동안 결과를 재사용
+    cache_ttl = 6 * 60 * 60
+
     def __init__(self, name: str) -> None:
         """
         에이전트 초기화 함수.
@@ -44,7 +64,8 @@ class FinancialStatementsAnalysisAgent(Node):
         # LLM 초기화 (모델명, 온도 등 필요 시 조정)
         self.llm = ChatOpenAI(
             model_name="gpt-4o-mini",  # 실제 사용 시 "gpt-3.5-turbo" 등으로 교체
-            temperature=0.2
+            temperature=0.2,
+            callbacks=[llm_span_callback]
         )
 
         # 재무제표 분석 전문가 역할 시스템 프롬프트
@@ -75,13 +96,17 @@ class FinancialStatementsAnalysisAgent(Node):
         )
         self.final_answer_chain = self.final_prompt_template | self.llm
 
-    def fetch_financial_ratios(self, company_name: str):
+        # prefetch()로 미리 계산한 재무 비율 (기업명 -> 연도별 재무 비율)
+        self._prefetched: Dict[str, dict] = {}
+
+    def fetch_financial_ratios(self, company_name: str, company_code: Optional[str] = None):
         """
         특정 한국 기업의 최근 4개년 재무 비율을 계산하여 가져오는 함수.
         모든 비율을 % 단위로 변환하고, 소수점 둘째 자리에서 반올림.
 
         Args:
             company_name (str): 재무제표 데이터를 조회할 기업명
+            company_code (Optional[str]): 종목 코드, 없으면 기업명으로 찾음
 
         Returns:
             dict or str: 연도별 재무 비율 데이터가 담긴 dictionary,
@@ -100,10 +125,10 @@ class FinancialStatementsAnalysisAgent(Node):
             "한화솔루션": "009830"
         }
 
-        if company_name not in company_code_list:
+        company_code = company_code or company_code_list.get(company_name)
+        if company_code is None:
             return f"'{company_name}'의 종목 코드를 찾을 수 없습니다."
 
-        company_code = company_code_list[company_name]
         ticker_symbol = f"{company_code}.KS"
 
         try:
@@ -201,18 +226,49 @@ class FinancialStatementsAnalysisAgent(Node):
         except Exception as e:
             return f"데이터 조회 중 오류 발생: {e}"
 
-    def format_financial_statements(self, fs_data: dict) -> str:
+    def prefetch(self, companies: Dict[str, str], max_workers: int = FINANCIALS_PREFETCH_WORKERS) -> int:
+        """
+        여러 기업의 재무 비율을 한 번에 미리 조회합니다. (유니버스 배치용)
+
+        Args:
+            companies (Dict[str, str]): 기업명 -> 종목 코드
+            max_workers (int): 동시에 요청하는 수
+
+        Returns:
+            int: 조회에 성공한 기업 수
+
+        Note:
+            조회에 실패한 기업은 분석 시점에 다시 조회합니다.
+            배치가 끝나면 clear_prefetch()로 비웁니다.
+        """
+
+        names = list(companies)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(self.fetch_financial_ratios, names, [companies[name] for name in names]))
+        prefetched = {name: data for name, data in zip(names, results) if isinstance(data, dict)}
+        self._prefetched.update(prefetched)
+        return len(prefetched)
+
+    def clear_prefetch(self) -> None:
+        """
+        prefetch()로 조회해 둔 데이터를 비웁니다.
+        """
+
+        self._prefetched.clear()
+
+    def format_financial_statements(self, fs_data: dict, company_name: str) -> str:
         """
         재무 비율(또는 재무제표) 데이터를 문자열로 가공하여 가독성이 높은 형식으로 변환합니다.
         데이터는 연도별로 구분되며, 각 연도 내에서 재무 항목(예: 부채비율, ROE 등)과 해당 값이 포함됩니다.
 
         Args:
             fs_data (dict): 연도별 재무 비율 데이터를 담고 있는 dictionary
+            company_name (str): 분석 대상 기업명
 
         Returns:
             str: 포맷팅된 재무제표 정보 문자열
         """
-        formatted = f"기업명: {self.current_company}\n"
+        formatted = f"기업명: {company_name}\n"
 
         for year, values in fs_data.items():
             formatted += f"\n[연도: {year}]\n"
@@ -221,7 +277,7 @@ class FinancialStatementsAnalysisAgent(Node):
 
         return formatted
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph 노드 인터페이스를 구현하는 함수로, 
         1) state에서 'company_name'을 추출하여 해당 기업의 재무제표 데이터를 수집합니다.
@@ -235,17 +291,24 @@ class FinancialStatementsAnalysisAgent(Node):
 
         Returns:
             GraphState: 분석 결과가 포함된 업데이트된 상태 정보
+
+        Note:
+            yfinance는 동기 라이브러리이므로 별도 스레드에서 호출하고,
+            LLM은 ainvoke로 호출하여 이벤트 루프를 막지 않습니다.
         """
         print(f"[{self.name}] process() 호출")
 
         company = state.get("company_name", "Unknown")
-        self.current_company = company  # 문자열 포맷팅에 사용
 
         # 간단히 'fs_query' 같은 질의키를 사용하거나, 고정된 질문 사용 가능
         question = "위 재무제표를 기반으로 투자 의견을 제시해주세요."
 
         # 1) 재무제표(또는 비율) 데이터 수집
-        fs_data = self.fetch_financial_ratios(company)
+        fs_data = self._prefetched.get(company)
+        if fs_data is None:
+            with start_span("yfinance.financials", company=company) as span:
+                fs_data = await asyncio.to_thread(self.fetch_financial_ratios, company, state.get("company_code"))
+                span.set_attribute("ok", not isinstance(fs_data, str))
 
         # 데이터가 문자열(에러 메시지)인지 여부 확인
         if isinstance(fs_data, str):
@@ -254,10 +317,10 @@ class FinancialStatementsAnalysisAgent(Node):
             return state
 
         # 2) 문자열로 포맷
-        formatted_fs = self.format_financial_statements(fs_data)
+        formatted_fs = self.format_financial_statements(fs_data, company)
 
         # 3) LLM 분석
-        final_answer = self.final_answer_chain.invoke({
+        final_answer = await self.final_answer_chain.ainvoke({
             "fs_data": formatted_fs,
             "question": question
         })
@@ -265,9 +328,35 @@ class FinancialStatementsAnalysisAgent(Node):
         # 4) 결과 저장 (예: 'financial_statements_report' 키)
         state["fin_statements_report"] = final_answer.content
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+        return state
+
+    def process(self, state: GraphState) -> GraphState:
+        """
+        aprocess()를 동기 방식으로 실행하는 adapter입니다.
+
+        Args:
+            state (GraphState): 'company_name' 키를 포함한 상태 정보
+
+        Returns:
+            GraphState: 분석 결과가 포함된 업데이트된 상태 정보
+        """
+        return run_sync(self.aprocess(state))
+
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        재무제표 분석 대신 실패 안내를 'fin_statements_report'에 기록합니다.
+        """
+        state["fin_statements_report"] = failure_message("재무제표 분석", error)
         return state
 
+    def should_cache(self, changed: dict) -> bool:
+        """
+        재무제표 조회에 실패하여 에러 메시지만 기록한 결과는 캐시하지 않습니다.
+        """
+        return "fin_statements_report" in changed
+
 
 if __name__ == "__main__":
     # standalone 테스트 예시
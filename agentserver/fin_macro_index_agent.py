@@ -1,14 +1,16 @@
 import requests
+import httpx
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI 
 from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
-import time
 import asyncio
 
 # LangGraph의 Node와 GraphState 타입을 사용
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, failure_message, RetryPolicy, remaining_time, run_sync
+from tracing_callbacks import llm_span_callback
+from graph_tracing import start_span
 
 class MacroeconomicAnalysisAgent(Node):
     """
@@ -27,7 +29,27 @@ class MacroeconomicAnalysisAgent(Node):
         system_prompt (SystemMessage): LLM에 제공되는 시스템 프롬프트
         final_prompt_template (PromptTemplate): 최종 분석을 위한 프롬프트 템플릿
         final_answer_chain: 프롬프트와 LLM을 연결한 체인
+        MARKET_URLS (dict): 네이버 금융 시장 지표 섹션별 URL
     """
+
+    MARKET_URLS = {
+        'main': "https://m.stock.naver.com/marketindex/home/major/exchange/bond",
+        'bond': "https://m.stock.naver.com/marketindex/home/bondAndInterest/bond/USA",
+        'energy': "https://m.stock.naver.com/marketindex/home/energy",
+        'metals': "https://m.stock.naver.com/marketindex/home/metals",
+        'agri': "https://m.stock.naver.com/marketindex/home/agricultural"
+    }
+
+    # 재실행 범위 계산에 사용되는 state 입출력 키
+    reads = ("macro_question",)
+    writes = ("macro_report",)
+
+    # 1회 실행 제한 시간(초)과 재시도 정책
+    timeout = 120
+    retry = RetryPolicy(max_attempts=3)
+    # 기업과 무관한 시장 지표 분석이므로 30분 동안 결과를 재사용
+    cache_ttl = 30 * 60
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
         load_dotenv()
@@ -35,7 +57,8 @@ class MacroeconomicAnalysisAgent(Node):
         # LLM 모델 초기화
         self.llm = ChatOpenAI(
             model_name="gpt-4o-mini",
-            temperature=0.5
+            temperature=0.5,
+            callbacks=[llm_span_callback]
         )
 
         self.system_prompt = SystemMessage(content=(
@@ -82,18 +105,10 @@ class MacroeconomicAnalysisAgent(Node):
             requests.RequestException: 데이터 수집 실패 시
         """
         
-        urls = {
-            'main': "https://m.stock.naver.com/marketindex/home/major/exchange/bond",
-            'bond': "https://m.stock.naver.com/marketindex/home/bondAndInterest/bond/USA",
-            'energy': "https://m.stock.naver.com/marketindex/home/energy",
-            'metals': "https://m.stock.naver.com/marketindex/home/metals",
-            'agri': "https://m.stock.naver.com/marketindex/home/agricultural"
-        }
-        
         try:
             soups = {}
-            for key, url in urls.items():
-                response = requests.get(url)
+            for key, url in self.MARKET_URLS.items():
+                response = requests.get(url, timeout=10)
                 response.raise_for_status()
                 soups[key] = BeautifulSoup(response.text, 'html.parser')
             
@@ -104,6 +119,28 @@ class MacroeconomicAnalysisAgent(Node):
             print(f"데이터 수집 오류: {e}")
             return {}
 
+    async def aget_market_data(self) -> dict:
+        """
+        get_market_data()의 비동기 버전입니다.
+        5개 섹션 페이지를 비동기 HTTP 클라이언트로 동시에 요청합니다.
+
+        Returns:
+            dict: 수집된 시장 데이터
+                형식: {'항목명': {'price': '가격', 'change': '변동폭'}}
+
+        Raises:
+            httpx.HTTPError: 데이터 수집 실패 시 (시간 초과 포함, 노드의 재시도 정책으로 다시 시도)
+        """
+
+        async with httpx.AsyncClient(timeout=remaining_time(10.0)) as client:
+            responses = await asyncio.gather(
+                *(client.get(url) for url in self.MARKET_URLS.values()))
+        soups = {}
+        for key, response in zip(self.MARKET_URLS, responses):
+            response.raise_for_status()
+            soups[key] = BeautifulSoup(response.text, 'html.parser')
+        return self._parse_market_data(soups)
+
     def _parse_market_data(self, soups: dict) -> dict:
         """
         BeautifulSoup 객체에서 필요한 시장 데이터를 추출합니다.
@@ -185,11 +222,17 @@ class MacroeconomicAnalysisAgent(Node):
                 - 한국 시장 영향 분석
                 - 리스크 요인
                 - 투자 전략
+
+        Raises:
+            httpx.HTTPError: 시장 데이터 요청 실패 시
+            ValueError: 페이지에서 시장 데이터를 찾지 못한 경우
         """
         
-        market_data = self.get_market_data()
+        with start_span("naver.market_index", pages=len(self.MARKET_URLS)) as span:
+            market_data = await self.aget_market_data()
+            span.set_attribute("ok", bool(market_data))
         if not market_data:
-            return "시장 데이터를 가져오는데 실패했습니다."
+            raise ValueError("시장 데이터를 가져오는데 실패했습니다.")
             
         formatted_data = self.format_market_data(market_data)
         final_answer = await self.final_answer_chain.ainvoke({
@@ -209,9 +252,9 @@ class MacroeconomicAnalysisAgent(Node):
             str: 분석 결과
         """
         
-        return asyncio.run(self.analyze_macro(query))
+        return run_sync(self.analyze_macro(query))
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph 노드로서 거시경제 분석을 수행합니다.
 
@@ -237,13 +280,32 @@ class MacroeconomicAnalysisAgent(Node):
             "현재 거시경제 지표들이 한국 주식 시장에 미치는 영향을 분석하고, 투자 전략을 제시해주세요."
         )
 
-        # 비동기 함수 호출을 동기 방식으로 처리
-        analysis_result = asyncio.run(self.analyze_macro(query))
+        analysis_result = await self.analyze_macro(query)
 
         # 분석 결과를 state에 저장
         state["macro_report"] = analysis_result
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+        return state
+
+    def process(self, state: GraphState) -> GraphState:
+        """
+        aprocess()를 동기 방식으로 실행하는 adapter입니다.
+
+        Args:
+            state (GraphState): 현재 그래프의 상태
+
+        Returns:
+            GraphState: 'macro_report'가 추가된 상태
+        """
+        return run_sync(self.aprocess(state))
+
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        거시경제 분석 대신 실패 안내를 'macro_report'에 기록합니다.
+        """
+        state["macro_report"] = failure_message("거시경제 분석", error)
         return state
 
 
@@ -1,6 +1,8 @@
 import os
-import time
+import asyncio
 import feedparser
+import httpx
+import requests
 from urllib.parse import quote
 from dotenv import load_dotenv
 
@@ -9,7 +11,9 @@ from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
 # LangGraph_base에서 Node, GraphState import (파일명이 LangGraph_base.py)
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, failure_message, RetryPolicy, remaining_time, run_sync
+from tracing_callbacks import llm_span_callback
+from graph_tracing import start_span
 
 class GoogleNewsFetcher:
     """
@@ -46,7 +50,35 @@ class GoogleNewsFetcher:
                 }
         """
         
-        news_data = feedparser.parse(url)
+        # feedparser.parse(url)는 제한 시간을 지정할 수 없으므로 직접 내려받아 파싱
+        response = requests.get(url, timeout=10)
+        response.raise_for_status()
+        news_data = feedparser.parse(response.content)
+        return self._parse_entries(news_data, k)
+
+    async def _afetch_news(self, url: str, k: int = 3) -> list:
+        """
+        RSS 피드를 비동기 HTTP 클라이언트로 내려받아 지정된 수의 뉴스 항목을 가져옵니다.
+
+        Args:
+            url (str): RSS 피드 URL
+            k (int, optional): 가져올 뉴스 항목 수. 기본값은 3
+
+        Returns:
+            list: _fetch_news()와 같은 형식의 뉴스 항목 리스트
+        """
+
+        async with httpx.AsyncClient(timeout=remaining_time(10.0), follow_redirects=True) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+        news_data = feedparser.parse(response.text)
+        return self._parse_entries(news_data, k)
+
+    def _parse_entries(self, news_data, k: int) -> list:
+        """
+        feedparser 결과에서 상위 k개의 뉴스 항목을 추출합니다.
+        """
+
         entries = news_data.entries[:k]
         result = []
         for entry in entries:
@@ -104,12 +136,36 @@ class GoogleNewsFetcher:
                 }
         """
         
+        with start_span("google_news.rss", keyword=keyword) as span:
+            news_list = self._fetch_news(self._build_url(keyword), k)
+            span.set_attribute("items", len(news_list))
+        return self._collect_news(news_list)
+
+    def _build_url(self, keyword: str) -> str:
+        """
+        키워드 검색용 RSS URL을 생성합니다.
+        """
+
         if keyword:
             encoded_keyword = quote(keyword)
-            url = f"{self.base_url}/search?q={encoded_keyword}&hl=ko&gl=KR&ceid=KR:ko"
-        else:
-            url = f"{self.base_url}?hl=ko&gl=KR&ceid=KR:ko"
-        news_list = self._fetch_news(url, k)
+            return f"{self.base_url}/search?q={encoded_keyword}&hl=ko&gl=KR&ceid=KR:ko"
+        return f"{self.base_url}?hl=ko&gl=KR&ceid=KR:ko"
+
+    async def afetch_news_by_keyword(self, keyword: str, k: int = 3) -> list:
+        """
+        fetch_news_by_keyword()의 비동기 버전입니다.
+
+        Args:
+            keyword (str): 검색할 키워드
+            k (int, optional): 가져올 뉴스 항목 수. 기본값은 3
+
+        Returns:
+            list: 수집된 뉴스 항목 리스트
+        """
+
+        with start_span("google_news.rss", keyword=keyword) as span:
+            news_list = await self._afetch_news(self._build_url(keyword), k)
+            span.set_attribute("items", len(news_list))
         return self._collect_news(news_list)
 
 class NewsAnalysisAgent(Node):
@@ -128,6 +184,14 @@ class NewsAnalysisAgent(Node):
         news_fetcher (GoogleNewsFetcher): 뉴스 수집을 위한 인스턴스
     """
     
+    # 재실행 범위 계산에 사용되는 state 입출력 키
+    reads = ("company_name",)
+    writes = ("news_report",)
+
+    # 1회 실행 제한 시간(초)과 재시도 정책
+    timeout = 120
+    retry = RetryPolicy(max_attempts=3)
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
         load_dotenv()  # 환경변수 로드
@@ -135,7 +199,8 @@ class NewsAnalysisAgent(Node):
         # LLM 초기화 
         self.llm = ChatOpenAI(
             model_name="gpt-4o-mini",
-            temperature=0.5
+            temperature=0.5,
+            callbacks=[llm_span_callback]
         )
 
         # 시스템 프롬프트: 뉴스 분석 전문가 역할 정의
@@ -195,7 +260,7 @@ class NewsAnalysisAgent(Node):
             formatted += f"{idx}. {news['title']} (발행일: {news['published']})\n"
         return formatted
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph 노드로서 뉴스 수집 및 분석을 수행합니다.
 
@@ -223,18 +288,38 @@ class NewsAnalysisAgent(Node):
         company = state.get("company_name", "Unknown")
         
         # 특정 기업 관련 최신 뉴스 10개를 불러옴
-        news_items = self.news_fetcher.fetch_news_by_keyword(company, k=10)
+        news_items = await self.news_fetcher.afetch_news_by_keyword(company, k=10)
         formatted_news = self.format_news_data(news_items)
         
         # LLM을 통한 뉴스 분석 실행
         query = f"해당 뉴스 데이터가 {company} 주식 시장에 미치는 영향과 투자 전략에 대해 분석해주세요."
-        final_answer = self.final_answer_chain.invoke({
+        final_answer = await self.final_answer_chain.ainvoke({
             "news_data": formatted_news,
             "query": query
         })
         state["news_report"] = final_answer.content
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+        return state
+
+    def process(self, state: GraphState) -> GraphState:
+        """
+        aprocess()를 동기 방식으로 실행하는 adapter입니다.
+
+        Args:
+            state (GraphState): 'company_name' 키를 포함한 상태 정보
+
+        Returns:
+            GraphState: 뉴스 분석 결과가 포함된 업데이트된 상태
+        """
+        return run_sync(self.aprocess(state))
+
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        뉴스 분석 대신 실패 안내를 'news_report'에 기록합니다.
+        """
+        state["news_report"] = failure_message("뉴스 분석", error)
         return state
 
 if __name__ == "__main__":
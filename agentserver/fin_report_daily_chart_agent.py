@@ -1,7 +1,7 @@
 import os
-import time
 import asyncio
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
 import pandas as pd
 from dotenv import load_dotenv
 
@@ -12,7 +12,14 @@ from langchain_openai import ChatOpenAI
 from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, failure_message, RetryPolicy, remaining_time, run_sync
+from tracing_callbacks import llm_span_callback
+from graph_tracing import start_span
+
+# 일봉/월봉 조회 제한 시간 (초)
+OHLCV_TIMEOUT = 30.0
+# 여러 종목의 일봉/월봉을 미리 조회할 때 동시에 요청하는 수 (증권사 API 초당 요청 제한 고려)
+OHLCV_PREFETCH_WORKERS = int(os.getenv("OHLCV_PREFETCH_WORKERS", 4))
 
 load_dotenv() 
 
@@ -39,6 +46,14 @@ class DailyChartAnalysisAgent(Node):
         analysis_prompt (PromptTemplate): 기술적 분석을 위한 프롬프트 템플릿
         analysis_chain: 프롬프트와 LLM을 연결한 체인
     """
+    # 재실행 범위 계산에 사용되는 state 입출력 키
+    reads = ("company_name", "company_code", "chart_question")
+    writes = ("daily_chart_report",)
+
+    # 1회 실행 제한 시간(초)과 재시도 정책
+    timeout = 120
+    retry = RetryPolicy(max_attempts=3)
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
         self.broker = self._initialize_broker()
@@ -46,6 +61,7 @@ class DailyChartAnalysisAgent(Node):
         self.chat_model = ChatOpenAI(
             model_name="gpt-4o-mini",
             temperature=0.4,
+            callbacks=[llm_span_callback]
         )
         
         self.target_stocks = {
@@ -94,6 +110,9 @@ class DailyChartAnalysisAgent(Node):
 
         self.analysis_chain = self.analysis_prompt | self.chat_model
 
+        # prefetch()로 미리 조회한 OHLCV 원본 응답 ((종목 코드, 'D'/'M') -> 데이터)
+        self._prefetched: Dict[Tuple[str, str], list] = {}
+
     def _initialize_broker(self) -> Optional[mojito.KoreaInvestment]:
         """
         한국투자증권 API 클라이언트를 초기화합니다.
@@ -124,6 +143,33 @@ class DailyChartAnalysisAgent(Node):
             acc_no=acc_no
         )
 
+    def _fetch_ohlcv(self, stock_code: str, timeframe: str) -> Optional[list]:
+        """
+        특정 종목의 일봉('D') 또는 월봉('M') 데이터를 조회합니다.
+        prefetch()로 미리 조회한 데이터가 있으면 API를 호출하지 않습니다.
+
+        Args:
+            stock_code (str): 종목 코드
+            timeframe (str): 'D'(일봉) 또는 'M'(월봉)
+
+        Returns:
+            Optional[list]: OHLCV 데이터 리스트, 조회 실패 시 None 반환
+        """
+
+        prefetched = self._prefetched.get((stock_code, timeframe))
+        if prefetched is not None:
+            return prefetched
+        if not self.broker:
+            print("Broker 객체가 없습니다.")
+            return None
+        with start_span("kis.fetch_ohlcv", symbol=stock_code, timeframe=timeframe):
+            data = self.broker.fetch_ohlcv(
+                symbol=stock_code,
+                timeframe=timeframe,
+                adj_price=True
+            )
+        return data.get('output2', [])[:-3] if data else None
+
     def get_daily_data(self, stock_code: str) -> Optional[list]:
         """
         특정 종목의 일봉 데이터를 조회합니다.
@@ -137,16 +183,8 @@ class DailyChartAnalysisAgent(Node):
                 조회 실패 시 None 반환
         """
         
-        if not self.broker:
-            print("Broker 객체가 없습니다.")
-            return None
         try:
-            daily_data = self.broker.fetch_ohlcv(
-                symbol=stock_code,
-                timeframe='D',
-                adj_price=True
-            )
-            return daily_data.get('output2', [])[:-3] if daily_data else None
+            return self._fetch_ohlcv(stock_code, 'D')
         except Exception as e:
             print(f"일봉 데이터 조회 실패: {e}")
             return None
@@ -164,20 +202,46 @@ class DailyChartAnalysisAgent(Node):
                 조회 실패 시 None 반환
         """
         
-        if not self.broker:
-            print("Broker 객체가 없습니다.")
-            return None
         try:
-            monthly_data = self.broker.fetch_ohlcv(
-                symbol=stock_code,
-                timeframe='M',
-                adj_price=True
-            )
-            return monthly_data.get('output2', [])[:-3] if monthly_data else None
+            return self._fetch_ohlcv(stock_code, 'M')
         except Exception as e:
             print(f"월봉 데이터 조회 실패: {e}")
             return None
 
+    def prefetch(self, stock_codes: Iterable[str], max_workers: int = OHLCV_PREFETCH_WORKERS) -> int:
+        """
+        여러 종목의 일봉/월봉 데이터를 한 번에 미리 조회합니다. (유니버스 배치용)
+        이후 분석에서는 API를 다시 호출하지 않고 조회해 둔 데이터를 사용합니다.
+
+        Args:
+            stock_codes (Iterable[str]): 종목 코드 목록
+            max_workers (int): 동시에 요청하는 수
+
+        Returns:
+            int: 조회에 성공한 (종목, 일봉/월봉) 수
+
+        Note:
+            조회에 실패한 종목은 분석 시점에 다시 조회합니다.
+            배치가 끝나면 clear_prefetch()로 비워야 다음 실행에서 최신 데이터를 조회합니다.
+        """
+
+        def fetch(job: Tuple[str, str]) -> Optional[list]:
+            code, timeframe = job
+            return self.get_daily_data(code) if timeframe == 'D' else self.get_monthly_data(code)
+
+        jobs = [(code, timeframe) for code in stock_codes for timeframe in ('D', 'M')]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, jobs))
+        self._prefetched.update({job: data for job, data in zip(jobs, results) if data})
+        return sum(1 for data in results if data)
+
+    def clear_prefetch(self) -> None:
+        """
+        prefetch()로 조회해 둔 데이터를 비웁니다.
+        """
+
+        self._prefetched.clear()
+
     def save_to_csv(self, data: list, filename: str) -> Optional[pd.DataFrame]:
         """
         OHLCV 데이터를 DataFrame으로 변환합니다.
@@ -234,13 +298,14 @@ class DailyChartAnalysisAgent(Node):
                   f"{monthly_df.to_string(index=False)}"
         return context
 
-    async def analyze_stock(self, company_name: str, question: str) -> str:
+    async def analyze_stock(self, company_name: str, question: str, stock_code: Optional[str] = None) -> str:
         """
         주식 데이터를 수집하고 기술적 분석을 수행합니다.
 
         Args:
             company_name (str): 분석할 기업명
             question (str): 분석 요청 질문
+            stock_code (Optional[str]): 종목 코드, 없으면 target_stocks에서 찾음
 
         Returns:
             str: 기술적 분석 결과
@@ -251,17 +316,24 @@ class DailyChartAnalysisAgent(Node):
                 - 매매 전략 제안
                 
         Note:
-            target_stocks에 없는 종목은 분석이 불가능합니다.
+            종목 코드 없이 요청한 경우 target_stocks에 없는 종목은 분석이 불가능합니다.
         """
         
-        if company_name not in self.target_stocks:
+        code = stock_code or self.target_stocks.get(company_name)
+        if code is None:
             return f"종목 {company_name}은(는) 관심 종목 리스트에 없습니다."
 
-        code = self.target_stocks[company_name]
         print(f"\n=== {company_name}({code}) 분석 시작 ===")
 
-        daily_data = self.get_daily_data(code)
-        monthly_data = self.get_monthly_data(code)
+        # mojito는 동기 라이브러리이므로 일봉/월봉 조회를 별도 스레드에서 동시에 실행
+        # (fetch_ohlcv는 제한 시간을 지정할 수 없으므로 대기 시간을 제한)
+        daily_data, monthly_data = await asyncio.wait_for(
+            asyncio.gather(
+                asyncio.to_thread(self.get_daily_data, code),
+                asyncio.to_thread(self.get_monthly_data, code),
+            ),
+            timeout=remaining_time(OHLCV_TIMEOUT),
+        )
 
         if not daily_data or not monthly_data:
             return "데이터 조회 실패"
@@ -291,9 +363,9 @@ class DailyChartAnalysisAgent(Node):
             str: 분석 결과
         """
         
-        return asyncio.run(self.analyze_stock(company_name, question))
+        return run_sync(self.analyze_stock(company_name, question))
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph 노드로서 차트 분석을 수행합니다.
 
@@ -301,6 +373,7 @@ class DailyChartAnalysisAgent(Node):
             state (GraphState): 현재 그래프의 상태
                 필요한 키:
                 - company_name: 분석할 기업명
+                - company_code (optional): 종목 코드
                 - chart_question (optional): 분석 요청 질문
 
         Returns:
@@ -316,10 +389,30 @@ class DailyChartAnalysisAgent(Node):
         company = state.get("company_name", "")
         question = state.get("chart_question", "최근 일봉과 월봉 데이터를 기반으로, 주요 지지선과 저항선, 거래량 변화, 기술적 지표(RSI, MACD 등)를 고려하여 단기 및 중기 주가 전망과 추천 매매 전략(매수/매도/관망)을 구체적으로 분석해 주세요.")
 
-        analysis_result = asyncio.run(self.analyze_stock(company, question))
+        analysis_result = await self.analyze_stock(company, question, state.get("company_code"))
         state["daily_chart_report"] = analysis_result
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+        return state
+
+    def process(self, state: GraphState) -> GraphState:
+        """
+        aprocess()를 동기 방식으로 실행하는 adapter입니다.
+
+        Args:
+            state (GraphState): 'company_name' 키를 포함한 상태 정보
+
+        Returns:
+            GraphState: 'daily_chart_report'가 추가된 상태
+        """
+        return run_sync(self.aprocess(state))
+
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        차트 분석 대신 실패 안내를 'daily_chart_report'에 기록합니다.
+        """
+        state["daily_chart_report"] = failure_message("일봉/월봉 차트 분석", error)
         return state
 
 if __name__ == "__main__":
@@ -1,8 +1,92 @@
 import os
 import time
+from typing import List, Optional, Tuple
 import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM
-from LangGraph_base import Node, GraphState
+from transformers import AutoTokenizer, AutoModelForCausalLM, DynamicCache
+from LangGraph_base import Node, GraphState, remaining_time
+from graph_batching import MicroBatcher
+from graph_tracing import start_span
+
+# 한 번의 forward에 묶을 최대 리포트 수, 1이면 동시 호출을 모으지 않고 한 건씩 평가
+SCORER_BATCH_SIZE = int(os.environ.get("SCORER_BATCH_SIZE", 8))
+# 동시에 실행 중인 파이프라인의 평가 요청을 더 모으기 위해 기다리는 최대 시간 (초)
+SCORER_BATCH_WAIT = float(os.environ.get("SCORER_BATCH_WAIT", 0.05))
+# 한 번의 forward에 넣는 패딩 포함 최대 토큰 수 (배치 크기 x 최장 길이), 긴 리포트끼리는 더 작은 배치로 나눔
+SCORER_BATCH_TOKENS = int(os.environ.get("SCORER_BATCH_TOKENS", 8192))
+# 고정 지시문(프롬프트 앞부분)의 KV 캐시를 로드 시 한 번 계산해 두고 재사용할지 여부
+SCORER_PREFIX_CACHE = os.environ.get("SCORER_PREFIX_CACHE", "1") not in ("0", "false", "False")
+# 평가할 리포트의 최대 토큰 수, 넘으면 앞부분과 뒷부분만 남기고 가운데를 생략 (0이면 제한 없음)
+SCORER_MAX_REPORT_TOKENS = int(os.environ.get("SCORER_MAX_REPORT_TOKENS", 4096))
+# 리포트를 줄일 때 앞부분에 배정하는 토큰 비율 (나머지는 결론이 있는 뒷부분)
+SCORER_TRUNCATE_HEAD = float(os.environ.get("SCORER_TRUNCATE_HEAD", 0.5))
+# 추론 백엔드: auto(하드웨어에 따라 선택), cuda-fp16, cpu-bf16, cpu-int8(Linear 동적 양자화), cpu-fp32
+SCORER_BACKEND = os.environ.get("SCORER_BACKEND", "auto")
+# CPU 추론 스레드 수, 0이면 사용 가능한 코어 수를 워커 프로세스 수(WORKER_PROCESSES)로 나눈 값
+SCORER_NUM_THREADS = int(os.environ.get("SCORER_NUM_THREADS", 0))
+# CPU 백엔드에서 torch.compile 사용 여부 (첫 추론에서 컴파일 시간이 추가됨)
+SCORER_COMPILE = os.environ.get("SCORER_COMPILE", "0") not in ("0", "false", "False")
+# 평가 서비스(worker/scorer_service.py) 주소, 설정하면 모델을 로드하지 않고 서비스에 평가를 요청
+SCORER_SERVICE_URL = os.environ.get("SCORER_SERVICE_URL")
+
+SCORER_BACKENDS = {
+    "cuda-fp16": ("cuda", torch.float16),
+    "cpu-bf16": ("cpu", torch.bfloat16),
+    "cpu-int8": ("cpu", torch.float32),
+    "cpu-fp32": ("cpu", torch.float32),
+}
+
+
+def cpu_flags() -> set:
+    """
+    /proc/cpuinfo의 CPU 기능 플래그를 반환합니다. (Linux 외에서는 빈 집합)
+    """
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+
+def select_backend(requested: str = "auto") -> Tuple[str, str]:
+    """
+    평가 모델의 추론 백엔드를 선택합니다.
+
+    Args:
+        requested (str): SCORER_BACKENDS의 이름 또는 "auto"
+
+    Returns:
+        Tuple[str, str]: (백엔드 이름, 선택 이유)
+
+    Note:
+        auto는 CUDA가 있으면 cuda-fp16, 없으면 CPU가 bf16 연산을 하드웨어로 지원(AMX/AVX512-BF16)할 때
+        cpu-bf16, 그 외에는 cpu-int8을 선택합니다. CPU의 fp16 행렬 연산은 매우 느리므로 사용하지 않습니다.
+    """
+    if requested != "auto":
+        if requested not in SCORER_BACKENDS:
+            raise ValueError(f"알 수 없는 SCORER_BACKEND: {requested} (사용 가능: auto, {', '.join(SCORER_BACKENDS)})")
+        if requested.startswith("cuda") and not torch.cuda.is_available():
+            return "cpu-int8", f"{requested} 요청, CUDA 없음"
+        return requested, "설정값"
+    if torch.cuda.is_available():
+        return "cuda-fp16", f"CUDA 사용 가능 ({torch.cuda.get_device_name(0)})"
+    flags = cpu_flags()
+    if flags & {"amx_bf16", "avx512_bf16"}:
+        return "cpu-bf16", f"CPU bf16 지원 ({', '.join(sorted(flags & {'amx_bf16', 'avx512_bf16'}))})"
+    return "cpu-int8", "CUDA/CPU bf16 미지원"
+
+
+def cpu_threads(requested: int = SCORER_NUM_THREADS) -> int:
+    """
+    CPU 추론 스레드 수를 정합니다. 한 머신에서 워커 프로세스 여러 개가 모델을 실행하므로
+    코어를 프로세스 수로 나눠 스레드가 서로 경쟁하지 않게 합니다.
+    """
+    if requested > 0:
+        return requested
+    available = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    return max(1, available // max(1, int(os.environ.get("WORKER_PROCESSES", 1))))
 
 def safe_softmax(logits: torch.Tensor, dim: int = 0) -> torch.Tensor:
     """
@@ -45,27 +129,93 @@ class ReportScorerAgent(Node):
         name (str): 에이전트의 이름
         model_name (str): 사용할 LLM 모델의 이름
         device (str): 연산에 사용할 디바이스 ('cuda' 또는 'cpu')
+        backend (str): 추론 백엔드 (SCORER_BACKENDS 참고)
+        service_url (Optional[str]): 평가 서비스 주소 (설정 시 모델 없이 서비스에 요청하는 클라이언트로 동작)
+        batcher (Optional[MicroBatcher]): 동시에 들어온 평가 요청을 모으는 배치 처리기
         tokenizer: 텍스트 토크나이저
         model: 로드된 LLM 모델
         valid_tokens (dict): 유효한 숫자 토큰들의 매핑
     """
-    def __init__(self, name: str, eval_model: str) -> None:
+    # 재실행 범위 계산에 사용되는 state 입출력 키
+    reads = ("integrated_report",)
+    writes = ("report_score",)
+
+    # 1회 실행 제한 시간(초), GPU 추론이므로 재시도하지 않음
+    timeout = 300
+
+    def __init__(self, name: str, eval_model: str, batch_size: int = SCORER_BATCH_SIZE,
+                 batch_wait: float = SCORER_BATCH_WAIT, prefix_cache: bool = SCORER_PREFIX_CACHE,
+                 backend: str = SCORER_BACKEND, compile_model: bool = SCORER_COMPILE,
+                 service_url: Optional[str] = SCORER_SERVICE_URL,
+                 max_report_tokens: int = SCORER_MAX_REPORT_TOKENS) -> None:
         super().__init__(name)
         self.model_name = eval_model
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.service_url = service_url.rstrip("/") if service_url else None
+        self.batcher: Optional[MicroBatcher] = None
+        if self.service_url:
+            # 모델은 평가 서비스 한 곳에만 로드하고, 서비스가 여러 워커의 요청을 모아 배치로 평가
+            import requests
+            self._session = requests.Session()
+            print(f"[{self.name}] 평가 서비스 사용: {self.service_url}")
+            return
+        self.backend, reason = select_backend(backend)
+        self.device, dtype = SCORER_BACKENDS[self.backend]
         self.tokenizer = AutoTokenizer.from_pretrained(
             self.model_name,
-            torch_dtype=torch.float16,
+            torch_dtype=dtype,
             trust_remote_code=True,
         )
         self.model = AutoModelForCausalLM.from_pretrained(
             self.model_name,
-            torch_dtype=torch.float16,
+            torch_dtype=dtype,
             trust_remote_code=True,
         )
         self.model.to(self.device)
         self.model.eval()
+        self._prepare_backend(compile_model)
+        print(f"[{self.name}] 평가 모델 백엔드: {self.backend} ({reason})"
+              + (f", 스레드 {torch.get_num_threads()}, torch.compile {'사용' if self.compiled else '미사용'}"
+                 if self.device == "cpu" else ""))
         self._prepare_valid_tokens()
+        self._prepare_digit_head()
+        self.max_report_tokens = max_report_tokens
+        self.batch_size = max(1, batch_size)
+        pad_token_id = self.tokenizer.pad_token_id
+        self.pad_token_id = pad_token_id if pad_token_id is not None else (self.tokenizer.eos_token_id or 0)
+        self.prefix_ids: List[int] = []
+        self.prefix_past: Optional[tuple] = None
+        if prefix_cache:
+            self.prepare_prefix_cache()
+        # 여러 파이프라인 스레드에서 동시에 들어온 평가 요청을 모아 한 번의 forward로 처리
+        self.batcher = MicroBatcher(self._score_batch, max_size=self.batch_size, max_wait=batch_wait,
+                                    name=name) if self.batch_size > 1 else None
+
+    def _prepare_backend(self, compile_model: bool) -> None:
+        """
+        CPU 백엔드의 스레드 수를 맞추고, cpu-int8이면 Linear 레이어를 동적 int8 양자화하며,
+        compile_model이 켜져 있으면 forward를 torch.compile합니다.
+
+        Note:
+            출력 임베딩(lm_head)은 점수 계산에 쓰는 숫자 토큰 logits의 정밀도를 위해 양자화하지 않습니다.
+            torch.compile에 실패하면 eager 실행으로 계속합니다.
+        """
+        self.compiled = False
+        if self.device != "cpu":
+            return
+        torch.set_num_threads(cpu_threads())
+        if self.backend == "cpu-int8":
+            output = self.model.get_output_embeddings()
+            linear = {module_name for module_name, module in self.model.named_modules()
+                      if isinstance(module, torch.nn.Linear) and module is not output}
+            torch.ao.quantization.quantize_dynamic(self.model, linear, dtype=torch.qint8, inplace=True)
+        if compile_model:
+            try:
+                # 평가는 출력 임베딩 없이 base model만 실행하므로 base model의 forward를 컴파일
+                base = self.model.base_model
+                base.forward = torch.compile(base.forward, dynamic=True)
+                self.compiled = True
+            except Exception as e:
+                print(f"[{self.name}] torch.compile 실패, eager로 실행: {e}")
 
     def _prepare_valid_tokens(self):
         """
@@ -90,8 +240,224 @@ class ReportScorerAgent(Node):
         self.numeric_values = torch.tensor([0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
                                              dtype=torch.float32,
                                              device=self.device)
+        self.valid_token_ids = torch.tensor([self.valid_tokens[token] for token in self.valid_token_list],
+                                            dtype=torch.long, device=self.device)
+
+    def _prepare_digit_head(self) -> None:
+        """
+        출력 임베딩(lm_head)에서 0~9 숫자 토큰의 행만 떼어 둡니다.
+        평가에는 마지막 위치의 숫자 10개 logits만 필요하므로, 전체 vocab logits 대신
+        마지막 hidden state를 이 10개 행에만 투영합니다.
+
+        Note:
+            logit 스케일링/소프트캡을 출력 임베딩 밖에서 적용하는 모델(Gemma2, Cohere 등)은 지원하지 않습니다.
+            평가 모델(EXAONE, Qwen 계열)은 lm_head 투영만 사용합니다.
+        """
+        output = self.model.get_output_embeddings()
+        self.digit_weight = output.weight[self.valid_token_ids].detach().clone()
+        bias = getattr(output, "bias", None)
+        self.digit_bias = bias[self.valid_token_ids].detach().clone() if bias is not None else None
+
+    def truncate_report(self, report: str) -> str:
+        """
+        리포트가 max_report_tokens를 넘으면 앞부분(요약)과 뒷부분(결론)만 남기고 가운데를 생략합니다.
+        입력 길이가 제한되므로 리포트가 아무리 길어도 평가 메모리 사용량이 일정합니다.
+
+        Args:
+            report (str): 평가할 리포트 텍스트
+
+        Returns:
+            str: 토큰 예산 안으로 줄인 리포트 (예산 이내면 그대로)
+        """
+        if self.max_report_tokens <= 0:
+            return report
+        ids = self.tokenizer.encode(report, add_special_tokens=False)
+        if len(ids) <= self.max_report_tokens:
+            return report
+        head = int(self.max_report_tokens * SCORER_TRUNCATE_HEAD)
+        tail = self.max_report_tokens - head
+        print(f"[{self.name}] 리포트 {len(ids)} 토큰을 {self.max_report_tokens} 토큰으로 축약 (앞 {head}, 뒤 {tail})")
+        return (self.tokenizer.decode(ids[:head]) + "\n...(중략)...\n"
+                + (self.tokenizer.decode(ids[-tail:]) if tail > 0 else ""))
+
+    @staticmethod
+    def build_prompt(report: str) -> str:
+        """
+        리포트를 평가 프롬프트로 만듭니다.
+        """
+        return f"""
+        다음 주식 리포트가 잘 작성되어 있는지 꼼꼼하게 확인하고, 리포트의 품질을 0에서 9점 사이의 점수로 평가해주세요.\n {report}\n
+        평가 점수: """  # 평가 대상 텍스트로 사용
+
+    def expected_score(self, token_logits: torch.Tensor) -> float:
+        """
+        마지막 위치의 0~9 숫자 토큰 logits으로 확률을 구해 기대 점수를 계산합니다.
+
+        Args:
+            token_logits (torch.Tensor): 숫자 0~9 순서의 logits (길이 10 1차원 텐서)
+
+        Returns:
+            float: 1~10 가중치로 계산한 기대 점수
+        """
+        # bf16/fp16 logits의 확률 계산 오차를 줄이기 위해 fp32로 계산
+        token_logits = token_logits.float()
+        # 온도 스케일링 (여기서는 temperature=1.0)
+        token_logits = token_logits / 1.0
+        probs = safe_softmax(token_logits, dim=0)
+        t = torch.tensor([1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+                         dtype=torch.float32,
+                         device=self.device)
+        return (probs * t).sum().item()
 
     @torch.no_grad()
+    def prepare_prefix_cache(self) -> None:
+        """
+        모든 평가 프롬프트가 공통으로 시작하는 토큰(특수 토큰 + 고정 지시문)의 past_key_values를 계산해 둡니다.
+        이후 평가에서는 리포트와 "평가 점수:" 부분의 토큰만 forward합니다.
+
+        Note:
+            지시문 끝 공백이 리포트 첫 글자와 합쳐져 토큰화될 수 있으므로, 지시문만 따로 토큰화하지 않고
+            서로 다른 리포트로 만든 프롬프트들의 공통 앞부분 토큰을 캐시합니다.
+            모델 dtype/디바이스를 바꾼 뒤에는 다시 호출해야 합니다.
+        """
+        probes = [self.tokenizer(self.build_prompt(text))["input_ids"] for text in ("삼성전자", "A", "1", " ")]
+        length = 0
+        while all(len(ids) > length and ids[length] == probes[0][length] for ids in probes):
+            length += 1
+        self.prefix_ids = probes[0][:length]
+        if not self.prefix_ids:
+            self.prefix_past = None
+            return
+        outputs = self.model.base_model(input_ids=torch.tensor([self.prefix_ids], device=self.device), use_cache=True)
+        past = outputs.past_key_values
+        # 레이어별 (key, value) 텐서로 보관하고 호출마다 새 캐시 객체를 만들어 원본이 확장되지 않게 함
+        self.prefix_past = past.to_legacy_cache() if hasattr(past, "to_legacy_cache") else tuple(past)
+
+    def _prefix_cache(self, batch_size: int):
+        """
+        보관한 prefix KV를 batch_size만큼 늘린(expand, 복사 없음) 새 캐시를 만듭니다.
+        """
+        return DynamicCache.from_legacy_cache(tuple(
+            (key.expand(batch_size, *key.shape[1:]), value.expand(batch_size, *value.shape[1:]))
+            for key, value in self.prefix_past))
+
+    def _buckets(self, encoded: List[Tuple[int, List[int]]]) -> List[List[Tuple[int, List[int]]]]:
+        """
+        (원래 순서, 토큰 ID) 목록을 길이순으로 정렬한 뒤 배치로 나눕니다.
+        길이가 비슷한 리포트끼리 묶이므로 패딩이 적고, 배치마다 패딩 포함 토큰 수가
+        SCORER_BATCH_TOKENS를 넘지 않도록 긴 리포트는 더 작은 배치로 나눕니다. (리포트 1건은 항상 허용)
+        """
+        buckets, bucket = [], []
+        for entry in sorted(encoded, key=lambda e: len(e[1]), reverse=True):
+            # 내림차순이므로 배치의 첫 리포트가 최장 길이
+            longest = len(bucket[0][1]) if bucket else len(entry[1])
+            if bucket and (len(bucket) >= self.batch_size or (len(bucket) + 1) * longest > SCORER_BATCH_TOKENS):
+                buckets.append(bucket)
+                bucket = []
+            bucket.append(entry)
+        if bucket:
+            buckets.append(bucket)
+        return buckets
+
+    @torch.no_grad()
+    def _forward_digits(self, sequences: List[List[int]]) -> Tuple[torch.Tensor, int]:
+        """
+        토큰 ID 목록을 왼쪽 패딩으로 맞춰 한 번의 forward를 실행하고 각 시퀀스 마지막 위치의 숫자 0~9 logits를 반환합니다.
+        모든 시퀀스가 캐시된 prefix로 시작하면 prefix 이후 토큰만 forward합니다.
+
+        Returns:
+            Tuple[torch.Tensor, int]: (시퀀스별 숫자 logits [배치, 10], 실제로 forward한 토큰 수)
+
+        Note:
+            왼쪽 패딩이므로 모든 시퀀스의 실제 마지막 토큰이 같은 위치(-1)에 오고,
+            attention_mask로 패딩을 가리고 position_ids를 실제 토큰부터 0으로 시작하도록 맞춰
+            한 건씩 평가할 때와 같은 입력이 되게 합니다.
+            prefix 캐시를 쓰면 패딩은 prefix와 리포트 사이에 들어가고, 마스크는 prefix 길이를 포함합니다.
+            출력 임베딩 없이 base model만 실행하고 마지막 위치의 hidden state만 숫자 토큰 행에 투영하므로
+            모든 위치 x 전체 vocab 크기의 logits를 만들지 않습니다.
+        """
+        prefix = len(self.prefix_ids)
+        use_prefix = self.prefix_past is not None and all(
+            len(ids) > prefix and ids[:prefix] == self.prefix_ids for ids in sequences)
+        if use_prefix:
+            sequences = [ids[prefix:] for ids in sequences]
+        else:
+            prefix = 0
+        longest = max(len(ids) for ids in sequences)
+        input_ids = torch.full((len(sequences), longest), self.pad_token_id, dtype=torch.long)
+        attention_mask = torch.zeros((len(sequences), prefix + longest), dtype=torch.long)
+        attention_mask[:, :prefix] = 1
+        for row, ids in enumerate(sequences):
+            input_ids[row, longest - len(ids):] = torch.tensor(ids, dtype=torch.long)
+            attention_mask[row, prefix + longest - len(ids):] = 1
+        position_ids = (attention_mask.cumsum(-1) - 1).clamp(min=0)[:, prefix:]
+        outputs = self.model.base_model(input_ids=input_ids.to(self.device),
+                                        attention_mask=attention_mask.to(self.device),
+                                        position_ids=position_ids.to(self.device),
+                                        past_key_values=self._prefix_cache(len(sequences)) if use_prefix else None,
+                                        use_cache=use_prefix)
+        # 마지막 토큰의 hidden state를 숫자 토큰 행에만 투영
+        hidden = outputs[0][:, -1, :]
+        token_logits = hidden @ self.digit_weight.T
+        if self.digit_bias is not None:
+            token_logits = token_logits + self.digit_bias
+        return token_logits, sum(len(ids) for ids in sequences)
+
+    @torch.no_grad()
+    def _score_batch(self, reports: List[str]) -> List[Tuple[float, int, int]]:
+        """
+        리포트 목록을 길이순 배치로 나눠 평가합니다.
+
+        Returns:
+            List[Tuple[float, int, int]]: 입력 순서대로 (점수, 입력 토큰 수, 함께 실행된 배치 크기)
+                빈 리포트는 forward 없이 (0.0, 0, 0)
+        """
+        results = [(0.0, 0, 0)] * len(reports)
+        encoded = [(index, self.tokenizer(self.build_prompt(self.truncate_report(report)))["input_ids"])
+                   for index, report in enumerate(reports) if report]
+        for bucket in self._buckets(encoded):
+            with start_span("scorer.forward", "model", model=self.model_name, batch_size=len(bucket),
+                            input_tokens=sum(len(ids) for _, ids in bucket)) as span:
+                logits, processed = self._forward_digits([ids for _, ids in bucket])
+                span.set_attribute("processed_tokens", processed)
+            for (index, ids), row in zip(bucket, logits):
+                results[index] = (self.expected_score(row), len(ids), len(bucket))
+        return results
+
+    def _request_scores(self, reports: List[str]) -> List[Tuple[float, int, int]]:
+        """
+        평가 서비스에 리포트 평가를 요청합니다. 요청 제한 시간은 노드 제한 시간과 그래프 남은 시간 중 짧은 쪽입니다.
+
+        Returns:
+            List[Tuple[float, int, int]]: _score_batch()와 같은 (점수, 입력 토큰 수, 배치 크기) 목록
+        """
+        response = self._session.post(f"{self.service_url}/score", json={"reports": reports},
+                                      timeout=remaining_time(self.timeout))
+        response.raise_for_status()
+        body = response.json()
+        return list(zip(body["scores"], body["input_tokens"], body["batch_sizes"]))
+
+    def score_reports(self, reports: List[str]) -> List[float]:
+        """
+        여러 리포트를 한 번(또는 길이별 몇 번)의 forward로 평가합니다.
+
+        길이가 비슷한 리포트끼리 최대 batch_size개씩 묶고 왼쪽 패딩과 attention mask로 한 번에 추론하므로,
+        리포트를 하나씩 process()로 평가할 때와 같은 점수를 반환합니다. (fp16 연산 순서 차이 수준의 오차 제외)
+
+        Args:
+            reports (List[str]): 평가할 리포트 텍스트 목록
+
+        Returns:
+            List[float]: 입력 순서대로의 리포트 점수 (빈 리포트는 0점)
+
+        Example:
+            >>> scorer.score_reports([report_a, report_b, report_c])
+            [6.84, 4.12, 7.35]
+        """
+        if self.service_url:
+            return [score for score, _, _ in self._request_scores(reports)]
+        return [score for score, _, _ in self._score_batch(reports)]
+
     def process(self, state: GraphState) -> GraphState:
         """
         통합 리포트의 품질을 평가하고 점수를 부여합니다.
@@ -112,37 +478,75 @@ class ReportScorerAgent(Node):
         Note:
             리포트가 없을 경우 0점을 부여합니다.
             점수 계산은 토큰 확률의 가중 평균을 사용합니다.
+            리포트가 max_report_tokens를 넘으면 앞/뒷부분만 남겨 평가합니다. (truncate_report 참고)
+            batch_size가 1보다 크면 동시에 실행 중인 다른 파이프라인의 평가 요청과
+            최대 batch_wait초 동안 모아 한 번의 forward로 평가합니다. (score_reports 참고)
+            고정 지시문의 KV 캐시(prepare_prefix_cache)를 재사용하므로 리포트와 "평가 점수:" 토큰만 forward합니다.
+            service_url이 설정되어 있으면 평가 서비스에 요청하고, 배치는 서비스에서 여러 워커의 요청을 모아 만듭니다.
         """
         report = state.get("integrated_report", "")
         if not report:
             state["report_score"] = 0.0
             return state
 
-        prompt = f"""
-        다음 주식 리포트가 잘 작성되어 있는지 꼼꼼하게 확인하고, 리포트의 품질을 0에서 9점 사이의 점수로 평가해주세요.\n {report}\n
-        평가 점수: """  # 평가 대상 텍스트로 사용
-        inputs = self.tokenizer(prompt, return_tensors="pt")
-        inputs = {k: v.to(self.device) for k, v in inputs.items()}
-        outputs = self.model(**inputs)
-        logits = outputs.logits[0, -1, :]  # 마지막 토큰의 logits
-
-        token_logits = []
-        for token in self.valid_token_list:
-            token_id = self.valid_tokens[token]
-            token_logits.append(logits[token_id])
-        token_logits = torch.stack(token_logits)
-        # 온도 스케일링 (여기서는 temperature=1.0)
-        token_logits = token_logits / 1.0
-        probs = safe_softmax(token_logits, dim=0)
-        t = torch.tensor([1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-                         dtype=torch.float32,
-                         device=self.device)
-        final_score = (probs * t).sum().item()
+        if self.service_url:
+            with start_span("scorer.request", "model", model=self.model_name, url=self.service_url) as span:
+                final_score, input_tokens, batch_size = self._request_scores([report])[0]
+                span.set_attribute("input_tokens", input_tokens)
+                span.set_attribute("batch_size", batch_size)
+        elif self.batcher is not None:
+            # 다른 파이프라인의 평가 요청과 묶여 한 번의 forward로 실행됨 (배치 스레드에서 실행)
+            with start_span("scorer.batch_wait", "model", model=self.model_name) as span:
+                final_score, input_tokens, batch_size = self.batcher(report)
+                span.set_attribute("input_tokens", input_tokens)
+                span.set_attribute("batch_size", batch_size)
+        else:
+            final_score, _, _ = self._score_batch([report])[0]
         state["report_score"] = final_score
         print(f"[{self.name}] 보고서 평가 점수: {final_score:.2f} / 10")
         time.sleep(0.5)
         return state
 
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        평가에 실패하거나 제한 시간을 넘긴 경우 점수를 비워 둡니다.
+        감독자 노드는 점수가 없으면 재시도 없이 최종 분석으로 진행합니다.
+        """
+        state["report_score"] = None
+        return state
+
+    @torch.no_grad()
+    def warm_up(self) -> None:
+        """
+        짧은 입력으로 한 번 추론하여 첫 작업에서 발생하는 CUDA 커널 초기화/메모리 할당 지연을 미리 처리합니다.
+        (CPU 백엔드에서 torch.compile을 사용하면 첫 컴파일도 여기서 처리됩니다.)
+        평가 서비스를 사용하면 서비스가 준비될 때까지 기다립니다.
+        """
+        if self.service_url:
+            self._wait_for_service()
+            return
+        self._forward_digits([self.tokenizer("평가 점수: ")["input_ids"]])
+        if self.device == "cuda":
+            torch.cuda.synchronize()
+
+    def _wait_for_service(self, timeout: float = 600.0) -> None:
+        """
+        평가 서비스의 /health가 응답할 때까지 기다립니다. (서비스의 모델 로딩 대기)
+
+        Raises:
+            TimeoutError: timeout초 안에 서비스가 준비되지 않은 경우
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                if self._session.get(f"{self.service_url}/health", timeout=5).ok:
+                    return
+            except Exception:
+                pass
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"평가 서비스({self.service_url})가 {timeout:.0f}초 안에 준비되지 않았습니다.")
+            time.sleep(2)
+
 if __name__ == "__main__":
     scorer = ReportScorerAgent("ReportScorerAgent", eval_model="deepseek-ai/DeepSeek-R1-Distill-Qwen-7B")
     test_report = (
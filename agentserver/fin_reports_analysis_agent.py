@@ -1,12 +1,15 @@
 import os
+import asyncio
 import requests
+import httpx
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI 
 from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
-import time
 
-from LangGraph_base import Node, GraphState 
+from LangGraph_base import Node, GraphState, failure_message, RetryPolicy, remaining_time, run_sync
+from tracing_callbacks import llm_span_callback
+from graph_tracing import start_span
 
 class FinancialReportsAnalysisAgent(Node):
     """
@@ -36,13 +39,22 @@ class FinancialReportsAnalysisAgent(Node):
         환경 변수 'FINANCIAL_API_URL'이 필요합니다.
         기본값: "http://10.28.224.32:30800/api/query"
     """
+    # 재실행 범위 계산에 사용되는 state 입출력 키
+    reads = ("company_name", "financial_query")
+    writes = ("financial_report",)
+
+    # 1회 실행 제한 시간(초)과 재시도 정책
+    timeout = 360  # 리포트 검색 API 제한 시간(300초) 포함
+    retry = RetryPolicy(max_attempts=2)
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
         load_dotenv()
         
         self.llm = ChatOpenAI(
             model_name="gpt-4o-mini", 
-            temperature=0.4
+            temperature=0.4,
+            callbacks=[llm_span_callback]
         )
 
         self.system_prompt = SystemMessage(content=(
@@ -93,7 +105,28 @@ class FinancialReportsAnalysisAgent(Node):
         except Exception as e:
             return f"API 호출 중 오류 발생: {e}"
 
-    def process(self, state: GraphState) -> GraphState:
+    async def acall_financial_api(self, query: str) -> str:
+        """
+        call_financial_api()의 비동기 버전입니다.
+
+        Args:
+            query (str): API에 전달할 쿼리 문자열
+
+        Returns:
+            str: API 응답 결과 (실패 시 에러 메시지)
+        """
+
+        api_url = os.getenv("FINANCIAL_API_URL", "http://10.28.224.32:30800/api/query")
+        try:
+            async with httpx.AsyncClient(timeout=remaining_time(300)) as client:
+                response = await client.post(api_url, json={"query": query})
+                response.raise_for_status()
+                result = response.json()
+            return result.get("answer", "답변이 존재하지 않습니다.")
+        except Exception as e:
+            return f"API 호출 중 오류 발생: {e}"
+
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph 노드로서 증권사 리포트 분석을 수행합니다.
 
@@ -133,10 +166,32 @@ class FinancialReportsAnalysisAgent(Node):
         query = state.get("financial_query", f"{company}의 증권 리포트를 분석하여 2025년 투자 전략 및 매매의견을 제시해 주세요.")
         
         # API 호출 및 LLM 분석
-        api_context = self.call_financial_api(query)
-        final_answer = self.final_answer_chain.invoke({"context": api_context, "question": query})
+        with start_span("rag.financial_query") as span:
+            api_context = await self.acall_financial_api(query)
+            span.set_attribute("ok", not api_context.startswith("API 호출 중 오류 발생"))
+        final_answer = await self.final_answer_chain.ainvoke({"context": api_context, "question": query})
         state["financial_report"] = final_answer.content
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+        return state
+
+    def process(self, state: GraphState) -> GraphState:
+        """
+        aprocess()를 동기 방식으로 실행하는 adapter입니다.
+
+        Args:
+            state (GraphState): 'company_name' 키를 포함한 상태 정보
+
+        Returns:
+            GraphState: 'financial_report'가 추가된 상태
+        """
+        return run_sync(self.aprocess(state))
+
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        증권사 리포트 분석 대신 실패 안내를 'financial_report'에 기록합니다.
+        """
+        state["financial_report"] = failure_message("증권사 리포트 분석", error)
         return state
 
 if __name__ == "__main__":
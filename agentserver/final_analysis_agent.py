@@ -1,7 +1,7 @@
 import os
 import requests
 import re
-import time
+import asyncio
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
@@ -13,7 +13,8 @@ from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
 # LangGraph
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, NodeTimeoutError, RetryPolicy, run_sync
+from tracing_callbacks import llm_span_callback
 
 class InvestmentEvaluation(BaseModel):
     """
@@ -53,6 +54,14 @@ class FinalAnalysisAgent(Node):
         - 최대 3번의 재시도를 통해 안정적인 결과를 보장합니다.
     """
     
+    # 재실행 범위 계산에 사용되는 state 입출력 키
+    reads = ("company_name", "integrated_report", "investment_persona")
+    writes = ("final_opinion", "portfolio_suggestion", "final_report", "final_fallback", "error")
+
+    # 1회 실행 제한 시간(초)과 재시도 정책
+    timeout = 180
+    retry = RetryPolicy(max_attempts=2)
+
     def __init__(self, name: str) -> None:
         super().__init__(name)
         load_dotenv()
@@ -61,6 +70,7 @@ class FinalAnalysisAgent(Node):
         self.llm = ChatOpenAI(
             model_name="o1-mini-2024-09-12",  # 예시 모델명 (원본 유지)
             temperature=1,
+            callbacks=[llm_span_callback]
         )
 
         # 시스템 프롬프트 (원본 코드)
@@ -107,7 +117,7 @@ class FinalAnalysisAgent(Node):
             return match.group(1)
         return raw_response
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph 노드로서 최종 투자 분석을 수행합니다.
 
@@ -160,7 +170,7 @@ class FinalAnalysisAgent(Node):
             )
             
             # 모델 호출
-            response = self.llm(prompt_content)
+            response = await self.llm.ainvoke(prompt_content)
             raw_response = response.content if hasattr(response, "content") else response
 
             try:
@@ -178,8 +188,9 @@ class FinalAnalysisAgent(Node):
                 final_report_text = f"최종 매매의견: {final_output['recommendation']}, " \
                                     f"자산 배분 제안: {final_output['weights']}"
                 state["final_report"] = final_report_text
+                state["final_fallback"] = False
 
-                time.sleep(0.5)
+                await asyncio.sleep(0.5)
                 return state
 
             except Exception as e:
@@ -194,6 +205,32 @@ class FinalAnalysisAgent(Node):
 
         return state
 
+    def process(self, state: GraphState) -> GraphState:
+        """
+        aprocess()를 동기 방식으로 실행하는 adapter입니다.
+
+        Args:
+            state (GraphState): 'integrated_report' 등을 포함한 상태 정보
+
+        Returns:
+            GraphState: 최종 매매의견이 추가된 상태
+        """
+        return run_sync(self.aprocess(state))
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        최종 분석에 실패하거나 제한 시간을 넘긴 경우 "관망" 의견으로 최종 보고서를 작성합니다.
+        (보고서에서 매매 포지션을 추출하므로 "매수"/"매도" 단어를 넣지 않음)
+        """
+        reason = "제한 시간 내에 완료하지 못해" if isinstance(error, NodeTimeoutError) else "완료하지 못해"
+        state["final_opinion"] = "관망"
+        state["portfolio_suggestion"] = "0%"
+        state["final_report"] = f"최종 매매의견: 관망, 자산 배분 제안: 0% (분석을 {reason} 관망 의견을 제시합니다.)"
+        # 분석 결과가 아닌 기본 의견이므로 매매 알림(trade outbox)을 보내지 않음
+        state["final_fallback"] = True
+        state["error"] = str(error) or type(error).__name__
+        return state
+
 
 if __name__ == "__main__":
     agent = FinalAnalysisAgent("FinalAnalysisAgent")
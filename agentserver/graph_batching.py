@@ -0,0 +1,164 @@
+import os
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 배치 하나에 모을 최대 호출 수
+BATCH_MAX_SIZE = int(os.environ.get("BATCH_MAX_SIZE", 8))
+# 첫 호출이 들어온 뒤 다른 호출을 더 기다리는 최대 시간 (초), 0이면 이미 대기 중인 호출만 모음
+BATCH_MAX_WAIT = float(os.environ.get("BATCH_MAX_WAIT", 0.05))
+
+
+class MicroBatcher:
+    """
+    여러 파이프라인(스레드)에서 동시에 들어온 개별 호출을 모아 배치 함수 한 번으로 처리합니다.
+
+    첫 호출이 들어오면 max_wait 동안(또는 max_size개가 찰 때까지) 다른 호출을 더 모은 뒤
+    batch_fn(items)을 전용 스레드에서 한 번 실행하고, 결과를 호출 순서대로 각 호출자에게 돌려줍니다.
+    batch_fn이 예외를 발생시키면 그 배치의 모든 호출자에게 같은 예외가 전달됩니다.
+
+    Attributes:
+        name (str): 로그와 스레드 이름에 사용할 이름
+        max_size (int): 배치 하나의 최대 크기
+        max_wait (float): 배치를 모으는 최대 대기 시간 (초)
+        batches (int): 실행한 배치 수
+        items (int): 처리한 호출 수
+        largest (int): 가장 컸던 배치 크기
+        batch_sizes (Dict[int, int]): 배치 크기별 실행 횟수
+        max_pending (int): 대기열 길이의 최대값
+
+    Example:
+        >>> batcher = MicroBatcher(scorer.score_reports, max_size=8, max_wait=0.05, name="scorer")
+        >>> score = batcher(report)  # 다른 스레드의 호출과 묶여 한 번의 forward로 처리
+    """
+
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], max_size: int = BATCH_MAX_SIZE,
+                 max_wait: float = BATCH_MAX_WAIT, name: str = "batch") -> None:
+        self.name = name
+        self.max_size = max(1, max_size)
+        self.max_wait = max(0.0, max_wait)
+        self.batches = 0
+        self.items = 0
+        self.largest = 0
+        self.batch_sizes: Dict[int, int] = {}
+        self.max_pending = 0
+        self.wait_seconds = {"total": 0.0, "max": 0.0}
+        self._batch_fn = batch_fn
+        self._queue: "queue.Queue[Optional[Tuple[Any, Future, float]]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, item: Any) -> Future:
+        """
+        호출 하나를 대기열에 넣습니다.
+
+        Returns:
+            Future: 배치 실행 후 item의 결과가 설정되는 Future
+        """
+
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} 배치 처리기가 종료되었습니다.")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"{self.name}-batcher", daemon=True)
+                self._thread.start()
+            self._queue.put((item, future, time.monotonic()))
+            self.max_pending = max(self.max_pending, self._queue.qsize())
+        return future
+
+    def __call__(self, item: Any, timeout: Optional[float] = None) -> Any:
+        """
+        item을 배치에 넣고 결과가 나올 때까지 기다립니다.
+        """
+
+        return self.submit(item).result(timeout)
+
+    @property
+    def pending(self) -> int:
+        """
+        배치 실행을 기다리는 호출 수
+        """
+
+        return self._queue.qsize()
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: 대기열 길이(현재/최대), 배치 수, 평균/최대 배치 크기, 배치 크기별 횟수,
+                호출이 배치 실행을 기다린 시간(평균/최대, 초)
+        """
+
+        return {
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+            "largest_batch": self.largest,
+            "batch_sizes": dict(sorted(self.batch_sizes.items())),
+            "mean_wait_seconds": self.wait_seconds["total"] / self.items if self.items else 0.0,
+            "max_wait_seconds": self.wait_seconds["max"],
+        }
+
+    def _collect(self) -> List[Tuple[Any, Future, float]]:
+        first = self._queue.get()
+        if first is None:
+            return []
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_size:
+            try:
+                entry = self._queue.get(timeout=max(0.0, deadline - time.monotonic())) \
+                    if self.max_wait > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None:
+                # 종료 신호는 이번 배치를 처리한 뒤 다시 받도록 되돌려 둠
+                self._queue.put(None)
+                break
+            batch.append(entry)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if not batch:
+                return
+            # 호출자가 이미 포기(cancel)한 호출은 제외
+            batch = [entry for entry in batch if entry[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            now = time.monotonic()
+            waits = [now - submitted for _, _, submitted in batch]
+            try:
+                results = self._batch_fn([item for item, _, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(f"{self.name} 배치 결과 수({len(results)})가 입력 수({len(batch)})와 다릅니다.")
+            except BaseException as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future, _), result in zip(batch, results):
+                    future.set_result(result)
+            self.batches += 1
+            self.items += len(batch)
+            self.largest = max(self.largest, len(batch))
+            self.batch_sizes[len(batch)] = self.batch_sizes.get(len(batch), 0) + 1
+            self.wait_seconds["total"] += sum(waits)
+            self.wait_seconds["max"] = max(self.wait_seconds["max"], max(waits))
+
+    def close(self) -> None:
+        """
+        대기 중인 호출을 모두 처리한 뒤 배치 스레드를 종료합니다.
+        """
+
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
@@ -0,0 +1,206 @@
+import os
+import json
+import time
+import pickle
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from abc import ABC, abstractmethod
+from contextlib import closing
+from typing import Any, Optional, Tuple
+
+
+def fingerprint(node_name: str, reads, state: dict) -> str:
+    """
+    노드가 선언한 입력(reads) 값으로 캐시 키를 계산합니다.
+
+    Args:
+        node_name (str): 노드 이름
+        reads (Tuple[str, ...]): 노드가 읽는 state 키 목록
+        state (dict): 노드에 전달될 state
+
+    Returns:
+        str: "노드 이름:입력 해시" 형식의 캐시 키
+    """
+
+    inputs = {key: state.get(key) for key in sorted(reads)}
+    payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return f"{node_name}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class NodeCache(ABC):
+    """
+    노드 실행 결과 캐시의 기본 클래스입니다.
+
+    캐시 값은 노드가 변경한 state 키와 값(dict)이며, 적중 시 Graph는
+    process()를 호출하지 않고 저장된 값을 state에 병합합니다.
+    하위 클래스는 _get()/_set()을 구현합니다.
+
+    Attributes:
+        counters (dict[str, dict[str, float]]): 노드별 hits/misses/saved_seconds 카운터
+    """
+
+    def __init__(self) -> None:
+        self.counters: dict[str, dict[str, float]] = {}
+        self._counter_lock = threading.Lock()
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Tuple]:
+        ...
+
+    @abstractmethod
+    def _set(self, key: str, entry: Tuple, ttl: float) -> None:
+        ...
+
+    def _count(self, node_name: str, field: str, amount: float = 1) -> None:
+        with self._counter_lock:
+            counter = self.counters.setdefault(
+                node_name, {"hits": 0, "misses": 0, "saved_seconds": 0.0})
+            counter[field] += amount
+
+    def get(self, node_name: str, key: str) -> Optional[dict]:
+        """
+        캐시에서 노드 결과를 조회하고 hit/miss 카운터를 갱신합니다.
+
+        Args:
+            node_name (str): 노드 이름 (카운터 집계용)
+            key (str): fingerprint()로 계산한 캐시 키
+
+        Returns:
+            Optional[dict]: 적중 시 노드가 변경한 state 키와 값, 미스 시 None
+        """
+
+        entry = self._get(key)
+        if entry is None:
+            self._count(node_name, "misses")
+            return None
+        changed, elapsed = entry
+        self._count(node_name, "hits")
+        # 적중으로 절약한 실행 시간 (원래 실행에 걸린 시간)
+        self._count(node_name, "saved_seconds", elapsed)
+        return changed
+
+    def set(self, key: str, changed: dict, ttl: float, elapsed: float = 0.0) -> None:
+        """
+        노드 결과를 TTL과 함께 저장합니다.
+
+        Args:
+            key (str): fingerprint()로 계산한 캐시 키
+            changed (dict): 노드가 변경한 state 키와 값
+            ttl (float): 유효 시간 (초)
+            elapsed (float): 노드 실행에 걸린 시간 (초)
+        """
+
+        self._set(key, (changed, elapsed), ttl)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        노드별 및 전체 hit/miss 통계를 반환합니다.
+
+        Returns:
+            dict[str, Any]: {"nodes": {노드: 카운터}, "hits": int, "misses": int,
+                             "hit_rate": float, "saved_seconds": float}
+        """
+
+        with self._counter_lock:
+            nodes = {name: dict(counter) for name, counter in self.counters.items()}
+        hits = sum(c["hits"] for c in nodes.values())
+        misses = sum(c["misses"] for c in nodes.values())
+        return {
+            "nodes": nodes,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "saved_seconds": sum(c["saved_seconds"] for c in nodes.values()),
+        }
+
+
+class InMemoryLRUCache(NodeCache):
+    """
+    프로세스 내부에서만 공유되는 LRU 캐시입니다.
+
+    Attributes:
+        max_entries (int): 저장할 최대 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+    """
+
+    def __init__(self, max_entries: int = 256) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, Tuple]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> Optional[Tuple]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, entry: Tuple, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteNodeCache(NodeCache):
+    """
+    로컬 SQLite 파일에 저장되어 같은 서버의 여러 워커 프로세스가 공유하는 캐시입니다.
+
+    Attributes:
+        path (str): SQLite 파일 경로
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS node_cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # 스레드/프로세스마다 별도 연결을 사용
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _get(self, key: str) -> Optional[Tuple]:
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM node_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                conn.execute("DELETE FROM node_cache WHERE key = ?", (key,))
+                return None
+        return pickle.loads(row[0])
+
+    def _set(self, key: str, entry: Tuple, ttl: float) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO node_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, pickle.dumps(entry), time.time() + ttl),
+            )
+
+    def purge_expired(self) -> int:
+        """
+        만료된 항목을 삭제합니다.
+
+        Returns:
+            int: 삭제된 항목 수
+        """
+
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute("DELETE FROM node_cache WHERE expires_at < ?", (time.time(),))
+            return cursor.rowcount
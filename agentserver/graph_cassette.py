@@ -0,0 +1,378 @@
+import os
+import json
+import time
+import pickle
+import asyncio
+import hashlib
+import inspect
+import threading
+import contextvars
+from collections import defaultdict
+from typing import Any, Callable, Optional, Tuple
+
+
+# 기록된 호출 안에서 일어나는 하위 호출(LLM 내부의 httpx 요청 등)은 그대로 통과시킴
+_passthrough: contextvars.ContextVar[bool] = contextvars.ContextVar("cassette_passthrough", default=False)
+
+# 재생 시 다시 계산되어 원래 응답과 맞지 않는 헤더
+_DROP_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# patch() 대상 속성이 클래스 자신이 아닌 상위 클래스에 정의되어 있음을 나타내는 값
+_INHERITED = object()
+
+
+class CassetteMiss(KeyError):
+    """
+    재생 모드에서 기록되지 않은 호출이 발생했을 때 발생하는 예외입니다.
+    """
+
+
+class Cassette:
+    """
+    그래프 실행 중의 외부 호출(LLM, HTTP, 데이터 소스) 응답을 기록하고 재생하는 저장소입니다.
+
+    record 모드에서는 실제 호출 결과와 소요 시간을 호출 키별로 순서대로 저장하고,
+    replay 모드에서는 같은 키의 호출에 저장된 결과를 돌려주며 기록된 소요 시간
+    (또는 지정한 지연 시간)만큼 대기합니다. 과금이나 외부 API 없이
+    그래프 오버헤드, 동시 실행 효과, 실행당 메모리를 재현 가능하게 측정하는 데 사용합니다.
+
+    Attributes:
+        path (str): 카세트 파일 경로 (pickle)
+        mode (str): "record" 또는 "replay"
+        latency_scale (float): 재생 시 기록된 소요 시간에 곱하는 배수 (0이면 대기하지 않음)
+        latency (dict[str, float]): 호출 종류별 고정 지연 시간 (초), latency_scale보다 우선
+        hits (dict[str, int]): 호출 종류별 재생 횟수
+        misses (dict[str, int]): 호출 종류별 기록 없음 횟수
+
+    Example:
+        >>> cassette = Cassette("./benchmark/cassettes/report_graph.pkl", mode="replay", latency_scale=0.5)
+        >>> with cassette:
+        ...     list(graph.run_stream(initial_state))
+    """
+
+    def __init__(self, path: str, mode: str = "replay", latency_scale: float = 1.0,
+                 latency: Optional[dict[str, float]] = None) -> None:
+        if mode not in ("record", "replay"):
+            raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+        self.path = path
+        self.mode = mode
+        self.latency_scale = latency_scale
+        self.latency: dict[str, float] = dict(latency or {})
+        self.hits: dict[str, int] = defaultdict(int)
+        self.misses: dict[str, int] = defaultdict(int)
+        self._entries: dict[str, list] = {}
+        # 재생 시 키별로 다음에 돌려줄 기록 위치
+        self._cursor: dict[str, int] = defaultdict(int)
+        self._patches: list = []
+        self._lock = threading.Lock()
+        if mode == "replay":
+            self.load()
+
+    # ------------------------------------------------------------------ 저장
+
+    def load(self) -> None:
+        """
+        카세트 파일을 읽습니다. 파일이 없으면 FileNotFoundError가 발생합니다.
+        """
+
+        with open(self.path, "rb") as f:
+            self._entries = pickle.load(f)
+
+    def save(self) -> None:
+        """
+        기록한 호출을 카세트 파일에 저장합니다. (임시 파일에 쓴 뒤 교체)
+        """
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with self._lock, open(tmp_path, "wb") as f:
+            pickle.dump(self._entries, f)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def key(kind: str, *parts: Any) -> str:
+        """
+        호출 종류와 입력으로 기록 키를 계산합니다.
+
+        Returns:
+            str: "종류:입력 해시" 형식의 키
+        """
+
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=repr)
+        return f"{kind}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def _record(self, key: str, value: Any, elapsed: float) -> None:
+        with self._lock:
+            self._entries.setdefault(key, []).append((value, elapsed))
+
+    def _replay(self, kind: str, key: str) -> Tuple[Any, float]:
+        """
+        키에 해당하는 다음 기록과 재생 시 대기할 시간을 반환합니다.
+        같은 키가 기록보다 많이 호출되면 마지막 기록을 반복해서 돌려줍니다.
+        """
+
+        with self._lock:
+            records = self._entries.get(key)
+            if not records:
+                self.misses[kind] += 1
+                raise CassetteMiss(key)
+            index = min(self._cursor[key], len(records) - 1)
+            self._cursor[key] += 1
+            self.hits[kind] += 1
+        value, elapsed = records[index]
+        return value, self.latency.get(kind, elapsed * self.latency_scale)
+
+    def rewind(self) -> None:
+        """
+        재생 위치를 처음으로 되돌립니다. (같은 카세트로 여러 번 반복 측정할 때 사용)
+        """
+
+        with self._lock:
+            self._cursor.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns:
+            dict: {"entries": 기록 키 수, "hits": {종류: 횟수}, "misses": {종류: 횟수}}
+        """
+
+        with self._lock:
+            return {"entries": len(self._entries), "hits": dict(self.hits), "misses": dict(self.misses)}
+
+    # ------------------------------------------------------------------ 호출 가로채기
+
+    def call(self, kind: str, key: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        동기 호출을 기록하거나 재생합니다.
+
+        Args:
+            kind (str): 호출 종류 (예: "llm", "http", "yfinance")
+            key (str): Cassette.key()로 계산한 기록 키
+            func (Callable): 실제 호출 함수 (record 모드에서만 호출)
+
+        Returns:
+            Any: 실제 또는 기록된 결과
+        """
+
+        if self.mode == "replay":
+            value, delay = self._replay(kind, key)
+            if delay > 0:
+                time.sleep(delay)
+            return value
+        started = time.perf_counter()
+        token = _passthrough.set(True)
+        try:
+            value = func(*args, **kwargs)
+        finally:
+            _passthrough.reset(token)
+        self._record(key, value, time.perf_counter() - started)
+        return value
+
+    async def acall(self, kind: str, key: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        비동기 호출을 기록하거나 재생합니다. (Cassette.call()의 비동기 버전)
+        """
+
+        if self.mode == "replay":
+            value, delay = self._replay(kind, key)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return value
+        started = time.perf_counter()
+        token = _passthrough.set(True)
+        try:
+            value = await func(*args, **kwargs)
+        finally:
+            _passthrough.reset(token)
+        self._record(key, value, time.perf_counter() - started)
+        return value
+
+    def patch(self, owner: Any, attr: str, replacement: Callable) -> None:
+        """
+        owner.attr을 replacement로 교체합니다. uninstall() 시 원래대로 복원됩니다.
+        """
+
+        # 상위 클래스에서 상속받은 메서드이면 복원 시 교체한 속성만 삭제
+        self._patches.append((owner, attr, owner.__dict__.get(attr, _INHERITED)))
+        setattr(owner, attr, replacement)
+
+    def patch_method(self, owner: type, attr: str, kind: str,
+                     key: Optional[Callable[..., Any]] = None) -> None:
+        """
+        클래스의 메서드 반환값을 기록/재생하도록 교체합니다.
+        (yfinance, 증권사 API처럼 HTTP 계층보다 위에서 가로채는 것이 간단한 데이터 소스용)
+
+        Args:
+            owner (type): 메서드를 가진 클래스
+            attr (str): 메서드 이름
+            kind (str): 호출 종류
+            key (Optional[Callable]): (self, *args, **kwargs)를 받아 키 입력을 반환하는 함수
+                None이면 self를 제외한 모든 인자를 사용합니다.
+        """
+
+        original = getattr(owner, attr)
+        key = key or (lambda _self, *args, **kwargs: (args, kwargs))
+        cassette = self
+
+        if inspect.iscoroutinefunction(original):
+            async def replacement(obj, *args, **kwargs):
+                if _passthrough.get():
+                    return await original(obj, *args, **kwargs)
+                return await cassette.acall(kind, cassette.key(kind, key(obj, *args, **kwargs)),
+                                            original, obj, *args, **kwargs)
+        else:
+            def replacement(obj, *args, **kwargs):
+                if _passthrough.get():
+                    return original(obj, *args, **kwargs)
+                return cassette.call(kind, cassette.key(kind, key(obj, *args, **kwargs)),
+                                     original, obj, *args, **kwargs)
+
+        self.patch(owner, attr, replacement)
+
+    def bypass(self, owner: type, attr: str) -> None:
+        """
+        메서드 안에서 일어나는 호출을 기록하지 않고 그대로 실행하도록 교체합니다.
+        (인증 토큰 발급처럼 카세트에 남기면 안 되는 호출용)
+        """
+
+        original = getattr(owner, attr)
+
+        def replacement(obj, *args, **kwargs):
+            token = _passthrough.set(True)
+            try:
+                return original(obj, *args, **kwargs)
+            finally:
+                _passthrough.reset(token)
+
+        self.patch(owner, attr, replacement)
+
+    def install(self) -> "Cassette":
+        """
+        LangChain 채팅 모델(ChatOpenAI), requests, httpx 호출을 가로챕니다.
+        데이터 소스별 메서드는 patch_method()로 추가합니다.
+        """
+
+        self._patch_chat_model()
+        self._patch_requests()
+        self._patch_httpx()
+        return self
+
+    def uninstall(self) -> None:
+        """
+        교체한 메서드를 모두 복원합니다. record 모드이면 카세트 파일을 저장합니다.
+        """
+
+        while self._patches:
+            owner, attr, original = self._patches.pop()
+            if original is _INHERITED:
+                delattr(owner, attr)
+            else:
+                setattr(owner, attr, original)
+        if self.mode == "record":
+            self.save()
+
+    def __enter__(self) -> "Cassette":
+        return self.install()
+
+    def __exit__(self, *exc_info) -> None:
+        self.uninstall()
+
+    def _patch_chat_model(self) -> None:
+        from langchain_openai import ChatOpenAI
+
+        original, aoriginal = ChatOpenAI._generate, ChatOpenAI._agenerate
+        cassette = self
+
+        def llm_key(model, messages, stop):
+            return cassette.key("llm", getattr(model, "model_name", None), getattr(model, "temperature", None),
+                                [(m.type, m.content) for m in messages], stop)
+
+        def _generate(model, messages, stop=None, run_manager=None, **kwargs):
+            if _passthrough.get():
+                return original(model, messages, stop=stop, run_manager=run_manager, **kwargs)
+            return cassette.call("llm", llm_key(model, messages, stop), original,
+                                 model, messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        async def _agenerate(model, messages, stop=None, run_manager=None, **kwargs):
+            if _passthrough.get():
+                return await aoriginal(model, messages, stop=stop, run_manager=run_manager, **kwargs)
+            return await cassette.acall("llm", llm_key(model, messages, stop), aoriginal,
+                                        model, messages, stop=stop, run_manager=run_manager, **kwargs)
+
+        self.patch(ChatOpenAI, "_generate", _generate)
+        self.patch(ChatOpenAI, "_agenerate", _agenerate)
+
+    def _patch_requests(self) -> None:
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        original = requests.Session.request
+        cassette = self
+
+        def fetch(session, method, url, **kwargs):
+            response = original(session, method, url, **kwargs)
+            headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROP_HEADERS}
+            return (response.status_code, headers, response.content, response.encoding, response.url)
+
+        def request(session, method, url, **kwargs):
+            if _passthrough.get():
+                return original(session, method, url, **kwargs)
+            key = cassette.key("http", method.upper(), url, kwargs.get("params"),
+                               kwargs.get("data"), kwargs.get("json"))
+            status_code, headers, content, encoding, final_url = cassette.call(
+                "http", key, fetch, session, method, url, **kwargs)
+            response = requests.models.Response()
+            response.status_code = status_code
+            response.headers = CaseInsensitiveDict(headers)
+            response._content = content
+            response.encoding = encoding
+            response.url = final_url
+            return response
+
+        self.patch(requests.Session, "request", request)
+
+    def _patch_httpx(self) -> None:
+        import httpx
+
+        original, aoriginal = httpx.Client.send, httpx.AsyncClient.send
+        cassette = self
+
+        def http_key(request):
+            try:
+                body = request.content
+            except httpx.RequestNotRead:
+                body = None
+            return cassette.key("http", request.method, str(request.url), body)
+
+        def to_record(response):
+            headers = [(k, v) for k, v in response.headers.multi_items() if k.lower() not in _DROP_HEADERS]
+            return (response.status_code, headers, response.content)
+
+        def fetch(client, request, **kwargs):
+            response = original(client, request, **kwargs)
+            response.read()
+            return to_record(response)
+
+        async def afetch(client, request, **kwargs):
+            response = await aoriginal(client, request, **kwargs)
+            await response.aread()
+            return to_record(response)
+
+        def send(client, request, **kwargs):
+            if _passthrough.get():
+                return original(client, request, **kwargs)
+            status_code, headers, content = cassette.call(
+                "http", http_key(request), fetch, client, request, **kwargs)
+            return httpx.Response(status_code, headers=headers, content=content, request=request)
+
+        async def asend(client, request, **kwargs):
+            if _passthrough.get():
+                return await aoriginal(client, request, **kwargs)
+            status_code, headers, content = await cassette.acall(
+                "http", http_key(request), afetch, client, request, **kwargs)
+            return httpx.Response(status_code, headers=headers, content=content, request=request)
+
+        self.patch(httpx.Client, "send", send)
+        self.patch(httpx.AsyncClient, "send", asend)
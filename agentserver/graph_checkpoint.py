@@ -0,0 +1,161 @@
+import os
+import json
+import time
+import pickle
+import sqlite3
+from contextlib import closing
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+
+@dataclass
+class Checkpoint:
+    """
+    체크포인트 기록을 재생하여 복원한 그래프 실행 상태입니다.
+
+    Attributes:
+        run_id (str): 실행 ID (워커에서는 task_id)
+        state (dict): 마지막으로 완료된 노드까지 병합된 state
+        pending (Set[str]): 재개 시 실행해야 하는 노드 집합 (중단 시점에 실행 중이던 노드 포함)
+        completed (Set[str]): 한 번 이상 완료된 노드 집합
+        last_node (Optional[str]): 마지막으로 완료된 노드 이름
+        seq (int): 마지막 기록 번호
+        finished (bool): 그래프 실행이 끝까지 완료되었는지 여부
+    """
+
+    run_id: str
+    state: dict = field(default_factory=dict)
+    pending: Set[str] = field(default_factory=set)
+    completed: Set[str] = field(default_factory=set)
+    last_node: Optional[str] = None
+    seq: int = 0
+    finished: bool = False
+
+
+class CheckpointStore(ABC):
+    """
+    노드 단위 체크포인트 저장소의 기본 클래스입니다.
+
+    각 기록에는 전체 state가 아닌 노드가 변경한 키(delta)와 삭제한 키,
+    그리고 그 시점의 실행 대기/완료 노드 목록만 저장합니다.
+    load()는 첫 기록(초기 state)부터 delta를 순서대로 적용하여 state를 복원합니다.
+    하위 클래스는 append()/records()/clear()를 구현합니다.
+    """
+
+    @abstractmethod
+    def append(self, run_id: str, seq: int, node_name: str, delta: dict, removed: List[str],
+               pending: Set[str], completed: Set[str], finished: bool = False) -> None:
+        ...
+
+    @abstractmethod
+    def records(self, run_id: str) -> List[tuple]:
+        """
+        Returns:
+            List[tuple]: seq 순서의 (seq, node_name, delta, removed, pending, completed, finished) 리스트
+        """
+
+    @abstractmethod
+    def clear(self, run_id: str) -> None:
+        ...
+
+    def load(self, run_id: str) -> Optional[Checkpoint]:
+        """
+        기록을 재생하여 실행 상태를 복원합니다.
+
+        Args:
+            run_id (str): 실행 ID
+
+        Returns:
+            Optional[Checkpoint]: 기록이 없으면 None
+        """
+
+        records = self.records(run_id)
+        if not records:
+            return None
+        checkpoint = Checkpoint(run_id=run_id)
+        for seq, node_name, delta, removed, pending, completed, finished in records:
+            checkpoint.state.update(delta)
+            for key in removed:
+                checkpoint.state.pop(key, None)
+            checkpoint.pending = set(pending)
+            checkpoint.completed = set(completed)
+            checkpoint.last_node = node_name
+            checkpoint.seq = seq
+            checkpoint.finished = finished
+        return checkpoint
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    로컬 SQLite 파일에 체크포인트를 기록하는 저장소입니다.
+    워커 프로세스가 재시작되어도 같은 파일에서 중단된 실행을 이어갈 수 있습니다.
+
+    Attributes:
+        path (str): SQLite 파일 경로
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS graph_checkpoint ("
+                "run_id TEXT NOT NULL, seq INTEGER NOT NULL, node TEXT NOT NULL, "
+                "delta BLOB NOT NULL, pending TEXT NOT NULL, completed TEXT NOT NULL, "
+                "finished INTEGER NOT NULL DEFAULT 0, created_at REAL NOT NULL, "
+                "PRIMARY KEY (run_id, seq))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def append(self, run_id: str, seq: int, node_name: str, delta: dict, removed: List[str],
+               pending: Set[str], completed: Set[str], finished: bool = False) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO graph_checkpoint "
+                "(run_id, seq, node, delta, pending, completed, finished, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (str(run_id), seq, node_name, pickle.dumps((delta, removed)),
+                 json.dumps(sorted(pending)), json.dumps(sorted(completed)),
+                 int(finished), time.time()),
+            )
+
+    def records(self, run_id: str) -> List[tuple]:
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT seq, node, delta, pending, completed, finished FROM graph_checkpoint "
+                "WHERE run_id = ? ORDER BY seq", (str(run_id),)).fetchall()
+        records = []
+        for seq, node_name, blob, pending, completed, finished in rows:
+            delta, removed = pickle.loads(blob)
+            records.append((seq, node_name, delta, removed,
+                            json.loads(pending), json.loads(completed), bool(finished)))
+        return records
+
+    def clear(self, run_id: str) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM graph_checkpoint WHERE run_id = ?", (str(run_id),))
+
+    def stale_runs(self, older_than: float) -> List[str]:
+        """
+        마지막 기록 이후 older_than초 이상 갱신되지 않은 미완료 실행 ID를 반환합니다.
+        (워커가 비정상 종료되어 이어서 실행해야 하는 후보)
+
+        Args:
+            older_than (float): 기준 시간 (초)
+
+        Returns:
+            List[str]: 실행 ID 리스트 (오래된 순)
+        """
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT run_id FROM graph_checkpoint GROUP BY run_id "
+                "HAVING MAX(finished) = 0 AND MAX(created_at) < ? ORDER BY MAX(created_at)",
+                (time.time() - older_than,)).fetchall()
+        return [row[0] for row in rows]
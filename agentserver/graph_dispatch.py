@@ -0,0 +1,430 @@
+import os
+import time
+import uuid
+import pickle
+import sqlite3
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from contextlib import closing
+from typing import Dict, Optional, Tuple
+
+from LangGraph_base import Graph, GraphState, Node, NodeTimeoutError, _deadline_at, remaining_time
+
+# SQLite 큐에서 작업/결과를 확인하는 주기 (초)
+JOB_POLL_INTERVAL = float(os.environ.get("JOB_POLL_INTERVAL", 0.05))
+# 노드 워커가 한 번에 작업을 기다리는 최대 시간 (초), 이 주기마다 종료 요청을 확인
+JOB_CLAIM_TIMEOUT = float(os.environ.get("JOB_CLAIM_TIMEOUT", 1.0))
+
+
+class RemoteNodeError(RuntimeError):
+    """
+    노드 워커에서 발생한 예외를 그대로 전달할 수 없을 때(pickle 불가) 대신 발생하는 예외입니다.
+    """
+
+
+class JobQueue(ABC):
+    """
+    노드 실행 작업 큐의 기본 클래스입니다.
+
+    코디네이터(그래프)는 submit()으로 노드 입력 state를 풀(pool) 이름의 큐에 넣고 wait()로 결과를 기다리며,
+    노드 워커는 claim()으로 자기 풀의 작업을 가져가 실행한 뒤 complete()로 결과를 돌려줍니다.
+    payload와 결과는 pickle로 직렬화합니다.
+    하위 클래스는 submit()/claim()/complete()/wait()/cancel()을 구현합니다.
+    """
+
+    @abstractmethod
+    def submit(self, pool: str, job_id: str, payload: dict, expires_at: Optional[float] = None) -> None:
+        """
+        Args:
+            pool (str): 작업을 실행할 워커 풀 이름 (예: "model", "io")
+            job_id (str): 작업 ID
+            payload (dict): {"node": 노드 이름, "state": 입력 state, "expires_at": 만료 시각}
+            expires_at (Optional[float]): 만료 시각 (time.time() 기준), 만료된 작업은 실행하지 않음
+        """
+
+    @abstractmethod
+    def claim(self, pool: str, timeout: float) -> Optional[Tuple[str, dict]]:
+        """
+        풀의 가장 오래된 작업 하나를 가져갑니다. 작업이 없으면 timeout까지 기다립니다.
+
+        Returns:
+            Optional[Tuple[str, dict]]: (작업 ID, payload), 작업이 없으면 None
+        """
+
+    @abstractmethod
+    def complete(self, job_id: str, result: tuple) -> None:
+        """
+        Args:
+            job_id (str): 작업 ID
+            result (tuple): ("ok", 변경된 키와 값, 삭제된 키 리스트) 또는 ("error", 예외)
+        """
+
+    @abstractmethod
+    def wait(self, job_id: str, timeout: Optional[float]) -> Optional[tuple]:
+        """
+        작업 결과를 기다립니다. 결과를 받으면 큐에서 삭제합니다.
+
+        Returns:
+            Optional[tuple]: complete()에 전달된 결과, timeout까지 결과가 없으면 None
+        """
+
+    @abstractmethod
+    def cancel(self, job_id: str) -> None:
+        """
+        결과를 더 이상 기다리지 않는 작업을 삭제합니다. (아직 시작되지 않았으면 실행되지 않음)
+        """
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    로컬 SQLite 파일을 사용하는 작업 큐입니다.
+    Redis 없이 같은 서버의 코디네이터와 노드 워커 프로세스가 파일 하나로 작업을 주고받습니다.
+
+    Attributes:
+        path (str): SQLite 파일 경로
+        poll_interval (float): 작업/결과 확인 주기 (초)
+    """
+
+    def __init__(self, path: str, poll_interval: float = JOB_POLL_INTERVAL) -> None:
+        self.path = path
+        self.poll_interval = poll_interval
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS graph_jobs ("
+                "job_id TEXT PRIMARY KEY, pool TEXT NOT NULL, payload BLOB NOT NULL, "
+                "status TEXT NOT NULL DEFAULT 'pending', result BLOB, "
+                "expires_at REAL, created_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS graph_jobs_pool ON graph_jobs (pool, status, created_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # BEGIN IMMEDIATE로 claim을 직렬화하기 위해 트랜잭션을 직접 관리
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def submit(self, pool: str, job_id: str, payload: dict, expires_at: Optional[float] = None) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO graph_jobs (job_id, pool, payload, expires_at, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, pool, pickle.dumps(payload), expires_at, time.time()),
+            )
+
+    def _claim_once(self, pool: str) -> Optional[Tuple[str, dict]]:
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                # 만료된 대기 작업은 코디네이터가 이미 포기했으므로 삭제
+                conn.execute("DELETE FROM graph_jobs WHERE pool = ? AND status = 'pending' AND expires_at < ?",
+                             (pool, now))
+                row = conn.execute(
+                    "SELECT job_id, payload FROM graph_jobs WHERE pool = ? AND status = 'pending' "
+                    "ORDER BY created_at LIMIT 1", (pool,)).fetchone()
+                if row is not None:
+                    conn.execute("UPDATE graph_jobs SET status = 'running' WHERE job_id = ?", (row[0],))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return (row[0], pickle.loads(row[1])) if row is not None else None
+
+    def claim(self, pool: str, timeout: float) -> Optional[Tuple[str, dict]]:
+        give_up_at = time.monotonic() + timeout
+        while True:
+            job = self._claim_once(pool)
+            if job is not None or time.monotonic() >= give_up_at:
+                return job
+            time.sleep(self.poll_interval)
+
+    def complete(self, job_id: str, result: tuple) -> None:
+        with closing(self._connect()) as conn:
+            # 취소된 작업(행 없음)의 결과는 버림
+            conn.execute("UPDATE graph_jobs SET status = 'done', result = ? WHERE job_id = ?",
+                         (pickle.dumps(result), job_id))
+
+    def wait(self, job_id: str, timeout: Optional[float]) -> Optional[tuple]:
+        give_up_at = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with closing(self._connect()) as conn:
+                row = conn.execute("SELECT result FROM graph_jobs WHERE job_id = ? AND status = 'done'",
+                                   (job_id,)).fetchone()
+                if row is not None:
+                    conn.execute("DELETE FROM graph_jobs WHERE job_id = ?", (job_id,))
+                    return pickle.loads(row[0])
+            if give_up_at is not None and time.monotonic() >= give_up_at:
+                return None
+            time.sleep(self.poll_interval)
+
+    def cancel(self, job_id: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM graph_jobs WHERE job_id = ?", (job_id,))
+
+
+class RedisJobQueue(JobQueue):
+    """
+    Redis 리스트를 사용하는 작업 큐입니다. 코디네이터와 노드 워커가 서로 다른 서버에 있을 때 사용합니다.
+
+    작업은 "graph_jobs:<pool>" 리스트에 작업 ID를, "graph_job:<job_id>" 키에 payload를 저장하고,
+    결과는 "graph_result:<job_id>" 리스트로 전달하여 코디네이터가 BLPOP으로 바로 받습니다.
+
+    Attributes:
+        url (str): Redis URL (예: redis://localhost:6379/0)
+        result_ttl (int): 결과 키 보관 시간 (초), 코디네이터가 가져가지 않은 결과는 이후 삭제
+
+    Note:
+        redis 패키지는 이 큐를 사용할 때만 import합니다.
+    """
+
+    def __init__(self, url: str, result_ttl: int = 3600) -> None:
+        import redis
+
+        self.url = url
+        self.result_ttl = result_ttl
+        self._redis = redis.Redis.from_url(url)
+
+    def submit(self, pool: str, job_id: str, payload: dict, expires_at: Optional[float] = None) -> None:
+        ttl = None if expires_at is None else max(1, int(expires_at - time.time()) + 1)
+        pipe = self._redis.pipeline()
+        pipe.set(f"graph_job:{job_id}", pickle.dumps(payload), ex=ttl)
+        pipe.rpush(f"graph_jobs:{pool}", job_id)
+        pipe.execute()
+
+    def claim(self, pool: str, timeout: float) -> Optional[Tuple[str, dict]]:
+        give_up_at = time.monotonic() + timeout
+        while True:
+            remaining = give_up_at - time.monotonic()
+            if remaining <= 0:
+                return None
+            item = self._redis.blpop(f"graph_jobs:{pool}", timeout=max(1, int(remaining)))
+            if item is None:
+                return None
+            job_id = item[1].decode()
+            # payload가 없으면 취소되었거나 만료된 작업이므로 건너뜀
+            blob = self._redis.getdel(f"graph_job:{job_id}")
+            if blob is not None:
+                return job_id, pickle.loads(blob)
+
+    def complete(self, job_id: str, result: tuple) -> None:
+        pipe = self._redis.pipeline()
+        pipe.rpush(f"graph_result:{job_id}", pickle.dumps(result))
+        pipe.expire(f"graph_result:{job_id}", self.result_ttl)
+        pipe.execute()
+
+    def wait(self, job_id: str, timeout: Optional[float]) -> Optional[tuple]:
+        # BLPOP timeout 0은 무한 대기
+        item = self._redis.blpop(f"graph_result:{job_id}", timeout=0 if timeout is None else max(1, int(timeout + 0.999)))
+        return pickle.loads(item[1]) if item is not None else None
+
+    def cancel(self, job_id: str) -> None:
+        self._redis.delete(f"graph_job:{job_id}", f"graph_result:{job_id}")
+
+
+def create_job_queue(url: str) -> JobQueue:
+    """
+    URL에 맞는 작업 큐를 생성합니다.
+
+    Args:
+        url (str): "redis://..."이면 Redis 큐, "sqlite:///<경로>"이면 해당 파일의 SQLite 큐
+
+    Returns:
+        JobQueue: 작업 큐
+    """
+
+    if url.startswith(("redis://", "rediss://")):
+        return RedisJobQueue(url)
+    return SQLiteJobQueue(url.removeprefix("sqlite:///"))
+
+
+def parse_dispatch(spec: str, default: Dict[str, str]) -> Dict[str, str]:
+    """
+    노드별 실행 풀 설정을 해석합니다.
+
+    Args:
+        spec (str): "" 또는 "0"이면 분산 실행 안 함, "1"/"default"이면 default,
+            그 외에는 "노드=풀,노드=풀" 형식 (예: "ReportScorerAgent=model,NewsAnalysisAgent=io")
+        default (Dict[str, str]): 기본 노드 -> 풀 매핑
+
+    Returns:
+        Dict[str, str]: 노드 이름 -> 풀 이름 (빈 dict이면 모든 노드를 코디네이터에서 실행)
+    """
+
+    spec = spec.strip()
+    if spec in ("", "0"):
+        return {}
+    if spec in ("1", "default"):
+        return dict(default)
+    dispatch = {}
+    for item in spec.split(","):
+        node_name, _, pool = item.partition("=")
+        if not pool.strip():
+            raise ValueError(f"GRAPH_DISPATCH 항목 형식 오류: {item!r} (노드=풀)")
+        dispatch[node_name.strip()] = pool.strip()
+    return dispatch
+
+
+class RemoteNode(Node):
+    """
+    노드 실행을 작업 큐로 노드 워커에 맡기는 코디네이터 쪽 대리 노드입니다.
+
+    실제 노드 클래스의 reads/writes/timeout/retry/cache_ttl 속성을 그대로 가지므로,
+    제한 시간, 재시도, 캐시, fallback, 체크포인트와 스트리밍은 코디네이터 그래프에서 기존과 같이 동작하고
+    process()만 큐를 거쳐 원격에서 실행됩니다. 노드 워커는 변경된 키만 돌려주며,
+    대리 노드는 이를 입력 state에 적용하여 반환합니다.
+
+    Attributes:
+        node_cls (type): 실제 노드 클래스 (코디네이터에서는 생성하지 않으므로 모델을 로딩하지 않음)
+        queue (JobQueue): 작업 큐
+        pool (str): 작업을 실행할 워커 풀 이름
+
+    Note:
+        fallback()/should_cache()는 __init__을 호출하지 않은 실제 클래스 인스턴스로 실행하므로
+        클래스 속성과 name만 사용해야 합니다.
+    """
+
+    def __init__(self, node_cls: type, name: str, queue: JobQueue, pool: str) -> None:
+        super().__init__(name)
+        self.node_cls = node_cls
+        self.queue = queue
+        self.pool = pool
+        self.reads = node_cls.reads
+        self.writes = node_cls.writes
+        self.cache_ttl = node_cls.cache_ttl
+        self.timeout = node_cls.timeout
+        self.retry = node_cls.retry
+        self._prototype = node_cls.__new__(node_cls)
+        self._prototype.name = name
+
+    def process(self, state: GraphState) -> GraphState:
+        # 노드 제한 시간과 그래프 남은 시간 중 작은 값까지만 기다리고, 노드 워커에도 만료 시각을 전달
+        limit = remaining_time(self.timeout)
+        expires_at = None if limit is None else time.time() + limit
+        job_id = uuid.uuid4().hex
+        self.queue.submit(self.pool, job_id, {"node": self.name, "state": dict(state), "expires_at": expires_at},
+                          expires_at)
+        result = self.queue.wait(job_id, limit)
+        if result is None:
+            self.queue.cancel(job_id)
+            raise NodeTimeoutError(f"{self.name}: {self.pool} 풀 작업 결과 대기 시간 초과")
+        if result[0] == "error":
+            raise result[1]
+        _, changed, removed = result
+        state.update(changed)
+        for key in removed:
+            state.pop(key, None)
+        return state
+
+    def should_cache(self, changed: dict) -> bool:
+        return self._prototype.should_cache(changed)
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        return self._prototype.fallback(state, error)
+
+
+class NodeWorkerPool:
+    """
+    작업 큐에서 한 풀의 노드 작업을 가져와 실행하는 노드 워커입니다.
+
+    - 평가 모델처럼 GPU/CPU를 많이 쓰는 노드는 concurrency=1인 전용 프로세스("model" 풀)에서 순서대로 실행하고,
+    - LLM/HTTP 호출 위주의 노드는 concurrency를 크게 준 비동기 풀("io" 풀)에서 aprocess()로 동시에 실행합니다.
+
+    재시도와 fallback은 코디네이터가 처리하므로 노드 워커는 1회 실행 결과(또는 예외)만 돌려줍니다.
+
+    Attributes:
+        queue (JobQueue): 작업 큐
+        pool (str): 풀 이름
+        nodes (Dict[str, Node]): 이 풀에서 실행하는 노드 이름 -> 노드 인스턴스
+        concurrency (int): 동시에 실행할 작업 수
+        completed (int): 정상 완료한 작업 수
+        failed (int): 예외로 끝난 작업 수 (만료 포함)
+    """
+
+    def __init__(self, queue: JobQueue, pool: str, nodes: Dict[str, Node], concurrency: int = 1) -> None:
+        self.queue = queue
+        self.pool = pool
+        self.nodes = nodes
+        self.concurrency = concurrency
+        self.completed = 0
+        self.failed = 0
+        self._stop = threading.Event()
+
+    def stop(self, *_) -> None:
+        """
+        새 작업을 가져오지 않고 실행 중인 작업만 마친 뒤 종료합니다. (SIGINT/SIGTERM 핸들러로 사용)
+        """
+
+        self._stop.set()
+
+    async def arun(self) -> None:
+        """
+        stop()이 호출될 때까지 작업을 가져와 실행합니다. 종료 시 실행 중인 작업이 끝날 때까지 기다립니다.
+        """
+
+        print(f"[NodeWorker] {self.pool} 풀 시작 (노드: {', '.join(self.nodes)}, 동시 실행 {self.concurrency})")
+        slots = asyncio.Semaphore(self.concurrency)
+        running = set()
+        while not self._stop.is_set():
+            await slots.acquire()
+            job = await asyncio.to_thread(self.queue.claim, self.pool, JOB_CLAIM_TIMEOUT)
+            if job is None:
+                slots.release()
+                continue
+            task = asyncio.create_task(self._handle(*job))
+            running.add(task)
+            task.add_done_callback(running.discard)
+            task.add_done_callback(lambda _: slots.release())
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        print(f"[NodeWorker] {self.pool} 풀 종료 (완료 {self.completed}건, 실패 {self.failed}건)")
+
+    def run(self) -> None:
+        asyncio.run(self.arun())
+
+    async def _handle(self, job_id: str, payload: dict) -> None:
+        node_name = payload["node"]
+        try:
+            result = await self._execute(node_name, payload["state"], payload.get("expires_at"))
+            self.completed += 1
+        except Exception as e:
+            self.failed += 1
+            print(f"[NodeWorker] {node_name} 실행 실패: {e!r}")
+            result = ("error", _portable(e))
+        await asyncio.to_thread(self.queue.complete, job_id, result)
+
+    async def _execute(self, node_name: str, state: GraphState, expires_at: Optional[float]) -> tuple:
+        node = self.nodes.get(node_name)
+        if node is None:
+            raise RemoteNodeError(f"{self.pool} 풀에 {node_name} 노드가 없습니다.")
+        limit = None
+        if expires_at is not None:
+            limit = expires_at - time.time()
+            if limit <= 0:
+                raise NodeTimeoutError(f"{node_name}: 실행 전에 작업이 만료되었습니다.")
+            # 노드 내부의 remaining_time()이 코디네이터의 마감 시각을 따르도록 설정 (작업별 asyncio 태스크 범위)
+            _deadline_at.set(time.monotonic() + limit)
+        try:
+            after = await asyncio.wait_for(node.aprocess(dict(state)), limit)
+        except asyncio.TimeoutError:
+            raise NodeTimeoutError(f"{node_name}: {limit:.1f}초 제한 시간 초과")
+        changed, removed = Graph._diff(state, after)
+        # 제자리 수정(list.append 등)은 동일 객체라 비교로 찾을 수 없으므로 writes 키는 항상 전달
+        for key in node.writes or ():
+            if key in after:
+                changed[key] = after[key]
+        return "ok", changed, removed
+
+
+def _portable(error: Exception) -> Exception:
+    """
+    코디네이터로 보낼 수 있도록 pickle 가능한 예외를 반환합니다.
+    (재시도 정책의 retry_on 판단을 위해 가능하면 원래 예외 타입을 유지)
+    """
+
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RemoteNodeError(f"{type(error).__name__}: {error}")
@@ -0,0 +1,104 @@
+import time
+import threading
+from typing import Callable, Dict, Optional
+
+from LangGraph_base import Graph
+
+
+class GraphRegistry:
+    """
+    프로세스 단위로 그래프를 한 번만 생성하여 모든 작업에 같은 인스턴스를 제공하는 레지스트리입니다.
+
+    그래프 생성(LLM 클라이언트, 증권사 API 로그인, 평가 모델 로딩)과 warm-up은
+    처음 get()을 호출할 때(보통 프로세스 시작 시 warm_up()) 한 번만 수행되고,
+    이후 작업은 같은 그래프를 재사용합니다.
+
+    Attributes:
+        startup_seconds (dict[str, float]): 그래프 이름 -> 생성 + warm-up 소요 시간 (초)
+        warm_up_seconds (dict[str, dict[str, float]]): 그래프 이름 -> 노드별 warm-up 소요 시간 (초)
+
+    Example:
+        >>> registry.register("report", create_graph)
+        >>> registry.warm_up()               # 프로세스 시작 시 1회
+        >>> graph = registry.get("report")   # 작업마다 같은 그래프 반환
+    """
+
+    def __init__(self) -> None:
+        self._factories: Dict[str, Callable[[], Graph]] = {}
+        self._graphs: Dict[str, Graph] = {}
+        self._lock = threading.Lock()
+        self.startup_seconds: dict[str, float] = {}
+        self.warm_up_seconds: dict[str, dict[str, float]] = {}
+
+    def register(self, name: str, factory: Callable[[], Graph]) -> None:
+        """
+        그래프 생성 함수를 등록합니다. 이미 생성된 그래프가 있으면 다음 get()에서 다시 생성합니다.
+
+        Args:
+            name (str): 그래프 이름
+            factory (Callable[[], Graph]): 그래프를 생성하는 함수
+        """
+
+        with self._lock:
+            self._factories[name] = factory
+            self._graphs.pop(name, None)
+
+    def get(self, name: str) -> Graph:
+        """
+        이름에 해당하는 그래프를 반환합니다. 처음 호출될 때만 생성 및 warm-up을 수행합니다.
+
+        Args:
+            name (str): 그래프 이름
+
+        Returns:
+            Graph: 프로세스 내에서 공유되는 그래프
+
+        Raises:
+            KeyError: 등록되지 않은 그래프 이름인 경우
+        """
+
+        graph = self._graphs.get(name)
+        if graph is not None:
+            return graph
+        with self._lock:
+            # 다른 스레드가 먼저 생성했는지 다시 확인
+            graph = self._graphs.get(name)
+            if graph is not None:
+                return graph
+            factory = self._factories[name]
+            print(f"[Registry] {name} 그래프 생성 및 warm-up 시작")
+            started = time.perf_counter()
+            graph = factory()
+            self.warm_up_seconds[name] = graph.warm_up()
+            self.startup_seconds[name] = time.perf_counter() - started
+            print(f"[Registry] {name} 그래프 준비 완료: {self.startup_seconds[name]:.2f}s")
+            self._graphs[name] = graph
+            return graph
+
+    def warm_up(self, name: Optional[str] = None) -> dict[str, float]:
+        """
+        등록된 그래프(또는 지정한 그래프)를 미리 생성합니다.
+
+        Args:
+            name (Optional[str]): 그래프 이름, None이면 등록된 모든 그래프
+
+        Returns:
+            dict[str, float]: 그래프 이름 -> 생성 + warm-up 소요 시간 (초)
+        """
+
+        names = [name] if name is not None else list(self._factories)
+        for graph_name in names:
+            self.get(graph_name)
+        return {graph_name: self.startup_seconds[graph_name] for graph_name in names}
+
+    def clear(self) -> None:
+        """
+        생성된 그래프를 모두 버립니다. (등록된 생성 함수는 유지)
+        """
+
+        with self._lock:
+            self._graphs.clear()
+
+
+# 프로세스 전역 레지스트리
+registry = GraphRegistry()
@@ -0,0 +1,338 @@
+import os
+import json
+import time
+import uuid
+import threading
+import contextvars
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
+
+
+# 현재 실행 컨텍스트의 Tracer와 부모 Span (스레드/태스크마다 독립적으로 전파됨)
+_current_tracer: contextvars.ContextVar[Optional["Tracer"]] = contextvars.ContextVar("tracer", default=None)
+_current_span: contextvars.ContextVar[Optional["Span"]] = contextvars.ContextVar("span", default=None)
+
+
+class Span:
+    """
+    하나의 작업 구간(그래프 실행, 노드, LLM 호출, 데이터 소스 호출)을 나타내는 span입니다.
+
+    Attributes:
+        name (str): span 이름 (예: "NewsAnalysisAgent", "llm", "google_news.rss")
+        kind (str): span 종류 ("graph" / "node" / "llm" / "data" / "model")
+        trace_id (str): 그래프 실행 단위 ID (32자리 hex)
+        span_id (str): span ID (16자리 hex)
+        parent_id (Optional[str]): 부모 span ID
+        start_time (float): 시작 시각 (epoch 초)
+        end_time (Optional[float]): 종료 시각 (epoch 초)
+        attributes (dict[str, Any]): 부가 정보 (모델명, 토큰 수, 캐시 적중 여부 등)
+        status (str): "ok" 또는 "error"
+    """
+
+    def __init__(self, tracer: "Tracer", name: str, kind: str, parent_id: Optional[str] = None,
+                 attributes: Optional[dict] = None) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = tracer.trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self.end_time: Optional[float] = None
+        self.duration: Optional[float] = None
+        self.attributes: dict[str, Any] = dict(attributes or {})
+        self.status = "ok"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """
+        span을 종료하고 Tracer에 기록합니다. 여러 번 호출되어도 한 번만 기록됩니다.
+        """
+
+        if self.end_time is not None:
+            return
+        self.duration = time.perf_counter() - self._start
+        self.end_time = self.start_time + self.duration
+        if error is not None:
+            self.status = "error"
+            self.attributes["error"] = repr(error)
+        self.tracer._record(self)
+
+    def to_dict(self) -> dict:
+        """
+        JSONL 내보내기용 dict로 변환합니다.
+        """
+
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+    def to_otlp(self) -> dict:
+        """
+        OpenTelemetry OTLP/JSON 형식의 span으로 변환합니다.
+        """
+
+        def value(v):
+            if isinstance(v, bool):
+                return {"boolValue": v}
+            if isinstance(v, int):
+                return {"intValue": str(v)}
+            if isinstance(v, float):
+                return {"doubleValue": v}
+            return {"stringValue": str(v)}
+
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            # SPAN_KIND_CLIENT(3): 외부 호출, SPAN_KIND_INTERNAL(1): 그 외
+            "kind": 3 if self.kind in ("llm", "data") else 1,
+            "startTimeUnixNano": str(int(self.start_time * 1e9)),
+            "endTimeUnixNano": str(int((self.end_time or self.start_time) * 1e9)),
+            "attributes": [{"key": k, "value": value(v)}
+                           for k, v in {"span.kind": self.kind, **self.attributes}.items() if v is not None],
+            "status": {"code": 2 if self.status == "error" else 1},
+        }
+
+
+class _NullSpan:
+    """
+    Tracer가 없는 컨텍스트에서 사용하는 아무 일도 하지 않는 span입니다.
+    """
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class SpanExporter(ABC):
+    """
+    그래프 실행 1회의 span들을 내보내는 exporter의 기본 클래스입니다.
+    """
+
+    @abstractmethod
+    def export(self, spans: List[Span]) -> None:
+        ...
+
+
+class JSONLSpanExporter(SpanExporter):
+    """
+    span을 한 줄에 하나씩 JSON으로 파일에 추가합니다.
+
+    Attributes:
+        path (str): 출력 파일 경로
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, spans: List[Span]) -> None:
+        lines = [json.dumps(span.to_dict(), ensure_ascii=False, default=str) for span in spans]
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+class OTLPJsonSpanExporter(SpanExporter):
+    """
+    그래프 실행 1회를 OTLP/JSON ExportTraceServiceRequest 한 줄로 파일에 추가합니다.
+    (OpenTelemetry Collector의 otlpjsonfile receiver 등으로 수집 가능)
+
+    Attributes:
+        path (str): 출력 파일 경로
+        service_name (str): resource의 service.name
+    """
+
+    def __init__(self, path: str, service_name: str = "agentserver") -> None:
+        self.path = path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def export(self, spans: List[Span]) -> None:
+        request = {"resourceSpans": [{
+            "resource": {"attributes": [
+                {"key": "service.name", "value": {"stringValue": self.service_name}}]},
+            "scopeSpans": [{
+                "scope": {"name": "agentserver.graph"},
+                "spans": [span.to_otlp() for span in spans],
+            }],
+        }]}
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+
+class Tracer:
+    """
+    그래프 실행 1회의 span을 수집합니다.
+
+    Attributes:
+        trace_id (str): 실행 단위 trace ID
+        spans (List[Span]): 종료된 span 목록 (종료 순서)
+        exporter (Optional[SpanExporter]): flush() 시 span을 내보낼 exporter
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter] = None) -> None:
+        self.trace_id = uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self.exporter = exporter
+        self._lock = threading.Lock()
+
+    def _record(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def start_span(self, name: str, kind: str, parent: Optional[Span] = None, **attributes) -> Span:
+        """
+        span을 시작합니다. 현재 컨텍스트를 바꾸지 않으므로 span.end()로 직접 종료해야 합니다.
+
+        Args:
+            name (str): span 이름
+            kind (str): span 종류
+            parent (Optional[Span]): 부모 span (없으면 현재 컨텍스트의 span)
+            **attributes: span 속성
+
+        Returns:
+            Span: 시작된 span
+        """
+
+        parent = parent or _current_span.get()
+        return Span(self, name, kind, parent.span_id if isinstance(parent, Span) else None, attributes)
+
+    @contextmanager
+    def span(self, name: str, kind: str, parent: Optional[Span] = None, **attributes) -> Iterator[Span]:
+        """
+        with 블록 동안 span을 현재 컨텍스트의 부모 span으로 설정합니다.
+        블록 안에서 발생한 예외는 span에 기록한 뒤 그대로 전달합니다.
+        """
+
+        span = self.start_span(name, kind, parent, **attributes)
+        tracer_token = _current_tracer.set(self)
+        span_token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.end(error=e)
+            raise
+        finally:
+            _current_span.reset(span_token)
+            _current_tracer.reset(tracer_token)
+            span.end()
+
+    def flush(self) -> None:
+        """
+        수집한 span을 exporter로 내보냅니다.
+        """
+
+        if self.exporter is not None and self.spans:
+            try:
+                self.exporter.export(list(self.spans))
+            except Exception as e:
+                print(f"[Tracer] span 내보내기 실패: {e}")
+
+    def summary(self) -> dict:
+        """
+        실행 1회의 소요 시간 요약을 계산합니다.
+
+        Returns:
+            dict: {
+                "trace_id": str,
+                "total_seconds": float,         # 그래프 실행 전체 시간
+                "nodes": {노드: {"count", "seconds", "max_seconds"}},
+                "slowest_node": str,
+                "llm": {"calls", "seconds", "prompt_tokens", "completion_tokens",
+                        "models": {모델: {"calls", "seconds"}}},
+                "data": {데이터 소스: {"count", "seconds"}},
+            }
+        """
+
+        with self._lock:
+            spans = list(self.spans)
+
+        def add(bucket: dict, key: str, seconds: float) -> dict:
+            entry = bucket.setdefault(key, {"count": 0, "seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += seconds
+            return entry
+
+        nodes, data, models = {}, {}, {}
+        llm = {"calls": 0, "seconds": 0.0, "prompt_tokens": 0, "completion_tokens": 0}
+        total = 0.0
+        for span in spans:
+            seconds = span.duration or 0.0
+            if span.kind == "graph":
+                total = max(total, seconds)
+            elif span.kind == "node":
+                entry = add(nodes, span.name, seconds)
+                entry["max_seconds"] = max(entry.get("max_seconds", 0.0), seconds)
+            elif span.kind == "llm":
+                llm["calls"] += 1
+                llm["seconds"] += seconds
+                llm["prompt_tokens"] += span.attributes.get("prompt_tokens") or 0
+                llm["completion_tokens"] += span.attributes.get("completion_tokens") or 0
+                add(models, str(span.attributes.get("model")), seconds)
+            elif span.kind == "data":
+                add(data, span.name, seconds)
+        llm["models"] = models
+        return {
+            "trace_id": self.trace_id,
+            "total_seconds": total,
+            "nodes": nodes,
+            "slowest_node": max(nodes, key=lambda n: nodes[n]["max_seconds"]) if nodes else None,
+            "llm": llm,
+            "data": data,
+        }
+
+
+def current_tracer() -> Optional[Tracer]:
+    """
+    현재 컨텍스트의 Tracer를 반환합니다. (그래프 실행 밖이면 None)
+    """
+
+    return _current_tracer.get()
+
+
+@contextmanager
+def start_span(name: str, kind: str = "data", **attributes) -> Iterator[Any]:
+    """
+    현재 컨텍스트의 Tracer에 자식 span을 기록합니다.
+    그래프 실행 밖(Tracer 없음)에서는 아무것도 기록하지 않습니다.
+
+    Args:
+        name (str): span 이름 (예: "naver.market_index")
+        kind (str): span 종류, 기본값 "data"
+        **attributes: span 속성
+
+    Example:
+        >>> with start_span("yfinance.financials", company=company) as span:
+        ...     data = fetch()
+        ...     span.set_attribute("rows", len(data))
+    """
+
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield _NULL_SPAN
+        return
+    with tracer.span(name, kind, **attributes) as span:
+        yield span
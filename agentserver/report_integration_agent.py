@@ -1,13 +1,14 @@
 # report_integration_agent.py
 
-import time
+import asyncio
 from dotenv import load_dotenv
 from langchain_openai import ChatOpenAI
 from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
 
 # LangGraph_base에서 Node, GraphState import
-from LangGraph_base import Node, GraphState
+from LangGraph_base import Node, GraphState, RetryPolicy, run_sync
+from tracing_callbacks import llm_span_callback
 
 load_dotenv()
 
@@ -18,6 +19,24 @@ class ReportIntegrationNode(Node):
     하나의 완성도 높은 통합 보고서를 생성하는 역할을 수행합니다.
     """
     
+    # 재실행 범위 계산에 사용되는 state 입출력 키
+    reads = ("company_name", "financial_report", "news_report", "macro_report",
+             "fin_statements_report", "daily_chart_report", "deficiency_details")
+    writes = ("integrated_report",)
+
+    # 1회 실행 제한 시간(초)과 재시도 정책
+    timeout = 180
+    retry = RetryPolicy(max_attempts=2)
+
+    # fallback 통합 보고서에 사용하는 (state 키, 섹션 제목)
+    REPORT_SECTIONS = (
+        ("financial_report", "기업 분석"),
+        ("news_report", "뉴스 분석"),
+        ("macro_report", "거시경제 분석"),
+        ("fin_statements_report", "재무제표 분석"),
+        ("daily_chart_report", "일봉/월봉 차트 분석"),
+    )
+
     def __init__(self, name: str) -> None:
         """
         에이전트 초기화 함수.
@@ -33,7 +52,8 @@ class ReportIntegrationNode(Node):
         # LLM 초기화 (시스템 프롬프트 포함)
         self.llm = ChatOpenAI(
             model_name="o1-mini-2024-09-12",
-            temperature=1
+            temperature=1,
+            callbacks=[llm_span_callback]
         )
         # 시스템 프롬프트: 통합 보고서를 작성하는 전문가로서의 역할을 명시
         self.system_prompt = SystemMessage(content=(
@@ -67,7 +87,7 @@ class ReportIntegrationNode(Node):
         # RunnableSequence: 프롬프트 템플릿과 LLM 모델을 연결
         self.final_answer_chain = self.final_prompt_template | self.llm
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         LangGraph 노드 인터페이스를 구현하는 함수로, 
         여러 리포트 데이터를 통합하여 하나의 완성도 높은 주식 보고서를 생성합니다.
@@ -113,11 +133,33 @@ class ReportIntegrationNode(Node):
             "deficiency": deficiency_text
         }
         
-        final_answer = self.final_answer_chain.invoke(prompt_values)
+        final_answer = await self.final_answer_chain.ainvoke(prompt_values)
         # 결과를 state에 저장
         state["integrated_report"] = final_answer.content
         
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+        return state
+
+    def process(self, state: GraphState) -> GraphState:
+        """
+        aprocess()를 동기 방식으로 실행하는 adapter입니다.
+
+        Args:
+            state (GraphState): 각 분석 보고서가 포함된 상태 정보
+
+        Returns:
+            GraphState: 'integrated_report'가 추가된 상태
+        """
+        return run_sync(self.aprocess(state))
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        LLM 통합에 실패한 경우, 개별 분석 보고서를 섹션별로 이어 붙여 통합 보고서로 사용합니다.
+        """
+        target = state.get("company_name", "미지정 기업")
+        sections = [f"### {title}\n{state[key]}" for key, title in self.REPORT_SECTIONS if state.get(key)]
+        state["integrated_report"] = f"## {target} 분석 보고서 (자동 통합 실패로 개별 보고서를 요약 없이 제공)\n\n" \
+                                     + "\n\n".join(sections)
         return state
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
-from LangGraph_base import Node, GraphState
-import time
+from LangGraph_base import Node, GraphState, RetryPolicy, run_sync
+from tracing_callbacks import llm_span_callback
+import asyncio
 from langchain_openai import ChatOpenAI
 from langchain.schema import SystemMessage
 from langchain_core.prompts import PromptTemplate
@@ -19,6 +20,14 @@ def get_next_node(state: GraphState) -> str:
     return state.get("next", "FINISH")
 
 class ReportSupervisorAgent(Node):
+    # 재실행 범위 계산에 사용되는 state 입출력 키
+    reads = ("report_score", "integrated_report", "retry_count")
+    writes = ("next", "retry_count", "deficiency_details")
+
+    # 1회 실행 제한 시간(초)과 재시도 정책
+    timeout = 60
+    retry = RetryPolicy(max_attempts=2)
+
     def __init__(self, name: str, quality_threshold: float = 5.0) -> None:
         """
         ReportSupervisorAgent 클래스를 초기화합니다.
@@ -37,7 +46,8 @@ class ReportSupervisorAgent(Node):
         # LLM 초기화 (진단용)
         self.llm = ChatOpenAI(
             model_name="gpt-4o-mini",
-            temperature=0.5
+            temperature=0.5,
+            callbacks=[llm_span_callback]
         )
         # 시스템 프롬프트: 감독자로서의 역할 설명
         self.system_prompt = SystemMessage(content=(
@@ -88,7 +98,7 @@ class ReportSupervisorAgent(Node):
         )
         self.diagnosis_chain = self.diagnosis_prompt | self.llm
 
-    def process(self, state: GraphState) -> GraphState:
+    async def aprocess(self, state: GraphState) -> GraphState:
         """
         통합 보고서의 품질을 평가하고, 다음 처리 단계(다음 노드)를 결정합니다.
 
@@ -136,7 +146,7 @@ class ReportSupervisorAgent(Node):
         prompt_suffix = f"\n\n(추가 시도 #{retry_count + 1}: 이전 결과와 동일할 경우, 새로운 관점을 포함해 주세요.)"
         modified_report = integrated_report + prompt_suffix
 
-        diagnosis_response = self.diagnosis_chain.invoke({
+        diagnosis_response = await self.diagnosis_chain.ainvoke({
             "integrated_report": modified_report
         })
         diagnosis_text = diagnosis_response.content if hasattr(diagnosis_response, "content") else diagnosis_response
@@ -173,7 +183,27 @@ class ReportSupervisorAgent(Node):
             print(f"[{self.name}] 모든 영역이 충분합니다. FINISH 처리합니다.")
             state["next"] = "FinalAnalysisAgent"
 
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
+        return state
+
+    def process(self, state: GraphState) -> GraphState:
+        """
+        aprocess()를 동기 방식으로 실행하는 adapter입니다.
+
+        Args:
+            state (GraphState): "report_score", "integrated_report" 등을 포함한 상태 사전
+
+        Returns:
+            GraphState: 다음 노드 정보가 업데이트된 상태 사전
+        """
+        return run_sync(self.aprocess(state))
+
+    def fallback(self, state: GraphState, error: Exception) -> GraphState:
+        """
+        진단에 실패하거나 제한 시간을 넘긴 경우 추가 재시도 없이 최종 분석으로 진행합니다.
+        """
+        print(f"[{self.name}] 진단 실패({type(error).__name__}). 최종 분석으로 진행합니다.")
+        state["next"] = "FinalAnalysisAgent"
         return state
 
 if __name__ == "__main__":
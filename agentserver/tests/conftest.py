@@ -0,0 +1,6 @@
+import os
+import sys
+
+# 워커 모듈은 agentserver와 worker 디렉터리를 기준으로 import하므로 (PYTHONPATH=. python worker/...) 같은 경로를 추가
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [ROOT, os.path.join(ROOT, "worker")]
@@ -0,0 +1,162 @@
+"""
+LangGraph_base.Graph 실행 순서 테스트
+
+reads/writes를 선언한 stub 노드로 보고서 그래프와 같은 모양의 그래프를 만들어
+동시 분기/합류, 감독자 재시도 시 재실행 범위, 체크포인트 재개를 확인합니다.
+
+    # agentserver 디렉터리에서 실행
+    python -m pytest tests/test_graph_runtime.py
+"""
+import threading
+from collections import Counter
+
+import pytest
+
+from LangGraph_base import Graph, GraphState, Node
+from graph_checkpoint import SQLiteCheckpointStore
+
+
+class StubNode(Node):
+    """
+    실행 기록을 남기고 func(state, 실행 횟수)의 결과를 writes 키에 기록하는 노드입니다.
+    """
+
+    def __init__(self, name: str, reads, writes, log: list, func=None) -> None:
+        super().__init__(name)
+        self.reads = tuple(reads)
+        self.writes = tuple(writes)
+        self.log = log
+        self.func = func or (lambda state, count: {key: f"{name}-{count}" for key in self.writes})
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def process(self, state: GraphState) -> GraphState:
+        with self._lock:
+            self.calls += 1
+            count = self.calls
+        self.log.append(self.name)
+        state.update(self.func(state, count))
+        return state
+
+
+def build_report_graph(log: list, news=None, supervisor=None, **graph_options) -> Graph:
+    """
+    분석 노드 2개 -> 통합 -> 평가 -> 감독자 -> (재시도 대상 분석 노드 | 최종 분석) 그래프를 만듭니다.
+    """
+
+    graph = Graph(**graph_options)
+    graph.add_node(StubNode("News", (), ("news_report",), log, news))
+    graph.add_node(StubNode("Macro", (), ("macro_report",), log))
+    graph.add_node(StubNode("Integration", ("news_report", "macro_report"), ("integrated_report",), log))
+    graph.add_node(StubNode("Scorer", ("integrated_report",), ("report_score",), log))
+    graph.add_node(StubNode("Supervisor", ("report_score", "integrated_report", "retry_count"),
+                            ("next", "retry_count"), log, supervisor))
+    graph.add_node(StubNode("Final", ("integrated_report",), ("final_report",), log))
+    for name in ("News", "Macro"):
+        graph.add_edge(name, "Integration")
+    graph.add_edge("Integration", "Scorer")
+    graph.add_edge("Scorer", "Supervisor")
+    graph.add_edge("Supervisor", "Final")
+    graph.add_conditional_edges("Supervisor", lambda state: state.get("next", "FINISH"),
+                                {"News": "News", "Final": "Final", "FINISH": "Final"})
+    return graph
+
+
+def retry_news_once(state: GraphState, count: int) -> dict:
+    """
+    첫 진단에서는 뉴스 분석을 다시 요청하고, 두 번째 진단에서는 최종 분석으로 진행하는 감독자입니다.
+    """
+
+    retry_count = state.get("retry_count", 0)
+    if retry_count == 0:
+        return {"next": "News", "retry_count": 1}
+    return {"next": "Final", "retry_count": retry_count}
+
+
+def run(graph: Graph, state: GraphState = None, run_id: str = None) -> GraphState:
+    final_state = None
+    for _, final_state in graph.run_stream(dict(state or {}), run_id=run_id):
+        pass
+    return final_state
+
+
+def test_analysis_nodes_fan_out_concurrently_and_join_once():
+    log = []
+    # 세 분석 노드가 동시에 실행되지 않으면 barrier가 시간 초과로 깨짐
+    barrier = threading.Barrier(3, timeout=5)
+
+    def analyst(key):
+        def func(state, count):
+            barrier.wait()
+            return {key: f"{key}-{count}"}
+        return func
+
+    graph = Graph(max_workers=4)
+    for name, key in (("A", "a"), ("B", "b"), ("C", "c")):
+        graph.add_node(StubNode(name, (), (key,), log, analyst(key)))
+    graph.add_node(StubNode("Join", ("a", "b", "c"), ("joined",), log,
+                            lambda state, count: {"joined": (state["a"], state["b"], state["c"])}))
+    for name in ("A", "B", "C"):
+        graph.add_edge(name, "Join")
+
+    state = run(graph)
+
+    assert sorted(log[:3]) == ["A", "B", "C"]
+    assert log[3:] == ["Join"]
+    assert state["joined"] == ("a-1", "b-1", "c-1")
+
+
+def test_supervisor_retry_reruns_only_the_dirty_region():
+    log = []
+    graph = build_report_graph(log, supervisor=retry_news_once)
+
+    state = run(graph)
+
+    # 감독자가 뉴스 분석만 다시 요청하면 거시경제 분석은 다시 실행하지 않음
+    assert Counter(log) == {"News": 2, "Macro": 1, "Integration": 2, "Scorer": 2, "Supervisor": 2, "Final": 1}
+    assert log.index("Final") == len(log) - 1
+    assert state["news_report"] == "News-2"
+    assert state["integrated_report"] == "Integration-2"
+    assert state["final_report"] == "Final-1"
+
+
+def test_retry_without_changes_still_reaches_final_analysis():
+    log = []
+    graph = build_report_graph(log, news=lambda state, count: {"news_report": "같은 뉴스 분석"},
+                               supervisor=retry_news_once)
+
+    state = run(graph)
+
+    # 재시도한 뉴스 분석의 결과가 같으면 하위 노드는 다시 실행하지 않지만 감독자는 다시 결정함
+    assert Counter(log) == {"News": 2, "Macro": 1, "Integration": 1, "Scorer": 1, "Supervisor": 2, "Final": 1}
+    assert log[-2:] == ["Supervisor", "Final"]
+    assert state["final_report"] == "Final-1"
+
+
+def test_checkpoint_resumes_after_crash(tmp_path):
+    log = []
+    crash = {"enabled": True}
+
+    def scorer(state, count):
+        if crash["enabled"]:
+            raise RuntimeError("프로세스 중단")
+        return {"report_score": 8.0}
+
+    checkpointer = SQLiteCheckpointStore(str(tmp_path / "checkpoints.db"))
+    graph = build_report_graph(log, checkpointer=checkpointer)
+    graph.nodes["Scorer"].func = scorer
+
+    with pytest.raises(RuntimeError):
+        run(graph, {"company_name": "LG화학"}, run_id="task-1")
+    assert "Final" not in log
+
+    # 재개 시 마지막 완료 노드(통합)까지는 다시 실행하지 않고 평가 노드부터 이어서 실행
+    crash["enabled"] = False
+    resumed_from = len(log)
+    state = run(graph, {"company_name": "LG화학"}, run_id="task-1")
+
+    assert log[resumed_from:] == ["Scorer", "Supervisor", "Final"]
+    assert state["company_name"] == "LG화학"
+    assert state["integrated_report"] == "Integration-1"
+    assert state["report_score"] == 8.0
+    assert state["final_report"] == "Final-1"
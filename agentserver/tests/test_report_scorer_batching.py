@@ -0,0 +1,78 @@
+"""
+ReportScorerAgent 배치 평가 테스트
+
+config로 만든 작은 랜덤 초기화 causal LM과 글자 단위 토크나이저를 임시 디렉터리에 저장해 로드하고,
+score_reports()로 여러 리포트를 한 번에 평가한 점수가 한 건씩 평가한 점수와 같은지 확인합니다.
+(왼쪽 패딩/attention mask/position_ids, prefix KV 캐시 경로 모두 확인)
+
+    # agentserver 디렉터리에서 실행 (torch, transformers, tokenizers 필요)
+    python -m pytest tests/test_report_scorer_batching.py
+"""
+import pytest
+
+torch = pytest.importorskip("torch")
+transformers = pytest.importorskip("transformers")
+tokenizers = pytest.importorskip("tokenizers")
+
+from fin_report_scorer_agent import ReportScorerAgent
+
+# 길이가 서로 다른 리포트 (배치 안에서 왼쪽 패딩이 생기도록)
+REPORTS = [
+    "LG화학 매수",
+    "삼성전자는 메모리 업황 회복으로 2분기 영업이익이 개선될 전망입니다. 목표주가 95000원, 투자의견 매수.",
+    "현대차 중립: 환율 효과는 줄었지만 판매 믹스 개선이 이어지고 있습니다.",
+]
+
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory):
+    """
+    작은 Llama 모델과 글자 단위 토크나이저를 만들어 저장한 디렉터리를 반환합니다.
+    """
+    # 프롬프트와 테스트 리포트의 모든 글자, 숫자 0~9를 각각 한 토큰으로 인코딩
+    corpus = ReportScorerAgent.build_prompt("".join(REPORTS) + "삼성전자A1 ") + "0123456789"
+    specials = ["<unk>", "<pad>", "</s>"]
+    vocab = {token: index for index, token in enumerate(specials + sorted(set(corpus)))}
+    tokenizer = tokenizers.Tokenizer(tokenizers.models.WordLevel(vocab, unk_token="<unk>"))
+    tokenizer.pre_tokenizer = tokenizers.pre_tokenizers.Split(tokenizers.Regex(r"[\s\S]"), behavior="isolated")
+
+    path = tmp_path_factory.mktemp("tiny-scorer")
+    transformers.PreTrainedTokenizerFast(tokenizer_object=tokenizer, unk_token="<unk>", pad_token="<pad>",
+                                         eos_token="</s>").save_pretrained(path)
+    torch.manual_seed(0)
+    # 기본 초기화 범위(0.02)에서는 점수가 모두 5.5 근처로 모이므로 가중치를 크게 초기화
+    config = transformers.LlamaConfig(vocab_size=len(vocab), hidden_size=32, intermediate_size=64,
+                                      num_hidden_layers=2, num_attention_heads=4, num_key_value_heads=2,
+                                      max_position_embeddings=512, initializer_range=0.5,
+                                      pad_token_id=vocab["<pad>"], eos_token_id=vocab["</s>"])
+    transformers.LlamaForCausalLM(config).save_pretrained(path)
+    return str(path)
+
+
+def build_scorer(model_dir: str, prefix_cache: bool) -> ReportScorerAgent:
+    return ReportScorerAgent("ReportScorerAgent", eval_model=model_dir, batch_size=8, prefix_cache=prefix_cache,
+                             backend="cpu-fp32", compile_model=False, service_url=None)
+
+
+@pytest.mark.parametrize("prefix_cache", [False, True])
+def test_batched_scores_match_single_report_scores(model_dir, prefix_cache):
+    scorer = build_scorer(model_dir, prefix_cache)
+    assert (scorer.prefix_past is not None) == prefix_cache
+
+    batched = scorer.score_reports(REPORTS)
+    single = [scorer.score_reports([report])[0] for report in REPORTS]
+
+    assert batched == pytest.approx(single, abs=1e-4)
+    # 랜덤 초기화 모델에서도 리포트마다 점수가 달라야 패딩 위치가 섞였는지 확인할 수 있음
+    assert len({round(score, 4) for score in single}) == len(REPORTS)
+
+
+def test_prefix_cache_does_not_change_scores(model_dir):
+    scorer = build_scorer(model_dir, prefix_cache=False)
+    without_cache = scorer.score_reports(REPORTS)
+
+    scorer.prepare_prefix_cache()
+    assert scorer.prefix_ids
+
+    assert scorer.score_reports(REPORTS) == pytest.approx(without_cache, abs=1e-4)
+    assert scorer.score_reports([""] + REPORTS) == pytest.approx([0.0] + without_cache, abs=1e-4)
@@ -0,0 +1,60 @@
+"""
+ReportWorker의 새 작업 알림 대기(_wait_for_task) 테스트
+
+PostgreSQL LISTEN/NOTIFY 대신 LocalNotificationChannel을 사용합니다.
+
+    # agentserver 디렉터리에서 실행
+    python -m pytest tests
+"""
+import time
+import threading
+
+from task_notifications import LocalNotificationChannel
+from report_worker import ReportWorker
+
+
+def start_waiter(worker: ReportWorker) -> dict:
+    """
+    별도 스레드에서 현재 알림 수를 기준으로 _wait_for_task를 호출하고, 반환까지 걸린 시간을 기록합니다.
+    """
+
+    result = {"done": threading.Event()}
+
+    def wait():
+        started = time.monotonic()
+        worker._wait_for_task(worker._notifications)
+        result["seconds"] = time.monotonic() - started
+        result["done"].set()
+
+    threading.Thread(target=wait, daemon=True).start()
+    return result
+
+
+def test_wait_for_task_wakes_on_notify():
+    channel = LocalNotificationChannel()
+    worker = ReportWorker(concurrency=1, sweep_interval=10, channel=channel)
+    listener = threading.Thread(target=worker._listen, daemon=True)
+    listener.start()
+    try:
+        waiter = start_waiter(worker)
+        time.sleep(0.1)
+        assert not waiter["done"].is_set()
+
+        channel.notify("task-1")
+        # sweep_interval(10초)까지 기다리지 않고 알림을 받자마자 깨어나야 함
+        assert waiter["done"].wait(timeout=2)
+        assert waiter["seconds"] < 2
+        assert worker._notifications == 1
+    finally:
+        worker.stop()
+        listener.join(timeout=5)
+
+
+def test_wait_for_task_sweeps_on_timeout():
+    worker = ReportWorker(concurrency=1, sweep_interval=0.2, channel=LocalNotificationChannel())
+
+    waiter = start_waiter(worker)
+    # 알림이 없어도 sweep_interval이 지나면 대기 작업을 다시 조회하도록 반환해야 함
+    assert waiter["done"].wait(timeout=2)
+    assert 0.15 <= waiter["seconds"] < 2
+    assert worker._notifications == 0
@@ -0,0 +1,64 @@
+import threading
+from typing import Any, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from graph_tracing import current_tracer
+
+
+class LLMSpanCallback(BaseCallbackHandler):
+    """
+    LangChain LLM 호출마다 "llm" span을 기록하는 콜백입니다.
+    모델명, 프롬프트/응답 토큰 수, 지연 시간을 현재 노드 span의 자식으로 남깁니다.
+
+    Note:
+        run_inline=True로 호출한 태스크/스레드에서 바로 실행되어야
+        현재 컨텍스트의 Tracer와 부모 span을 찾을 수 있습니다.
+    """
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        self._spans: dict[UUID, Any] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, serialized: Optional[dict], run_id: UUID, kwargs: dict) -> None:
+        tracer = current_tracer()
+        if tracer is None:
+            return
+        params = kwargs.get("invocation_params") or {}
+        model = params.get("model_name") or params.get("model") or (serialized or {}).get("name")
+        span = tracer.start_span("llm", "llm", model=model)
+        with self._lock:
+            self._spans[run_id] = span
+
+    def on_chat_model_start(self, serialized: dict, messages: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(serialized, run_id, kwargs)
+
+    def on_llm_start(self, serialized: dict, prompts: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._start(serialized, run_id, kwargs)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            span = self._spans.pop(run_id, None)
+        if span is None:
+            return
+        llm_output = response.llm_output or {}
+        usage = llm_output.get("token_usage") or {}
+        if llm_output.get("model_name"):
+            span.set_attribute("model", llm_output["model_name"])
+        span.set_attribute("prompt_tokens", usage.get("prompt_tokens"))
+        span.set_attribute("completion_tokens", usage.get("completion_tokens"))
+        span.end()
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            span = self._spans.pop(run_id, None)
+        if span is not None:
+            span.end(error=error)
+
+
+# 모든 에이전트의 ChatOpenAI에 공유하는 콜백 인스턴스
+llm_span_callback = LLMSpanCallback()
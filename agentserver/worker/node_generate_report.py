@@ -1,10 +1,24 @@
 import os
-from datetime import datetime
+import re
+import time
+import uuid
+from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from dotenv import load_dotenv
-from LangGraph_base import Graph, GraphState
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import aliased
+from LangGraph_base import Graph, GraphState, ProgressListener
+from graph_cache import NodeCache, SQLiteNodeCache
+from graph_checkpoint import CheckpointStore, SQLiteCheckpointStore
+from graph_dispatch import JobQueue, RemoteNode, create_job_queue, parse_dispatch
+from graph_tracing import JSONLSpanExporter, OTLPJsonSpanExporter, SpanExporter
+from graph_registry import registry
+from progress_writer import progress_writer
+from task_lease import TaskLeases, claim_values, lease_values, worker_id
 # 에이전트 모듈들
 from fin_financial_statements_agent import FinancialStatementsAnalysisAgent
 from fin_news_analysis_agent import NewsAnalysisAgent
@@ -16,11 +30,42 @@ from final_analysis_agent import FinalAnalysisAgent
 from fin_report_scorer_agent import ReportScorerAgent
 from report_supervisor_agent import ReportSupervisorAgent, get_next_node
 from app.db.session import get_db, get_db_session
-from app.schemas.db import Stock, Task
+from app.schemas.db import Stock, Task, TradeOutbox
 
 
 MANAGER_API_URL = os.environ.get("MANAGER_API_URL")
 load_dotenv()
+# 같은 서버의 워커 프로세스들이 공유하는 노드 결과 캐시 파일
+NODE_CACHE_PATH = os.environ.get("NODE_CACHE_PATH", "./cache/node_cache.sqlite3")
+# 노드 단위 체크포인트 파일 (워커 재시작 시 중단된 작업을 이어서 실행)
+CHECKPOINT_PATH = os.environ.get("CHECKPOINT_PATH", "./cache/checkpoints.sqlite3")
+# 마지막 체크포인트 이후 이 시간(초) 동안 기록이 없으면 중단된 실행으로 간주
+CHECKPOINT_STALE_SECONDS = float(os.environ.get("CHECKPOINT_STALE_SECONDS", 600))
+# 보고서 1건의 전체 제한 시간 (초), 초과 시 남은 노드는 대체 결과로 마무리
+REPORT_DEADLINE_SECONDS = float(os.environ.get("REPORT_DEADLINE_SECONDS", 1200))
+# 노드/LLM/데이터 소스 호출 span 출력 파일과 형식 ("jsonl" 또는 "otlp")
+TRACE_EXPORT_PATH = os.environ.get("TRACE_EXPORT_PATH", "./logs/traces.jsonl")
+TRACE_EXPORT_FORMAT = os.environ.get("TRACE_EXPORT_FORMAT", "jsonl")
+# SQLite(SKIP LOCKED 미지원)에서 작업을 가져올 때 조건부 UPDATE를 시도할 후보 수
+CLAIM_CANDIDATES = int(os.environ.get("CLAIM_CANDIDATES", 5))
+# 같은 종목의 '시작 전' 작업을 하나의 기업 분석으로 묶는 시간 범위 (초, 0이면 묶지 않음)와 최대 묶음 크기
+COALESCE_WINDOW_SECONDS = float(os.environ.get("COALESCE_WINDOW_SECONDS", 3600))
+COALESCE_MAX_TASKS = int(os.environ.get("COALESCE_MAX_TASKS", 20))
+# 함께 가져온 작업의 투자 성향별 최종 분석을 동시에 실행하는 최대 수 (1이면 순서대로 실행)
+PERSONA_CONCURRENCY = int(os.environ.get("PERSONA_CONCURRENCY", 4))
+# 노드를 작업 큐로 노드 워커 프로세스에 나누어 실행할지 여부와 노드별 풀 ("", "default" 또는 "노드=풀,...")
+GRAPH_DISPATCH = os.environ.get("GRAPH_DISPATCH", "")
+# 분산 실행 시 작업 큐 ("sqlite:///<경로>" 또는 "redis://...")
+JOB_QUEUE_URL = os.environ.get("JOB_QUEUE_URL", "sqlite:///./cache/jobs.sqlite3")
+
+# 작업 우선순위 클래스 (앞에 있을수록 먼저 처리, priority가 NULL인 작업은 DEFAULT_PRIORITY로 처리)
+TASK_PRIORITIES = ("interactive", "scheduled", "backfill")
+DEFAULT_PRIORITY = "scheduled"
+
+# 프로세스 레지스트리에 등록하는 보고서 그래프 이름
+REPORT_GRAPH = "report"
+# 투자 성향(investment_persona)에 따라 결과가 달라지는 노드, 묶인 작업마다 이 노드만 따로 실행
+PERSONA_NODE = "FinalAnalysisAgent"
 
 # StartNode 및 EndNode 정의
 START = "START"
@@ -81,12 +126,72 @@ class EndNode:
         return state
 
 
-def create_graph() -> Graph:
+def create_span_exporter() -> SpanExporter:
+    """
+    TRACE_EXPORT_FORMAT에 따라 span exporter를 생성합니다.
+
+    Returns:
+        SpanExporter: "otlp"이면 OTLP/JSON, 그 외에는 JSONL exporter
+    """
+
+    if TRACE_EXPORT_FORMAT == "otlp":
+        return OTLPJsonSpanExporter(TRACE_EXPORT_PATH)
+    return JSONLSpanExporter(TRACE_EXPORT_PATH)
+
+
+# 그래프 노드 이름 -> (노드 클래스, 생성 인자), 코디네이터와 노드 워커가 같은 정의로 노드를 생성
+NODE_SPECS: Dict[str, tuple] = {
+    "FinancialStatementsAnalysisAgent": (FinancialStatementsAnalysisAgent, {}),
+    "NewsAnalysisAgent": (NewsAnalysisAgent, {}),
+    "MacroeconomicAnalysisAgent": (MacroeconomicAnalysisAgent, {}),
+    "FinancialReportsAnalysisAgent": (FinancialReportsAnalysisAgent, {}),
+    "DailyChartAnalysisAgent": (DailyChartAnalysisAgent, {}),
+    "ReportIntegrationNode": (ReportIntegrationNode, {}),
+    # LGAI-EXAONE/EXAONE-3.5-7.8B-Instruct
+    # deepseek-ai/DeepSeek-R1-Distill-Qwen-7B
+    "ReportScorerAgent": (ReportScorerAgent, {"eval_model": "LGAI-EXAONE/EXAONE-3.5-7.8B-Instruct"}),
+    "ReportSupervisorAgent": (ReportSupervisorAgent, {"quality_threshold": 5.0}),
+    "FinalAnalysisAgent": (FinalAnalysisAgent, {}),
+}
+
+# GRAPH_DISPATCH="default"일 때 노드별 실행 풀
+# 평가 모델은 전용 모델 프로세스("model"), LLM/HTTP 위주의 노드는 비동기 풀("io")에서 실행하고
+# 가벼운 감독자 노드는 코디네이터에서 실행
+DEFAULT_DISPATCH_POOLS = {
+    "FinancialStatementsAnalysisAgent": "io",
+    "NewsAnalysisAgent": "io",
+    "MacroeconomicAnalysisAgent": "io",
+    "FinancialReportsAnalysisAgent": "io",
+    "DailyChartAnalysisAgent": "io",
+    "ReportIntegrationNode": "io",
+    "ReportScorerAgent": "model",
+    "FinalAnalysisAgent": "io",
+}
+
+
+def build_node(name: str):
+    """
+    NODE_SPECS에 정의된 노드를 생성합니다.
+
+    Args:
+        name (str): 노드 이름
+
+    Returns:
+        Node: 생성된 에이전트 노드
+    """
+
+    node_cls, kwargs = NODE_SPECS[name]
+    return node_cls(name, **kwargs)
+
+
+def create_graph(cache: NodeCache = None, checkpointer: CheckpointStore = None,
+                 span_exporter: SpanExporter = None, progress: ProgressListener = None,
+                 dispatch: Optional[Dict[str, str]] = None, job_queue: Optional[JobQueue] = None) -> Graph:
     """
     투자 분석을 위한 전체 워크플로우 그래프를 생성합니다.
 
     그래프는 다음 컴포넌트들로 구성됩니다:
-    1. 기본 분석 노드들
+    1. 기본 분석 노드들 (START 이후 동시 실행, 통합 노드에서 합류)
         - 재무제표 분석
         - 뉴스 분석
         - 거시경제 분석
@@ -98,43 +203,45 @@ def create_graph() -> Graph:
         - 품질 감독 (임계값 5.0)
         - 최종 분석
 
+    Args:
+        cache (NodeCache, optional): 노드 결과 캐시
+            거시경제 분석과 재무제표 분석 결과를 노드별 TTL 동안 재사용합니다.
+        checkpointer (CheckpointStore, optional): 노드 완료마다 실행 상태를 기록하는 저장소
+        span_exporter (SpanExporter, optional): 노드/LLM/데이터 소스 호출 span exporter
+        progress (ProgressListener, optional): 노드 실행 시작/종료를 전달받는 진행 상황 리스너
+        dispatch (Dict[str, str], optional): 노드 이름 -> 실행 풀 이름
+            지정된 노드는 이 프로세스에서 생성하지 않고 job_queue를 통해 노드 워커(worker/node_pool.py)에서 실행합니다.
+        job_queue (JobQueue, optional): dispatch에 사용할 작업 큐
+
+    Note:
+        그래프 전체 제한 시간은 REPORT_DEADLINE_SECONDS이며, 각 노드의 제한 시간/재시도 정책은
+        에이전트 클래스의 timeout/retry 속성으로 정의됩니다.
+        dispatch된 노드도 제한 시간, 재시도, 캐시, fallback과 스트리밍은 이 그래프에서 그대로 처리됩니다.
+
     Returns:
         Graph: 설정된 분석 워크플로우 그래프
     """
     
-    graph = Graph()
-
-    # 에이전트 노드 생성
-    start_node = StartNode()
-    fs_node = FinancialStatementsAnalysisAgent("FinancialStatementsAnalysisAgent")
-    news_node = NewsAnalysisAgent("NewsAnalysisAgent")
-    macro_node = MacroeconomicAnalysisAgent("MacroeconomicAnalysisAgent")
-    financial_node = FinancialReportsAnalysisAgent("FinancialReportsAnalysisAgent")
-    daily_chart_node = DailyChartAnalysisAgent("DailyChartAnalysisAgent")
-    integration_node = ReportIntegrationNode("ReportIntegrationNode")
-    
-    # LGAI-EXAONE/EXAONE-3.5-7.8B-Instruct
-    # deepseek-ai/DeepSeek-R1-Distill-Qwen-7B
-    scorer_node = ReportScorerAgent(
-        "ReportScorerAgent", eval_model="LGAI-EXAONE/EXAONE-3.5-7.8B-Instruct")
-    supervisor_node = ReportSupervisorAgent(
-        "ReportSupervisorAgent", quality_threshold=5.0)
-    final_node = FinalAnalysisAgent("FinalAnalysisAgent")
-    end_node = EndNode()
-
-    # 노드 추가
-    for node in [start_node, fs_node, news_node, macro_node, financial_node, daily_chart_node,
-                 integration_node, scorer_node, supervisor_node, final_node, end_node]:
-        graph.add_node(node)
-
-    # 엣지 연결 (순차적 흐름)
-    graph.add_edge(START, "FinancialStatementsAnalysisAgent")
-    graph.add_edge("FinancialStatementsAnalysisAgent", "NewsAnalysisAgent")
-    graph.add_edge("NewsAnalysisAgent", "MacroeconomicAnalysisAgent")
-    graph.add_edge("MacroeconomicAnalysisAgent",
-                   "FinancialReportsAnalysisAgent")
-    graph.add_edge("FinancialReportsAnalysisAgent", "DailyChartAnalysisAgent")
-    graph.add_edge("DailyChartAnalysisAgent", "ReportIntegrationNode")
+    graph = Graph(cache=cache, checkpointer=checkpointer, deadline=REPORT_DEADLINE_SECONDS,
+                  span_exporter=span_exporter, progress=progress)
+    dispatch = dispatch or {}
+
+    # 노드 추가 (dispatch된 노드는 작업 큐로 실행을 맡기는 대리 노드)
+    graph.add_node(StartNode())
+    for name, (node_cls, _) in NODE_SPECS.items():
+        if name in dispatch:
+            graph.add_node(RemoteNode(node_cls, name, job_queue, dispatch[name]))
+        else:
+            graph.add_node(build_node(name))
+    graph.add_node(EndNode())
+
+    # 엣지 연결: 5개의 분석 노드는 서로의 결과를 읽지 않으므로
+    # START에서 동시에 분기하고 ReportIntegrationNode에서 합류
+    analysis_nodes = ["FinancialStatementsAnalysisAgent", "NewsAnalysisAgent", "MacroeconomicAnalysisAgent",
+                      "FinancialReportsAnalysisAgent", "DailyChartAnalysisAgent"]
+    for name in analysis_nodes:
+        graph.add_edge(START, name)
+        graph.add_edge(name, "ReportIntegrationNode")
     graph.add_edge("ReportIntegrationNode", "ReportScorerAgent")
     graph.add_edge("ReportScorerAgent", "ReportSupervisorAgent")
     graph.add_edge("ReportSupervisorAgent", "FinalAnalysisAgent")
@@ -154,6 +261,34 @@ def create_graph() -> Graph:
     return graph
 
 
+def create_report_graph() -> Graph:
+    """
+    워커가 사용하는 보고서 그래프를 노드 결과 캐시, 체크포인트 저장소, span exporter,
+    진행 상황 기록기(작업의 status_message에 노드별 진행 상황을 모아서 기록)와 함께 생성합니다.
+    프로세스 레지스트리에 등록되어 프로세스당 한 번만 호출됩니다.
+
+    GRAPH_DISPATCH가 설정되어 있으면 해당 노드들은 JOB_QUEUE_URL의 작업 큐를 통해
+    노드 워커 프로세스에서 실행됩니다.
+
+    Returns:
+        Graph: 설정된 분석 워크플로우 그래프
+    """
+
+    dispatch = parse_dispatch(GRAPH_DISPATCH, DEFAULT_DISPATCH_POOLS)
+    return create_graph(cache=SQLiteNodeCache(NODE_CACHE_PATH),
+                        checkpointer=SQLiteCheckpointStore(CHECKPOINT_PATH),
+                        span_exporter=create_span_exporter(),
+                        progress=progress_writer,
+                        dispatch=dispatch,
+                        job_queue=create_job_queue(JOB_QUEUE_URL) if dispatch else None)
+
+
+registry.register(REPORT_GRAPH, create_report_graph)
+
+
+STOCK_POSITION_PATTERN = re.compile(r"최종\s*매매의견\s*[:：]\s*\**\s*(매수|매도|관망)")
+
+
 def parse_stock_position(report: str) -> str:
     """
     최종 매매의견에서 주식 포지션을 추출합니다.
@@ -170,25 +305,443 @@ def parse_stock_position(report: str) -> str:
         >>> parse_stock_position("최종 매매의견: 매수, 자산 배분 제안: 30%")
         "매수"
     """
-    
-    if "매도" in report:
-        return "매도"
-    elif "매수" in report:
-        return "매수"
-    elif "관망" in report:
-        return "관망"
-    else:
-        return "관망"
+
+    # 보고서 본문(통합 보고서 등)의 "매수/매도" 단어가 아니라 "최종 매매의견:" 뒤의 값만 사용
+    match = STOCK_POSITION_PATTERN.search(report or "")
+    return match.group(1) if match else "관망"
+
+
+def find_resumable_task(db, checkpointer: SQLiteCheckpointStore, exclude: Set[str] = frozenset()):
+    """
+    워커가 비정상 종료되어 '생성 중' 상태로 남은 작업 중 체크포인트가 있는 작업을 찾아 이 워커가 임대합니다.
+    임대가 아직 유효한 작업(다른 워커가 실행 중)은 제외합니다.
+
+    Args:
+        db: DB 세션
+        checkpointer (SQLiteCheckpointStore): 체크포인트 저장소
+        exclude (Set[str]): 이 프로세스에서 실행 중이어서 제외할 task_id
+
+    Returns:
+        Optional[Task]: 이어서 실행할 Task, 없으면 None
+
+    Note:
+        이미 완료/실패 처리된 작업의 체크포인트는 정리합니다.
+        임대가 만료된 작업은 reap_expired_tasks()가 대기열로 되돌리기 전에 같은 서버의 워커가 바로 재개할 수 있습니다.
+    """
+
+    now = datetime.now(ZoneInfo("Asia/Seoul"))
+    for run_id in checkpointer.stale_runs(CHECKPOINT_STALE_SECONDS):
+        if run_id in exclude:
+            continue
+        task = db.query(Task).filter(Task.task_id == uuid.UUID(run_id), Task.status == '생성 중').first()
+        if task is None:
+            checkpointer.clear(run_id)
+            continue
+        # 임대가 만료된 경우에만 조건부 UPDATE로 임대를 넘겨받음 (여러 워커가 동시에 재개하지 않음)
+        updated = db.query(Task).filter(
+            Task.id == task.id, Task.status == '생성 중',
+            or_(Task.lease_expires_at.is_(None), Task.lease_expires_at < now)
+        ).update(claim_values(), synchronize_session=False)
+        db.commit()
+        if updated == 1:
+            db.refresh(task)
+            return task
+    return None
+
+
+def _claim(db, waiting, limit: int) -> List[Task]:
+    """
+    조회 조건(waiting)에 해당하는 '시작 전' 작업을 최대 limit개까지 원자적으로 '생성 중'으로 바꾸고 반환합니다.
+    여러 워커(프로세스/스레드)가 동시에 호출해도 같은 작업을 두 번 가져가지 않습니다.
+
+    Args:
+        db: DB 세션
+        waiting: '시작 전' 작업을 가져올 순서대로 정렬한 Task 쿼리
+        limit (int): 가져올 최대 작업 수
+
+    Returns:
+        List[Task]: 가져온 Task 목록 (없으면 빈 리스트)
+
+    Note:
+        PostgreSQL에서는 SELECT ... FOR UPDATE SKIP LOCKED로 다른 워커가 잠근 행을 건너뛰고,
+        SKIP LOCKED를 지원하지 않는 SQLite(로컬 테스트)에서는 상태가 '시작 전'일 때만
+        갱신하는 조건부 UPDATE로 먼저 갱신한 워커만 작업을 가져갑니다.
+    """
+
+    # 상태 변경과 함께 이 워커의 임대(worker_id, heartbeat, 만료 시각)를 기록하고 시도 횟수를 늘림
+    claim = claim_values()
+
+    if db.get_bind().dialect.name == "postgresql":
+        tasks = waiting.with_for_update(skip_locked=True).limit(limit).all()
+        if not tasks:
+            db.rollback()
+            return []
+        db.query(Task).filter(Task.id.in_([task.id for task in tasks])).update(
+            claim, synchronize_session=False)
+        db.commit()
+        for task in tasks:
+            db.refresh(task)
+        return tasks
+
+    claimed = []
+    for (candidate_id,) in waiting.with_entities(Task.id).limit(max(limit, CLAIM_CANDIDATES)).all():
+        updated = db.query(Task).filter(Task.id == candidate_id, Task.status == '시작 전').update(
+            claim, synchronize_session=False)
+        db.commit()
+        if updated == 1:
+            claimed.append(candidate_id)
+            if len(claimed) >= limit:
+                break
+    if not claimed:
+        return []
+    return db.query(Task).filter(Task.id.in_(claimed)).order_by(Task.created_at, Task.id).all()
+
+
+def task_priority(task: Task) -> str:
+    """
+    Task의 우선순위 클래스를 반환합니다. (NULL이거나 알 수 없는 값이면 DEFAULT_PRIORITY)
+    """
+
+    return task.priority if task.priority in TASK_PRIORITIES else DEFAULT_PRIORITY
+
+
+def claim_task(db, priorities: Sequence[str] = TASK_PRIORITIES) -> Optional[Task]:
+    """
+    '시작 전' 작업 하나를 우선순위와 사용자별 공정 분배 순서로 골라 원자적으로 '생성 중'으로 바꾸고 반환합니다.
+
+    작업은 다음 순서로 고릅니다.
+    1. 우선순위 클래스 (interactive -> scheduled -> backfill)
+    2. 같은 클래스 안에서는 현재 '생성 중'인 작업이 적은 사용자의 작업
+       (한 사용자가 작업을 많이 쌓아도 다른 사용자의 작업이 뒤로 밀리지 않음)
+    3. 생성 시각이 오래된 작업
+
+    Args:
+        db: DB 세션
+        priorities (Sequence[str]): 가져올 수 있는 우선순위 클래스
+            (워커가 클래스별 동시 실행 한도에 도달한 클래스는 제외하여 호출)
+
+    Returns:
+        Optional[Task]: 가져온 Task, 대기 중인 작업이 없으면 None
+    """
+
+    if not priorities:
+        return None
+    # NULL이거나 알 수 없는 값은 DEFAULT_PRIORITY로 취급 (task_priority()와 같은 규칙)
+    priority = case({name: name for name in TASK_PRIORITIES}, value=Task.priority, else_=DEFAULT_PRIORITY)
+    rank = case({name: rank for rank, name in enumerate(TASK_PRIORITIES)}, value=priority)
+    running = aliased(Task)
+    user_running = db.query(func.count(running.id)).filter(
+        running.status == '생성 중', running.create_user_id == Task.create_user_id).correlate(Task).scalar_subquery()
+
+    waiting = db.query(Task).filter(Task.status == '시작 전', priority.in_(list(priorities))).order_by(
+        rank, user_running, Task.created_at, Task.id)
+    tasks = _claim(db, waiting, 1)
+    return tasks[0] if tasks else None
+
+
+def claim_followers(db, leader: Task, window: float = COALESCE_WINDOW_SECONDS) -> List[Task]:
+    """
+    leader와 같은 종목의 '시작 전' 작업 중 생성 시각이 window 이내인 작업을 함께 가져옵니다.
+    가져온 작업은 leader의 기업 분석 결과(5개 분석, 통합 보고서, 평가)를 공유하고
+    투자 성향별 최종 분석(PERSONA_NODE)만 따로 실행합니다.
+
+    Args:
+        db: DB 세션
+        leader (Task): 그래프 전체를 실행할 작업
+        window (float): leader 생성 시각 기준으로 묶을 시간 범위 (초)
+
+    Returns:
+        List[Task]: 함께 처리할 Task 목록 (최대 COALESCE_MAX_TASKS - 1개)
+    """
+
+    if window <= 0 or COALESCE_MAX_TASKS <= 1 or leader.stock_code is None or leader.created_at is None:
+        return []
+    freshness = timedelta(seconds=window)
+    waiting = db.query(Task).filter(
+        Task.status == '시작 전',
+        Task.stock_code == leader.stock_code,
+        Task.created_at >= leader.created_at - freshness,
+        Task.created_at <= leader.created_at + freshness,
+    ).order_by(Task.created_at, Task.id)
+    followers = _claim(db, waiting, COALESCE_MAX_TASKS - 1)
+    if followers:
+        print(f"[Coalesce] {leader.stock_name}({leader.stock_code}) 작업 {len(followers)}건을 "
+              f"Task {leader.task_id}의 기업 분석 결과로 함께 처리합니다.")
+    return followers
+
+
+def claim_stock_tasks(db, stock_code: str, limit: int = COALESCE_MAX_TASKS) -> List[Task]:
+    """
+    같은 종목의 '시작 전' 작업을 생성 시각 순서로 최대 limit개 가져옵니다.
+    (유니버스 배치가 만든 기업 분석 결과로 투자 성향별 최종 분석만 실행할 작업)
+
+    Args:
+        db: DB 세션
+        stock_code (str): 종목 코드
+        limit (int): 가져올 최대 작업 수
+
+    Returns:
+        List[Task]: 가져온 Task 목록
+    """
+
+    waiting = db.query(Task).filter(Task.status == '시작 전', Task.stock_code == stock_code).order_by(
+        Task.created_at, Task.id)
+    return _claim(db, waiting, limit)
+
+
+def load_followers(db, state: GraphState) -> List[Task]:
+    """
+    재개한 실행의 state에 기록된, 함께 처리하던 작업들을 다시 불러옵니다.
+
+    Args:
+        db: DB 세션
+        state (GraphState): 체크포인트에서 복원한 state
+
+    Returns:
+        List[Task]: 아직 '생성 중'인 Task 목록 (이 워커가 임대를 넘겨받은 작업)
+    """
+
+    task_ids = [uuid.UUID(task_id) for task_id in state.get("coalesced_task_ids") or []]
+    if not task_ids:
+        return []
+    # 중단된 워커의 임대를 넘겨받아 대기열로 되돌려지지 않게 함 (시도 횟수는 leader 작업만 증가)
+    now = datetime.now(ZoneInfo("Asia/Seoul"))
+    db.query(Task).filter(
+        Task.task_id.in_(task_ids), Task.status == '생성 중',
+        or_(Task.lease_expires_at.is_(None), Task.lease_expires_at < now)
+    ).update(lease_values(now), synchronize_session=False)
+    db.commit()
+    return db.query(Task).filter(Task.task_id.in_(task_ids), Task.status == '생성 중',
+                                 Task.worker_id == worker_id()).all()
+
+
+def save_report(db, task: Task, state: GraphState) -> Optional[str]:
+    """
+    state의 최종 보고서와 통합 보고서를 Task에 저장하고 '완료'로 변경합니다.
+    이 워커가 임대 중인 '생성 중' 작업일 때만 저장합니다. (임대 만료/반납 후 다른 워커가 가져갔거나 이미 저장된 작업은 건드리지 않음)
+
+    Args:
+        db: DB 세션
+        task (Task): 결과를 저장할 Task
+        state (GraphState): 그래프(또는 최종 분석 노드) 실행 결과
+
+    Returns:
+        Optional[str]: 추출한 매매 포지션 (이 워커의 작업이 아니어서 저장하지 않았으면 None)
+
+    Raises:
+        Exception: 최종 보고서 또는 통합 보고서가 없는 경우
+    """
+
+    if state.get("final_report") is None or state.get("integrated_report") is None:
+        raise Exception("최종 보고서 생성 실패")
+
+    progress_writer.forget(str(task.task_id))
+    now = datetime.now(ZoneInfo("Asia/Seoul"))
+    stock_position = parse_stock_position(state.get("final_report"))
+
+    integrated_report = state.get("integrated_report") or ""
+    final_report = state.get("final_report") or ""
+    total_report = final_report + " " + integrated_report
+
+    # db.query(Task).filter(Task.task_id == tasks.task_id).update({Task.status: "완료"})
+    updated = db.query(Task).filter(
+        Task.task_id == task.task_id, Task.status == "생성 중", Task.worker_id == worker_id()).update(
+        {Task.status: "완료", Task.report_generate: total_report, Task.stock_position: stock_position,
+         Task.stock_justification: integrated_report, Task.modified_at: now}, synchronize_session=False)
+    if updated == 0:
+        # 같은 작업이 두 번 저장되면 outbox 유니크 제약으로 commit이 실패하고 완료된 보고서가 '실패'로 바뀌므로 건너뜀
+        db.rollback()
+        print(f"[Worker] Task {task.task_id}는 이 워커가 임대 중인 작업이 아니므로 결과를 저장하지 않습니다.")
+        return None
+    if MANAGER_API_URL and not state.get("final_fallback"):
+        # 최종 분석이 fallback() 기본 의견이면 실제 매매의견이 아니므로 알림을 보내지 않음
+        # 관리 서버 알림은 같은 트랜잭션에 outbox로만 기록하고 전송은 worker/trade_dispatcher.py가 처리
+        # (관리 서버/카카오 응답 지연이 보고서 처리량에 영향을 주지 않음)
+        db.add(TradeOutbox(task_id=task.task_id, created_at=now, payload=json.dumps({
+            "user_id": str(task.create_user_id),
+            "stock_code": task.stock_code,
+            "position": stock_position,
+            "justification": total_report,
+            "task_id": str(task.task_id),
+        }, ensure_ascii=False)))
+    db.commit()
+    return stock_position
+
+
+def fail_task(db, task: Task, message: str) -> None:
+    """
+    Task 상태를 "실패"로 변경하고 에러 메시지를 status_message에 저장합니다.
+    """
+
+    progress_writer.forget(str(task.task_id))
+    db.rollback()
+    # 이미 저장된 보고서나 다른 워커가 다시 가져간 작업은 실패로 덮어쓰지 않음
+    db.query(Task).filter(Task.task_id == task.task_id, Task.status == "생성 중",
+                          Task.worker_id == worker_id()).update(
+        {Task.status: "실패", Task.status_message: message}, synchronize_session=False)
+    db.commit()
+
+
+def run_persona(db, graph: Graph, task: Task, company_state: GraphState) -> bool:
+    """
+    leader 작업의 기업 분석 결과에 task의 투자 성향을 적용해 최종 분석만 실행하고 결과를 저장합니다.
+
+    Args:
+        db: DB 세션
+        graph (Graph): 보고서 그래프
+        task (Task): 함께 처리하는 Task
+        company_state (GraphState): leader 작업의 최종 state
+
+    Returns:
+        bool: 보고서 생성에 성공하면 True
+    """
+
+    state = {key: value for key, value in company_state.items()
+             if key not in graph.nodes[PERSONA_NODE].writes and key != "coalesced_task_ids"}
+    state.update({
+        "customer_id": task.create_user_id,
+        "task_id": task.task_id,
+        "investment_persona": task.investor_type,
+    })
+    try:
+        state = graph.run_node(PERSONA_NODE, state, run_id=str(task.task_id))
+        save_report(db, task, state)
+        print(f"[Coalesce] Task {task.task_id} ({task.investor_type}) 최종 분석 완료")
+        return True
+    except Exception as e:
+        print(f"Error: {e}")
+        fail_task(db, task, str(e))
+        return False
+
+
+def run_personas(graph: Graph, tasks: Sequence[Task], company_state: GraphState,
+                 concurrency: int = PERSONA_CONCURRENCY) -> List[Tuple[bool, float]]:
+    """
+    함께 가져온 작업들의 최종 분석(run_persona)을 최대 concurrency개씩 동시에 실행합니다.
+
+    Args:
+        graph (Graph): 보고서 그래프
+        tasks (Sequence[Task]): 최종 분석만 실행할 Task 목록
+        company_state (GraphState): leader 작업(또는 종목)의 최종 state
+        concurrency (int): 동시에 실행하는 최종 분석 수
+
+    Returns:
+        List[Tuple[bool, float]]: 입력 순서대로 (보고서 생성 성공 여부, 소요 시간(초))
+
+    Note:
+        SQLAlchemy 세션은 스레드 간에 공유할 수 없으므로 스레드마다 새 세션에서 Task를 다시 읽어 실행합니다.
+        Task의 기본키는 호출한 스레드(Task를 읽은 세션의 스레드)에서 미리 꺼내 둡니다.
+    """
+
+    task_pks = [task.id for task in tasks]
+    if not task_pks:
+        return []
+
+    def run_one(task_pk: int) -> Tuple[bool, float]:
+        started = time.perf_counter()
+        with get_db_session() as db:
+            ok = run_persona(db, graph, db.get(Task, task_pk), company_state)
+        return ok, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(task_pks))),
+                            thread_name_prefix="persona") as executor:
+        return list(executor.map(run_one, task_pks))
+
+
+def run_task(db, graph: Graph, tasks: Task, resumed: bool = False,
+             setup_started: Optional[float] = None, followers: Sequence[Task] = ()) -> bool:
+    """
+    '생성 중'으로 가져온 작업의 보고서를 생성하고 결과를 DB에 기록합니다.
+    같은 종목으로 함께 가져온 작업(followers)은 기업 분석 결과를 공유하고 최종 분석만 따로 실행합니다.
+
+    Args:
+        db: DB 세션
+        graph (Graph): 프로세스에서 공유하는 보고서 그래프
+        tasks (Task): 그래프 전체를 실행할 Task
+        resumed (bool): 체크포인트에서 이어서 실행하는 작업인지 여부
+        setup_started (Optional[float]): 작업 준비 시작 시각 (time.perf_counter() 기준)
+        followers (Sequence[Task]): claim_followers()로 함께 가져온 Task 목록
+            재개한 경우에는 체크포인트 state에 기록된 작업을 다시 불러옵니다.
+
+    Returns:
+        bool: tasks의 보고서 생성에 성공하면 True
+
+    Error Handling:
+        - 예외 발생 시 Task 상태를 "실패"로 변경하고 에러 메시지를 status_message에 저장
+        - 기업 분석이 실패하면 함께 가져온 작업도 모두 "실패"로 변경
+        - 함께 가져온 작업의 최종 분석은 run_personas()로 동시에 실행하며, 작업별로 성공/실패를 기록
+        - DB 트랜잭션 롤백
+    """
+
+    checkpointer = graph.checkpointer
+    if setup_started is None:
+        setup_started = time.perf_counter()
+
+    try:
+        initial_state: GraphState = {
+            "company_name": tasks.stock_name,
+            "company_code": tasks.stock_code,
+            "customer_id": tasks.create_user_id,
+            "task_id": tasks.task_id,
+            "date": tasks.created_at,
+            "user_assets": 10000000.0,
+            "financial_query": "2025년 3월 기준, 해당 기업의 재무 리포트 및 투자 전망 분석",
+            "investment_persona": tasks.investor_type,
+            # 재개 시에도 함께 처리할 작업을 알 수 있도록 체크포인트 state에 기록
+            "coalesced_task_ids": [str(task.task_id) for task in followers],
+        }
+
+        if resumed:
+            print(f"**************중단된 Task {tasks.task_id} 재개************************")
+            checkpoint = checkpointer.load(str(tasks.task_id))
+            followers = load_followers(db, checkpoint.state) if checkpoint is not None else []
+
+        final_state = dict(initial_state)
+        # final_state = {
+        #     "final_report" : "최종 보고서가 들어갔다고 가정, 매수",
+        #     "integrated_report" : "통합 보고서가 들어갔다고 가정"
+        # }
+        print(f"[TIMING] 그래프 준비(프로세스당 1회): {registry.startup_seconds[REPORT_GRAPH]:.2f}s, "
+              f"작업 준비: {time.perf_counter() - setup_started:.2f}s")
+        # 노드가 바꾼 키만 받아 최종 state에 적용 (노드마다 state 전체를 보관하지 않음)
+        for delta in graph.run_deltas(initial_state, run_id=str(tasks.task_id)):
+            delta.apply(final_state)
+            print(
+                f"[Stream] {delta.node} 완료 (v{delta.version}). 변경된 keys: {list(delta.changed)}")
+
+        cache_stats = graph.cache.stats()
+        print(f"[Cache] (프로세스 누적) hits: {cache_stats['hits']}, misses: {cache_stats['misses']}, "
+              f"절약한 실행 시간: {cache_stats['saved_seconds']:.1f}s")
+
+        print("\n===== 최종 보고서와 매매 의견 및 포트폴리오 =====")
+        
+        # 최종 보고서는 FinalAnalysisAgent 또는 EndNode에서 생성된 state에 있습니다.
+        print(final_state.get("final_report", "최종 보고서가 생성되지 않았습니다."))
+        print(final_state.get("integrated_report", "최종 통합보고서가 생성되지 않았습니다."))
+
+        if save_report(db, tasks, final_state) is not None:
+            checkpointer.clear(str(tasks.task_id))
+
+    except Exception as e:
+        print(f"Error: {e}")
+        for task in [tasks, *followers]:
+            fail_task(db, task, str(e))
+        checkpointer.clear(str(tasks.task_id))
+        return False
+
+    run_personas(graph, followers, final_state)
+    return True
 
 
 def main():
     """
-    투자 분석 워크플로우의 메인 실행 함수입니다.
+    투자 분석 워크플로우의 메인 실행 함수입니다. (작업 1건 실행 후 종료)
 
     다음 단계로 실행됩니다:
-    1. DB에서 '시작 전' 상태의 Task 조회
-    2. 초기 상태 설정 및 Task 상태 업데이트
-    3. 그래프 생성 및 실행
+    1. 중단된 '생성 중' Task가 있으면 체크포인트에서 재개, 없으면 '시작 전' 상태의 Task를 원자적으로 가져옴
+        - 같은 종목의 '시작 전' Task는 COALESCE_WINDOW_SECONDS 이내라면 함께 가져와 기업 분석 결과를 공유
+    2. 초기 상태 설정
+    3. 프로세스에서 공유하는 그래프로 실행 (처음 호출될 때만 생성 및 warm-up)
     4. 분석 결과 처리 및 DB 업데이트
         - 매매 포지션 추출
         - 리포트 저장
@@ -199,96 +752,42 @@ def main():
         - 생성된 리포트 저장
         - 매매 포지션 및 근거 업데이트
         - 수정 시간 업데이트
+        - 관리 서버 매매 알림을 trade_outbox에 기록 (같은 트랜잭션, 전송은 worker/trade_dispatcher.py)
 
     Error Handling:
-        - 예외 발생 시 Task 상태를 "실패"로 변경
-        - 에러 메시지를 status_message에 저장
-        - DB 트랜잭션 롤백
+        - 프로세스가 비정상 종료된 경우 다음 실행에서 마지막 완료 노드 이후부터 재개
+        - 실행 중에는 작업 임대를 연장하고, 임대가 만료되면 워커의 reaper가 작업을 대기열로 되돌림
 
     Note:
-        환경 변수 MANAGER_API_URL이 필요합니다.
+        환경 변수 MANAGER_API_URL이 설정된 경우에만 매매 알림을 outbox에 기록합니다.
+        그래프 준비 시간(프로세스당 1회)과 작업 준비 시간(작업 조회 ~ 그래프 실행 시작)을 따로 출력합니다.
+        작업을 계속 처리하는 데몬은 worker/report_worker.py를 사용합니다.
     """
     
-    with get_db_session() as db:
-        try:
-
-            tasks = db.query(Task).filter(Task.status == '시작 전').first()
+    graph = registry.get(REPORT_GRAPH)
+    setup_started = time.perf_counter()
+    # 실행하는 동안 작업 임대를 연장하여 다른 워커의 reaper가 대기열로 되돌리지 않게 함
+    leases = TaskLeases()
+    leases.start()
+
+    try:
+        with get_db_session() as db:
+            tasks = find_resumable_task(db, graph.checkpointer)
+            resumed = tasks is not None
+            if tasks is None:
+                tasks = claim_task(db)
 
             if tasks is None:
                 print("**************Task가 없습니다.************************")
                 return
 
-            initial_state: GraphState = {
-                "company_name": tasks.stock_name,
-                "company_code": tasks.stock_code,
-                "customer_id": tasks.create_user_id,
-                "task_id": tasks.task_id,
-                "date": tasks.created_at,
-                "user_assets": 10000000.0,
-                "financial_query": "2025년 3월 기준, 해당 기업의 재무 리포트 및 투자 전망 분석",
-                "investment_persona": tasks.investor_type
-            }
-
-            db.query(Task).filter(Task.task_id == tasks.task_id).update(
-                {Task.status: "생성 중", Task.status_message: "AI 전문가와 분석가가 보고서 생성 중"})
-            db.commit()
-
-            final_state = None
-            # final_state = {
-            #     "final_report" : "최종 보고서가 들어갔다고 가정, 매수",
-            #     "integrated_report" : "통합 보고서가 들어갔다고 가정"
-            # }
-            graph = create_graph()
-            for node_name, state in graph.run_stream(initial_state):
-                print(
-                    f"[Stream] {node_name} 완료. 현재 state keys: {list(state.keys())}")
-                final_state = state
-
-            print("\n===== 최종 보고서와 매매 의견 및 포트폴리오 =====")
-            
-            # 최종 보고서는 FinalAnalysisAgent 또는 EndNode에서 생성된 state에 있습니다.
-            print(final_state.get("final_report", "최종 보고서가 생성되지 않았습니다."))
-            print(final_state.get("integrated_report", "최종 통합보고서가 생성되지 않았습니다."))
-
-            now = datetime.now(ZoneInfo("Asia/Seoul"))
-
-            if final_state.get("final_report") is not None and final_state.get("integrated_report") is not None:
-                stock_position = parse_stock_position(
-                    final_state.get("final_report"))
-
-                integrated_report = final_state.get("integrated_report") or ""
-                final_report = final_state.get("final_report") or ""
-                total_report = final_report + " " + integrated_report
-
-                # db.query(Task).filter(Task.task_id == tasks.task_id).update({Task.status: "완료"})
-                db.query(Task).filter(Task.task_id == tasks.task_id).update({Task.status: "완료", Task.report_generate: total_report,
-                                                                             Task.stock_position: stock_position, Task.stock_justification: integrated_report, Task.modified_at: now})
-                db.commit()
-            else:
-                raise Exception("최종 보고서 생성 실패")
-
-            # request_data = {
-            #     "user_id": tasks.create_user_id,
-            #     "stock_code": tasks.stock_code,
-            #     "investor_type": tasks.investor_type,
-            #     "task_id": tasks.task_id,
-            #     "position": stock_position,
-            #     "justification": total_report,
-
-            # }
-            # response = requests.post(
-            #     f"{MANAGER_API_URL}/trade", data=request_data)
-
-            # print(response.text)
-
-        except Exception as e:
-            print(f"Error: {e}")
-            db.rollback()
-            db.query(Task).filter(Task.task_id == tasks.task_id).update(
-                {Task.status: "실패", Task.status_message: str(e)})
-            db.commit()
-            return
+            followers = [] if resumed else claim_followers(db, tasks)
+            run_task(db, graph, tasks, resumed, setup_started, followers)
+    finally:
+        leases.close()
 
 
 if __name__ == "__main__":
+    # 작업을 조회하기 전에 모델 로딩과 외부 연결을 먼저 끝냄
+    registry.warm_up(REPORT_GRAPH)
     main()
@@ -0,0 +1,48 @@
+import os
+import signal
+import argparse
+
+from graph_dispatch import NodeWorkerPool, create_job_queue, parse_dispatch
+from fin_report_scorer_agent import SCORER_BATCH_SIZE
+from node_generate_report import DEFAULT_DISPATCH_POOLS, GRAPH_DISPATCH, JOB_QUEUE_URL, build_node
+
+# 풀별 기본 동시 실행 수 (평가 모델은 동시에 받은 작업을 한 번의 forward로 묶도록 배치 크기만큼,
+# LLM/HTTP 노드는 응답 대기 동안 다른 작업 실행)
+NODE_POOL_CONCURRENCY = {"model": SCORER_BATCH_SIZE, "io": int(os.environ.get("NODE_POOL_IO_CONCURRENCY", 16))}
+
+
+def main():
+    """
+    분산 실행 모드(GRAPH_DISPATCH)에서 한 풀의 노드 작업을 실행하는 노드 워커를 시작합니다.
+    보고서 워커(코디네이터)와 같은 GRAPH_DISPATCH, JOB_QUEUE_URL 설정으로 실행해야 합니다.
+
+    Example:
+        >>> # agentserver 디렉터리에서, 평가 모델 전용 프로세스와 비동기 IO 풀을 각각 실행
+        >>> # GRAPH_DISPATCH=default PYTHONPATH=. python worker/node_pool.py --pool model
+        >>> # GRAPH_DISPATCH=default PYTHONPATH=. python worker/node_pool.py --pool io --concurrency 16
+    """
+
+    parser = argparse.ArgumentParser(description="그래프 노드 워커")
+    parser.add_argument("--pool", required=True, help="실행할 풀 이름 (예: model, io)")
+    parser.add_argument("--concurrency", type=int, default=None, help="동시에 실행할 작업 수")
+    args = parser.parse_args()
+
+    dispatch = parse_dispatch(GRAPH_DISPATCH or "default", DEFAULT_DISPATCH_POOLS)
+    names = [name for name, pool in dispatch.items() if pool == args.pool]
+    if not names:
+        raise SystemExit(f"[NodeWorker] {args.pool} 풀에 배정된 노드가 없습니다.")
+
+    # 이 풀의 노드만 생성하고 첫 실행 지연(모델 로딩 후 첫 추론 등)을 미리 처리
+    nodes = {name: build_node(name) for name in names}
+    for node in nodes.values():
+        node.warm_up()
+
+    concurrency = args.concurrency or NODE_POOL_CONCURRENCY.get(args.pool, 1)
+    worker = NodeWorkerPool(create_job_queue(JOB_QUEUE_URL), args.pool, nodes, concurrency)
+    signal.signal(signal.SIGINT, worker.stop)
+    signal.signal(signal.SIGTERM, worker.stop)
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
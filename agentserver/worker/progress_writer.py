@@ -0,0 +1,194 @@
+import os
+import time
+import uuid
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import bindparam, update
+
+from LangGraph_base import ProgressListener
+from app.db.session import get_db_session
+from app.schemas.db import Task
+
+# 진행 상황을 DB에 모아서 기록하는 주기 (초)
+PROGRESS_FLUSH_INTERVAL = float(os.environ.get("PROGRESS_FLUSH_INTERVAL", 2))
+
+# 진행 상황에 표시하는 노드와 표시 이름 (없는 노드는 표시하지 않음)
+NODE_LABELS = {
+    "FinancialStatementsAnalysisAgent": "재무제표 분석",
+    "NewsAnalysisAgent": "뉴스 분석",
+    "MacroeconomicAnalysisAgent": "거시경제 분석",
+    "FinancialReportsAnalysisAgent": "증권사 리포트 분석",
+    "DailyChartAnalysisAgent": "차트 분석",
+    "ReportIntegrationNode": "보고서 통합",
+    "ReportScorerAgent": "보고서 품질 평가",
+    "ReportSupervisorAgent": "품질 검토",
+    "FinalAnalysisAgent": "최종 투자 의견 작성",
+}
+
+
+class _TaskProgress:
+    """
+    작업 하나의 진행 상황입니다.
+
+    Attributes:
+        started_at (float): 첫 노드 시작 시각 (time.monotonic() 기준)
+        running (Dict[str, float]): 실행 중인 노드 -> 시작 시각
+        done (List[Tuple[str, float]]): 끝난 노드와 소요 시간 (초), 끝난 순서
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.monotonic()
+        self.running: Dict[str, float] = {}
+        self.done: List[Tuple[str, float]] = []
+
+
+class ProgressWriter(ProgressListener):
+    """
+    노드 실행 시작/종료를 받아 작업별 진행 상황(status_message)을 모아 두었다가
+    주기적으로 한 트랜잭션에 모든 작업의 변경분만 기록하는 진행 상황 기록기입니다.
+
+    노드가 끝날 때마다 바로 기록하지 않으므로, 파이프라인이 많아도 DB 쓰기는
+    flush 주기마다 1회(변경된 작업 수만큼의 UPDATE를 executemany)로 제한됩니다.
+    같은 작업의 여러 변경은 마지막 상태 하나로 합쳐집니다.
+
+    Attributes:
+        interval (float): 기록 주기 (초)
+        labels (Dict[str, str]): 노드 이름 -> 표시 이름
+        flushes (int): DB에 기록한 횟수
+        rows_written (int): 기록한 작업(행) 수 합계
+
+    Note:
+        '생성 중'인 작업만 갱신하므로, 최종 결과가 저장된 뒤 늦게 기록되는 진행 상황이
+        '완료'/'실패' 메시지를 덮어쓰지 않습니다.
+    """
+
+    def __init__(self, interval: float = PROGRESS_FLUSH_INTERVAL, labels: Optional[Dict[str, str]] = None) -> None:
+        self.interval = interval
+        self.labels = labels if labels is not None else NODE_LABELS
+        self.flushes = 0
+        self.rows_written = 0
+        self._tasks: Dict[str, _TaskProgress] = {}
+        self._dirty: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def node_started(self, run_id: str, node_name: str) -> None:
+        if node_name not in self.labels:
+            return
+        with self._lock:
+            progress = self._tasks.setdefault(run_id, _TaskProgress())
+            progress.running[node_name] = time.monotonic()
+            self._dirty.add(run_id)
+        self._ensure_started()
+
+    def node_finished(self, run_id: str, node_name: str, seconds: float) -> None:
+        if node_name not in self.labels:
+            return
+        with self._lock:
+            progress = self._tasks.setdefault(run_id, _TaskProgress())
+            progress.running.pop(node_name, None)
+            progress.done.append((node_name, seconds))
+            self._dirty.add(run_id)
+
+    def forget(self, run_id: str) -> None:
+        """
+        끝난 작업의 진행 상황을 버립니다. (최종 결과를 저장할 때 호출)
+        """
+
+        with self._lock:
+            self._tasks.pop(run_id, None)
+            self._dirty.discard(run_id)
+
+    def message(self, run_id: str) -> Optional[str]:
+        """
+        작업의 현재 진행 상황 문구를 반환합니다.
+
+        Returns:
+            Optional[str]: 예) "보고서 생성 중 (52초 경과) · 완료: 재무제표 분석(12초) · 진행 중: 뉴스 분석"
+        """
+
+        with self._lock:
+            progress = self._tasks.get(run_id)
+            return self._format(progress) if progress is not None else None
+
+    def _format(self, progress: _TaskProgress) -> str:
+        parts = [f"보고서 생성 중 ({time.monotonic() - progress.started_at:.0f}초 경과)"]
+        if progress.done:
+            parts.append("완료: " + ", ".join(f"{self.labels[name]}({seconds:.0f}초)" for name, seconds in progress.done))
+        if progress.running:
+            parts.append("진행 중: " + ", ".join(self.labels[name] for name in progress.running))
+        return " · ".join(parts)
+
+    def flush(self) -> int:
+        """
+        변경된 작업의 진행 상황을 한 트랜잭션으로 기록합니다.
+
+        Returns:
+            int: 기록한 작업 수
+        """
+
+        with self._lock:
+            run_ids, updates = [], []
+            # 실행 중인 노드가 있는 작업은 경과 시간이 바뀌므로 함께 기록
+            dirty = self._dirty | {run_id for run_id, progress in self._tasks.items() if progress.running}
+            for run_id in dirty:
+                try:
+                    task_id = uuid.UUID(run_id)
+                except ValueError:
+                    # 작업이 아닌 실행(유니버스 배치의 거시경제 분석 등)은 기록하지 않음
+                    self._tasks.pop(run_id, None)
+                    continue
+                run_ids.append(run_id)
+                updates.append({"_task_id": task_id, "_message": self._format(self._tasks[run_id])})
+            self._dirty.clear()
+        if not updates:
+            return 0
+
+        table = Task.__table__
+        statement = update(table).where(
+            table.c.task_id == bindparam("_task_id"), table.c.status == "생성 중"
+        ).values(status_message=bindparam("_message"))
+        try:
+            with get_db_session() as db:
+                db.connection().execute(statement, updates)
+                db.commit()
+        except Exception:
+            # 기록하지 못한 작업은 다음 주기에 다시 기록
+            with self._lock:
+                self._dirty.update(run_id for run_id in run_ids if run_id in self._tasks)
+            raise
+        self.flushes += 1
+        self.rows_written += len(updates)
+        return len(updates)
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                # 진행 상황 기록 실패는 보고서 생성에 영향을 주지 않음 (다음 변경 때 다시 기록)
+                print(f"[Progress] 진행 상황 기록 실패: {e}")
+
+    def close(self) -> None:
+        """
+        기록 스레드를 멈추고 남은 변경분을 기록합니다.
+        """
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+
+# 프로세스 전역 진행 상황 기록기 (보고서 그래프가 공유)
+progress_writer = ProgressWriter()
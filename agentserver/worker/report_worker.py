@@ -0,0 +1,494 @@
+import os
+import json
+import time
+import signal
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Dict, Optional, Set
+
+from node_generate_report import (REPORT_GRAPH, TASK_PRIORITIES, claim_followers, claim_task, find_resumable_task,
+                                  progress_writer, registry, run_task, task_priority)
+from task_lease import TASK_REAPER_INTERVAL, TaskLeases, reap_expired_tasks
+from task_notifications import NotificationChannel, create_channel
+from app.config import settings
+from app.db.session import get_db_session
+from app.schemas.db import Task
+
+# 동시에 실행할 보고서 파이프라인 수
+WORKER_CONCURRENCY = int(os.environ.get("WORKER_CONCURRENCY", 2))
+# 오류 발생 후 다시 시도하기까지 기다리는 시간 (초)
+WORKER_POLL_INTERVAL = float(os.environ.get("WORKER_POLL_INTERVAL", 5))
+# 새 작업 알림이 없어도 대기 작업을 다시 조회하는 주기 (초, 알림 유실 대비)
+WORKER_SWEEP_INTERVAL = float(os.environ.get("WORKER_SWEEP_INTERVAL", 30))
+# 처리량 지표를 출력/기록하는 주기 (초)와 기록 파일
+WORKER_METRICS_INTERVAL = float(os.environ.get("WORKER_METRICS_INTERVAL", 60))
+WORKER_METRICS_PATH = os.environ.get("WORKER_METRICS_PATH", "./logs/worker_metrics.json")
+# 우선순위 클래스별 최대 동시 실행 수 (예: "interactive=4,scheduled=2,backfill=1", 지정하지 않은 클래스는 기본값)
+WORKER_MAX_IN_FLIGHT = os.environ.get("WORKER_MAX_IN_FLIGHT", "")
+# interactive 작업이 바로 시작할 수 있도록 scheduled/backfill 작업이 사용하지 않고 남겨 두는 파이프라인 수
+WORKER_INTERACTIVE_RESERVED = os.environ.get("WORKER_INTERACTIVE_RESERVED")
+# 이 수만큼 작업을 시작한 워커 프로세스는 실행 중인 작업을 마치고 종료 (0이면 제한 없음, 감독 프로세스가 새 워커로 교체)
+WORKER_MAX_TASKS = int(os.environ.get("WORKER_MAX_TASKS", 0))
+
+
+def parse_max_in_flight(spec: str, concurrency: int) -> Dict[str, int]:
+    """
+    우선순위 클래스별 최대 동시 실행 수 설정을 읽습니다.
+
+    Args:
+        spec (str): "클래스=수" 를 쉼표로 구분한 문자열
+        concurrency (int): 파이프라인 수
+
+    Returns:
+        Dict[str, int]: 우선순위 클래스 -> 최대 동시 실행 수
+            기본값은 interactive는 파이프라인 수 전체, scheduled는 파이프라인 수 - 1, backfill은 절반 (최소 1)
+
+    Raises:
+        ValueError: 알 수 없는 우선순위 클래스인 경우
+    """
+
+    limits = {
+        "interactive": concurrency,
+        "scheduled": max(1, concurrency - 1),
+        "backfill": max(1, concurrency // 2),
+    }
+    for item in filter(None, (item.strip() for item in spec.split(","))):
+        name, value = item.split("=", 1)
+        if name.strip() not in limits:
+            raise ValueError(f"알 수 없는 우선순위 클래스입니다: {name}")
+        limits[name.strip()] = int(value)
+    return limits
+
+
+class WorkerMetrics:
+    """
+    워커 프로세스의 처리량 지표입니다.
+
+    Attributes:
+        started_at (float): 워커 시작 시각 (epoch 초)
+        claimed (int): 가져온 작업 수 (재개 포함)
+        completed (int): 보고서 생성에 성공한 작업 수
+        failed (int): 실패한 작업 수
+        in_flight (int): 현재 실행 중인 작업 수
+        coalesced (int): 다른 작업의 기업 분석 결과를 공유하여 처리한 작업 수
+        busy_seconds (float): 작업 실행에 사용한 시간 합계 (초)
+        queue_wait (Dict[str, dict]): 우선순위 클래스별 대기 시간 (작업 생성 ~ 실행 시작) 통계
+        reaped (Dict[str, int]): 임대가 만료된 작업을 처리한 횟수 ("requeued" 대기열 복귀, "failed" 재시도 한도 초과)
+        recovery_seconds (dict): 임대 만료 작업의 복구 지연 (마지막 heartbeat ~ 대기열 복귀) 통계
+    """
+
+    def __init__(self, concurrency: int) -> None:
+        self.concurrency = concurrency
+        self.started_at = time.time()
+        self.claimed = 0
+        self.completed = 0
+        self.failed = 0
+        self.in_flight = 0
+        self.coalesced = 0
+        self.busy_seconds = 0.0
+        self.queue_wait = {name: {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0} for name in TASK_PRIORITIES}
+        self.reaped = {"requeued": 0, "failed": 0}
+        self.recovery_seconds = {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        self._lock = threading.Lock()
+
+    def start(self, count: int = 1, priority: Optional[str] = None, wait_seconds: Optional[float] = None) -> None:
+        with self._lock:
+            self.claimed += count
+            self.in_flight += count
+            self.coalesced += count - 1
+            if priority is not None and wait_seconds is not None:
+                wait = self.queue_wait[priority]
+                wait["count"] += 1
+                wait["total_seconds"] += wait_seconds
+                wait["max_seconds"] = max(wait["max_seconds"], wait_seconds)
+
+    def finish(self, completed: int, failed: int, seconds: float) -> None:
+        with self._lock:
+            self.in_flight -= completed + failed
+            self.busy_seconds += seconds
+            self.completed += completed
+            self.failed += failed
+
+    def reap(self, action: str, latency: float) -> None:
+        with self._lock:
+            self.reaped[action] += 1
+            self.recovery_seconds["count"] += 1
+            self.recovery_seconds["total_seconds"] += latency
+            self.recovery_seconds["max_seconds"] = max(self.recovery_seconds["max_seconds"], latency)
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: 누적 카운터와 분당 처리량, 작업당 평균 소요 시간, 파이프라인 사용률
+        """
+
+        with self._lock:
+            uptime = max(time.time() - self.started_at, 1e-9)
+            finished = self.completed + self.failed
+            return {
+                "concurrency": self.concurrency,
+                "uptime_seconds": uptime,
+                "claimed": self.claimed,
+                "completed": self.completed,
+                "failed": self.failed,
+                "in_flight": self.in_flight,
+                "coalesced": self.coalesced,
+                "throughput_per_minute": finished / uptime * 60,
+                # 함께 처리한 작업도 1건으로 세므로 묶음이 클수록 작업당 평균 시간이 줄어듦
+                "avg_task_seconds": self.busy_seconds / finished if finished else 0.0,
+                # 파이프라인이 작업을 실행한 시간의 비율 (1에 가까우면 작업이 밀려 있음)
+                "utilization": self.busy_seconds / (uptime * self.concurrency),
+                "queue_wait": {
+                    name: {"count": wait["count"], "max_seconds": wait["max_seconds"],
+                           "avg_seconds": wait["total_seconds"] / wait["count"] if wait["count"] else 0.0}
+                    for name, wait in self.queue_wait.items()
+                },
+                "reaped": dict(self.reaped),
+                "recovery_seconds": {
+                    "count": self.recovery_seconds["count"], "max_seconds": self.recovery_seconds["max_seconds"],
+                    "avg_seconds": (self.recovery_seconds["total_seconds"] / self.recovery_seconds["count"]
+                                    if self.recovery_seconds["count"] else 0.0),
+                },
+            }
+
+
+class ReportWorker:
+    """
+    보고서 작업을 계속 가져와 N개의 파이프라인에서 동시에 실행하는 데몬 워커입니다.
+
+    각 파이프라인(스레드)은 claim_task()로 작업을 원자적으로 가져오므로
+    같은 DB를 바라보는 워커 프로세스를 여러 개 띄워도 작업이 중복 실행되지 않고,
+    대기열을 비우는 시간은 전체 파이프라인 수에 비례해 줄어듭니다.
+    같은 종목의 대기 작업은 claim_followers()로 함께 가져와 기업 분석을 한 번만 실행합니다.
+
+    작업은 우선순위 클래스(interactive -> scheduled -> backfill)와 사용자별 공정 분배 순서로 가져오며,
+    클래스마다 최대 동시 실행 수를 두고 interactive용 파이프라인을 남겨 두어
+    정기 생성 작업이 많이 쌓여 있어도 사용자가 요청한 보고서는 바로 시작됩니다.
+
+    대기 중인 파이프라인은 새 작업 알림(PostgreSQL LISTEN/NOTIFY)을 받는 즉시 깨어나 작업을 가져가고,
+    알림이 유실되는 경우에 대비해 sweep_interval마다 대기 작업을 다시 조회합니다.
+    그래프는 프로세스당 한 번 생성되어 모든 파이프라인이 공유합니다.
+
+    실행 중인 작업은 임대(lease)를 주기적으로 연장하고, reaper 스레드는 임대가 만료된 작업
+    (비정상 종료된 워커의 작업)을 대기열로 되돌립니다. SIGTERM을 받으면 실행 중인 작업을 기다리지 않고
+    임대를 바로 반납(대기열로 복귀)한 뒤 종료하고, 다른 워커가 체크포인트에서 이어서 실행합니다.
+
+    Attributes:
+        concurrency (int): 동시에 실행할 파이프라인 수
+        poll_interval (float): 오류 발생 후 대기 시간 (초)
+        sweep_interval (float): 알림이 없을 때 대기 작업을 다시 조회하는 주기 (초)
+        channel (NotificationChannel): 새 작업 알림 채널
+        max_in_flight (Dict[str, int]): 우선순위 클래스별 최대 동시 실행 수
+        interactive_reserved (int): scheduled/backfill 작업이 사용하지 않는 파이프라인 수
+        metrics (WorkerMetrics): 처리량 지표
+        leases (TaskLeases): 실행 중인 작업의 임대 관리
+        reaper_interval (float): 임대 만료 작업을 확인하는 주기 (초)
+        max_tasks (Optional[int]): 이 수만큼 작업을 시작하면 새 작업을 가져오지 않고 종료 (None이면 제한 없음)
+            동시에 실행 중이던 파이프라인이 있으면 최대 concurrency - 1건까지 더 실행될 수 있습니다.
+    """
+
+    def __init__(self, concurrency: int = WORKER_CONCURRENCY, poll_interval: float = WORKER_POLL_INTERVAL,
+                 metrics_interval: float = WORKER_METRICS_INTERVAL,
+                 metrics_path: Optional[str] = WORKER_METRICS_PATH,
+                 max_in_flight: Optional[Dict[str, int]] = None,
+                 interactive_reserved: Optional[int] = None,
+                 sweep_interval: float = WORKER_SWEEP_INTERVAL,
+                 channel: Optional[NotificationChannel] = None,
+                 max_tasks: Optional[int] = WORKER_MAX_TASKS or None,
+                 reaper_interval: float = TASK_REAPER_INTERVAL) -> None:
+        self.concurrency = concurrency
+        self.reaper_interval = reaper_interval
+        self.leases = TaskLeases()
+        self.max_tasks = max_tasks
+        self.sweep_interval = sweep_interval
+        self.channel = channel or create_channel(settings.database_url)
+        self.max_in_flight = max_in_flight or parse_max_in_flight(WORKER_MAX_IN_FLIGHT, concurrency)
+        if interactive_reserved is None:
+            interactive_reserved = (int(WORKER_INTERACTIVE_RESERVED) if WORKER_INTERACTIVE_RESERVED is not None
+                                    else min(1, concurrency - 1))
+        self.interactive_reserved = interactive_reserved
+        self.poll_interval = poll_interval
+        self.metrics_interval = metrics_interval
+        self.metrics_path = metrics_path
+        self.metrics = WorkerMetrics(concurrency)
+        self._stop = threading.Event()
+        # 이 프로세스에서 실행 중인 task_id (중단 작업 재개 시 제외)
+        self._running: Set[str] = set()
+        self._resume_lock = threading.Lock()
+        # 이 프로세스에서 실행 중인 우선순위 클래스별 작업 수 (작업 조회와 함께 _claim_lock으로 보호)
+        self._in_flight: Dict[str, int] = {name: 0 for name in TASK_PRIORITIES}
+        self._claim_lock = threading.Lock()
+        # 받은 알림 수 (대기 중인 파이프라인은 이 값이 바뀌면 깨어남)
+        self._notifications = 0
+        self._wakeup = threading.Condition()
+        # 이 프로세스에서 시작한 작업 수 (max_tasks 확인용, _claim_lock으로 보호)
+        self._started = 0
+        # SIGTERM으로 임대를 반납하고 실행 중인 작업을 기다리지 않고 종료하는 중인지 여부
+        self._terminated = threading.Event()
+
+    def stop(self, *_) -> None:
+        """
+        새 작업을 가져오지 않도록 종료를 요청합니다. 실행 중인 작업은 끝까지 처리합니다.
+        """
+
+        print("[Worker] 종료 요청을 받았습니다. 실행 중인 작업을 마친 뒤 종료합니다.")
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    def terminate(self, *_) -> None:
+        """
+        새 작업을 가져오지 않고, 실행 중인 작업의 임대를 바로 반납(대기열로 복귀)한 뒤 종료합니다. (SIGTERM 핸들러)
+        반납한 작업은 다른 워커가 가져가 체크포인트에서 이어서 실행합니다.
+        """
+
+        print("[Worker] SIGTERM을 받았습니다. 실행 중인 작업의 임대를 반납하고 종료합니다.")
+        # 시그널 핸들러는 메인 스레드가 잠금을 잡은 채로 끼어들 수 있으므로 잠금 없이 종료 표시만 하고,
+        # 임대 반납은 run()이 대기 루프를 빠져나온 뒤 _release_leases()에서 처리
+        self._terminated.set()
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    def _release_leases(self) -> None:
+        """
+        실행 중인 작업의 임대를 반납하여 대기열로 되돌립니다. (SIGTERM 종료 시 run()에서 호출)
+        """
+
+        # 작업 조회 중인 파이프라인이 반납 이후에 새 작업을 가져가지 않도록 조회 잠금을 잡고 반납
+        with self._resume_lock, self._claim_lock:
+            try:
+                released = self.leases.release_all()
+                print(f"[Worker] 작업 {released}건을 대기열로 되돌렸습니다.")
+            except Exception as e:
+                # 반납하지 못한 작업은 임대 만료 후 다른 워커의 reaper가 되돌림
+                print(f"[Worker] 임대 반납 실패: {e}")
+
+    def _reap(self) -> None:
+        """
+        임대가 만료된 작업을 주기적으로 대기열로 되돌립니다. (별도 스레드)
+        """
+
+        while not self._stop.wait(self.reaper_interval):
+            try:
+                with get_db_session() as db:
+                    reaped = reap_expired_tasks(db)
+            except Exception as e:
+                print(f"[Worker] 임대 만료 작업 확인 실패: {e}")
+                continue
+            for task_id, action, latency in reaped:
+                self.metrics.reap(action, latency)
+                print(f"[Reaper] Task {task_id} 임대 만료 -> {'대기열 복귀' if action == 'requeued' else '실패 처리'} "
+                      f"(마지막 heartbeat 이후 {latency:.0f}s)")
+            if reaped:
+                with self._wakeup:
+                    self._notifications += 1
+                    self._wakeup.notify_all()
+
+    def _retire_if_exhausted(self) -> bool:
+        """
+        max_tasks만큼 작업을 시작했으면 종료를 요청합니다.
+
+        Returns:
+            bool: 종료를 요청했으면 True
+        """
+
+        with self._claim_lock:
+            if self.max_tasks is None or self._started < self.max_tasks:
+                return False
+        if not self._stop.is_set():
+            print(f"[Worker] 작업 {self._started}건을 시작했습니다. 실행 중인 작업을 마친 뒤 새 워커로 교체됩니다.")
+            self._stop.set()
+            with self._wakeup:
+                self._wakeup.notify_all()
+        return True
+
+    def _listen(self) -> None:
+        """
+        새 작업 알림을 기다렸다가 대기 중인 파이프라인을 깨웁니다. (별도 스레드)
+        """
+
+        while not self._stop.is_set():
+            payloads = self.channel.wait(timeout=1.0)
+            if payloads:
+                with self._wakeup:
+                    self._notifications += len(payloads)
+                    self._wakeup.notify_all()
+        self.channel.close()
+
+    def _wait_for_task(self, seen: int) -> None:
+        """
+        작업 조회 이후(seen) 새 알림이 오거나 sweep_interval이 지나거나 종료 요청이 올 때까지 기다립니다.
+        """
+
+        with self._wakeup:
+            self._wakeup.wait_for(lambda: self._notifications != seen or self._stop.is_set(),
+                                  timeout=self.sweep_interval)
+
+    def _allowed_priorities(self) -> list:
+        """
+        동시 실행 한도에 도달하지 않은 우선순위 클래스 목록을 반환합니다. (_claim_lock 안에서 호출)
+        """
+
+        allowed = [name for name in TASK_PRIORITIES if self._in_flight[name] < self.max_in_flight[name]]
+        background = sum(count for name, count in self._in_flight.items() if name != "interactive")
+        if background >= self.concurrency - self.interactive_reserved:
+            allowed = [name for name in allowed if name == "interactive"]
+        return allowed
+
+    def _next_task(self, db, checkpointer):
+        """
+        중단된 작업을 먼저 재개하고, 없으면 새 작업을 가져옵니다.
+
+        Returns:
+            Tuple[Optional[Task], bool, List[Task]]: (작업, 재개 여부, 함께 처리할 작업 목록)
+                재개한 작업의 함께 처리할 작업은 run_task()가 체크포인트에서 다시 불러옵니다.
+        """
+
+        # 재개 후보 조회와 실행 중 등록을 묶어 같은 작업을 두 파이프라인이 재개하지 않게 함
+        with self._resume_lock:
+            if self._terminated.is_set():
+                return None, False, []
+            task = find_resumable_task(db, checkpointer, exclude=set(self._running))
+            if task is not None:
+                self._running.add(str(task.task_id))
+        if task is not None:
+            with self._claim_lock:
+                self._in_flight[task_priority(task)] += 1
+                self._started += 1
+            return task, True, []
+
+        # 한도 확인과 실행 중 등록을 묶어 여러 파이프라인이 동시에 한도를 넘지 않게 함
+        with self._claim_lock:
+            if self._terminated.is_set():
+                return None, False, []
+            task = claim_task(db, self._allowed_priorities())
+            if task is None:
+                return None, False, []
+            self._in_flight[task_priority(task)] += 1
+            self._started += 1
+        with self._resume_lock:
+            self._running.add(str(task.task_id))
+        return task, False, claim_followers(db, task)
+
+    def _pipeline(self, slot: int) -> None:
+        graph = registry.get(REPORT_GRAPH)
+        while not self._stop.is_set() and not self._retire_if_exhausted():
+            setup_started = time.perf_counter()
+            # 조회와 대기 사이에 온 알림을 놓치지 않도록 조회 전에 알림 수를 기록
+            with self._wakeup:
+                seen = self._notifications
+            try:
+                with get_db_session() as db:
+                    task, resumed, followers = self._next_task(db, graph.checkpointer)
+                    if task is None:
+                        self._wait_for_task(seen)
+                        continue
+                    priority = task_priority(task)
+                    print(f"[Worker-{slot}] Task {task.task_id} 시작 ({task.stock_name}, {priority}, "
+                          f"함께 처리 {len(followers)}건)")
+                    wait_seconds = None
+                    if not resumed and task.created_at is not None:
+                        created_at = task.created_at
+                        if created_at.tzinfo is None:
+                            created_at = created_at.replace(tzinfo=ZoneInfo("Asia/Seoul"))
+                        wait_seconds = (datetime.now(ZoneInfo("Asia/Seoul")) - created_at).total_seconds()
+                    self.metrics.start(1 + len(followers), priority, wait_seconds)
+                    task_ids = [task.task_id] + [follower.task_id for follower in followers]
+                    try:
+                        run_task(db, graph, task, resumed, setup_started, followers)
+                    finally:
+                        # 지표 조회가 실패해도 우선순위 슬롯이 새지 않도록 실행 중 등록부터 해제
+                        with self._resume_lock:
+                            self._running.discard(str(task.task_id))
+                        with self._claim_lock:
+                            self._in_flight[priority] -= 1
+                        try:
+                            statuses = [status for (status,) in
+                                        db.query(Task.status).filter(Task.task_id.in_(task_ids)).all()]
+                        except Exception as e:
+                            # 세션 오류 등으로 상태를 확인하지 못한 작업은 실패로 집계
+                            print(f"[Worker-{slot}] Task {task.task_id} 상태 조회 실패: {e}")
+                            statuses = []
+                        completed = statuses.count("완료")
+                        self.metrics.finish(completed, len(task_ids) - completed,
+                                            time.perf_counter() - setup_started)
+            except Exception as e:
+                # DB 연결 오류 등으로 파이프라인이 멈추지 않도록 잠시 후 다시 시도
+                print(f"[Worker-{slot}] Error: {e}")
+                self._stop.wait(self.poll_interval)
+
+    def _report_metrics(self) -> None:
+        snapshot = self.metrics.snapshot()
+        with self._claim_lock:
+            snapshot["in_flight_by_priority"] = dict(self._in_flight)
+        snapshot["progress_flushes"] = progress_writer.flushes
+        snapshot["progress_rows_written"] = progress_writer.rows_written
+        print(f"[Worker] 완료 {snapshot['completed']}, 실패 {snapshot['failed']}, "
+              f"실행 중 {snapshot['in_flight']}, 함께 처리 {snapshot['coalesced']}, "
+              f"처리량 {snapshot['throughput_per_minute']:.2f}건/분, "
+              f"평균 {snapshot['avg_task_seconds']:.1f}s, 사용률 {snapshot['utilization']:.0%}, "
+              f"클래스별 실행 중 {snapshot['in_flight_by_priority']}, "
+              f"interactive 최대 대기 {snapshot['queue_wait']['interactive']['max_seconds']:.1f}s, "
+              f"임대 만료 처리 {snapshot['reaped']} (최대 복구 지연 {snapshot['recovery_seconds']['max_seconds']:.0f}s)")
+        if self.metrics_path:
+            directory = os.path.dirname(self.metrics_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.metrics_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self.metrics_path)
+
+    def run(self) -> None:
+        """
+        그래프를 준비한 뒤 파이프라인 스레드를 시작하고, 종료 요청(SIGINT/SIGTERM)까지 실행합니다.
+        """
+
+        registry.warm_up(REPORT_GRAPH)
+        self.leases.start()
+        listener = threading.Thread(target=self._listen, name="report-task-listener", daemon=True)
+        listener.start()
+        reaper = threading.Thread(target=self._reap, name="report-task-reaper", daemon=True)
+        reaper.start()
+        # SIGTERM 시 실행 중인 작업을 기다리지 않고 종료할 수 있도록 daemon 스레드로 실행
+        threads = [threading.Thread(target=self._pipeline, args=(slot,), name=f"report-pipeline-{slot}",
+                                    daemon=True)
+                   for slot in range(self.concurrency)]
+        for thread in threads:
+            thread.start()
+        print(f"[Worker] 파이프라인 {self.concurrency}개로 작업 처리를 시작합니다. "
+              f"(클래스별 최대 동시 실행 {self.max_in_flight}, interactive 예약 {self.interactive_reserved})")
+
+        while not self._stop.wait(self.metrics_interval):
+            self._report_metrics()
+        # SIGINT 후 실행 중인 작업을 기다리는 동안 SIGTERM이 오면 기다리지 않고 임대를 반납
+        for thread in threads:
+            while thread.is_alive() and not self._terminated.is_set():
+                thread.join(timeout=1.0)
+        if self._terminated.is_set():
+            self._release_leases()
+        self.leases.close()
+        progress_writer.close()
+        self._report_metrics()
+
+
+def main():
+    """
+    보고서 데몬 워커를 실행합니다.
+
+    Example:
+        >>> # agentserver 디렉터리에서
+        >>> # WORKER_CONCURRENCY=4 PYTHONPATH=. python worker/report_worker.py
+    """
+
+    worker = ReportWorker()
+    # SIGINT(Ctrl+C)는 실행 중인 작업을 마친 뒤 종료, SIGTERM은 임대를 반납하고 바로 종료
+    signal.signal(signal.SIGINT, worker.stop)
+    signal.signal(signal.SIGTERM, worker.terminate)
+    worker.run()
+
+
+if __name__ == "__main__":
+    main()
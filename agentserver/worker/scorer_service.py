@@ -0,0 +1,152 @@
+import os
+import time
+import asyncio
+import argparse
+import threading
+from typing import List
+
+import uvicorn
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from graph_batching import MicroBatcher
+from fin_report_scorer_agent import SCORER_BATCH_SIZE, SCORER_BATCH_WAIT, ReportScorerAgent
+
+# 평가 서비스가 로드할 평가 모델
+SCORER_MODEL = os.environ.get("SCORER_MODEL", "LGAI-EXAONE/EXAONE-3.5-7.8B-Instruct")
+# 평가 서비스 주소 (같은 머신의 워커만 접근하도록 기본값은 localhost)
+SCORER_SERVICE_HOST = os.environ.get("SCORER_SERVICE_HOST", "127.0.0.1")
+SCORER_SERVICE_PORT = int(os.environ.get("SCORER_SERVICE_PORT", 8070))
+# 배치 지표를 로그로 남기는 주기 (초), 0이면 남기지 않음
+SCORER_METRICS_INTERVAL = float(os.environ.get("SCORER_METRICS_INTERVAL", 60))
+
+
+class ScoreRequest(BaseModel):
+    reports: List[str]
+
+
+class ScoreResponse(BaseModel):
+    scores: List[float]
+    # 리포트별 입력 토큰 수와 함께 forward된 배치 크기 (빈 리포트는 0)
+    input_tokens: List[int]
+    batch_sizes: List[int]
+
+
+class ScorerService:
+    """
+    평가 모델 하나를 로드해 여러 워커 프로세스의 평가 요청을 처리하는 서비스입니다.
+
+    요청마다 리포트를 MicroBatcher에 넣으므로, 서로 다른 워커에서 동시에 들어온 요청이
+    최대 SCORER_BATCH_WAIT초 동안 모여 SCORER_BATCH_SIZE개까지 한 번의 forward로 평가됩니다.
+    워커는 SCORER_SERVICE_URL을 설정하면 모델을 로드하지 않고 이 서비스에 요청합니다.
+
+    Attributes:
+        scorer (ReportScorerAgent): 모델을 로드한 평가 에이전트
+        batcher (MicroBatcher): 요청을 모으는 배치 처리기
+        requests (int): 처리한 요청 수
+        in_flight (int): 처리 중인 요청 수
+    """
+
+    def __init__(self, model: str = SCORER_MODEL) -> None:
+        self.scorer = ReportScorerAgent("ReportScorerAgent", eval_model=model, service_url=None)
+        self.scorer.warm_up()
+        # batch_size가 1이어도 모델 호출이 한 스레드에서 순서대로 실행되도록 배치 처리기를 거침
+        self.batcher = self.scorer.batcher or MicroBatcher(self.scorer._score_batch, max_size=1, max_wait=0,
+                                                           name="ReportScorerAgent")
+        self.started_at = time.time()
+        self.requests = 0
+        self.in_flight = 0
+
+    async def score(self, reports: List[str]) -> ScoreResponse:
+        self.requests += 1
+        self.in_flight += 1
+        try:
+            results = await asyncio.gather(*(asyncio.wrap_future(self.batcher.submit(report)) for report in reports))
+        finally:
+            self.in_flight -= 1
+        return ScoreResponse(scores=[score for score, _, _ in results],
+                             input_tokens=[tokens for _, tokens, _ in results],
+                             batch_sizes=[size for _, _, size in results])
+
+    def snapshot(self) -> dict:
+        """
+        Returns:
+            dict: 요청 수, 처리 중인 요청 수와 배치 지표(대기열 길이, 배치 크기 분포, 대기 시간)
+        """
+
+        return {
+            "model": self.scorer.model_name,
+            "backend": self.scorer.backend,
+            "uptime_seconds": time.time() - self.started_at,
+            "requests": self.requests,
+            "in_flight": self.in_flight,
+            "max_batch_size": self.batcher.max_size,
+            "max_wait_seconds": self.batcher.max_wait,
+            **self.batcher.snapshot(),
+        }
+
+    def report_metrics(self, interval: float = SCORER_METRICS_INTERVAL) -> None:
+        """
+        interval초마다 배치 지표를 로그로 남깁니다. (데몬 스레드에서 실행)
+        """
+
+        while interval > 0:
+            time.sleep(interval)
+            metrics = self.snapshot()
+            print(f"[ScorerService] 요청 {metrics['requests']}건, 대기열 {metrics['pending']} "
+                  f"(최대 {metrics['max_pending']}), 배치 {metrics['batches']}회 "
+                  f"(평균 {metrics['mean_batch_size']:.2f}, 최대 {metrics['largest_batch']}), "
+                  f"평균 대기 {metrics['mean_wait_seconds'] * 1000:.0f}ms")
+
+
+def create_app(service: ScorerService) -> FastAPI:
+    """
+    평가 서비스 FastAPI 앱을 만듭니다.
+
+    - POST /score: {"reports": [...]} -> 리포트별 점수, 입력 토큰 수, 배치 크기
+    - GET /metrics: 대기열 길이, 배치 크기 분포 등 배치 지표
+    - GET /health: 모델 로딩이 끝나 요청을 받을 수 있는지 확인
+    """
+
+    app = FastAPI(title="Report Scorer API", description="보고서 품질 평가 모델 서비스", version="1.0.0")
+
+    @app.post("/score", response_model=ScoreResponse)
+    async def score(request: ScoreRequest) -> ScoreResponse:
+        return await service.score(request.reports)
+
+    @app.get("/metrics")
+    async def metrics() -> dict:
+        return service.snapshot()
+
+    @app.get("/health")
+    async def health() -> dict:
+        return {"status": "ok", "model": service.scorer.model_name}
+
+    return app
+
+
+def main():
+    """
+    평가 서비스를 실행합니다. 모델을 로드한 뒤 요청을 받기 시작합니다.
+
+    Example:
+        >>> # agentserver 디렉터리에서 서비스 실행 후, 워커는 SCORER_SERVICE_URL로 연결
+        >>> # PYTHONPATH=. python worker/scorer_service.py --port 8070
+        >>> # SCORER_SERVICE_URL=http://127.0.0.1:8070 WORKER_PROCESSES=4 PYTHONPATH=. python worker/worker_supervisor.py
+    """
+
+    parser = argparse.ArgumentParser(description="보고서 평가 모델 서비스")
+    parser.add_argument("--host", default=SCORER_SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SCORER_SERVICE_PORT)
+    parser.add_argument("--model", default=SCORER_MODEL)
+    args = parser.parse_args()
+
+    service = ScorerService(args.model)
+    print(f"[ScorerService] {args.model} 로드 완료, 배치 최대 {SCORER_BATCH_SIZE}건 / 대기 {SCORER_BATCH_WAIT}초, "
+          f"http://{args.host}:{args.port}")
+    threading.Thread(target=service.report_metrics, name="scorer-metrics", daemon=True).start()
+    uvicorn.run(create_app(service), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
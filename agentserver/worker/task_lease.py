@@ -0,0 +1,169 @@
+import os
+import socket
+import threading
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from typing import List, Optional, Tuple
+
+from sqlalchemy import case, func
+
+from app.db.session import get_db_session
+from app.schemas.db import Task
+
+# 작업 임대 시간 (초), 워커가 이 시간 동안 heartbeat를 갱신하지 않으면 중단된 작업으로 간주
+TASK_LEASE_SECONDS = float(os.environ.get("TASK_LEASE_SECONDS", 120))
+# 실행 중인 작업의 heartbeat(임대 연장) 주기 (초)
+TASK_HEARTBEAT_INTERVAL = float(os.environ.get("TASK_HEARTBEAT_INTERVAL", 30))
+# 임대가 만료된 작업을 찾아 대기열로 되돌리는 주기 (초)
+TASK_REAPER_INTERVAL = float(os.environ.get("TASK_REAPER_INTERVAL", 30))
+# 작업을 가져갈 수 있는 최대 횟수, 이만큼 중단되면 다시 대기열에 넣지 않고 '실패'로 변경
+TASK_MAX_ATTEMPTS = int(os.environ.get("TASK_MAX_ATTEMPTS", 3))
+
+
+def worker_id() -> str:
+    """
+    현재 프로세스의 워커 ID("호스트:pid")를 반환합니다. (fork된 워커마다 다름)
+    """
+
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def lease_values(now: Optional[datetime] = None) -> dict:
+    """
+    작업을 가져오거나 임대를 연장할 때 기록할 값을 반환합니다.
+
+    Returns:
+        dict: worker_id, heartbeat_at, lease_expires_at 갱신 값
+    """
+
+    now = now or datetime.now(ZoneInfo("Asia/Seoul"))
+    return {Task.worker_id: worker_id(), Task.heartbeat_at: now,
+            Task.lease_expires_at: now + timedelta(seconds=TASK_LEASE_SECONDS)}
+
+
+def claim_values() -> dict:
+    """
+    작업을 가져갈 때('시작 전' 또는 임대 만료 -> '생성 중') 기록할 값을 반환합니다. (시도 횟수 증가 포함)
+    """
+
+    return {Task.status: "생성 중", Task.status_message: "AI 전문가와 분석가가 보고서 생성 중",
+            Task.attempt: func.coalesce(Task.attempt, 0) + 1, **lease_values()}
+
+
+def reap_expired_tasks(db, max_attempts: int = TASK_MAX_ATTEMPTS) -> List[Tuple[str, str, float]]:
+    """
+    임대가 만료된 '생성 중' 작업을 대기열('시작 전')로 되돌립니다.
+    max_attempts번 가져갔던 작업은 더 시도하지 않고 '실패'로 변경합니다.
+
+    Args:
+        db: DB 세션
+        max_attempts (int): 최대 시도 횟수
+
+    Returns:
+        List[Tuple[str, str, float]]: (task_id, 처리 결과 "requeued"/"failed", 복구 지연 초) 목록
+            복구 지연은 마지막 heartbeat부터 되돌린 시점까지의 시간입니다.
+
+    Note:
+        상태와 임대 만료 조건을 함께 거는 조건부 UPDATE이므로 여러 워커가 동시에 실행해도
+        작업이 한 번만 처리되고, 그 사이 heartbeat로 임대가 연장된 작업은 건드리지 않습니다.
+    """
+
+    now = datetime.now(ZoneInfo("Asia/Seoul"))
+    expired = db.query(Task.id, Task.task_id, Task.attempt, Task.heartbeat_at).filter(
+        Task.status == "생성 중", Task.lease_expires_at < now).all()
+    reaped = []
+    for row_id, task_id, attempt, heartbeat_at in expired:
+        if (attempt or 0) >= max_attempts:
+            action, values = "failed", {
+                Task.status: "실패",
+                Task.status_message: f"보고서 생성이 {attempt}회 중단되어 실패 처리되었습니다. 다시 요청해 주세요."}
+        else:
+            action, values = "requeued", {
+                Task.status: "시작 전",
+                Task.status_message: f"보고서 생성이 중단되어 다시 대기 중입니다. ({attempt}회 시도)"}
+        values.update({Task.worker_id: None, Task.lease_expires_at: None})
+        updated = db.query(Task).filter(Task.id == row_id, Task.status == "생성 중",
+                                        Task.lease_expires_at < now).update(values, synchronize_session=False)
+        db.commit()
+        if updated == 1:
+            latency = (now - heartbeat_at).total_seconds() if heartbeat_at is not None else 0.0
+            reaped.append((str(task_id), action, latency))
+    return reaped
+
+
+class TaskLeases:
+    """
+    워커 프로세스가 실행 중인 작업의 임대를 관리합니다.
+
+    이 워커(worker_id)가 가진 '생성 중' 작업의 heartbeat_at/lease_expires_at을 heartbeat_interval마다
+    한 번의 UPDATE로 연장하고, 종료(SIGTERM) 시에는 실행 중인 작업을 바로 대기열로 되돌려
+    다른 워커가 이어서 실행하게 합니다. (체크포인트가 남아 있으므로 다시 가져간 워커는 마지막 완료 노드 이후부터 재개)
+
+    워커가 비정상 종료되어 heartbeat가 끊긴 작업은 TASK_LEASE_SECONDS 뒤 reap_expired_tasks()가 되돌리므로,
+    작업이 '생성 중'에 멈춰 있는 시간은 최대 TASK_LEASE_SECONDS + TASK_REAPER_INTERVAL입니다.
+
+    Attributes:
+        heartbeat_interval (float): 임대 연장 주기 (초)
+        heartbeats (int): 임대를 연장한 횟수
+    """
+
+    def __init__(self, heartbeat_interval: float = TASK_HEARTBEAT_INTERVAL) -> None:
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeats = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def heartbeat(self) -> int:
+        """
+        이 워커가 실행 중인 작업의 임대를 연장합니다.
+
+        Returns:
+            int: 갱신한 작업 수
+        """
+
+        with get_db_session() as db:
+            updated = db.query(Task).filter(Task.status == "생성 중", Task.worker_id == worker_id()).update(
+                lease_values(), synchronize_session=False)
+            db.commit()
+        self.heartbeats += 1
+        return updated
+
+    def release_all(self) -> int:
+        """
+        이 워커가 실행 중인 작업을 모두 대기열('시작 전')로 되돌리고 임대를 해제합니다. (종료 시 호출)
+
+        Returns:
+            int: 되돌린 작업 수
+        """
+
+        with get_db_session() as db:
+            released = db.query(Task).filter(Task.status == "생성 중", Task.worker_id == worker_id()).update(
+                {Task.status: "시작 전", Task.status_message: "워커 종료로 다시 대기 중입니다.",
+                 Task.worker_id: None, Task.lease_expires_at: None,
+                 # 워커가 스스로 반납한 작업은 중단 횟수(재시도 한도)에 포함하지 않음
+                 Task.attempt: case((Task.attempt > 0, Task.attempt - 1), else_=0)},
+                synchronize_session=False)
+            db.commit()
+        return released
+
+    def start(self) -> None:
+        """
+        heartbeat 스레드를 시작합니다.
+        """
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="task-heartbeat", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                self.heartbeat()
+            except Exception as e:
+                # 일시적인 DB 오류는 다음 주기에 다시 연장 (임대 시간이 heartbeat 주기보다 충분히 김)
+                print(f"[Lease] heartbeat 실패: {e}")
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
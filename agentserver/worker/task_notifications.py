@@ -0,0 +1,145 @@
+import re
+import time
+import select
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import List
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+# 새 작업 알림 채널 이름 (webapplication/backend/app/api/v1/invest.py의 TASK_CHANNEL과 같아야 함)
+TASK_CHANNEL = "report_tasks"
+
+
+class NotificationChannel(ABC):
+    """
+    새 보고서 작업 알림 채널의 기본 클래스입니다.
+
+    워커는 wait()로 알림을 기다리다가 알림이 오면 바로 작업을 가져갑니다.
+    알림은 "새 작업이 있을 수 있다"는 신호일 뿐이므로, 작업은 항상 claim_task()로 원자적으로 가져옵니다.
+    알림을 보내는 쪽(작업 생성 API, webapplication/backend/app/api/v1/invest.py)은 작업 INSERT와
+    같은 트랜잭션에서 pg_notify()를 호출합니다.
+    하위 클래스는 wait()를 구현합니다.
+    """
+
+    @abstractmethod
+    def wait(self, timeout: float) -> List[str]:
+        """
+        알림이 오거나 timeout이 지날 때까지 기다립니다.
+
+        Args:
+            timeout (float): 최대 대기 시간 (초)
+
+        Returns:
+            List[str]: 받은 알림 payload 목록 (timeout이면 빈 리스트)
+        """
+
+    def close(self) -> None:
+        pass
+
+
+class LocalNotificationChannel(NotificationChannel):
+    """
+    프로세스 내부에서 알림을 주고받는 채널입니다.
+    PostgreSQL 없이 로컬(SQLite)에서 실행하거나, 같은 프로세스에서 작업을 만들고 처리할 때 LISTEN/NOTIFY 대신 사용합니다.
+    (알림을 보내는 쪽이 없으면 워커는 sweep 주기마다 대기 작업을 조회합니다.)
+    """
+
+    def __init__(self) -> None:
+        self._payloads: deque = deque()
+        self._condition = threading.Condition()
+
+    def notify(self, payload: str = "") -> None:
+        with self._condition:
+            self._payloads.append(payload)
+            self._condition.notify_all()
+
+    def wait(self, timeout: float) -> List[str]:
+        with self._condition:
+            self._condition.wait_for(lambda: self._payloads, timeout=timeout)
+            payloads = list(self._payloads)
+            self._payloads.clear()
+            return payloads
+
+
+class PostgresNotificationChannel(NotificationChannel):
+    """
+    PostgreSQL LISTEN/NOTIFY 채널입니다.
+
+    작업을 만드는 쪽은 INSERT와 같은 트랜잭션에서 pg_notify()를 호출하고(commit 시점에 전달),
+    워커는 전용 연결에서 LISTEN 후 소켓을 select()로 기다리므로 알림을 받는 즉시 깨어납니다.
+
+    Attributes:
+        dsn (str): psycopg2 연결 문자열
+        channel (str): LISTEN 채널 이름
+
+    Note:
+        연결이 끊기면 다음 wait()에서 다시 연결하고, 끊긴 동안 놓친 알림이 있을 수 있으므로
+        다시 연결한 직후에는 빈 payload 하나를 반환하여 워커가 대기 작업을 한 번 조회하게 합니다.
+    """
+
+    # 연결 실패 시 다시 시도하기 전 대기 시간 (초)
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, dsn: str, channel: str = TASK_CHANNEL) -> None:
+        self.dsn = dsn
+        self.channel = channel
+        self._conn = None
+
+    def _connect(self):
+        conn = psycopg2.connect(self.dsn)
+        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.channel}")
+        print(f"[Notify] {self.channel} 채널 LISTEN 시작")
+        return conn
+
+    def wait(self, timeout: float) -> List[str]:
+        try:
+            if self._conn is None:
+                self._conn = self._connect()
+                return [""]
+            if select.select([self._conn], [], [], timeout) == ([], [], []):
+                return []
+            self._conn.poll()
+            payloads = [notification.payload for notification in self._conn.notifies]
+            self._conn.notifies.clear()
+            return payloads
+        except (psycopg2.Error, OSError) as e:
+            print(f"[Notify] LISTEN 연결 오류: {e}")
+            self.close()
+            time.sleep(min(timeout, self.RECONNECT_DELAY))
+            return []
+
+    def close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except psycopg2.Error:
+                pass
+            self._conn = None
+
+
+# 같은 프로세스의 생산자/워커가 공유하는 로컬 채널
+local_channel = LocalNotificationChannel()
+
+
+def create_channel(database_url: str, channel: str = TASK_CHANNEL) -> NotificationChannel:
+    """
+    DB 종류에 맞는 알림 채널을 생성합니다.
+
+    Args:
+        database_url (str): SQLAlchemy DB URL
+        channel (str): 채널 이름
+
+    Returns:
+        NotificationChannel: PostgreSQL이면 LISTEN/NOTIFY 채널, 그 외에는 프로세스 내부 채널
+    """
+
+    if database_url.startswith("postgresql"):
+        # SQLAlchemy URL의 드라이버 지정(postgresql+psycopg2://)은 psycopg2 연결 문자열에서 제거
+        return PostgresNotificationChannel(re.sub(r"^postgresql\+\w+://", "postgresql://", database_url), channel)
+    return local_channel
+
@@ -0,0 +1,192 @@
+import os
+import signal
+import threading
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import requests
+from dotenv import load_dotenv
+from sqlalchemy import or_
+
+from app.db.session import get_db_session
+from app.schemas.db import Task, TradeOutbox
+
+load_dotenv()
+# 매매 알림을 받는 관리 서버 주소
+MANAGER_API_URL = os.environ.get("MANAGER_API_URL")
+# 한 번에 가져와 전송하는 outbox 행 수와 동시 전송 수
+TRADE_OUTBOX_BATCH_SIZE = int(os.environ.get("TRADE_OUTBOX_BATCH_SIZE", 20))
+TRADE_OUTBOX_CONCURRENCY = int(os.environ.get("TRADE_OUTBOX_CONCURRENCY", 4))
+# 보낼 행이 없을 때 outbox를 다시 조회하는 주기 (초)
+TRADE_OUTBOX_POLL_INTERVAL = float(os.environ.get("TRADE_OUTBOX_POLL_INTERVAL", 5))
+# 전송 요청 1건의 제한 시간 (초)
+TRADE_OUTBOX_TIMEOUT = float(os.environ.get("TRADE_OUTBOX_TIMEOUT", 30))
+# 최대 전송 시도 횟수와 재시도 대기 시간 (초, 시도마다 2배, 최대값)
+TRADE_OUTBOX_MAX_ATTEMPTS = int(os.environ.get("TRADE_OUTBOX_MAX_ATTEMPTS", 8))
+TRADE_OUTBOX_RETRY_DELAY = float(os.environ.get("TRADE_OUTBOX_RETRY_DELAY", 10))
+TRADE_OUTBOX_MAX_RETRY_DELAY = float(os.environ.get("TRADE_OUTBOX_MAX_RETRY_DELAY", 1800))
+
+
+class PermanentDeliveryError(Exception):
+    """
+    다시 보내도 성공할 수 없는 응답(요청 형식 오류 등 4xx)을 받았을 때 발생하는 예외입니다.
+    """
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    attempts번 실패한 뒤 다음 시도까지 기다릴 시간을 계산합니다. (지수 백오프)
+    """
+
+    return min(TRADE_OUTBOX_MAX_RETRY_DELAY, TRADE_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def claim_due(db, limit: int) -> List[TradeOutbox]:
+    """
+    전송할 때가 된 '전송 대기' 행을 오래된 순으로 최대 limit개 가져옵니다.
+
+    Note:
+        PostgreSQL에서는 FOR UPDATE SKIP LOCKED로 잠그므로 전송기를 여러 개 실행해도
+        같은 행을 동시에 보내지 않습니다. (잠금은 결과를 기록하는 commit까지 유지)
+    """
+
+    now = datetime.now(ZoneInfo("Asia/Seoul"))
+    due = db.query(TradeOutbox).filter(
+        TradeOutbox.status == "전송 대기",
+        or_(TradeOutbox.next_attempt_at.is_(None), TradeOutbox.next_attempt_at <= now),
+    ).order_by(TradeOutbox.id).limit(limit)
+    if db.get_bind().dialect.name == "postgresql":
+        due = due.with_for_update(skip_locked=True)
+    return due.all()
+
+
+class TradeDispatcher:
+    """
+    trade_outbox에 기록된 매매 알림을 관리 서버 /trade로 전송하는 전송기입니다.
+
+    보고서 워커는 Task 완료와 같은 트랜잭션에서 outbox 행만 기록하고, 전송기는 별도 프로세스에서
+    행을 배치로 가져와 동시에 전송한 뒤 결과를 한 번에 기록합니다.
+    실패한 행은 지수 백오프로 다시 시도하고, TRADE_OUTBOX_MAX_ATTEMPTS번 실패하거나
+    4xx 응답을 받으면 '전송 실패'로 남깁니다.
+
+    Attributes:
+        url (str): 관리 서버 /trade 주소
+        sent (int): 전송 완료한 알림 수
+        failed (int): 전송 실패로 확정한 알림 수
+
+    Note:
+        task_id를 Idempotency-Key 헤더로 보내고, 관리 서버는 같은 task_id의 거래 요청을
+        한 번만 저장/전송합니다. 전송 후 결과 기록 전에 종료되어 다시 보내도 알림은 중복되지 않습니다.
+    """
+
+    def __init__(self, base_url: str = MANAGER_API_URL) -> None:
+        if not base_url:
+            raise ValueError("MANAGER_API_URL이 설정되지 않았습니다.")
+        self.url = f"{base_url.rstrip('/')}/trade"
+        self.sent = 0
+        self.failed = 0
+        self._session = requests.Session()
+        self._executor = ThreadPoolExecutor(max_workers=TRADE_OUTBOX_CONCURRENCY)
+        self._stop = threading.Event()
+
+    def deliver(self, row: TradeOutbox) -> None:
+        """
+        알림 1건을 전송합니다.
+
+        Raises:
+            PermanentDeliveryError: 4xx 응답 (429 제외)
+            Exception: 연결 오류, 시간 초과, 5xx/429 응답 (다시 시도)
+        """
+
+        response = self._session.post(self.url, data=row.payload.encode("utf-8"), timeout=TRADE_OUTBOX_TIMEOUT,
+                                      headers={"Content-Type": "application/json",
+                                               "Idempotency-Key": str(row.task_id)})
+        if 400 <= response.status_code < 500 and response.status_code != 429:
+            raise PermanentDeliveryError(f"HTTP {response.status_code}: {response.text[:200]}")
+        response.raise_for_status()
+
+    def _attempt(self, row: TradeOutbox) -> Tuple[TradeOutbox, Optional[Exception]]:
+        try:
+            self.deliver(row)
+            return row, None
+        except Exception as e:
+            return row, e
+
+    def dispatch_once(self) -> int:
+        """
+        전송할 때가 된 행을 한 배치 전송하고 결과를 기록합니다.
+
+        Returns:
+            int: 처리한 행 수 (성공/실패 포함)
+        """
+
+        with get_db_session() as db:
+            rows = claim_due(db, TRADE_OUTBOX_BATCH_SIZE)
+            if not rows:
+                db.rollback()
+                return 0
+
+            now = datetime.now(ZoneInfo("Asia/Seoul"))
+            delivered = []
+            for row, error in self._executor.map(self._attempt, rows):
+                row.attempts += 1
+                if error is None:
+                    row.status, row.sent_at, row.last_error = "전송 완료", now, None
+                    delivered.append(row.task_id)
+                    self.sent += 1
+                elif isinstance(error, PermanentDeliveryError) or row.attempts >= TRADE_OUTBOX_MAX_ATTEMPTS:
+                    row.status, row.last_error = "전송 실패", str(error)
+                    self.failed += 1
+                    print(f"[Outbox] Task {row.task_id} 알림 전송 실패 ({row.attempts}회): {error}")
+                else:
+                    row.next_attempt_at = now + timedelta(seconds=retry_delay(row.attempts))
+                    row.last_error = str(error)
+                    print(f"[Outbox] Task {row.task_id} 알림 전송 {row.attempts}회차 실패, "
+                          f"{retry_delay(row.attempts):.0f}초 후 재시도: {error}")
+            if delivered:
+                db.query(Task).filter(Task.task_id.in_(delivered)).update(
+                    {Task.kakao_send_status: True, Task.kakao_send_at: now}, synchronize_session=False)
+            db.commit()
+            return len(rows)
+
+    def run(self) -> None:
+        """
+        stop()이 호출될 때까지 outbox를 전송합니다. 보낼 행이 배치 크기만큼 남아 있으면 기다리지 않고 계속 전송합니다.
+        """
+
+        print(f"[Outbox] 매매 알림 전송 시작 ({self.url}, 배치 {TRADE_OUTBOX_BATCH_SIZE}, "
+              f"동시 전송 {TRADE_OUTBOX_CONCURRENCY})")
+        while not self._stop.is_set():
+            try:
+                processed = self.dispatch_once()
+            except Exception as e:
+                print(f"[Outbox] outbox 처리 오류: {e}")
+                processed = 0
+            if processed < TRADE_OUTBOX_BATCH_SIZE:
+                self._stop.wait(TRADE_OUTBOX_POLL_INTERVAL)
+        self._executor.shutdown()
+        print(f"[Outbox] 종료 (전송 완료 {self.sent}건, 전송 실패 {self.failed}건)")
+
+    def stop(self, *_) -> None:
+        self._stop.set()
+
+
+def main():
+    """
+    매매 알림 전송기를 실행합니다.
+
+    Example:
+        >>> # agentserver 디렉터리에서
+        >>> # MANAGER_API_URL=http://localhost:8001 PYTHONPATH=. python worker/trade_dispatcher.py
+    """
+
+    dispatcher = TradeDispatcher()
+    signal.signal(signal.SIGINT, dispatcher.stop)
+    signal.signal(signal.SIGTERM, dispatcher.stop)
+    dispatcher.run()
+
+
+if __name__ == "__main__":
+    main()
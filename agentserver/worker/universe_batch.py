@@ -0,0 +1,324 @@
+import os
+import json
+import time
+import asyncio
+import threading
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Dict, Optional
+
+from LangGraph_base import Graph, GraphState
+from graph_cache import SQLiteNodeCache
+from node_generate_report import (NODE_CACHE_PATH, claim_stock_tasks, create_graph, create_span_exporter,
+                                  parse_stock_position, progress_writer, registry, run_personas)
+from task_lease import TaskLeases
+from app.db.session import get_db_session
+from app.schemas.db import Stock
+
+# 동시에 분석하는 종목 수 (종목마다 분석 에이전트 5개가 LLM을 호출하므로 동시 LLM 호출은 최대 이 값의 5배)
+UNIVERSE_CONCURRENCY = int(os.environ.get("UNIVERSE_CONCURRENCY", 4))
+# 기업 단위 최종 분석에 사용하는 기본 투자 성향 (대기 중인 작업은 각자의 투자 성향으로 다시 최종 분석)
+UNIVERSE_PERSONA = os.environ.get("UNIVERSE_PERSONA", "중고위험(적극적)")
+# 배치 결과(종목별 보고서와 단계별 처리량) 기록 파일
+UNIVERSE_REPORT_PATH = os.environ.get("UNIVERSE_REPORT_PATH", "./logs/universe_batch.json")
+
+# 프로세스 레지스트리에 등록하는 유니버스 배치 그래프 이름
+UNIVERSE_GRAPH = "universe"
+
+
+def create_universe_graph() -> Graph:
+    """
+    유니버스 배치용 보고서 그래프를 생성합니다.
+    배치는 매번 처음부터 다시 실행하므로 체크포인트는 기록하지 않고, 노드 결과 캐시와 span exporter,
+    진행 상황 기록기(대기 작업의 최종 분석 진행 상황 기록용)만 사용합니다.
+
+    Returns:
+        Graph: 설정된 분석 워크플로우 그래프
+    """
+
+    return create_graph(cache=SQLiteNodeCache(NODE_CACHE_PATH), span_exporter=create_span_exporter(),
+                        progress=progress_writer)
+
+
+registry.register(UNIVERSE_GRAPH, create_universe_graph)
+
+
+class StageMeter:
+    """
+    유니버스 배치의 단계별 처리량을 집계합니다.
+
+    단계 이름은 "prefetch.macro", "node.NewsAnalysisAgent", "graph", "persona"처럼 지정하며
+    처리 건수와 소요 시간 합계를 누적합니다.
+    """
+
+    def __init__(self) -> None:
+        self.stages: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, count: int = 1, seconds: float = 0.0) -> None:
+        with self._lock:
+            entry = self.stages.setdefault(stage, {"count": 0, "busy_seconds": 0.0})
+            entry["count"] += count
+            entry["busy_seconds"] += seconds
+
+    def summary(self, wall_seconds: Dict[str, float], default_wall: float) -> Dict[str, dict]:
+        """
+        Args:
+            wall_seconds (Dict[str, float]): 단계 이름 -> 해당 단계의 경과 시간 (초)
+            default_wall (float): wall_seconds에 없는 단계의 경과 시간 (그래프 실행 구간)
+
+        Returns:
+            Dict[str, dict]: 단계 이름 -> 처리 건수, 소요 시간 합계, 건당 평균, 분당 처리량
+        """
+
+        with self._lock:
+            summary = {}
+            for stage, entry in self.stages.items():
+                wall = max(wall_seconds.get(stage, default_wall), 1e-9)
+                summary[stage] = {
+                    "count": entry["count"],
+                    "busy_seconds": entry["busy_seconds"],
+                    "avg_seconds": entry["busy_seconds"] / entry["count"] if entry["count"] else 0.0,
+                    "wall_seconds": wall,
+                    "throughput_per_minute": entry["count"] / wall * 60,
+                }
+            return summary
+
+
+class UniverseBatch:
+    """
+    Stock 테이블의 모든 종목 보고서를 한 번의 파이프라인으로 생성하는 배치입니다.
+
+    1. 데이터 준비 (동시 실행)
+        - 거시경제 분석: 종목과 무관하므로 한 번만 실행하여 노드 결과 캐시에 저장 (이후 종목은 캐시 사용)
+        - 일봉/월봉: 전 종목을 미리 조회
+        - 재무제표: 전 종목의 재무 비율을 미리 계산
+    2. 종목별 그래프 실행: 최대 concurrency개 종목을 동시에 실행 (분석 에이전트 LLM 호출 수 제한)
+    3. 종목 분석이 끝나는 대로 같은 종목의 '시작 전' 작업을 가져와 투자 성향별 최종 분석만 실행하고 저장
+       (가져온 작업은 배치가 끝날 때까지 heartbeat로 임대를 연장하여 다른 워커의 reaper가 되돌리지 않게 함)
+
+    Attributes:
+        graph (Graph): 보고서 그래프
+        concurrency (int): 동시에 분석하는 종목 수
+        persona (str): 기업 단위 최종 분석에 사용하는 투자 성향
+        meter (StageMeter): 단계별 처리량
+        leases (TaskLeases): 가져온 작업의 임대 관리
+    """
+
+    def __init__(self, graph: Graph, concurrency: int = UNIVERSE_CONCURRENCY,
+                 persona: str = UNIVERSE_PERSONA) -> None:
+        self.graph = graph
+        self.concurrency = concurrency
+        self.persona = persona
+        self.meter = StageMeter()
+        self.leases = TaskLeases()
+        self._stage_walls: Dict[str, float] = {}
+
+    def _timed(self, stage: str, func, *args) -> int:
+        """
+        데이터 준비 함수를 실행하고 처리 건수와 소요 시간을 기록합니다.
+        """
+
+        started = time.perf_counter()
+        count = func(*args)
+        seconds = time.perf_counter() - started
+        self.meter.add(stage, count, seconds)
+        self._stage_walls[stage] = seconds
+        print(f"[Universe] {stage}: {count}건, {seconds:.1f}s")
+        return count
+
+    def _prefetch_macro(self) -> int:
+        self.graph.run_node("MacroeconomicAnalysisAgent", {}, run_id="universe-macro")
+        return 1
+
+    async def prefetch(self, universe: Dict[str, str]) -> None:
+        """
+        종목과 무관한 데이터와 전 종목의 시세/재무 데이터를 동시에 미리 준비합니다.
+
+        Args:
+            universe (Dict[str, str]): 기업명 -> 종목 코드
+        """
+
+        chart_node = self.graph.nodes["DailyChartAnalysisAgent"]
+        fs_node = self.graph.nodes["FinancialStatementsAnalysisAgent"]
+        await asyncio.gather(
+            asyncio.to_thread(self._timed, "prefetch.macro", self._prefetch_macro),
+            asyncio.to_thread(self._timed, "prefetch.ohlcv", chart_node.prefetch, list(universe.values())),
+            asyncio.to_thread(self._timed, "prefetch.financials", fs_node.prefetch, universe),
+        )
+
+    def clear_prefetch(self) -> None:
+        self.graph.nodes["DailyChartAnalysisAgent"].clear_prefetch()
+        self.graph.nodes["FinancialStatementsAnalysisAgent"].clear_prefetch()
+
+    def _fan_out(self, company_code: str, company_state: GraphState) -> Dict[str, int]:
+        """
+        같은 종목의 '시작 전' 작업을 모두 가져와 기업 분석 결과로 투자 성향별 최종 분석만 실행합니다.
+        가져온 작업들의 최종 분석은 run_personas()로 동시에 실행합니다.
+
+        Returns:
+            Dict[str, int]: {"completed": 성공 수, "failed": 실패 수}
+        """
+
+        counts = {"completed": 0, "failed": 0}
+        with get_db_session() as db:
+            while True:
+                tasks = claim_stock_tasks(db, company_code)
+                if not tasks:
+                    return counts
+                for ok, seconds in run_personas(self.graph, tasks, company_state):
+                    self.meter.add("persona", 1, seconds)
+                    counts["completed" if ok else "failed"] += 1
+
+    async def run_stock(self, semaphore: asyncio.Semaphore, company_name: str, company_code: str) -> dict:
+        """
+        종목 하나의 그래프를 실행하고 대기 중인 작업에 결과를 반영합니다.
+
+        Returns:
+            dict: 종목별 결과 (매매 의견, 평가 점수, 보고서, 소요 시간, 처리한 작업 수, 작업 처리 오류)
+
+        Note:
+            그래프 실행과 대기 작업 처리(_fan_out)의 예외는 모두 종목 결과에 기록하고 다시 발생시키지 않으므로
+            한 종목의 실패가 arun()의 asyncio.gather를 중단시키지 않습니다.
+        """
+
+        async with semaphore:
+            started = time.perf_counter()
+            initial_state: GraphState = {
+                "company_name": company_name,
+                "company_code": company_code,
+                "date": datetime.now(ZoneInfo("Asia/Seoul")),
+                "user_assets": 10000000.0,
+                "financial_query": "2025년 3월 기준, 해당 기업의 재무 리포트 및 투자 전망 분석",
+                "investment_persona": self.persona,
+            }
+            final_state = dict(initial_state)
+            try:
+                async for delta in self.graph.arun_deltas(initial_state):
+                    delta.apply(final_state)
+            except Exception as e:
+                print(f"[Universe] {company_name}({company_code}) 실패: {e}")
+                self.meter.add("graph.failed", 1, time.perf_counter() - started)
+                return {"company_name": company_name, "ok": False, "error": str(e)}
+
+            seconds = time.perf_counter() - started
+            self.meter.add("graph", 1, seconds)
+            for name, entry in final_state.get("run_timing", {}).get("nodes", {}).items():
+                self.meter.add(f"node.{name}", 1, entry["seconds"])
+
+        ok = final_state.get("final_report") is not None and final_state.get("integrated_report") is not None
+        tasks, fan_out_error = {}, None
+        if ok:
+            try:
+                tasks = await asyncio.to_thread(self._fan_out, company_code, final_state)
+            except Exception as e:
+                # 대기 작업 조회/저장 중 오류(DB 연결 등)는 이 종목 결과에만 기록하고 다른 종목은 계속 진행
+                # (이미 가져온 작업은 배치가 끝나 임대가 만료되면 reaper가 대기열로 되돌림)
+                fan_out_error = str(e)
+                print(f"[Universe] {company_name}({company_code}) 대기 작업 처리 실패: {e}")
+        print(f"[Universe] {company_name}({company_code}) 완료: {seconds:.1f}s, 작업 {tasks}")
+        return {
+            "company_name": company_name,
+            "ok": ok,
+            "seconds": seconds,
+            "stock_position": parse_stock_position(final_state.get("final_report") or ""),
+            "report_score": final_state.get("report_score"),
+            "integrated_report": final_state.get("integrated_report"),
+            "final_report": final_state.get("final_report"),
+            "tasks": tasks,
+            "fan_out_error": fan_out_error,
+        }
+
+    async def arun(self, universe: Dict[str, str]) -> dict:
+        """
+        전 종목 보고서를 생성합니다.
+
+        Args:
+            universe (Dict[str, str]): 기업명 -> 종목 코드
+
+        Returns:
+            dict: 전체 소요 시간, 단계별 처리량, 종목별 결과
+        """
+
+        started = time.perf_counter()
+        self.leases.start()
+        try:
+            await self.prefetch(universe)
+            graph_started = time.perf_counter()
+            semaphore = asyncio.Semaphore(self.concurrency)
+            results = await asyncio.gather(
+                *(self.run_stock(semaphore, name, code) for name, code in universe.items()))
+            graph_wall = time.perf_counter() - graph_started
+        finally:
+            self.clear_prefetch()
+            self.leases.close()
+
+        return {
+            "started_at": datetime.now(ZoneInfo("Asia/Seoul")).isoformat(),
+            "stocks": len(universe),
+            "concurrency": self.concurrency,
+            "wall_seconds": time.perf_counter() - started,
+            "graph_wall_seconds": graph_wall,
+            "stages": self.meter.summary(self._stage_walls, graph_wall),
+            "results": {code: result for code, result in zip(universe.values(), results)},
+        }
+
+
+def load_universe(db) -> Dict[str, str]:
+    """
+    Stock 테이블의 전 종목을 읽습니다.
+
+    Returns:
+        Dict[str, str]: 기업명 -> 종목 코드
+    """
+
+    return {stock.stock_name or stock.stock_code: stock.stock_code
+            for stock in db.query(Stock).order_by(Stock.id).all()}
+
+
+def print_summary(result: dict) -> None:
+    failed = [entry["company_name"] for entry in result["results"].values() if not entry["ok"]]
+    print("\n===== 유니버스 배치 결과 =====")
+    print(f"종목 {result['stocks']}개, 동시 실행 {result['concurrency']}, 전체 {result['wall_seconds']:.1f}s "
+          f"(그래프 실행 {result['graph_wall_seconds']:.1f}s)")
+    print(f"{'단계':<44}{'건수':>6}{'평균(s)':>10}{'건/분':>10}")
+    for stage, entry in sorted(result["stages"].items()):
+        print(f"{stage:<44}{entry['count']:>6}{entry['avg_seconds']:>10.2f}{entry['throughput_per_minute']:>10.2f}")
+    if failed:
+        print(f"[WARN] 보고서를 만들지 못한 종목: {failed}")
+    fan_out_failed = [entry["company_name"] for entry in result["results"].values() if entry.get("fan_out_error")]
+    if fan_out_failed:
+        print(f"[WARN] 대기 작업을 처리하지 못한 종목: {fan_out_failed}")
+
+
+def main() -> Optional[dict]:
+    """
+    Stock 테이블 전 종목의 보고서를 생성하는 배치를 실행합니다.
+    하루 3회 알림 시각(12:00, 18:00, 21:00) 전에 실행되도록 스케줄링합니다.
+
+    Example:
+        >>> # agentserver 디렉터리에서
+        >>> # UNIVERSE_CONCURRENCY=6 PYTHONPATH=. python worker/universe_batch.py
+    """
+
+    with get_db_session() as db:
+        universe = load_universe(db)
+    if not universe:
+        print("[Universe] Stock 테이블에 종목이 없습니다.")
+        return None
+
+    graph = registry.get(UNIVERSE_GRAPH)
+    result = asyncio.run(UniverseBatch(graph).arun(universe))
+    print_summary(result)
+
+    if UNIVERSE_REPORT_PATH:
+        directory = os.path.dirname(UNIVERSE_REPORT_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(UNIVERSE_REPORT_PATH, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -2,5 +2,11 @@
 set -e
 
 HOME_DIR="/data/ephemeral/home"
+# 동시에 실행할 보고서 파이프라인 수
+export WORKER_CONCURRENCY="${WORKER_CONCURRENCY:-2}"
+# 감독 프로세스가 실행할 워커 프로세스 수 (GPU 평가 모델은 워커마다 로딩되므로 기본 1개)
+# (SCORER_SERVICE_URL로 평가 서비스(worker/scorer_service.py)를 사용하면 모델을 한 번만 로딩하므로 늘릴 수 있음)
+export WORKER_PROCESSES="${WORKER_PROCESSES:-1}"
 
-cd "$HOME_DIR/agentserver" && source "$HOME_DIR/.pyenv/versions/nlp13-env/bin/activate" && python node_generate_report.py
+# 에이전트 모듈(LangGraph_base 등)을 agentserver 기준으로 import하므로 PYTHONPATH 지정
+cd "$HOME_DIR/agentserver" && source "$HOME_DIR/.pyenv/versions/nlp13-env/bin/activate" && PYTHONPATH="$HOME_DIR/agentserver" python worker/worker_supervisor.py
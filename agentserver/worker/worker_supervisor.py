@@ -0,0 +1,284 @@
+import os
+# 부모 프로세스에서 GPU 사용 가능 여부를 확인해도 CUDA 드라이버를 초기화하지 않도록 설정 (fork 후 자식에서 CUDA 사용 가능)
+os.environ.setdefault("PYTORCH_NVML_BASED_CUDA_CHECK", "1")
+
+import gc
+import sys
+import time
+import signal
+import resource
+from typing import Dict, Optional
+
+import torch
+
+from node_generate_report import REPORT_GRAPH, registry
+from report_worker import WORKER_METRICS_PATH, ReportWorker
+from app.db.session import engine
+
+# 감독 프로세스가 실행할 워커 프로세스 수 (각 워커는 WORKER_CONCURRENCY개의 파이프라인을 실행)
+WORKER_PROCESSES = int(os.environ.get("WORKER_PROCESSES", 2))
+# 워커 하나가 이 수만큼 작업을 시작하면 새 워커로 교체 (0이면 작업 수로 교체하지 않음)
+WORKER_RECYCLE_TASKS = int(os.environ.get("WORKER_RECYCLE_TASKS", 50))
+# 워커의 고유 메모리(USS, fork 이후 새로 할당하거나 복사된 페이지)가 이 크기(MB)를 넘으면 교체 (0이면 제한 없음)
+WORKER_MEMORY_CEILING_MB = float(os.environ.get("WORKER_MEMORY_CEILING_MB", 4096))
+# 워커 메모리를 확인하는 주기 (초)
+WORKER_MEMORY_CHECK_INTERVAL = float(os.environ.get("WORKER_MEMORY_CHECK_INTERVAL", 10))
+# 교체를 요청한 워커가 종료되기를 기다리는 최대 시간 (초), 넘으면 강제 종료 (작업은 임대 만료 후 대기열로 복귀)
+WORKER_RECYCLE_GRACE_SECONDS = float(os.environ.get("WORKER_RECYCLE_GRACE_SECONDS", 60))
+# fork 전에 부모 프로세스에서 그래프(평가 모델 포함)를 미리 생성할지 여부 ("auto"는 GPU가 없을 때만)
+WORKER_PRELOAD = os.environ.get("WORKER_PRELOAD", "auto")
+# 감독자가 처리하는 종료 신호 (자식은 fork 직후 이 신호의 핸들러를 자신의 것으로 바꿈)
+CHILD_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+
+def read_memory(pid: int) -> Optional[Dict[str, float]]:
+    """
+    /proc에서 프로세스의 메모리 사용량을 읽습니다.
+
+    Args:
+        pid (int): 프로세스 ID
+
+    Returns:
+        Optional[Dict[str, float]]: {"rss_mb", "hwm_mb", "uss_mb"} (프로세스가 없으면 None)
+            - rss_mb: 현재 RSS (부모와 공유하는 모델 가중치 페이지 포함)
+            - hwm_mb: RSS 최고치 (커널 기록 VmHWM)
+            - uss_mb: 고유 메모리 (Private_Clean + Private_Dirty), smaps_rollup이 없으면 RSS
+    """
+
+    memory = {}
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    memory["rss_mb"] = int(line.split()[1]) / 1024
+                elif line.startswith("VmHWM:"):
+                    memory["hwm_mb"] = int(line.split()[1]) / 1024
+    except (FileNotFoundError, ProcessLookupError):
+        return None
+    try:
+        private_kb = 0
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                    private_kb += int(line.split()[1])
+        memory["uss_mb"] = private_kb / 1024
+    except OSError:
+        memory["uss_mb"] = memory.get("rss_mb", 0.0)
+    return memory if "rss_mb" in memory else None
+
+
+class _Child:
+    """
+    감독 프로세스가 관리하는 워커 프로세스 하나의 상태입니다.
+
+    Attributes:
+        slot (int): 워커 번호 (교체된 워커는 같은 번호를 이어받음)
+        pid (int): 프로세스 ID
+        started_at (float): 시작 시각 (time.monotonic() 기준)
+        peak (Dict[str, float]): 확인한 메모리 항목별 최고치 (MB)
+        recycle_reason (Optional[str]): 감독 프로세스가 교체를 요청한 이유
+        recycle_requested_at (Optional[float]): 교체 요청 시각
+    """
+
+    def __init__(self, slot: int, pid: int) -> None:
+        self.slot = slot
+        self.pid = pid
+        self.started_at = time.monotonic()
+        self.peak: Dict[str, float] = {"rss_mb": 0.0, "hwm_mb": 0.0, "uss_mb": 0.0}
+        self.recycle_reason: Optional[str] = None
+        self.recycle_requested_at: Optional[float] = None
+
+
+class WorkerSupervisor:
+    """
+    보고서 워커 프로세스를 여러 개 fork하여 실행하고, 작업 수와 메모리 사용량에 따라 교체하는 감독 프로세스입니다.
+
+    - fork 전에 부모에서 그래프(평가 모델, LLM 클라이언트)를 생성하고 gc.freeze()로 고정하므로
+      자식 프로세스는 모델 가중치를 복사하지 않고 copy-on-write로 공유합니다.
+    - 자식은 max_tasks만큼 작업을 시작하면 실행 중인 작업을 마치고 스스로 종료하고,
+      감독 프로세스는 주기적으로 자식의 메모리를 확인하여 고유 메모리가 상한을 넘으면 SIGTERM으로 교체를 요청합니다.
+      (SIGTERM을 받은 자식은 실행 중인 작업의 임대를 반납하고 바로 종료하며, 작업은 다른 워커가 체크포인트에서 재개)
+    - 종료된 자식은 같은 번호의 새 자식으로 교체하며, 교체 이유와 메모리 최고치를 로그로 남깁니다.
+
+    Attributes:
+        processes (int): 워커 프로세스 수
+        recycle_tasks (Optional[int]): 워커당 최대 작업 수
+        memory_ceiling_mb (Optional[float]): 워커 고유 메모리 상한 (MB)
+        recycles (Dict[str, int]): 교체 이유별 횟수
+
+    Note:
+        공유 가중치는 모든 자식의 RSS에 포함되므로 상한은 자식이 새로 늘린 고유 메모리(USS)로 판단합니다.
+        GPU에서 실행하는 평가 모델은 CUDA 컨텍스트를 fork로 물려줄 수 없으므로 WORKER_PRELOAD=auto이면
+        GPU가 있을 때 미리 생성하지 않습니다. (평가 모델을 GRAPH_DISPATCH의 model 풀에서 실행하면
+        워커에는 모델이 없으므로 항상 미리 생성할 수 있습니다.)
+    """
+
+    def __init__(self, processes: int = WORKER_PROCESSES, recycle_tasks: int = WORKER_RECYCLE_TASKS,
+                 memory_ceiling_mb: float = WORKER_MEMORY_CEILING_MB,
+                 check_interval: float = WORKER_MEMORY_CHECK_INTERVAL,
+                 grace_seconds: float = WORKER_RECYCLE_GRACE_SECONDS) -> None:
+        self.processes = processes
+        self.recycle_tasks = recycle_tasks or None
+        self.memory_ceiling_mb = memory_ceiling_mb or None
+        self.check_interval = check_interval
+        self.grace_seconds = grace_seconds
+        self.recycles: Dict[str, int] = {}
+        self._children: Dict[int, _Child] = {}
+        self._stopping = False
+
+    def stop(self, *_) -> None:
+        """
+        모든 워커에 종료를 요청합니다. 워커는 실행 중인 작업의 임대를 반납하고 종료합니다.
+        """
+
+        print("[Supervisor] 종료 요청을 받았습니다. 워커가 종료될 때까지 기다립니다.")
+        self._stopping = True
+        for child in self._children.values():
+            self._signal(child, signal.SIGTERM)
+
+    def preload(self) -> None:
+        """
+        fork 전에 그래프를 생성하고, 이후 만들어진 객체를 GC 대상에서 제외하여
+        자식 프로세스의 GC가 공유 페이지를 건드려 복사되지 않게 합니다.
+        """
+
+        if WORKER_PRELOAD == "0" or (WORKER_PRELOAD == "auto" and torch.cuda.is_available()):
+            print("[Supervisor] 그래프를 미리 생성하지 않습니다. (각 워커가 시작할 때 생성)")
+            return
+        startup = registry.warm_up(REPORT_GRAPH)[REPORT_GRAPH]
+        gc.collect()
+        gc.freeze()
+        memory = read_memory(os.getpid())
+        print(f"[Supervisor] 그래프 미리 생성 완료 ({startup:.1f}s, RSS {memory['rss_mb']:.0f}MB), "
+              f"워커는 copy-on-write로 공유합니다.")
+
+    def _spawn(self, slot: int) -> None:
+        # 버퍼에 남은 출력이 자식에서 한 번 더 출력되지 않도록 fork 전에 비움
+        sys.stdout.flush()
+        # fork 직후 자식이 핸들러를 바꾸기 전에 신호를 받지 않도록 fork 동안 SIGINT/SIGTERM을 막아 둠
+        signal.pthread_sigmask(signal.SIG_BLOCK, CHILD_SIGNALS)
+        pid = os.fork()
+        if pid == 0:
+            # 부모의 핸들러(supervisor.stop)를 물려받은 채로 신호를 받으면 자식이 감독자처럼 동작하므로
+            # 다른 작업보다 먼저 기본 동작으로 되돌림 (Ctrl+C는 감독자만 처리하고 자식에는 SIGTERM으로 전달)
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, CHILD_SIGNALS)
+            code = self._child_main(slot)
+            sys.stdout.flush()
+            os._exit(code)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, CHILD_SIGNALS)
+        self._children[pid] = _Child(slot, pid)
+        print(f"[Supervisor] 워커 {slot} 시작 (pid {pid})")
+
+    def _child_main(self, slot: int) -> int:
+        # 부모에서 만든 DB 연결을 자식이 함께 사용하지 않도록 연결 풀만 새로 시작 (부모 연결은 닫지 않음)
+        engine.dispose(close=False)
+        try:
+            metrics_path = f"{WORKER_METRICS_PATH}.{slot}" if WORKER_METRICS_PATH else None
+            worker = ReportWorker(max_tasks=self.recycle_tasks, metrics_path=metrics_path)
+            # 워커를 만든 뒤부터는 SIGTERM에 실행 중인 작업을 반납하고 종료
+            signal.signal(signal.SIGTERM, worker.terminate)
+            worker.run()
+            peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"[Worker] 워커 {slot} 종료 (작업 {worker.metrics.claimed}건, 최대 RSS {peak_mb:.0f}MB)")
+            return 0
+        except BaseException as e:
+            print(f"[Worker] 워커 {slot} 비정상 종료: {e!r}")
+            return 1
+
+    def _signal(self, child: _Child, signum: int) -> None:
+        try:
+            os.kill(child.pid, signum)
+        except ProcessLookupError:
+            pass
+
+    def _request_recycle(self, child: _Child, reason: str) -> None:
+        child.recycle_reason = reason
+        child.recycle_requested_at = time.monotonic()
+        print(f"[Supervisor] 워커 {child.slot} (pid {child.pid}) 교체 요청: {reason}")
+        self._signal(child, signal.SIGTERM)
+
+    def _check_memory(self) -> None:
+        for child in list(self._children.values()):
+            memory = read_memory(child.pid)
+            if memory is None:
+                continue
+            for key, value in memory.items():
+                child.peak[key] = max(child.peak[key], value)
+            if child.recycle_requested_at is not None:
+                # 유예 시간 안에 종료되지 않은 워커는 강제 종료 (작업은 임대 만료 후 대기열로 복귀)
+                if time.monotonic() - child.recycle_requested_at > self.grace_seconds:
+                    print(f"[Supervisor] 워커 {child.slot} (pid {child.pid})가 {self.grace_seconds:.0f}초 안에 "
+                          f"종료되지 않아 강제 종료합니다.")
+                    self._signal(child, signal.SIGKILL)
+                continue
+            if not self._stopping and self.memory_ceiling_mb is not None \
+                    and memory["uss_mb"] > self.memory_ceiling_mb:
+                self._request_recycle(child, f"고유 메모리 {memory['uss_mb']:.0f}MB > 상한 "
+                                             f"{self.memory_ceiling_mb:.0f}MB")
+
+    def _reap(self) -> None:
+        while self._children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            child = self._children.pop(pid, None)
+            if child is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if child.recycle_reason is not None:
+                reason = "memory"
+            elif self._stopping:
+                reason = "shutdown"
+            elif code == 0:
+                reason = "max_tasks"
+            else:
+                reason = "crash"
+            self.recycles[reason] = self.recycles.get(reason, 0) + 1
+            print(f"[Supervisor] 워커 {child.slot} (pid {pid}) 종료: 이유 {reason}, 종료 코드 {code}, "
+                  f"실행 {time.monotonic() - child.started_at:.0f}s, 메모리 최고치 RSS {child.peak['hwm_mb']:.0f}MB, "
+                  f"고유 {child.peak['uss_mb']:.0f}MB (누적 교체 {self.recycles})")
+            if not self._stopping:
+                if reason == "crash":
+                    # 시작하자마자 죽는 경우 계속 fork하지 않도록 잠시 대기
+                    time.sleep(1)
+                self._spawn(child.slot)
+
+    def run(self) -> None:
+        """
+        워커 프로세스를 시작하고, 종료 요청(SIGINT/SIGTERM)까지 교체하며 실행합니다.
+        """
+
+        self.preload()
+        for slot in range(self.processes):
+            self._spawn(slot)
+        print(f"[Supervisor] 워커 {self.processes}개 실행 (작업 {self.recycle_tasks or '무제한'}건 또는 "
+              f"고유 메모리 {self.memory_ceiling_mb or '무제한'}MB마다 교체)")
+        checked_at = time.monotonic()
+        while self._children:
+            self._reap()
+            if time.monotonic() - checked_at >= self.check_interval:
+                self._check_memory()
+                checked_at = time.monotonic()
+            time.sleep(0.5)
+        print(f"[Supervisor] 종료 (교체 {self.recycles})")
+
+
+def main():
+    """
+    보고서 워커 감독 프로세스를 실행합니다.
+
+    Example:
+        >>> # agentserver 디렉터리에서
+        >>> # WORKER_PROCESSES=2 WORKER_RECYCLE_TASKS=50 PYTHONPATH=. python worker/worker_supervisor.py
+    """
+
+    supervisor = WorkerSupervisor()
+    signal.signal(signal.SIGINT, supervisor.stop)
+    signal.signal(signal.SIGTERM, supervisor.stop)
+    supervisor.run()
+
+
+if __name__ == "__main__":
+    main()
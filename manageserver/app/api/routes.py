@@ -26,13 +26,38 @@ async def execute_trade(trade: TradeRequest):
         TradeResponse: 거래 ID와 처리 결과 메시지
     """
 
-    # 거래 요청을 데이터베이스에 저장
+    # 에이전트 서버는 전송 결과를 받지 못하면 같은 보고서의 알림을 다시 보내므로(task_id가 중복 방지 키),
+    # 같은 task_id의 거래 요청은 한 건만 저장하고 카카오톡은 아직 보내지 않은(또는 전송에 실패한) 경우에만 보냄
     trade_id = db.save_trade_request(
         trade.user_id, trade.stock_code, trade.position, trade.justification, trade.task_id
     )
+    if trade_id is None:
+        raise HTTPException(status_code=503, detail="거래 요청 저장 실패")
+    claim = db.claim_trade_send(trade_id)
+    if claim is None:
+        raise HTTPException(status_code=503, detail="거래 요청 상태 조회 실패")
+    claimed, status = claim
+    if not claimed:
+        if status in ("sent", "auth_required"):
+            return TradeResponse(trade_id=trade_id, message="이미 처리된 거래 요청입니다.")
+        # 다른 요청이 전송 중이면 결과를 알 수 없으므로 5xx로 응답하여 에이전트 서버가 나중에 다시 확인하게 함
+        # (4xx는 영구 실패로 처리되므로 사용하지 않음)
+        raise HTTPException(status_code=503, detail="다른 요청이 카카오톡을 전송 중입니다.")
 
     # 거래 요청 후 카카오톡 메시지 전송
-    result = kakao_notifier.send_trade_request(trade_id)
+    try:
+        result = kakao_notifier.send_trade_request(trade_id)
+    except Exception as e:
+        result = {"error": f"카카오톡 전송 중 오류: {e}"}
+    if "success" in result:
+        db.set_trade_status(trade_id, "sent")
+    elif "auth_url" in result:
+        # 사용자 인증이 필요하면 다시 보내도 같은 결과이므로 인증 링크를 응답으로 돌려줌
+        db.set_trade_status(trade_id, "auth_required")
+    else:
+        # 전송 실패는 5xx로 응답하여 에이전트 서버가 다시 보내게 함 (send_failed는 다시 전송 권한을 가져갈 수 있음)
+        db.set_trade_status(trade_id, "send_failed")
+        raise HTTPException(status_code=502, detail=result.get("error", "카카오톡 전송 실패"))
 
     # 결과가 dict 형태일 경우 JSON 문자열로 변환
     if isinstance(result, dict):
@@ -8,6 +8,10 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 dotenv_path = os.path.join(BASE_DIR, "..", "config", ".env")
 load_dotenv(dotenv_path)
 
+# 카카오톡 전송 중('sending') 상태가 이 시간(초)보다 오래되면 전송이 중단된 것으로 보고 다시 전송 권한을 가져갈 수 있음
+# (서버 재시작 등으로 전송 결과를 기록하지 못한 거래 요청 복구용, 카카오톡 전송 시간보다 충분히 길어야 함)
+TRADE_SEND_TIMEOUT = float(os.getenv("TRADE_SEND_TIMEOUT", 300))
+
 
 class Database:
     """PostgreSQL 데이터베이스 관리 클래스"""
@@ -74,6 +78,19 @@ class Database:
                         status TEXT DEFAULT 'pending'
                     )
                 """)
+                # 카카오톡 전송을 시작한 시각 (오래된 'sending' 상태를 다시 가져가기 위한 기준)
+                cursor.execute("ALTER TABLE trade_requests ADD COLUMN IF NOT EXISTS sending_at TIMESTAMPTZ")
+                # 같은 보고서(task_id)의 거래 요청은 한 건만 저장 (알림 재전송/동시 전송 시 중복 방지)
+                # 유니크 인덱스가 없던 기존 테이블의 중복 task_id는 가장 먼저 저장된 행(min(id))만 남기고 삭제
+                cursor.execute("""
+                    DELETE FROM trade_requests duplicate USING trade_requests kept
+                    WHERE duplicate.task_id = kept.task_id AND duplicate.id > kept.id
+                """)
+                if cursor.rowcount:
+                    print(f"📌 [INFO] 중복 거래 요청 {cursor.rowcount}건 삭제 (task_id별 첫 요청만 유지)")
+                cursor.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS trade_requests_task_id_key ON trade_requests (task_id)
+                """)
                 conn.commit()
         except Exception as e:
             conn.rollback()
@@ -84,6 +101,7 @@ class Database:
     def save_trade_request(self, user_id: str, stock_code: str, position: str, justification: str, task_id: str) -> int:
         """
         거래 요청을 데이터베이스에 저장하고 거래 ID 반환
+        같은 task_id의 거래 요청이 이미 있으면 새로 저장하지 않고 기존 거래 ID를 반환
 
         Args:
             user_id (str): 사용자 ID
@@ -103,10 +121,16 @@ class Database:
             with conn.cursor() as cursor:
                 cursor.execute("""
                     INSERT INTO trade_requests (user_id, stock_code, position, justification, task_id, status) 
-                    VALUES (%s, %s, %s, %s, %s, 'pending') RETURNING id
+                    VALUES (%s, %s, %s, %s, %s, 'pending')
+                    ON CONFLICT (task_id) DO NOTHING RETURNING id
                 """, (user_id, stock_code, position, justification, task_id))
+                row = cursor.fetchone()
+                if row is None:
+                    # 이미 저장된 거래 요청 (동시에 들어온 요청도 유니크 인덱스로 한 건만 저장됨)
+                    cursor.execute("SELECT id FROM trade_requests WHERE task_id = %s", (task_id,))
+                    row = cursor.fetchone()
 
-                trade_id = cursor.fetchone()[0]  # 생성된 trade_id 반환
+                trade_id = row[0]  # 생성된(또는 기존) trade_id 반환
                 conn.commit()
                 return trade_id
         except Exception:
@@ -115,6 +139,65 @@ class Database:
         finally:
             conn.close()
 
+    def claim_trade_send(self, trade_id: int):
+        """
+        거래 요청의 카카오톡 전송 권한을 가져옴 (status: pending/send_failed -> sending)
+        조건부 UPDATE이므로 같은 거래 요청을 동시에 여러 번 받아도 한 요청만 전송함
+        TRADE_SEND_TIMEOUT보다 오래된 'sending' 상태는 전송이 중단된 것으로 보고 다시 가져감
+
+        Args:
+            trade_id (int): 거래 ID
+
+        Returns:
+            tuple: (전송 권한을 가져왔는지 여부, 현재 status) (DB 오류 시 None 반환)
+        """
+        conn = self.get_connection()
+        if conn is None:
+            return None
+
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    UPDATE trade_requests SET status = 'sending', sending_at = NOW()
+                    WHERE id = %s AND (status IN ('pending', 'send_failed')
+                        OR (status = 'sending' AND (sending_at IS NULL
+                            OR sending_at < NOW() - make_interval(secs => %s))))
+                    RETURNING status
+                """, (trade_id, TRADE_SEND_TIMEOUT))
+                row = cur.fetchone()
+                claimed = row is not None
+                if not claimed:
+                    cur.execute("SELECT status FROM trade_requests WHERE id = %s", (trade_id,))
+                    row = cur.fetchone()
+                conn.commit()
+                return (claimed, row[0]) if row else None
+        except Exception:
+            conn.rollback()
+            return None
+        finally:
+            conn.close()
+
+    def set_trade_status(self, trade_id: int, status: str) -> None:
+        """
+        거래 요청의 전송 상태를 변경
+
+        Args:
+            trade_id (int): 거래 ID
+            status (str): 'sent'(전송 완료), 'auth_required'(카카오 인증 필요), 'send_failed'(재전송 대상)
+        """
+        conn = self.get_connection()
+        if conn is None:
+            return
+
+        try:
+            with conn.cursor() as cur:
+                cur.execute("UPDATE trade_requests SET status = %s WHERE id = %s", (status, trade_id))
+                conn.commit()
+        except Exception:
+            conn.rollback()
+        finally:
+            conn.close()
+
     def get_trade_request(self, trade_id: int):
         """
         특정 거래 요청 정보를 조회
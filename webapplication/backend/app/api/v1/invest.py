@@ -1,7 +1,9 @@
+import json
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
 from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.schemas.invest import TaskCreate, TaskResponse, ReportRequest, ReportResponse, ReportLogsResponse
@@ -14,6 +16,11 @@ from uuid import UUID
 
 router = APIRouter()
 
+# 보고서 워커가 처리하는 작업 우선순위 클래스
+TASK_PRIORITIES = ("interactive", "scheduled", "backfill")
+# 보고서 워커가 LISTEN하는 새 작업 알림 채널 (agentserver/worker/task_notifications.py의 TASK_CHANNEL과 같아야 함)
+TASK_CHANNEL = "report_tasks"
+
 
 @router.put("/", response_model=TaskResponse)
 async def create_a_report_task(report_request: TaskCreate, db: Session = Depends(get_db)):
@@ -25,6 +32,11 @@ async def create_a_report_task(report_request: TaskCreate, db: Session = Depends
     if not report_request.investor_type:
         raise HTTPException(
             status_code=400, detail="investor_type is required")
+    # 사용자가 직접 요청한 보고서는 정기 생성 작업보다 먼저 처리되도록 interactive로 등록
+    priority = report_request.priority or "interactive"
+    if priority not in TASK_PRIORITIES:
+        raise HTTPException(
+            status_code=400, detail=f"priority must be one of {TASK_PRIORITIES}")
     now = datetime.now(ZoneInfo("Asia/Seoul"))
 
     stock = db.query(Stock).filter(Stock.stock_code ==
@@ -32,8 +44,15 @@ async def create_a_report_task(report_request: TaskCreate, db: Session = Depends
     stock_name = stock.stock_name if stock else None
 
     task = Task(task_id=uuid.uuid4(), create_user_id=report_request.user_id, investor_type=report_request.investor_type,
-                stock_code=report_request.stock_code, stock_name=stock_name, created_at=now, status="시작 전", status_message="보고서 생성을 준비 중입니다. ")
+                stock_code=report_request.stock_code, stock_name=stock_name, created_at=now, status="시작 전", status_message="보고서 생성을 준비 중입니다. ",
+                priority=priority)
     db.add(task)
+    # 워커가 다음 조회 주기를 기다리지 않고 바로 작업을 가져가도록 알림 (INSERT와 함께 commit 시점에 전달)
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("SELECT pg_notify(:channel, :payload)"), {
+            "channel": TASK_CHANNEL,
+            "payload": json.dumps({"task_id": str(task.task_id), "priority": priority}),
+        })
     db.commit()
     db.refresh(task)
     print(f"Task created: {task.task_id}")
@@ -150,6 +150,34 @@ class Task(SQLModel, table=True):
         default=None,
         sa_column=Column(String, nullable=True)
     )
+    # priority: 작업 우선순위 클래스 (varchar, NULL 허용)
+    # "interactive"(웹 요청), "scheduled"(정기 생성), "backfill"(과거 보고서 재생성), NULL은 "scheduled"로 처리
+    # ALTER TABLE invest.tasks ADD COLUMN priority varchar;
+    priority: Optional[str] = Field(
+        default=None,
+        sa_column=Column(String, nullable=True)
+    )
+    # worker_id: 작업을 실행 중인 워커 ("호스트:pid", NULL 허용)
+    # heartbeat_at / lease_expires_at: 워커가 주기적으로 갱신하는 실행 확인 시각과 임대 만료 시각 (timestamptz, NULL 허용)
+    # attempt: 작업을 가져간 횟수 (임대가 만료되어 다시 대기열에 넣을 때마다 증가한 횟수로 재시도 한도 판단)
+    # ALTER TABLE invest.tasks ADD COLUMN worker_id varchar, ADD COLUMN heartbeat_at timestamptz,
+    #     ADD COLUMN lease_expires_at timestamptz, ADD COLUMN attempt integer NOT NULL DEFAULT 0;
+    worker_id: Optional[str] = Field(
+        default=None,
+        sa_column=Column(String, nullable=True)
+    )
+    heartbeat_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
+    )
+    lease_expires_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True), nullable=True)
+    )
+    attempt: int = Field(
+        default=0,
+        sa_column=Column(Integer, nullable=False, default=0, server_default="0")
+    )
 
 
 class Stock(SQLModel, table=True):
@@ -10,6 +10,8 @@ class TaskCreate(BaseModel):
     user_id: str
     stock_code: str
     investor_type: str
+    # 작업 우선순위 클래스 ("interactive", "scheduled", "backfill"), 웹 요청은 생략 시 "interactive"
+    priority: Optional[str] = None
 
 
 class TaskResponse(BaseModel):
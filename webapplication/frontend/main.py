@@ -624,6 +624,9 @@ def report_view_page():
                           st.query_params.get("user_id"))
     if resp['status'] == '완료':
         st.text_area("생성된 보고서", resp['text'], height=500)
+    elif resp['status'] == '실패':
+        # 실패한 작업은 다시 생성되지 않으므로 새로고침을 멈추고 원인을 표시
+        st.error(f"보고서 생성에 실패했습니다. {resp['status_message']}")
     else:
         st.info(f"생성된 보고서가 없습니다. {resp['status_message']}")
         st.text_area("생성된 보고서", '현재 생성된 보고서가 없습니다.', height=500)